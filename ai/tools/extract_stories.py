@@ -4,12 +4,23 @@
 This script extracts stories from a markdown file and saves
 them to individual files. It uses a specific format for the
 markdown content and requires an AUTHOR environment variable to be set.
+
+Batch mode (several inputs, or a directory of *.md files) parses inputs in
+parallel in a process pool and records each input's content hash in a
+manifest in the output directory, so inputs unchanged since the last run are
+skipped. Existing story files are kept unless --overwrite is given, in which
+case stories whose content changed are rewritten.
 """
 
+import argparse
+import hashlib
+import json
 import logging
 import os
 import re
 import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import TextIO
@@ -32,13 +43,73 @@ START_PATTERN = re.compile(r"^```+markdown\s*$")
 END_PATTERN = re.compile(r"^```+\s*$")
 IGNORE_PATTERN = re.compile(r"^### Agent Model Used: .*$")
 
+OUTPUT_DIR = Path("./ai")
+MANIFEST_PATH = OUTPUT_DIR / ".extract_stories_manifest.json"
+
+Story = tuple[str, list[str]]
+
 
-def _write_story_file(
+def parse_stories(lines: Iterable[str]) -> list[Story]:
+    """
+    Parses story sections out of markdown lines.
+
+    Args:
+        lines: The lines of the input, with line endings.
+
+    Returns:
+        A list of (filename, content lines) pairs, in input order.
+    """
+    stories: list[Story] = []
+    current_story_filename: str | None = None
+    current_story_content_lines: list[str] = []
+    current_state: str = STATE_LOOKING_FOR_FILENAME
+
+    for line in lines:
+        if IGNORE_PATTERN.match(line):
+            continue
+        stripped_line = line.strip()
+
+        if current_state == STATE_LOOKING_FOR_FILENAME:
+            match = FILENAME_PATTERN.match(stripped_line)
+            if match:
+                current_story_filename = match.group(1)
+                current_state = STATE_LOOKING_FOR_START
+                logging.debug("Found filename: %s", current_story_filename)
+
+        elif current_state == STATE_LOOKING_FOR_START:
+            if START_PATTERN.match(line.rstrip()):
+                current_state = STATE_COLLECTING_CONTENT
+                current_story_content_lines = []  # Reset content buffer
+                logging.debug("Found start marker for %s", current_story_filename)
+
+        elif current_state == STATE_COLLECTING_CONTENT:
+            if END_PATTERN.match(line.rstrip()):
+                if current_story_filename and current_story_content_lines:
+                    stories.append(
+                        (current_story_filename, current_story_content_lines)
+                    )
+                current_state = STATE_LOOKING_FOR_FILENAME
+                current_story_filename = None
+                current_story_content_lines = []  # Always reset
+            else:
+                current_story_content_lines.append(line)
+
+    return stories
+
+
+def _render_story(content_lines: list[str], current_date: str, author: str) -> str:
+    markdown_content = "".join(content_lines)
+    markdown_content = markdown_content.replace("{Date}", current_date)
+    return markdown_content.replace("{Author}", author)
+
+
+def _write_story_file(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     filename: str,
     content_lines: list[str],
     output_dir: Path,
     current_date: str,
     author: str,
+    overwrite: bool = False,
 ) -> bool:
     """
     Writes the collected story content to a file.
@@ -49,19 +120,25 @@ def _write_story_file(
         output_dir: The directory where the file should be saved.
         current_date: The current date string to replace {Date} token.
         author: The author string to replace {Author} token.
+        overwrite: Replace an existing file if its content differs.
 
     Returns:
         True if the file was written successfully, False otherwise.
     """
     output_file = output_dir / filename
 
-    if output_file.exists():
-        logging.warning("Output file '%s' already exists. Skipping.", output_file)
-        return False
+    markdown_content = _render_story(content_lines, current_date, author)
 
-    markdown_content = "".join(content_lines)
-    markdown_content = markdown_content.replace("{Date}", current_date)
-    markdown_content = markdown_content.replace("{Author}", author)
+    if output_file.exists():
+        if not overwrite:
+            logging.warning("Output file '%s' already exists. Skipping.", output_file)
+            return False
+        try:
+            if output_file.read_text(encoding="utf-8") == markdown_content:
+                logging.info("Output file '%s' is unchanged. Skipping.", output_file)
+                return False
+        except (OSError, UnicodeDecodeError):
+            pass  # Unreadable: rewrite it below.
 
     try:
         with open(output_file, "w", encoding="utf-8") as out_f:
@@ -73,21 +150,55 @@ def _write_story_file(
         return False
 
 
-def extract_stories(input_file_path: str) -> int:
+def _get_author() -> str | None:
+    load_dotenv()
+    author = os.getenv("AUTHOR")
+    if not author:
+        logging.error("AUTHOR environment variable must be set.")
+    return author
+
+
+def _write_stories(
+    stories: list[Story], output_dir: Path, author: str, overwrite: bool
+) -> tuple[int, bool]:
+    """
+    Writes stories to output_dir.
+
+    Returns:
+        The number of files written, and whether every story file now holds
+        the story's current content (False if any was skipped or failed).
+    """
+    current_date = datetime.now().strftime("%Y-%m-%d")
+    written = 0
+    up_to_date = True
+    for filename, content_lines in stories:
+        if _write_story_file(
+            filename, content_lines, output_dir, current_date, author, overwrite
+        ):
+            written += 1
+            continue
+        try:
+            current = (output_dir / filename).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            current = None
+        if current != _render_story(content_lines, current_date, author):
+            up_to_date = False
+    return written, up_to_date
+
+
+def extract_stories(input_file_path: str, overwrite: bool = False) -> int:
     """
     Extract stories from a markdown file and save them to individual files.
 
     Args:
         input_file_path (str): Path to the input markdown file. Use '-' for stdin.
+        overwrite (bool): Rewrite existing story files whose content changed.
 
     Returns:
         int: Number of stories successfully extracted and written.
     """
-    load_dotenv()
-
-    author = os.getenv("AUTHOR")
+    author = _get_author()
     if not author:
-        logging.error("AUTHOR environment variable must be set.")
         return 0
 
     is_stdin = input_file_path == "-"
@@ -95,63 +206,19 @@ def extract_stories(input_file_path: str) -> int:
         logging.error("Input file '%s' not found.", input_file_path)
         return 0
 
-    output_dir = Path("./ai")
-    output_dir.mkdir(exist_ok=True)
-
-    stories_extracted_count = 0
-    current_date = datetime.now().strftime("%Y-%m-%d")
-    current_story_filename: str | None = None
-    current_story_content_lines: list[str] = []
-    current_state: str = STATE_LOOKING_FOR_FILENAME
+    OUTPUT_DIR.mkdir(exist_ok=True)
 
     try:
         file_source: TextIO = (
             sys.stdin if is_stdin else open(input_file_path, encoding="utf-8")
         )
-
         with file_source as f_input:
-            for line in f_input:
-                if IGNORE_PATTERN.match(line):
-                    continue
-                stripped_line = line.strip()
-
-                if current_state == STATE_LOOKING_FOR_FILENAME:
-                    match = FILENAME_PATTERN.match(stripped_line)
-                    if match:
-                        current_story_filename = match.group(1)
-                        current_state = STATE_LOOKING_FOR_START
-                        logging.debug("Found filename: %s", current_story_filename)
-
-                elif current_state == STATE_LOOKING_FOR_START:
-                    if START_PATTERN.match(line.rstrip()):
-                        current_state = STATE_COLLECTING_CONTENT
-                        current_story_content_lines = []  # Reset content buffer
-                        logging.debug(
-                            "Found start marker for %s", current_story_filename
-                        )
-
-                elif current_state == STATE_COLLECTING_CONTENT:
-                    if END_PATTERN.match(line.rstrip()):
-                        if current_story_filename and current_story_content_lines:
-                            if _write_story_file(
-                                current_story_filename,
-                                current_story_content_lines,
-                                output_dir,
-                                current_date,
-                                author,
-                            ):
-                                stories_extracted_count += 1
-
-                        current_state = STATE_LOOKING_FOR_FILENAME
-                        current_story_filename = None
-                        current_story_content_lines = []  # Always reset
-                    else:
-                        current_story_content_lines.append(line)
-
+            stories = parse_stories(f_input)
     except (OSError, PermissionError, UnicodeDecodeError) as e:
         logging.error("Failed to read input: %s", e)
         return 0  # Indicates failure to process input
 
+    stories_extracted_count, _ = _write_stories(stories, OUTPUT_DIR, author, overwrite)
     if stories_extracted_count == 0:
         logging.warning(
             "No story sections were found or successfully written from the input."
@@ -160,16 +227,167 @@ def extract_stories(input_file_path: str) -> int:
     return stories_extracted_count
 
 
+def collect_inputs(paths: Iterable[str]) -> list[Path]:
+    """Expands directories into the *.md files below them, sorted."""
+    inputs: list[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            inputs.extend(sorted(path.rglob("*.md")))
+        else:
+            inputs.append(path)
+    return inputs
+
+
+def _parse_input(path: Path) -> tuple[Path, str, list[Story] | None, str | None]:
+    """
+    Reads and parses one input (runs in a worker process).
+
+    Returns:
+        (path, content hash, stories, error); stories is None on error.
+    """
+    try:
+        data = path.read_bytes()
+        stories = parse_stories(data.decode("utf-8").splitlines(keepends=True))
+    except (OSError, UnicodeDecodeError) as e:
+        return path, "", None, str(e)
+    return path, hashlib.sha256(data).hexdigest(), stories, None
+
+
+def _load_manifest(manifest_path: Path) -> dict[str, str]:
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning("Ignoring unreadable manifest %s: %s", manifest_path, e)
+        return {}
+
+
+def _save_manifest(manifest_path: Path, manifest: dict[str, str]) -> None:
+    temporary = manifest_path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(manifest, indent=2, sort_keys=True), "utf-8")
+    temporary.replace(manifest_path)
+
+
+def _content_hash(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _changed_inputs(inputs: list[Path], manifest: dict[str, str]) -> list[Path]:
+    """The existing inputs whose content hash differs from the manifest."""
+    changed = []
+    for path in inputs:
+        if not path.is_file():
+            logging.error("Input file '%s' not found.", path)
+        elif manifest.get(str(path.resolve())) == _content_hash(path):
+            logging.info("Input '%s' is unchanged. Skipping.", path)
+        else:
+            changed.append(path)
+    return changed
+
+
+def extract_stories_batch(
+    paths: Iterable[str],
+    overwrite: bool = False,
+    force: bool = False,
+    jobs: int | None = None,
+) -> int:
+    """
+    Extract stories from many markdown files (or directories) in parallel.
+
+    Inputs whose content hash matches the manifest from the previous run are
+    skipped. An input is recorded in the manifest only once every story file
+    it produces holds its current content, so inputs whose stories were kept
+    (exist, no overwrite) or failed to write are retried on the next run.
+
+    Args:
+        paths: Input files and/or directories searched for *.md files.
+        overwrite: Rewrite existing story files whose content changed.
+        force: Process every input even if it is unchanged.
+        jobs: Worker processes for parsing (default: CPU count).
+
+    Returns:
+        Number of stories successfully extracted and written.
+    """
+    author = _get_author()
+    if not author:
+        return 0
+
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    manifest = _load_manifest(MANIFEST_PATH)
+    pending = _changed_inputs(collect_inputs(paths), {} if force else manifest)
+
+    stories_extracted_count = 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for path, digest, stories, error in pool.map(_parse_input, pending):
+                if stories is None:
+                    logging.error("Failed to read input '%s': %s", path, error)
+                    continue
+                written, up_to_date = _write_stories(
+                    stories, OUTPUT_DIR, author, overwrite
+                )
+                stories_extracted_count += written
+                if up_to_date:
+                    manifest[str(path.resolve())] = digest
+        _save_manifest(MANIFEST_PATH, manifest)
+
+    logging.info(
+        "Processed %s input(s); %s stories written.",
+        len(pending),
+        stories_extracted_count,
+    )
+    return stories_extracted_count
+
+
 def main():
     """Main function to parse command line arguments and run the extraction."""
-    if len(sys.argv) != 2:
-        print(f"Usage: {sys.argv[0]} <input_file_path>")
-        print("       Use '-' as input_file_path to read from standard input.")
-        sys.exit(1)
-
-    input_file_path = sys.argv[1]
+    parser = argparse.ArgumentParser(
+        description="Extract stories from markdown files into ./ai/."
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        metavar="input_path",
+        help="Markdown file(s) or directories of *.md files; '-' reads stdin",
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Rewrite existing story files whose content changed",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Batch mode: process inputs even if unchanged since the last run",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="Batch mode: worker processes"
+    )
+    args = parser.parse_args()
+
+    if len(args.inputs) > 1 and "-" in args.inputs:
+        parser.error("'-' (stdin) cannot be combined with other inputs.")
+
+    if len(args.inputs) > 1 or os.path.isdir(args.inputs[0]):
+        if not _get_author():
+            sys.exit(1)
+        num_extracted = extract_stories_batch(
+            args.inputs, overwrite=args.overwrite, force=args.force, jobs=args.jobs
+        )
+        # Unchanged inputs are expected in batch mode, so writing nothing
+        # is not an error.
+        print(
+            f"Extracted {num_extracted} new or changed stories "
+            f"from {len(args.inputs)} input path(s) to the ./ai/ directory."
+        )
+        return
 
-    num_extracted = extract_stories(input_file_path)
+    input_file_path = args.inputs[0]
+    num_extracted = extract_stories(input_file_path, overwrite=args.overwrite)
     if num_extracted > 0:
         source_description = (
             "stdin" if input_file_path == "-" else f"'{input_file_path}'"
@@ -0,0 +1,71 @@
+"""Dashboard API Router"""
+
+import asyncio
+
+from fastapi import APIRouter, Header, Response, status
+
+from backend.app.trend_identification.dashboard import (
+    get_dashboard_store,
+    publish_dashboard_snapshot,
+)
+
+router = APIRouter()
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    qualities = {}
+    for coding in (accept_encoding or "").lower().split(","):
+        name, _, params = coding.partition(";")
+        quality = params.replace(" ", "").removeprefix("q=")
+        try:
+            qualities.setdefault(name.strip(), float(quality or 1))
+        except ValueError:
+            qualities.setdefault(name.strip(), 1.0)
+    # An explicit gzip entry takes precedence over the * wildcard.
+    quality = qualities.get("gzip", qualities.get("*", 0.0))
+    return quality > 0
+
+
+def _none_match(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires; * matches any tag."""
+    if if_none_match is None:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+@router.get("", summary="Precomputed dashboard snapshot")
+async def dashboard_snapshot(
+    accept_encoding: str | None = Header(None),
+    if_none_match: str | None = Header(None),
+) -> Response:
+    """
+    Returns the top trends with their sparklines and the sentiment summary,
+    as built at the end of the last fetch cycle.
+
+    The snapshot is served as stored, gzip-compressed unless the client does
+    not accept gzip, with an ETag of its version and content (distinct for
+    each encoding). A snapshot is built on the spot only if none has been
+    published yet.
+    """
+    store = get_dashboard_store()
+    snapshot = await asyncio.to_thread(store.current)
+    if snapshot is None:
+        snapshot = await asyncio.to_thread(publish_dashboard_snapshot)
+    gzipped = _accepts_gzip(accept_encoding)
+    headers = {
+        "ETag": snapshot.gzip_etag if gzipped else snapshot.etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if _none_match(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+        return Response(
+            snapshot.gzipped, media_type="application/json", headers=headers
+        )
+    return Response(snapshot.body, media_type="application/json", headers=headers)
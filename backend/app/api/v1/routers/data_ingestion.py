@@ -1,10 +1,21 @@
 """Data Ingestion API Router"""
 
+import asyncio
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, status
 
+from backend.app.core.config import settings
+from backend.app.data_ingestion.content_store import get_article_store
 from backend.app.data_ingestion.scheduler import perform_scheduled_article_fetch
+from backend.app.db.pagination import InvalidCursorError
+from backend.app.schemas.data_ingestion import (
+    ArticleListResponse,
+    ArticleSearchHitSchema,
+    ArticleSearchResponse,
+    ArticleSummarySchema,
+)
+from backend.app.worker.queue import FETCH_CYCLE_TASK, get_work_queue
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -19,9 +30,20 @@ async def trigger_fetch_articles(background_tasks: BackgroundTasks):
     """
     Manually triggers the scheduled article fetching job.
     This is useful for MVP demonstration purposes.
+
+    In worker ingestion mode the job is queued for an ingestion worker
+    instead of running in the API process.
     """
     logger.info("Manual trigger received for article fetching.")
     try:
+        if settings.INGESTION_MODE == "worker":
+            task_id = await asyncio.to_thread(
+                get_work_queue().enqueue, FETCH_CYCLE_TASK
+            )
+            return {
+                "message": "Article fetching job has been queued for a worker.",
+                "task_id": task_id,
+            }
         # Running as a background task to avoid blocking the HTTP response.
         background_tasks.add_task(perform_scheduled_article_fetch)
         return {"message": "Article fetching job has been scheduled successfully."}
@@ -31,3 +53,48 @@ async def trigger_fetch_articles(background_tasks: BackgroundTasks):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to schedule article fetching job: {str(e)}",
         ) from e
+
+
+@router.get(
+    "/articles",
+    summary="List stored articles, most recently fetched first",
+    response_model=ArticleListResponse,
+)
+async def list_articles(
+    limit: int = Query(50, ge=1, le=200, description="Articles per page"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+) -> ArticleListResponse:
+    """
+    Returns one page of stored article metadata. Pages are keyed on
+    (fetched_at, id) and read from a covering index, so content is never
+    loaded and deep pages are as fast as the first.
+    """
+    try:
+        page = await asyncio.to_thread(get_article_store().list_articles, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+    return ArticleListResponse(
+        items=[ArticleSummarySchema(**vars(article)) for article in page.items],
+        next_cursor=page.next_cursor,
+    )
+
+
+@router.get(
+    "/articles/search",
+    summary="Full-text search stored articles",
+    response_model=ArticleSearchResponse,
+)
+async def search_articles(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+) -> ArticleSearchResponse:
+    """
+    Returns the articles containing every word of the query (after
+    stemming), best BM25 match first, each with a highlighted snippet.
+    """
+    hits = await asyncio.to_thread(get_article_store().search, q, limit)
+    return ArticleSearchResponse(
+        query=q, results=[ArticleSearchHitSchema(**vars(hit)) for hit in hits]
+    )
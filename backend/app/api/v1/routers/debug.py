@@ -0,0 +1,46 @@
+"""Debug API Router"""
+
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from backend.app.core.config import settings
+from backend.app.core.memory import get_memory_profiler, take_sample
+from backend.app.schemas.debug import MemoryDebugResponse
+
+router = APIRouter()
+
+
+def _require_debug_endpoints() -> None:
+    if not settings.DEBUG_ENDPOINTS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+
+@router.get(
+    "/memory",
+    response_model=MemoryDebugResponse,
+    summary="Memory usage and allocation growth per ingestion cycle",
+)
+async def memory_usage(
+    top: int = Query(25, ge=1, le=500, description="Allocation sites to list"),
+):
+    """
+    Returns current RSS and GC counters, the largest live allocation sites,
+    and the memory reports of recent ingestion cycles.
+
+    Allocation sites are only available when MEMORY_PROFILING_ENABLED is
+    set. Served only when DEBUG_ENDPOINTS_ENABLED is set.
+    """
+    _require_debug_endpoints()
+    profiler = get_memory_profiler()
+    current = await asyncio.to_thread(take_sample)
+    allocations = await asyncio.to_thread(profiler.current_allocations, top)
+    return MemoryDebugResponse.model_validate(
+        {
+            "tracing": profiler.tracing,
+            "current": current,
+            "current_allocations": allocations,
+            "cycles": profiler.reports(),
+        },
+        from_attributes=True,
+    )
@@ -0,0 +1,265 @@
+"""Trends API Router"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from backend.app.core.config import settings
+from backend.app.core.sse import HEARTBEAT, SSE_HEADERS, SSE_MEDIA_TYPE, format_event
+from backend.app.db.pagination import InvalidCursorError
+from backend.app.llm_integration.generation import (
+    GenerationResult,
+    get_content_generator,
+)
+from backend.app.llm_integration.providers import (
+    LLMProviderError,
+    LLMUnavailableError,
+)
+from backend.app.schemas.content_generation import (
+    GenerateContentRequest,
+    LLMContentResponse,
+)
+from backend.app.schemas.trends import (
+    TrendDataPointSchema,
+    TrendDetailResponse,
+    TrendListResponse,
+)
+from backend.app.trend_identification.history import (
+    Resolution,
+    get_trend_history_store,
+)
+from backend.app.trend_identification.trends import Trend, get_trend, list_trends
+from backend.app.trend_identification.updates import (
+    TooManySubscribersError,
+    get_trend_broadcaster,
+    trend_summary,
+)
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+async def _get_trend_or_404(trend_id: str) -> Trend:
+    trend = await asyncio.to_thread(get_trend, trend_id)
+    if trend is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Trend {trend_id} not found.",
+        )
+    return trend
+
+
+@router.get(
+    "",
+    summary="List trends, highest score first",
+    response_model=TrendListResponse,
+)
+async def get_trends(
+    limit: int = Query(20, ge=1, le=100, description="Trends per page"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+) -> TrendListResponse:
+    """
+    Returns one page of active trends. Pages are keyed on (score, id), so
+    every page is served by an index seek however deep it is.
+    """
+    try:
+        page = await asyncio.to_thread(list_trends, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+    return TrendListResponse(
+        items=[trend_summary(trend) for trend in page.items],
+        next_cursor=page.next_cursor,
+    )
+
+
+@router.get(
+    "/stream",
+    summary="Stream trend changes as server-sent events",
+    response_class=StreamingResponse,
+)
+async def stream_trends(
+    http_request: Request, last_event_id: str | None = Header(None)
+) -> StreamingResponse:
+    """
+    Pushes trend changes as server-sent events, so dashboards need not poll:
+
+    - `snapshot`: `{"revision": ..., "trends": [...]}`, the top trends
+      (highest score first), sent when the stream opens;
+    - `update`: `{"revision": ..., "changed": [...], "removed": [...]}`, the
+      summaries that changed and the ids that disappeared, after a trend
+      cycle commits. A client that falls behind gets one combined update.
+
+    Each event's id is its revision, so a client reconnecting with a
+    Last-Event-ID at the current revision is not sent the snapshot again.
+    Returns 503 when this process already streams to
+    TREND_STREAM_MAX_SUBSCRIBERS clients.
+    """
+    broadcaster = get_trend_broadcaster()
+    try:
+        subscription = await broadcaster.subscribe()
+    except TooManySubscribersError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
+        ) from e
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            snapshot = subscription.delivered
+            if last_event_id != snapshot.revision:
+                yield format_event("snapshot", snapshot.to_json(), snapshot.revision)
+            while not subscription.closed:
+                update = await subscription.next(
+                    settings.TREND_STREAM_HEARTBEAT_SECONDS
+                )
+                if await http_request.is_disconnected():
+                    return
+                if update is not None:
+                    yield format_event("update", update, update["revision"])
+                elif not subscription.closed:
+                    yield HEARTBEAT
+        finally:
+            broadcaster.unsubscribe(subscription)
+
+    return StreamingResponse(events(), media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
+
+
+@router.get(
+    "/{trend_id}",
+    summary="Get a trend and its history",
+    response_model=TrendDetailResponse,
+)
+async def get_trend_detail(
+    trend_id: str,
+    resolution: Resolution = Query("day", description="Period of each point"),
+    days: int = Query(365, ge=1, le=3650, description="History to return"),
+) -> TrendDetailResponse:
+    """
+    Returns a trend with its score and article count per period, read from
+    the precomputed rollups of the trend history store. Periods in which
+    the trend was not recorded are omitted.
+    """
+    trend = await _get_trend_or_404(trend_id)
+    now = datetime.now(timezone.utc)
+    series = await asyncio.to_thread(
+        get_trend_history_store().rollup,
+        int(trend.id),
+        int((now - timedelta(days=days)).timestamp()),
+        int(now.timestamp()) + 1,
+        resolution,
+    )
+    recorded = series.points > 0
+    history = [
+        TrendDataPointSchema(
+            date=datetime.fromtimestamp(start, timezone.utc),
+            score=score,
+            mention_frequency=mentions,
+        )
+        for start, score, mentions in zip(
+            series.start[recorded].tolist(),
+            series.score_last[recorded].tolist(),
+            series.mentions[recorded].tolist(),
+        )
+    ]
+    return TrendDetailResponse(
+        **trend_summary(trend).model_dump(), resolution=resolution, history=history
+    )
+
+
+@router.post(
+    "/{trend_id}/generate-content",
+    summary="Generate marketing content ideas for a trend",
+    response_model=LLMContentResponse,
+)
+async def generate_trend_content(
+    trend_id: str, request: GenerateContentRequest | None = None
+) -> LLMContentResponse:
+    """
+    Generates email subject lines, body copy and campaign themes for a trend.
+
+    Results are cached per trend version and request parameters, and
+    concurrent identical requests share a single LLM call.
+    """
+    trend = await _get_trend_or_404(trend_id)
+    try:
+        result = await get_content_generator().generate(
+            trend, request or GenerateContentRequest()
+        )
+    except LLMUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
+        ) from e
+    except LLMProviderError as e:
+        logger.error("Content generation failed for trend %s: %s", trend_id, e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to generate content: {e}",
+        ) from e
+    return LLMContentResponse(
+        trend_id=trend.id,
+        trend_name=trend.name,
+        generated_content=result.content,
+        cached=result.cached,
+    )
+
+
+@router.post(
+    "/{trend_id}/generate-content/stream",
+    summary="Stream marketing content ideas for a trend as server-sent events",
+    response_class=StreamingResponse,
+)
+async def stream_trend_content(
+    trend_id: str, http_request: Request, request: GenerateContentRequest | None = None
+) -> StreamingResponse:
+    """
+    Streams generated content as server-sent events:
+
+    - `token`: `{"text": ...}` for each piece of the completion;
+    - `done`: the full LLMContentResponse once generation has finished;
+    - `error`: `{"status_code": ..., "detail": ...}` if generation fails.
+
+    Generation stops when the client disconnects. Finished results are
+    written to the same cache as the non-streaming endpoint.
+    """
+    trend = await _get_trend_or_404(trend_id)
+    params = request or GenerateContentRequest()
+
+    async def events() -> AsyncIterator[str]:
+        stream = None
+        try:
+            # Inside the try: building the provider can fail (e.g. no API
+            # key), and by now the 200 has been sent.
+            stream = get_content_generator().stream(trend, params)
+            async for item in stream:
+                if await http_request.is_disconnected():
+                    logger.info("Client disconnected; stopping trend %s.", trend_id)
+                    return
+                if isinstance(item, GenerationResult):
+                    response = LLMContentResponse(
+                        trend_id=trend.id,
+                        trend_name=trend.name,
+                        generated_content=item.content,
+                        cached=item.cached,
+                    )
+                    yield format_event("done", response.model_dump())
+                else:
+                    yield format_event("token", {"text": item})
+        except LLMProviderError as e:
+            logger.error("Content streaming failed for trend %s: %s", trend_id, e)
+            code = (
+                status.HTTP_503_SERVICE_UNAVAILABLE
+                if isinstance(e, LLMUnavailableError)
+                else status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+            yield format_event("error", {"status_code": code, "detail": str(e)})
+        finally:
+            # Closes the upstream provider stream if we stopped early.
+            if stream is not None:
+                await stream.aclose()
+
+    return StreamingResponse(events(), media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
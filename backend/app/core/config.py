@@ -4,6 +4,7 @@ environment variables, default values, and validation.
 It also sets up basic logging configuration."""
 
 import logging
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -24,10 +25,186 @@ class Settings(BaseSettings):
         "https://www.marketingdive.com/",
     ]
 
+    # Optional JSON source registry file with per-source priority, poll
+    # interval and enabled flag. Reloaded on change; when empty,
+    # NEWS_SOURCES is used instead.
+    SOURCE_REGISTRY_PATH: str = ""
+
     # Delay between Jina AI Reader fetches to respect rate limits
     JINA_FETCH_DELAY_SECONDS: float = 4.0
 
-    SCHEDULER_PROCESSING_DELAY_SECONDS: float = 0.1
+    # Every Jina request takes a token from the bucket named
+    # JINA_RATE_LIMIT_KEY, refilled once per JINA_FETCH_DELAY_SECONDS and
+    # holding up to JINA_RATE_LIMIT_BURST tokens. Buckets live in this
+    # process ("local"), in shared memory for every process on the host
+    # ("shm", files under RATE_LIMIT_SHM_PATH), or in the database for
+    # every replica sharing DATABASE_PATH ("database"). RATE_LIMIT_QUOTAS
+    # sets (requests per second, burst) per key, as JSON.
+    RATE_LIMIT_BACKEND: Literal["local", "shm", "database"] = "local"
+    RATE_LIMIT_SHM_PATH: str = "/dev/shm/mailchimp-trends-rate-limits"
+    RATE_LIMIT_QUOTAS: dict[str, tuple[float, float]] = {}
+    JINA_RATE_LIMIT_KEY: str = "jina"
+    JINA_RATE_LIMIT_BURST: float = 1.0
+
+    # "record" appends every Jina request and response to the archive
+    # directory JINA_ARCHIVE_PATH; "replay" serves responses from it instead
+    # of the network, with their recorded latency if JINA_REPLAY_REALTIME
+    # (and the rate limit), otherwise at full speed.
+    JINA_ARCHIVE_MODE: Literal["off", "record", "replay"] = "off"
+    JINA_ARCHIVE_PATH: str = "jina_archive"
+    JINA_REPLAY_REALTIME: bool = False
+
+    # Hedge slow Jina requests with a second request past this latency
+    # percentile. Hedges are capped at JINA_HEDGE_MAX_RATIO of all requests.
+    JINA_HEDGING_ENABLED: bool = False
+    JINA_HEDGE_PERCENTILE: float = 0.95
+    JINA_HEDGE_MAX_RATIO: float = 0.1
+    JINA_HEDGE_MIN_SAMPLES: int = 20
+
+    # Unfinished fetch cycles younger than this are resumed on the next run
+    # (0 disables resuming). On shutdown, in-flight cycles get this long to
+    # finish before being cancelled and left to resume from their checkpoint.
+    FETCH_CHECKPOINT_STALENESS_SECONDS: float = 3600.0
+    # A running cycle belongs to its process until its heartbeat, renewed
+    # every third of this while it runs, is this old; until then other
+    # processes do not start a cycle.
+    FETCH_CHECKPOINT_HEARTBEAT_TIMEOUT_SECONDS: float = 300.0
+    SCHEDULER_SHUTDOWN_DRAIN_SECONDS: float = 30.0
+
+    # Fetch sources concurrently through per-host queues instead of one at a
+    # time. The Jina budget is still the shared rate limit above; each host
+    # additionally gets its own concurrency cap and minimum interval between
+    # requests.
+    FETCH_FRONTIER_ENABLED: bool = False
+    FETCH_FRONTIER_WORKERS: int = 8
+    FETCH_HOST_CONCURRENCY: int = 2
+    FETCH_HOST_MIN_INTERVAL_SECONDS: float = 1.0
+
+    # SQLite database holding raw article content and ingestion state
+    DATABASE_PATH: str = "mailchimp_trends.db"
+
+    # Per-source zstd dictionary compression of stored article bodies
+    COMPRESSION_LEVEL: int = 3
+    COMPRESSION_DICT_SIZE_BYTES: int = 64 * 1024
+    # Number of recent bodies per source used as training samples
+    COMPRESSION_DICT_SAMPLE_COUNT: int = 200
+    COMPRESSION_DICT_MIN_SAMPLES: int = 8
+    # Retrain a source's dictionary after this many new articles
+    COMPRESSION_DICT_RETRAIN_EVERY: int = 100
+
+    # Content-defined chunking of stored bodies for deduplication: chunks are
+    # at least MIN and at most MAX bytes, cut on average AVG (a power of two)
+    # bytes past MIN.
+    CONTENT_CHUNK_MIN_BYTES: int = 256
+    CONTENT_CHUNK_AVG_BYTES: int = 1024
+    CONTENT_CHUNK_MAX_BYTES: int = 8192
+
+    # Content-addressed embedding cache (memory-mapped matrix directory)
+    EMBEDDING_STORE_PATH: str = "embeddings"
+    EMBEDDING_DIMENSION: int = 256
+    # Similarity search switches from exhaustive to IVF at this many vectors
+    EMBEDDING_IVF_THRESHOLD: int = 5000
+    # IVF partitions (0 = sqrt of the collection size) and partitions scanned
+    EMBEDDING_IVF_LISTS: int = 0
+    EMBEDDING_IVF_PROBES: int = 8
+
+    # Online topic clustering of newly stored articles after each fetch cycle
+    TOPIC_CLUSTERING_ENABLED: bool = True
+    TOPIC_CLUSTER_BATCH_SIZE: int = 256
+    # Minimum cosine similarity to join a cluster; below it a cluster spawns
+    TOPIC_CLUSTER_SPAWN_THRESHOLD: float = 0.35
+    # Clusters whose centroids drift closer than this are merged
+    TOPIC_CLUSTER_MERGE_THRESHOLD: float = 0.8
+    TOPIC_CLUSTER_MAX_CLUSTERS: int = 200
+    # Caps a cluster's accumulated weight so old articles fade out (drift)
+    TOPIC_CLUSTER_MAX_WEIGHT: float = 500.0
+
+    # Trend history: memory-mapped columnar segments and hour/day/week
+    # rollups. Raw points and hourly rollups are compacted away after their
+    # retention; daily and weekly rollups are kept.
+    TREND_HISTORY_PATH: str = "trend_history"
+    TREND_HISTORY_RAW_RETENTION_DAYS: float = 30.0
+    TREND_HISTORY_HOURLY_RETENTION_DAYS: float = 90.0
+
+    # Trend changes pushed over /api/v1/trends/stream: the top
+    # TREND_STREAM_MAX_TRENDS trends, re-checked every
+    # TREND_STREAM_POLL_SECONDS for cycles committed by other processes, with
+    # a keepalive every TREND_STREAM_HEARTBEAT_SECONDS and at most
+    # TREND_STREAM_MAX_SUBSCRIBERS streams per process.
+    TREND_STREAM_MAX_TRENDS: int = 100
+    TREND_STREAM_POLL_SECONDS: float = 5.0
+    TREND_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    TREND_STREAM_MAX_SUBSCRIBERS: int = 1000
+
+    # Dashboard snapshot served by /api/v1/dashboard, rebuilt after every
+    # fetch cycle: the top DASHBOARD_MAX_TRENDS trends with daily sparklines
+    # over the last DASHBOARD_SPARKLINE_DAYS, stored gzipped at
+    # DASHBOARD_SNAPSHOT_PATH so it survives restarts.
+    DASHBOARD_SNAPSHOT_PATH: str = "dashboard_snapshot.json.gz"
+    DASHBOARD_MAX_TRENDS: int = 50
+    DASHBOARD_SPARKLINE_DAYS: int = 30
+
+    # Micro-batched sentiment/topic inference: a batch is flushed at
+    # INFERENCE_MAX_BATCH_SIZE items or INFERENCE_MAX_WAIT_MS after its first
+    INFERENCE_MAX_BATCH_SIZE: int = 32
+    INFERENCE_MAX_WAIT_MS: float = 10.0
+    INFERENCE_WORKERS: int = 2
+    # Long articles are analyzed in sentence-aligned windows of this size
+    ARTICLE_WINDOW_CHARS: int = 2000
+    ARTICLE_WINDOW_OVERLAP_CHARS: int = 200
+
+    # Version stored with every article analysis. Bump it when the models,
+    # topic ontology or scoring change, then run `make backfill` to
+    # recompute stored articles: batches of BACKFILL_BATCH_SIZE articles on
+    # BACKFILL_WORKERS processes (0 = one per CPU) at nice level
+    # BACKFILL_NICE, paced to BACKFILL_MAX_ARTICLES_PER_SECOND (0 = no cap).
+    ANALYSIS_VERSION: str = "1"
+    BACKFILL_WORKERS: int = 0
+    BACKFILL_BATCH_SIZE: int = 200
+    BACKFILL_MAX_ARTICLES_PER_SECOND: float = 0.0
+    BACKFILL_NICE: int = 10
+
+    # LLM content generation ("stub" is a deterministic offline provider)
+    LLM_PROVIDER: Literal["stub", "anthropic"] = "stub"
+    ANTHROPIC_API_KEY: str | None = None
+    ANTHROPIC_MODEL: str = "claude-3-haiku-20240307"
+    LLM_MAX_TOKENS: int = 1024
+    LLM_TEMPERATURE: float = 0.7
+    LLM_TIMEOUT_SECONDS: float = 60.0
+    # Simulated completion latency of the stub provider
+    LLM_STUB_LATENCY_SECONDS: float = 0.5
+    # Generated content is cached per trend version, template and parameters
+    GENERATION_CACHE_MAX_ENTRIES: int = 256
+    GENERATION_CACHE_TTL_SECONDS: float = 3600.0
+
+    # Per-cycle memory reports: RSS and GC counts are always recorded;
+    # tracemalloc snapshots (with this many frames per allocation site)
+    # only when MEMORY_PROFILING_ENABLED is set.
+    MEMORY_PROFILING_ENABLED: bool = False
+    MEMORY_PROFILING_FRAMES: int = 1
+    MEMORY_PROFILING_TOP_N: int = 25
+    MEMORY_PROFILING_HISTORY: int = 20
+    # Serve /api/v1/debug endpoints (they expose source paths and internals)
+    DEBUG_ENDPOINTS_ENABLED: bool = False
+
+    # Readiness (/ready) and /metrics: dependency checks and backlog figures
+    # are cached this long so frequent probes stay cheap. A pod is not ready
+    # while its event loop lags more than the maximum or, if the maximum is
+    # above zero, while more than READINESS_MAX_QUEUE_DEPTH tasks are queued.
+    READINESS_CACHE_SECONDS: float = 5.0
+    READINESS_MAX_EVENT_LOOP_LAG_SECONDS: float = 0.5
+    READINESS_MAX_QUEUE_DEPTH: int = 0
+    EVENT_LOOP_LAG_INTERVAL_SECONDS: float = 0.5
+
+    # "inprocess" runs ingestion inside the API process; "worker" makes the
+    # API only enqueue tasks for separate ingestion worker processes.
+    INGESTION_MODE: Literal["inprocess", "worker"] = "inprocess"
+    WORKER_POLL_INTERVAL_SECONDS: float = 2.0
+    # A claimed task reappears for other workers if not acked within this;
+    # the worker running it extends the lease every third of it.
+    WORKER_VISIBILITY_TIMEOUT_SECONDS: float = 600.0
+    WORKER_MAX_ATTEMPTS: int = 5
+    WORKER_RETRY_DELAY_SECONDS: float = 30.0
 
     CORS_ORIGINS: list[str] = [
         "http://localhost",  # General localhost for flexibility if needed
@@ -36,9 +213,6 @@ class Settings(BaseSettings):
         "https://your-production-domain.com",
     ]
 
-    # Example of another setting that might be needed later
-    # ANTHROPIC_API_KEY: Optional[str] = None
-
     model_config = SettingsConfigDict(
         env_file=".env", extra="ignore", case_sensitive=False
     )
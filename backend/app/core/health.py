@@ -0,0 +1,324 @@
+"""Readiness checks and autoscaling metrics.
+
+/health only says the process is up. Readiness also looks at the state
+that decides whether a pod should receive traffic, and at the backlog that
+decides how many ingestion workers are needed:
+
+- event-loop lag, measured by a task that sleeps for a fixed interval and
+  records how late it wakes up; a saturated pod lags;
+- work queue depth and how long the oldest ready task has waited;
+- ingestion lag, the time since the last fetch cycle completed;
+- dependency state: the SQLite database and the LLM provider.
+
+Database reads and dependency checks are cached for a few seconds, so
+probes and metric scrapes stay cheap however often they arrive. The same
+figures are served in the Prometheus text format at /metrics, where a
+metrics adapter can expose them to a HorizontalPodAutoscaler.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Generic, TypeVar
+
+from backend.app.core.config import settings
+from backend.app.core.memory import MemorySample
+from backend.app.data_ingestion.checkpoint import get_checkpoint_store
+from backend.app.llm_integration.providers import LLMProviderError, get_llm_provider
+from backend.app.worker.queue import get_work_queue
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Cached(Generic[T]):
+    """
+    Caches the result (or exception) of a blocking call for ttl seconds.
+
+    The call runs in a worker thread. Two probes arriving just as an entry
+    expires may both refresh it; that is harmless and needs no lock.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[], T],
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._fn = fn
+        self.ttl = ttl
+        self._clock = clock
+        self._expires_at = float("-inf")
+        self._value: T | None = None
+        self._error: Exception | None = None
+
+    def _refresh(self) -> None:
+        try:
+            self._value, self._error = self._fn(), None
+        except (sqlite3.Error, OSError) as e:
+            self._value, self._error = None, e
+        self._expires_at = self._clock() + self.ttl
+
+    async def get(self) -> T:
+        """Returns the cached result, refreshing it if it has expired."""
+        if self._clock() >= self._expires_at:
+            await asyncio.to_thread(self._refresh)
+        if self._error is not None:
+            raise self._error
+        return self._value  # type: ignore[return-value]
+
+
+class EventLoopLagMonitor:
+    """Measures how late the event loop runs a periodic sleep."""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lag_seconds = max(0.0, loop.time() - start - self.interval)
+            self.max_lag_seconds = max(self.max_lag_seconds, self.lag_seconds)
+
+    def start(self) -> None:
+        """Starts measuring on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops measuring."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+@dataclass(frozen=True)
+class Backlog:
+    """Ingestion backlog figures read from the database."""
+
+    ingestion_lag_seconds: float | None
+    queue_depth: int
+    queue_oldest_age_seconds: float | None
+
+
+def read_backlog() -> Backlog:
+    """
+    Reads the queue depth and the time since the last completed fetch cycle.
+
+    Raises:
+        sqlite3.Error: If the database cannot be read.
+    """
+    queue = get_work_queue()
+    last_completed = get_checkpoint_store().last_completed_at()
+    return Backlog(
+        ingestion_lag_seconds=(
+            (datetime.now(timezone.utc) - last_completed).total_seconds()
+            if last_completed
+            else None
+        ),
+        queue_depth=queue.depth(),
+        queue_oldest_age_seconds=queue.oldest_ready_age(),
+    )
+
+
+def check_llm() -> str | None:
+    """Returns why the configured LLM provider is unusable, or None."""
+    try:
+        get_llm_provider()
+    except LLMProviderError as e:
+        return str(e)
+    return None
+
+
+@dataclass(frozen=True)
+class DependencyStatus:
+    """Whether a dependency is usable; critical ones gate readiness."""
+
+    name: str
+    ok: bool
+    critical: bool
+    detail: str | None = None
+
+
+@dataclass(frozen=True)
+class ReadinessReport:
+    """Everything /ready and /metrics report."""
+
+    ready: bool
+    event_loop_lag_seconds: float
+    backlog: Backlog | None
+    dependencies: list[DependencyStatus]
+    reasons: list[str] = field(default_factory=list)
+
+
+class ReadinessMonitor:
+    """Builds readiness reports from cached checks and the loop monitor."""
+
+    def __init__(
+        self,
+        *,
+        cache_seconds: float = 5.0,
+        max_event_loop_lag: float = 0.5,
+        max_queue_depth: int = 0,
+        lag_interval: float = 0.5,
+    ):
+        self.max_event_loop_lag = max_event_loop_lag
+        self.max_queue_depth = max_queue_depth
+        self.event_loop = EventLoopLagMonitor(lag_interval)
+        self._backlog = Cached(read_backlog, cache_seconds)
+        self._llm = Cached(check_llm, cache_seconds)
+
+    def start(self) -> None:
+        """Starts event-loop lag measurement."""
+        self.event_loop.start()
+
+    async def close(self) -> None:
+        """Stops event-loop lag measurement."""
+        await self.event_loop.stop()
+
+    async def report(self) -> ReadinessReport:
+        """Checks readiness, from cache where the cache is fresh."""
+        reasons = []
+        backlog = None
+        try:
+            backlog = await self._backlog.get()
+            database = DependencyStatus("database", ok=True, critical=True)
+        except (sqlite3.Error, OSError) as e:
+            database = DependencyStatus("database", False, True, str(e))
+            reasons.append(f"database unavailable: {e}")
+        llm_error = await self._llm.get()
+        llm = DependencyStatus("llm", llm_error is None, False, llm_error)
+
+        lag = self.event_loop.lag_seconds
+        if lag > self.max_event_loop_lag:
+            reasons.append(
+                f"event loop lag {lag:.3f}s exceeds {self.max_event_loop_lag}s"
+            )
+        if (
+            backlog is not None
+            and self.max_queue_depth > 0
+            and backlog.queue_depth > self.max_queue_depth
+        ):
+            reasons.append(
+                f"queue depth {backlog.queue_depth} exceeds {self.max_queue_depth}"
+            )
+        if reasons:
+            logger.warning("Not ready: %s.", "; ".join(reasons))
+        return ReadinessReport(
+            ready=not reasons,
+            event_loop_lag_seconds=lag,
+            backlog=backlog,
+            dependencies=[database, llm],
+            reasons=reasons,
+        )
+
+
+def format_metrics(report: ReadinessReport, memory: MemorySample | None = None) -> str:
+    """
+    Renders a report, and optionally a memory sample of this process, as
+    Prometheus text exposition format gauges.
+    """
+    gauges: list[tuple[str, str, list[tuple[str, float]]]] = [
+        ("trends_ready", "1 if the pod accepts traffic.", [("", report.ready)]),
+        (
+            "trends_event_loop_lag_seconds",
+            "How late the event loop ran its last periodic check.",
+            [("", report.event_loop_lag_seconds)],
+        ),
+        (
+            "trends_dependency_up",
+            "1 if the dependency is usable.",
+            [(f'{{dependency="{d.name}"}}', d.ok) for d in report.dependencies],
+        ),
+    ]
+    backlog = report.backlog
+    if backlog is not None:
+        gauges.append(
+            (
+                "trends_work_queue_depth",
+                "Queued ingestion tasks, including leased ones.",
+                [("", backlog.queue_depth)],
+            )
+        )
+        if backlog.queue_oldest_age_seconds is not None:
+            gauges.append(
+                (
+                    "trends_work_queue_oldest_age_seconds",
+                    "How long the oldest ready task has waited.",
+                    [("", backlog.queue_oldest_age_seconds)],
+                )
+            )
+        if backlog.ingestion_lag_seconds is not None:
+            gauges.append(
+                (
+                    "trends_ingestion_lag_seconds",
+                    "Time since the last fetch cycle completed.",
+                    [("", backlog.ingestion_lag_seconds)],
+                )
+            )
+    if memory is not None:
+        generations = range(len(memory.gc_counts))
+        gauges += [
+            (
+                "process_resident_memory_bytes",
+                "Resident memory size in bytes.",
+                [("", memory.rss_bytes)],
+            ),
+            (
+                "trends_gc_objects",
+                "Allocations minus deallocations since the generation was collected.",
+                [(f'{{generation="{g}"}}', memory.gc_counts[g]) for g in generations],
+            ),
+            (
+                "trends_gc_collections",
+                "Times the generation has been collected.",
+                [
+                    (f'{{generation="{g}"}}', count)
+                    for g, count in enumerate(memory.gc_collections)
+                ],
+            ),
+        ]
+        if memory.traced_bytes is not None:
+            gauges.append(
+                (
+                    "trends_traced_memory_bytes",
+                    "Memory traced by tracemalloc.",
+                    [("", memory.traced_bytes)],
+                )
+            )
+    lines = []
+    for name, description, samples in gauges:
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} gauge"]
+        lines += [f"{name}{labels} {float(value)!r}" for labels, value in samples]
+    return "\n".join(lines) + "\n"
+
+
+@lru_cache(maxsize=1)
+def get_readiness_monitor() -> ReadinessMonitor:
+    """Returns the process-wide ReadinessMonitor, creating it on first use."""
+    return ReadinessMonitor(
+        cache_seconds=settings.READINESS_CACHE_SECONDS,
+        max_event_loop_lag=settings.READINESS_MAX_EVENT_LOOP_LAG_SECONDS,
+        max_queue_depth=settings.READINESS_MAX_QUEUE_DEPTH,
+        lag_interval=settings.EVENT_LOOP_LAG_INTERVAL_SECONDS,
+    )
+
+
+async def close_readiness_monitor() -> None:
+    """Stops the process-wide ReadinessMonitor if it was created."""
+    # pylint: disable-next=too-many-function-args
+    if get_readiness_monitor.cache_info().currsize:
+        await get_readiness_monitor().close()
+        get_readiness_monitor.cache_clear()
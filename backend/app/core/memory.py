@@ -0,0 +1,247 @@
+"""Memory instrumentation for ingestion cycles.
+
+Every fetch cycle records process RSS and garbage collector counters at its
+start and end. When MEMORY_PROFILING_ENABLED is set, tracemalloc is also
+started and a snapshot is taken at both points, so each cycle report lists
+the allocation sites that grew the most during the cycle and the largest
+live allocation sites at its end. Recent reports are kept in memory for the
+debug API and a summary line is logged per cycle.
+
+tracemalloc slows allocation-heavy code down noticeably, so it is meant to
+be switched on while hunting a leak, not left on.
+"""
+
+import asyncio
+import gc
+import logging
+import os
+import resource
+import threading
+import tracemalloc
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Allocations made by tracemalloc itself and by the import system are noise.
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def read_rss_bytes() -> int:
+    """
+    Current resident set size of this process.
+
+    Reads /proc/self/statm where available (Linux); elsewhere falls back to
+    the peak RSS reported by getrusage.
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in kilobytes on Linux but bytes on macOS.
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+@dataclass(frozen=True)
+class MemorySample:
+    """Process memory and GC counters at one point in time."""
+
+    taken_at: datetime
+    rss_bytes: int
+    gc_counts: tuple[int, ...]
+    gc_collections: tuple[int, ...]
+    traced_bytes: int | None = None
+    traced_peak_bytes: int | None = None
+
+
+def take_sample() -> MemorySample:
+    """Samples RSS, GC generation counts and (if tracing) traced memory."""
+    traced_bytes = traced_peak_bytes = None
+    if tracemalloc.is_tracing():
+        traced_bytes, traced_peak_bytes = tracemalloc.get_traced_memory()
+    return MemorySample(
+        taken_at=datetime.now(timezone.utc),
+        rss_bytes=read_rss_bytes(),
+        gc_counts=gc.get_count(),
+        gc_collections=tuple(stats["collections"] for stats in gc.get_stats()),
+        traced_bytes=traced_bytes,
+        traced_peak_bytes=traced_peak_bytes,
+    )
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    """Live allocations (and their change over a cycle) at one traceback."""
+
+    location: str
+    size_bytes: int
+    count: int
+    size_diff_bytes: int = 0
+    count_diff: int = 0
+
+
+def _location(traceback: tracemalloc.Traceback) -> str:
+    return " <- ".join(f"{frame.filename}:{frame.lineno}" for frame in traceback)
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, limit: int) -> list[AllocationSite]:
+    """The limit largest allocation sites in a snapshot."""
+    return [
+        AllocationSite(_location(stat.traceback), stat.size, stat.count)
+        for stat in snapshot.statistics("traceback")[:limit]
+    ]
+
+
+def top_growth(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, limit: int
+) -> list[AllocationSite]:
+    """The limit allocation sites that grew the most between two snapshots."""
+    diffs = [
+        stat for stat in after.compare_to(before, "traceback") if stat.size_diff > 0
+    ]
+    diffs.sort(key=lambda stat: stat.size_diff, reverse=True)
+    return [
+        AllocationSite(
+            _location(stat.traceback),
+            stat.size,
+            stat.count,
+            stat.size_diff,
+            stat.count_diff,
+        )
+        for stat in diffs[:limit]
+    ]
+
+
+@dataclass(frozen=True)
+class CycleMemoryReport:
+    """Memory at the start and end of one ingestion cycle."""
+
+    label: str
+    start: MemorySample
+    end: MemorySample
+    top_growth: list[AllocationSite] = field(default_factory=list)
+    top_allocations: list[AllocationSite] = field(default_factory=list)
+
+    @property
+    def rss_delta_bytes(self) -> int:
+        """RSS growth over the cycle (negative if memory was returned)."""
+        return self.end.rss_bytes - self.start.rss_bytes
+
+
+class MemoryProfiler:
+    """Takes per-cycle memory samples and keeps the most recent reports."""
+
+    def __init__(
+        self,
+        tracing: bool = False,
+        frames: int = 1,
+        top_n: int = 25,
+        history: int = 20,
+    ):
+        self.tracing = tracing
+        self.frames = frames
+        self.top_n = top_n
+        self._reports: deque[CycleMemoryReport] = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        if tracing and not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            self._started_tracing = True
+
+    def _snapshot(self) -> tracemalloc.Snapshot | None:
+        if not (self.tracing and tracemalloc.is_tracing()):
+            return None
+        return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+    def _begin(self) -> tuple[MemorySample, tracemalloc.Snapshot | None]:
+        return take_sample(), self._snapshot()
+
+    def _finish(
+        self,
+        label: str,
+        start: MemorySample,
+        before: tracemalloc.Snapshot | None,
+    ) -> CycleMemoryReport:
+        after = self._snapshot()
+        end = take_sample()
+        report = CycleMemoryReport(
+            label=label,
+            start=start,
+            end=end,
+            top_growth=(
+                top_growth(before, after, self.top_n)
+                if before is not None and after is not None
+                else []
+            ),
+            top_allocations=(
+                top_allocations(after, self.top_n) if after is not None else []
+            ),
+        )
+        with self._lock:
+            self._reports.append(report)
+        logger.info(
+            "Memory after %s: RSS %.1f MiB (%+.1f MiB), GC counts %s.",
+            label,
+            end.rss_bytes / 2**20,
+            report.rss_delta_bytes / 2**20,
+            end.gc_counts,
+        )
+        return report
+
+    @asynccontextmanager
+    async def track(self, label: str) -> AsyncIterator[None]:
+        """Records a CycleMemoryReport for the enclosed block."""
+        start, before = await asyncio.to_thread(self._begin)
+        try:
+            yield
+        finally:
+            await asyncio.to_thread(self._finish, label, start, before)
+
+    def reports(self) -> list[CycleMemoryReport]:
+        """Recent cycle reports, oldest first."""
+        with self._lock:
+            return list(self._reports)
+
+    def current_allocations(self, limit: int | None = None) -> list[AllocationSite]:
+        """The largest live allocation sites now (empty unless tracing)."""
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return []
+        return top_allocations(snapshot, limit or self.top_n)
+
+    def close(self) -> None:
+        """Stops tracemalloc if this profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+@lru_cache(maxsize=1)
+def get_memory_profiler() -> MemoryProfiler:
+    """Returns the process-wide MemoryProfiler, creating it on first use."""
+    return MemoryProfiler(
+        tracing=settings.MEMORY_PROFILING_ENABLED,
+        frames=settings.MEMORY_PROFILING_FRAMES,
+        top_n=settings.MEMORY_PROFILING_TOP_N,
+        history=settings.MEMORY_PROFILING_HISTORY,
+    )
+
+
+def close_memory_profiler() -> None:
+    """Closes the process-wide MemoryProfiler if it was created."""
+    # pylint: disable-next=too-many-function-args
+    if get_memory_profiler.cache_info().currsize:
+        get_memory_profiler().close()
+        get_memory_profiler.cache_clear()
@@ -0,0 +1,19 @@
+"""Server-sent event (text/event-stream) formatting helpers."""
+
+import json
+
+SSE_MEDIA_TYPE = "text/event-stream"
+# Stop proxies (e.g. nginx) from buffering the stream and clients caching it.
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+# A comment line; keeps idle connections from being closed by proxies.
+HEARTBEAT = ": keepalive\n\n"
+
+
+def format_event(event: str, data: object, event_id: str | None = None) -> str:
+    """
+    Encodes one server-sent event with a JSON payload. A client that
+    reconnects sends the last event_id it saw as the Last-Event-ID header.
+    """
+    payload = json.dumps(data, separators=(",", ":"))
+    header = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{header}event: {event}\ndata: {payload}\n\n"
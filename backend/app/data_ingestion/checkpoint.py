@@ -0,0 +1,286 @@
+"""Durable checkpoints for article fetch cycles.
+
+Every fetch cycle records its source list in SQLite and marks each source
+done as soon as it has been attempted. If the process stops partway through
+a cycle, the next run resumes the same cycle and fetches only the sources
+that are still outstanding, provided the cycle started within the
+configured staleness window. Older unfinished cycles are abandoned and a
+fresh cycle is started instead.
+
+Several processes share the database (the API's manual trigger, the
+scheduler, ingestion worker replicas), so a running cycle records its
+owner and a heartbeat, renewed periodically by the running process and as
+each source is marked done. Only a cycle whose heartbeat has expired is
+resumed or abandoned; while another run's heartbeat is live, starting a
+cycle raises CycleInProgressError.
+"""
+
+import logging
+import os
+import socket
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+from backend.app.core.config import settings
+from backend.app.db.database import connect
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fetch_cycles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    status TEXT NOT NULL DEFAULT 'running',
+    owner TEXT,
+    heartbeat_at TEXT
+);
+CREATE TABLE IF NOT EXISTS fetch_cycle_items (
+    cycle_id INTEGER NOT NULL REFERENCES fetch_cycles (id),
+    position INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (cycle_id, position)
+);
+-- mark_done looks items up by URL.
+CREATE INDEX IF NOT EXISTS ix_fetch_cycle_items_url
+    ON fetch_cycle_items (cycle_id, url);
+"""
+
+# Databases created before heartbeats: unowned running cycles count as
+# expired.
+MIGRATE_HEARTBEAT = """
+ALTER TABLE fetch_cycles ADD COLUMN owner TEXT;
+ALTER TABLE fetch_cycles ADD COLUMN heartbeat_at TEXT;
+"""
+
+
+class CycleInProgressError(RuntimeError):
+    """Raised when another run's fetch cycle still has a live heartbeat."""
+
+
+def _owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+@dataclass(frozen=True)
+class FetchCycle:
+    """A fetch cycle and the sources it still has to fetch."""
+
+    id: int
+    pending_urls: list[str]
+    total: int
+    resumed: bool
+
+
+class CycleCheckpointStore:
+    """Persists fetch cycle progress so interrupted cycles can resume."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._conn = connection
+        self._lock = threading.Lock()
+        columns = {
+            row["name"] for row in self._conn.execute("PRAGMA table_info(fetch_cycles)")
+        }
+        if columns and "heartbeat_at" not in columns:
+            self._conn.executescript(MIGRATE_HEARTBEAT)
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def start_or_resume(
+        self,
+        urls: list[str],
+        staleness_seconds: float,
+        now: datetime | None = None,
+        *,
+        heartbeat_timeout_seconds: float = 300.0,
+    ) -> FetchCycle:
+        """
+        Resumes the latest unfinished cycle if it is fresh, else starts one.
+
+        Cycles whose heartbeat is younger than heartbeat_timeout_seconds are
+        still being run by someone and are left alone.
+
+        Args:
+            urls: Sources for a new cycle (ignored when resuming).
+            staleness_seconds: Maximum age of an unfinished cycle that may be
+                resumed. Zero or less disables resuming.
+            now: Current time. Defaults to now (UTC).
+            heartbeat_timeout_seconds: How long a running cycle stays owned
+                after its last heartbeat.
+
+        Returns:
+            The cycle to run, owned by this process.
+
+        Raises:
+            CycleInProgressError: If a running cycle's heartbeat is live.
+        """
+        now = now or datetime.now(timezone.utc)
+        expired_before = now - timedelta(seconds=heartbeat_timeout_seconds)
+        owner = _owner()
+        with self._lock:
+            # Take the write lock first so that concurrent starts queue.
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cycle = self._claim(urls, staleness_seconds, now, expired_before, owner)
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        return cycle
+
+    def _claim(
+        self,
+        urls: list[str],
+        staleness_seconds: float,
+        now: datetime,
+        expired_before: datetime,
+        owner: str,
+    ) -> FetchCycle:
+        rows = self._conn.execute(
+            "SELECT id, started_at, owner, heartbeat_at FROM fetch_cycles "
+            "WHERE status = 'running' ORDER BY id DESC"
+        ).fetchall()
+        for row in rows:
+            if (
+                row["heartbeat_at"]
+                and datetime.fromisoformat(row["heartbeat_at"]) > expired_before
+            ):
+                raise CycleInProgressError(
+                    f"Fetch cycle {row['id']} is still running in {row['owner']}."
+                )
+        running = rows[0] if rows else None
+        if running is not None and staleness_seconds > 0:
+            started_at = datetime.fromisoformat(running["started_at"])
+            if now - started_at <= timedelta(seconds=staleness_seconds):
+                self._conn.execute(
+                    "UPDATE fetch_cycles SET owner = ?, heartbeat_at = ? WHERE id = ?",
+                    (owner, now.isoformat(), running["id"]),
+                )
+                return self._resume(running["id"])
+
+        abandoned = self._conn.execute(
+            "UPDATE fetch_cycles SET status = 'abandoned', finished_at = ? "
+            "WHERE status = 'running'",
+            (now.isoformat(),),
+        ).rowcount
+        if abandoned:
+            logger.info("Abandoned %s stale unfinished fetch cycle(s).", abandoned)
+        cursor = self._conn.execute(
+            "INSERT INTO fetch_cycles (started_at, owner, heartbeat_at) "
+            "VALUES (?, ?, ?)",
+            (now.isoformat(), owner, now.isoformat()),
+        )
+        cycle_id = int(cursor.lastrowid or 0)
+        self._conn.executemany(
+            "INSERT INTO fetch_cycle_items (cycle_id, position, url) VALUES (?, ?, ?)",
+            [(cycle_id, position, url) for position, url in enumerate(urls)],
+        )
+        return FetchCycle(
+            id=cycle_id, pending_urls=list(urls), total=len(urls), resumed=False
+        )
+
+    def _resume(self, cycle_id: int) -> FetchCycle:
+        rows = self._conn.execute(
+            "SELECT url, done FROM fetch_cycle_items WHERE cycle_id = ? "
+            "ORDER BY position",
+            (cycle_id,),
+        ).fetchall()
+        pending = [row["url"] for row in rows if not row["done"]]
+        return FetchCycle(
+            id=cycle_id, pending_urls=pending, total=len(rows), resumed=True
+        )
+
+    def mark_done(self, cycle_id: int, url: str, now: datetime | None = None) -> None:
+        """Marks a source as attempted within a cycle and renews its heartbeat."""
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            self._conn.execute(
+                "UPDATE fetch_cycle_items SET done = 1 WHERE cycle_id = ? AND url = ?",
+                (cycle_id, url),
+            )
+            self._conn.execute(
+                "UPDATE fetch_cycles SET heartbeat_at = ? WHERE id = ?",
+                (now.isoformat(), cycle_id),
+            )
+            self._conn.commit()
+
+    def outstanding(self, cycle_id: int) -> int:
+        """Number of sources in a cycle not yet marked done."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM fetch_cycle_items "
+                "WHERE cycle_id = ? AND done = 0",
+                (cycle_id,),
+            ).fetchone()[0]
+
+    def is_pending(self, cycle_id: int, url: str) -> bool:
+        """Whether a source is still outstanding in a running cycle."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM fetch_cycle_items AS i "
+                "JOIN fetch_cycles AS c ON c.id = i.cycle_id "
+                "WHERE i.cycle_id = ? AND i.url = ? AND i.done = 0 "
+                "AND c.status = 'running'",
+                (cycle_id, url),
+            ).fetchone()
+        return row is not None
+
+    def heartbeat(self, cycle_id: int, now: datetime | None = None) -> bool:
+        """
+        Renews the heartbeat of a cycle owned by this process.
+
+        Returns:
+            False if the cycle is no longer running or another process took
+            it over.
+        """
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            renewed = self._conn.execute(
+                "UPDATE fetch_cycles SET heartbeat_at = ? "
+                "WHERE id = ? AND status = 'running' AND owner = ?",
+                (now.isoformat(), cycle_id, _owner()),
+            ).rowcount
+            self._conn.commit()
+        return bool(renewed)
+
+    def complete(self, cycle_id: int, now: datetime | None = None) -> None:
+        """Marks a cycle as finished so it is never resumed."""
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            self._conn.execute(
+                "UPDATE fetch_cycles SET status = 'completed', finished_at = ? "
+                "WHERE id = ?",
+                (now.isoformat(), cycle_id),
+            )
+            self._conn.commit()
+
+    def last_completed_at(self) -> datetime | None:
+        """When the most recently completed cycle finished, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(finished_at) FROM fetch_cycles WHERE status = 'completed'"
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row[0] else None
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_checkpoint_store() -> CycleCheckpointStore:
+    """Returns the process-wide CycleCheckpointStore, creating it on first use."""
+    return CycleCheckpointStore(connect(settings.DATABASE_PATH))
+
+
+def close_checkpoint_store() -> None:
+    """Closes the process-wide CycleCheckpointStore if it was opened."""
+    # pylint: disable-next=too-many-function-args
+    if get_checkpoint_store.cache_info().currsize:
+        get_checkpoint_store().close()
+        get_checkpoint_store.cache_clear()
@@ -0,0 +1,86 @@
+"""Dictionary-based zstd compression for stored article bodies.
+Articles fetched from the same source share a large amount of boilerplate
+(navigation, footers, Jina markdown framing). A zstd dictionary trained on
+recent samples from that source captures the shared content once, so each
+compressed body only needs to encode what is specific to it.
+"""
+
+import logging
+import threading
+
+import zstandard as zstd
+
+logger = logging.getLogger(__name__)
+
+
+class DictionaryTrainingError(ValueError):
+    """Raised when a dictionary cannot be trained from the given samples."""
+
+
+def train_dictionary(samples: list[bytes], dict_size: int) -> bytes:
+    """
+    Trains a zstd dictionary from sample documents.
+
+    Args:
+        samples: Raw (uncompressed) sample documents.
+        dict_size: Maximum size of the trained dictionary in bytes.
+
+    Returns:
+        The serialized dictionary.
+
+    Raises:
+        DictionaryTrainingError: If zstd cannot build a dictionary, e.g.
+            because there are too few samples or they are too small.
+    """
+    if not samples:
+        raise DictionaryTrainingError("No samples supplied for dictionary training.")
+    try:
+        dictionary = zstd.train_dictionary(dict_size, samples)
+    except zstd.ZstdError as e:
+        raise DictionaryTrainingError(
+            f"zstd dictionary training failed on {len(samples)} samples: {e}"
+        ) from e
+    return dictionary.as_bytes()
+
+
+class ZstdCodec:
+    """
+    Compresses and decompresses payloads with an optional zstd dictionary.
+
+    zstd compressor and decompressor objects are not safe to share between
+    threads, so each thread lazily gets its own pair.
+    """
+
+    def __init__(self, dictionary: bytes | None = None, level: int = 3):
+        self.level = level
+        self._dict_data = zstd.ZstdCompressionDict(dictionary) if dictionary else None
+        self._local = threading.local()
+
+    @property
+    def has_dictionary(self) -> bool:
+        """True if this codec compresses with a trained dictionary."""
+        return self._dict_data is not None
+
+    def _compressor(self) -> zstd.ZstdCompressor:
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = zstd.ZstdCompressor(
+                level=self.level, dict_data=self._dict_data
+            )
+            self._local.compressor = compressor
+        return compressor
+
+    def _decompressor(self) -> zstd.ZstdDecompressor:
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = zstd.ZstdDecompressor(dict_data=self._dict_data)
+            self._local.decompressor = decompressor
+        return decompressor
+
+    def compress(self, data: bytes) -> bytes:
+        """Compresses data into a single zstd frame."""
+        return self._compressor().compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompresses a zstd frame produced by compress()."""
+        return self._decompressor().decompress(data)
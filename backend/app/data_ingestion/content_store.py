@@ -0,0 +1,726 @@
+"""Raw article content storage.
+This module persists the text fetched by the Jina AI Reader service into
+SQLite so that the NLP processing module can retrieve it later. Bodies are
+stored zstd-compressed; once enough articles from a source have been seen, a
+per-source dictionary is trained from recent samples and used for subsequent
+writes. Dictionaries are versioned (each training run inserts a new row) and
+every article records the dictionary it was written with, so reads always
+decompress transparently, even after a retrain.
+
+Bodies of URLs fetched before (such as the listing pages refetched every
+cycle) are split into content-defined chunks (see chunking) and each unique
+chunk is compressed and stored once, keyed by its digest; an article keeps
+the list of its chunk ids and is rebuilt from them on read. Repeated fetches
+of a listing page that changed slightly then only add their new chunks.
+Chunks compress worse one by one than a body does whole, so a URL seen for
+the first time keeps its whole compressed body, as do articles stored
+before chunking.
+
+Article text is also indexed for full-text search with SQLite FTS5. The
+index is an external-content table over a view that decompresses bodies on
+demand, so text is not stored twice; only the inverted index is. Every
+save_article adds the new article to the index in the same transaction.
+"""
+
+import hashlib
+import html
+import json
+import logging
+import re
+import sqlite3
+import struct
+import threading
+import urllib.parse
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from backend.app.core.config import settings
+from backend.app.data_ingestion.chunking import (
+    AVG_CHUNK_SIZE,
+    MAX_CHUNK_SIZE,
+    MIN_CHUNK_SIZE,
+    split_chunks,
+)
+from backend.app.data_ingestion.compression import (
+    DictionaryTrainingError,
+    ZstdCodec,
+    train_dictionary,
+)
+from backend.app.db.database import connect
+from backend.app.db.pagination import Page, decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS compression_dictionaries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    trained_through_id INTEGER NOT NULL,
+    sample_count INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_compression_dictionaries_source
+    ON compression_dictionaries (source, id);
+
+-- Unique body chunks, compressed with the dictionary current when first seen.
+CREATE TABLE IF NOT EXISTS content_chunks (
+    id INTEGER PRIMARY KEY,
+    digest BLOB NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    dictionary_id INTEGER REFERENCES compression_dictionaries (id),
+    data BLOB NOT NULL
+);
+
+-- content is empty when chunk_ids (packed little-endian int64 ids) is set.
+CREATE TABLE IF NOT EXISTS raw_articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    content BLOB NOT NULL,
+    content_size INTEGER NOT NULL,
+    dictionary_id INTEGER REFERENCES compression_dictionaries (id),
+    fetched_at TEXT NOT NULL,
+    chunk_ids BLOB
+);
+CREATE INDEX IF NOT EXISTS ix_raw_articles_source ON raw_articles (source, id);
+CREATE INDEX IF NOT EXISTS ix_raw_articles_source_url
+    ON raw_articles (source_url, fetched_at);
+-- Covers list_articles, so listing never reads the content blobs.
+CREATE INDEX IF NOT EXISTS ix_raw_articles_fetched_at
+    ON raw_articles (fetched_at, id, source_url, source, content_size);
+
+-- article_text() is registered on the connection by each ArticleStore.
+CREATE VIEW IF NOT EXISTS raw_article_text AS
+    SELECT id, article_text(content, dictionary_id, chunk_ids) AS content
+    FROM raw_articles;
+CREATE VIRTUAL TABLE IF NOT EXISTS article_search USING fts5(
+    content,
+    content = 'raw_article_text',
+    content_rowid = 'id',
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+"""
+
+# Databases created before chunking: add the column and rebuild the view.
+MIGRATE_CHUNK_IDS = """
+ALTER TABLE raw_articles ADD COLUMN chunk_ids BLOB;
+DROP VIEW IF EXISTS raw_article_text;
+"""
+
+SELECT_CHUNKS_SQL = (
+    "SELECT id, dictionary_id, data FROM content_chunks "
+    "WHERE id IN (SELECT value FROM json_each(?))"
+)
+
+# Best BM25 match first. Snippets are computed only for the returned rows.
+SEARCH_ARTICLES_SQL = (
+    "SELECT a.id, a.source_url, a.source, a.fetched_at, "
+    "snippet(article_search, 0, ?, ?, '…', ?) AS snippet, "
+    "bm25(article_search) AS bm25 "
+    "FROM article_search JOIN raw_articles AS a ON a.id = article_search.rowid "
+    "WHERE article_search MATCH ? ORDER BY article_search.rank LIMIT ?"
+)
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+# snippet() wraps matches in these private-use characters; the text is then
+# HTML-escaped and only they are turned into HIGHLIGHT_START/HIGHLIGHT_END.
+_MATCH_START = "\ue000"
+_MATCH_END = "\ue001"
+SNIPPET_TOKENS = 24
+
+_SEARCH_TERM_RE = re.compile(r"\w+")
+
+# Upper bound for id ranges left open.
+LAST_ROWID = 2**63 - 1
+
+# Newest first; the second form continues after a cursor.
+LIST_ARTICLES_SQL = (
+    "SELECT id, source_url, source, content_size, fetched_at FROM raw_articles "
+    "ORDER BY fetched_at DESC, id DESC LIMIT ?"
+)
+LIST_ARTICLES_AFTER_SQL = (
+    "SELECT id, source_url, source, content_size, fetched_at FROM raw_articles "
+    "WHERE (fetched_at, id) < (?, ?) ORDER BY fetched_at DESC, id DESC LIMIT ?"
+)
+
+
+def pack_chunk_ids(chunk_ids: list[int]) -> bytes:
+    """Packs chunk ids as little-endian int64s."""
+    return struct.pack(f"<{len(chunk_ids)}q", *chunk_ids)
+
+
+def unpack_chunk_ids(data: bytes) -> tuple[int, ...]:
+    """Unpacks chunk ids packed by pack_chunk_ids."""
+    return struct.unpack(f"<{len(data) // 8}q", data)
+
+
+def source_key(url: str) -> str:
+    """Returns the key used to group articles for dictionary training."""
+    return urllib.parse.urlsplit(url).netloc.lower() or "unknown"
+
+
+@dataclass(frozen=True)
+class StoredArticle:
+    """A raw article as read back from the store."""
+
+    id: int
+    source_url: str
+    source: str
+    content: str
+    fetched_at: datetime
+
+
+def highlight(snippet: str) -> str:
+    """HTML-escapes an FTS snippet and marks its matches up."""
+    return (
+        html.escape(snippet)
+        .replace(_MATCH_START, HIGHLIGHT_START)
+        .replace(_MATCH_END, HIGHLIGHT_END)
+    )
+
+
+def match_query(text: str) -> str | None:
+    """
+    Turns free text into an FTS5 query matching articles with all its words.
+
+    Each word is quoted, so FTS5 operators and punctuation in user input
+    are never interpreted. Returns None if text has no words.
+    """
+    terms = _SEARCH_TERM_RE.findall(text)
+    return " ".join(f'"{term}"' for term in terms) if terms else None
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """An article matching a full-text search."""
+
+    id: int
+    source_url: str
+    source: str
+    fetched_at: datetime
+    snippet: str
+    score: float
+
+
+@dataclass(frozen=True)
+class ArticleSummary:
+    """Article metadata for listings, without the content."""
+
+    id: int
+    source_url: str
+    source: str
+    content_size: int
+    fetched_at: datetime
+
+
+@dataclass(frozen=True)
+class StorageStats:
+    """Aggregate storage figures for raw articles and their chunks."""
+
+    article_count: int
+    raw_bytes: int
+    stored_bytes: int
+    chunk_count: int = 0
+    # Raw size of the unique chunks, and of the chunked articles built from them.
+    chunk_bytes: int = 0
+    chunked_article_bytes: int = 0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Uncompressed size divided by stored size (1.0 when empty)."""
+        if not self.stored_bytes:
+            return 1.0
+        return self.raw_bytes / self.stored_bytes
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Chunked article bytes per unique chunk byte (1.0 when empty)."""
+        if not self.chunk_bytes:
+            return 1.0
+        return self.chunked_article_bytes / self.chunk_bytes
+
+
+class ArticleStore:  # pylint: disable=too-many-instance-attributes
+    """SQLite-backed store for raw article text with dictionary compression."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        connection: sqlite3.Connection,
+        *,
+        level: int = 3,
+        dict_size: int = 64 * 1024,
+        sample_count: int = 200,
+        min_samples: int = 8,
+        retrain_every: int = 100,
+        chunk_sizes: tuple[int, int, int] = (
+            MIN_CHUNK_SIZE,
+            AVG_CHUNK_SIZE,
+            MAX_CHUNK_SIZE,
+        ),
+    ):
+        self._conn = connection
+        self._lock = threading.Lock()
+        self.level = level
+        self.dict_size = dict_size
+        self.sample_count = sample_count
+        self.min_samples = min_samples
+        self.retrain_every = retrain_every
+        # (min, avg, max) chunk sizes, see chunking.chunk_boundaries.
+        self.chunk_sizes = chunk_sizes
+        # Codecs by dictionary id (None = no dictionary) and the latest
+        # dictionary id per source.
+        self._codecs: dict[int | None, ZstdCodec] = {None: ZstdCodec(level=level)}
+        self._current_dictionary: dict[str, int | None] = {}
+        self._conn.create_function(
+            "article_text", 3, self._article_text, deterministic=True
+        )
+        indexed = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'article_search'"
+        ).fetchone()
+        columns = {
+            row["name"] for row in self._conn.execute("PRAGMA table_info(raw_articles)")
+        }
+        if columns and "chunk_ids" not in columns:
+            self._conn.executescript(MIGRATE_CHUNK_IDS)
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        if (
+            not indexed
+            and self._conn.execute("SELECT 1 FROM raw_articles LIMIT 1").fetchone()
+        ):
+            logger.warning(
+                "The article search index is new; run "
+                "`make search-index` "
+                "to index articles stored before it existed."
+            )
+
+    def _article_text(
+        self, content: bytes, dictionary_id: int | None, chunk_ids: bytes | None
+    ) -> str:
+        return self._body(content, dictionary_id, chunk_ids).decode("utf-8")
+
+    def _body(
+        self, content: bytes, dictionary_id: int | None, chunk_ids: bytes | None
+    ) -> bytes:
+        if chunk_ids is None:
+            return self._codec(dictionary_id).decompress(content)
+        ids = unpack_chunk_ids(chunk_ids)
+        chunks = {
+            row["id"]: self._codec(row["dictionary_id"]).decompress(row["data"])
+            for row in self._conn.execute(SELECT_CHUNKS_SQL, (json.dumps(ids),))
+        }
+        try:
+            return b"".join(chunks[chunk_id] for chunk_id in ids)
+        except KeyError as e:
+            raise LookupError(f"Content chunk {e.args[0]} not found.") from e
+
+    def _row_body(self, row: sqlite3.Row) -> bytes:
+        return self._body(row["content"], row["dictionary_id"], row["chunk_ids"])
+
+    def _store_chunks(
+        self, chunks: list[bytes], dictionary_id: int | None
+    ) -> tuple[list[int], int]:
+        """Stores the chunks not seen before; returns all ids and new bytes."""
+        ids = []
+        new_bytes = 0
+        for chunk in chunks:
+            digest = hashlib.blake2b(chunk, digest_size=16).digest()
+            row = self._conn.execute(
+                "SELECT id FROM content_chunks WHERE digest = ?", (digest,)
+            ).fetchone()
+            if row is None:
+                data = self._codec(dictionary_id).compress(chunk)
+                cursor = self._conn.execute(
+                    "INSERT INTO content_chunks (digest, size, dictionary_id, data) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT (digest) DO UPDATE SET "
+                    "digest = excluded.digest RETURNING id",
+                    (digest, len(chunk), dictionary_id, data),
+                )
+                row = cursor.fetchone()
+                new_bytes += len(data)
+            ids.append(row["id"])
+        return ids, new_bytes
+
+    def _codec(self, dictionary_id: int | None) -> ZstdCodec:
+        codec = self._codecs.get(dictionary_id)
+        if codec is None:
+            row = self._conn.execute(
+                "SELECT data FROM compression_dictionaries WHERE id = ?",
+                (dictionary_id,),
+            ).fetchone()
+            if row is None:
+                raise LookupError(f"Compression dictionary {dictionary_id} not found.")
+            codec = ZstdCodec(row["data"], level=self.level)
+            self._codecs[dictionary_id] = codec
+        return codec
+
+    def _latest_dictionary(self, source: str) -> sqlite3.Row | None:
+        return self._conn.execute(
+            "SELECT id, trained_through_id FROM compression_dictionaries "
+            "WHERE source = ? ORDER BY id DESC LIMIT 1",
+            (source,),
+        ).fetchone()
+
+    def _current_dictionary_id(self, source: str) -> int | None:
+        if source not in self._current_dictionary:
+            row = self._latest_dictionary(source)
+            self._current_dictionary[source] = row["id"] if row else None
+        return self._current_dictionary[source]
+
+    def _row_to_article(self, row: sqlite3.Row) -> StoredArticle:
+        return StoredArticle(
+            id=row["id"],
+            source_url=row["source_url"],
+            source=row["source"],
+            content=self._row_body(row).decode("utf-8"),
+            fetched_at=datetime.fromisoformat(row["fetched_at"]),
+        )
+
+    def save_article(
+        self, source_url: str, content: str, fetched_at: datetime | None = None
+    ) -> int:
+        """
+        Stores a fetched article body, compressed.
+
+        The body of a URL stored before is split into chunks and only the
+        new ones are compressed and stored; any other body is compressed
+        whole.
+
+        Args:
+            source_url: The URL the content was fetched from.
+            content: The extracted text returned by Jina AI Reader.
+            fetched_at: Fetch timestamp. Defaults to now (UTC).
+
+        Returns:
+            The id of the stored article.
+        """
+        source = source_key(source_url)
+        fetched_at = fetched_at or datetime.now(timezone.utc)
+        raw = content.encode("utf-8")
+        with self._lock:
+            dictionary_id = self._current_dictionary_id(source)
+            repeated = self._conn.execute(
+                "SELECT 1 FROM raw_articles WHERE source_url = ? LIMIT 1",
+                (source_url,),
+            ).fetchone()
+            if repeated:
+                chunks = split_chunks(raw, *self.chunk_sizes)
+                chunk_ids, new_bytes = self._store_chunks(chunks, dictionary_id)
+                body, packed_ids = b"", pack_chunk_ids(chunk_ids)
+            else:
+                chunks = [raw]
+                body, packed_ids = self._codec(dictionary_id).compress(raw), None
+                new_bytes = len(body)
+            cursor = self._conn.execute(
+                "INSERT INTO raw_articles "
+                "(source_url, source, content, content_size, dictionary_id, "
+                "fetched_at, chunk_ids) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    source_url,
+                    source,
+                    body,
+                    len(raw),
+                    dictionary_id,
+                    fetched_at.isoformat(),
+                    packed_ids,
+                ),
+            )
+            article_id = int(cursor.lastrowid or 0)
+            self._conn.execute(
+                "INSERT INTO article_search (rowid, content) VALUES (?, ?)",
+                (article_id, content),
+            )
+            self._conn.commit()
+            logger.debug(
+                "Stored article %s from %s: %s bytes in %s chunks, "
+                "%s new bytes stored (dictionary %s)",
+                article_id,
+                source_url,
+                len(raw),
+                len(chunks),
+                new_bytes,
+                dictionary_id,
+            )
+            if self._needs_training(source):
+                self._train_locked(source)
+        return article_id
+
+    def _needs_training(self, source: str) -> bool:
+        latest = self._latest_dictionary(source)
+        trained_through = latest["trained_through_id"] if latest else 0
+        new_articles = self._conn.execute(
+            "SELECT COUNT(*) FROM raw_articles WHERE source = ? AND id > ?",
+            (source, trained_through),
+        ).fetchone()[0]
+        threshold = self.retrain_every if latest else self.min_samples
+        return new_articles >= threshold
+
+    def train_dictionary(self, source: str) -> int | None:
+        """
+        Trains a new dictionary version for a source from its recent articles.
+
+        Args:
+            source: The source key (see source_key()).
+
+        Returns:
+            The new dictionary id, or None if training was not possible.
+        """
+        with self._lock:
+            return self._train_locked(source)
+
+    def _train_locked(self, source: str) -> int | None:
+        rows = self._conn.execute(
+            "SELECT id, content, dictionary_id, chunk_ids FROM raw_articles "
+            "WHERE source = ? ORDER BY id DESC LIMIT ?",
+            (source, self.sample_count),
+        ).fetchall()
+        if len(rows) < self.min_samples:
+            return None
+        samples = [self._row_body(row) for row in rows]
+        try:
+            data = train_dictionary(samples, self.dict_size)
+        except DictionaryTrainingError as e:
+            logger.warning("Skipping dictionary training for %s: %s", source, e)
+            return None
+
+        cursor = self._conn.execute(
+            "INSERT INTO compression_dictionaries "
+            "(source, trained_through_id, sample_count, created_at, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                source,
+                rows[0]["id"],
+                len(samples),
+                datetime.now(timezone.utc).isoformat(),
+                data,
+            ),
+        )
+        self._conn.commit()
+        dictionary_id = int(cursor.lastrowid or 0)
+        self._current_dictionary[source] = dictionary_id
+        logger.info(
+            "Trained compression dictionary %s for %s from %s samples (%s bytes).",
+            dictionary_id,
+            source,
+            len(samples),
+            len(data),
+        )
+        return dictionary_id
+
+    def get_article(self, article_id: int) -> StoredArticle | None:
+        """Returns the article with the given id, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM raw_articles WHERE id = ?", (article_id,)
+            ).fetchone()
+            return self._row_to_article(row) if row else None
+
+    def get_latest_article(self, source_url: str) -> StoredArticle | None:
+        """Returns the most recently fetched article for a URL, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM raw_articles WHERE source_url = ? "
+                "ORDER BY fetched_at DESC, id DESC LIMIT 1",
+                (source_url,),
+            ).fetchone()
+            return self._row_to_article(row) if row else None
+
+    def get_recent_articles(self, limit: int = 10) -> list[StoredArticle]:
+        """Returns the most recently stored articles, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM raw_articles ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+            return [self._row_to_article(row) for row in rows]
+
+    def get_articles_after(
+        self, after_id: int, limit: int = 100
+    ) -> list[StoredArticle]:
+        """Returns up to `limit` articles with an id above after_id, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM raw_articles WHERE id > ? ORDER BY id LIMIT ?",
+                (after_id, limit),
+            ).fetchall()
+            return [self._row_to_article(row) for row in rows]
+
+    def article_ids_after(
+        self, after_id: int, limit: int = 1000, up_to: int | None = None
+    ) -> list[int]:
+        """
+        Returns up to `limit` article ids above after_id (and at most up_to),
+        in ascending order, without reading any content.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM raw_articles WHERE id > ? AND id <= ? "
+                "ORDER BY id LIMIT ?",
+                (after_id, LAST_ROWID if up_to is None else up_to, limit),
+            ).fetchall()
+        return [row["id"] for row in rows]
+
+    def count_articles(self, after_id: int = 0, up_to: int | None = None) -> int:
+        """Returns the number of articles with after_id < id <= up_to."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM raw_articles WHERE id > ? AND id <= ?",
+                (after_id, LAST_ROWID if up_to is None else up_to),
+            ).fetchone()[0]
+
+    def max_article_id(self) -> int:
+        """Returns the highest article id, or 0 if there are no articles."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM raw_articles"
+            ).fetchone()[0]
+
+    def list_articles(
+        self, limit: int = 50, cursor: str | None = None
+    ) -> Page[ArticleSummary]:
+        """
+        Returns a page of articles, most recently fetched first.
+
+        Args:
+            limit: Maximum number of articles in the page.
+            cursor: next_cursor of the previous page, or None for the first.
+
+        Raises:
+            InvalidCursorError: If cursor is malformed.
+        """
+        if cursor is None:
+            sql, params = LIST_ARTICLES_SQL, (limit + 1,)
+        else:
+            fetched_at, article_id = decode_cursor(cursor, str, int)
+            sql, params = LIST_ARTICLES_AFTER_SQL, (fetched_at, article_id, limit + 1)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        items = [
+            ArticleSummary(
+                id=row["id"],
+                source_url=row["source_url"],
+                source=row["source"],
+                content_size=row["content_size"],
+                fetched_at=datetime.fromisoformat(row["fetched_at"]),
+            )
+            for row in rows[:limit]
+        ]
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last["fetched_at"], last["id"])
+        return Page(items, next_cursor)
+
+    def search(self, query: str, limit: int = 20) -> list[SearchHit]:
+        """
+        Full-text searches article content, best BM25 match first.
+
+        Args:
+            query: Free text; matches articles containing all of its words
+                (after stemming), in any order.
+            limit: Maximum number of hits.
+
+        Returns:
+            Hits with an HTML-escaped snippet around the matches, which are
+            wrapped in HIGHLIGHT_START and HIGHLIGHT_END.
+        """
+        expression = match_query(query)
+        if expression is None:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                SEARCH_ARTICLES_SQL,
+                (_MATCH_START, _MATCH_END, SNIPPET_TOKENS, expression, limit),
+            ).fetchall()
+        return [
+            SearchHit(
+                id=row["id"],
+                source_url=row["source_url"],
+                source=row["source"],
+                fetched_at=datetime.fromisoformat(row["fetched_at"]),
+                snippet=highlight(row["snippet"]),
+                # bm25() is negative, more so for better matches.
+                score=-row["bm25"],
+            )
+            for row in rows
+        ]
+
+    def rebuild_search_index(self) -> int:
+        """
+        Rebuilds the full-text index from every stored article.
+
+        Returns:
+            The number of articles indexed.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO article_search (article_search) VALUES ('rebuild')"
+            )
+            self._conn.execute(
+                "INSERT INTO article_search (article_search) VALUES ('optimize')"
+            )
+            self._conn.commit()
+            return self._conn.execute("SELECT COUNT(*) FROM raw_articles").fetchone()[0]
+
+    def search_index_bytes(self) -> int:
+        """Size of the full-text index (its inverted index and document sizes)."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT "
+                "(SELECT COALESCE(SUM(LENGTH(block)), 0) FROM article_search_data) + "
+                "(SELECT COALESCE(SUM(LENGTH(sz)), 0) FROM article_search_docsize)"
+            ).fetchone()[0]
+
+    def storage_stats(self) -> StorageStats:
+        """Returns article and chunk counts and raw vs. stored byte totals."""
+        with self._lock:
+            articles = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(content_size), 0), "
+                "COALESCE(SUM(LENGTH(content) + IFNULL(LENGTH(chunk_ids), 0)), 0), "
+                "COALESCE(SUM(content_size) FILTER (WHERE chunk_ids IS NOT NULL), 0) "
+                "FROM raw_articles"
+            ).fetchone()
+            chunks = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), "
+                "COALESCE(SUM(LENGTH(data)), 0) FROM content_chunks"
+            ).fetchone()
+        return StorageStats(
+            article_count=articles[0],
+            raw_bytes=articles[1],
+            stored_bytes=articles[2] + chunks[2],
+            chunk_count=chunks[0],
+            chunk_bytes=chunks[1],
+            chunked_article_bytes=articles[3],
+        )
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_article_store() -> ArticleStore:
+    """Returns the process-wide ArticleStore, creating it on first use."""
+    return ArticleStore(
+        connect(settings.DATABASE_PATH),
+        level=settings.COMPRESSION_LEVEL,
+        dict_size=settings.COMPRESSION_DICT_SIZE_BYTES,
+        sample_count=settings.COMPRESSION_DICT_SAMPLE_COUNT,
+        min_samples=settings.COMPRESSION_DICT_MIN_SAMPLES,
+        retrain_every=settings.COMPRESSION_DICT_RETRAIN_EVERY,
+        chunk_sizes=(
+            settings.CONTENT_CHUNK_MIN_BYTES,
+            settings.CONTENT_CHUNK_AVG_BYTES,
+            settings.CONTENT_CHUNK_MAX_BYTES,
+        ),
+    )
+
+
+def close_article_store() -> None:
+    """Closes the process-wide ArticleStore if it was opened."""
+    # pylint: disable-next=too-many-function-args
+    if get_article_store.cache_info().currsize:
+        get_article_store().close()
+        get_article_store.cache_clear()
@@ -0,0 +1,191 @@
+"""Domain-sharded fetch frontier.
+
+URLs are queued per host. Each host has its own concurrency cap and minimum
+interval between request starts (politeness towards the origin site), while
+a shared rate limiter enforces the global Jina AI Reader budget. Hosts that
+are ready to send are served round-robin, so one slow or heavily populated
+domain cannot starve the others. All dispatch operations are O(1) or
+O(log hosts), which keeps tens of thousands of URLs per cycle cheap.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+import urllib.parse
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+
+from backend.app.data_ingestion.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class _HostQueue:  # pylint: disable=too-few-public-methods
+    """Pending URLs and politeness state for one host."""
+
+    __slots__ = ("host", "urls", "active", "next_start", "scheduled")
+
+    def __init__(self, host: str):
+        self.host = host
+        self.urls: deque[str] = deque()
+        self.active = 0
+        self.next_start = 0.0
+        self.scheduled = False
+
+
+class FetchFrontier:  # pylint: disable=too-many-instance-attributes
+    """
+    Per-host fetch queues with a fair round-robin dispatcher.
+
+    Usage:
+        frontier = FetchFrontier(per_host_concurrency=2, per_host_min_interval=1.0)
+        frontier.add_many(urls)
+        await frontier.run(fetch_one, workers=8)
+    """
+
+    def __init__(
+        self,
+        *,
+        per_host_concurrency: int = 2,
+        per_host_min_interval: float = 1.0,
+        rate_limiter: TokenBucket | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if per_host_concurrency < 1:
+            raise ValueError("per_host_concurrency must be at least 1")
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_min_interval = per_host_min_interval
+        self.rate_limiter = rate_limiter
+        self._clock = clock
+        self._hosts: dict[str, _HostQueue] = {}
+        self._ready: deque[_HostQueue] = deque()
+        self._delayed: list[tuple[float, int, _HostQueue]] = []
+        self._sequence = itertools.count()
+        self._pending = 0
+        self._active = 0
+        self._wakeup: asyncio.Event | None = None
+
+    def __len__(self) -> int:
+        """Number of URLs waiting to be dispatched."""
+        return self._pending
+
+    @property
+    def host_count(self) -> int:
+        """Number of distinct hosts seen by this frontier."""
+        return len(self._hosts)
+
+    def add(self, url: str) -> None:
+        """Queues a URL on its host's queue."""
+        host = urllib.parse.urlsplit(url).netloc.lower()
+        queue = self._hosts.get(host)
+        if queue is None:
+            queue = self._hosts[host] = _HostQueue(host)
+        queue.urls.append(url)
+        self._pending += 1
+        self._schedule(queue)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def add_many(self, urls: Iterable[str]) -> None:
+        """Queues several URLs."""
+        for url in urls:
+            self.add(url)
+
+    def _schedule(self, queue: _HostQueue) -> None:
+        """Makes a host dispatchable if it has work and spare capacity."""
+        if (
+            queue.scheduled
+            or not queue.urls
+            or queue.active >= self.per_host_concurrency
+        ):
+            return
+        queue.scheduled = True
+        if queue.next_start <= self._clock():
+            self._ready.append(queue)
+        else:
+            heapq.heappush(
+                self._delayed, (queue.next_start, next(self._sequence), queue)
+            )
+
+    def _promote_due_hosts(self) -> None:
+        now = self._clock()
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, queue = heapq.heappop(self._delayed)
+            self._ready.append(queue)
+
+    def _take(self) -> tuple[str, _HostQueue] | None:
+        """Takes the next URL from the next ready host, if any."""
+        self._promote_due_hosts()
+        if not self._ready:
+            return None
+        queue = self._ready.popleft()
+        queue.scheduled = False
+        url = queue.urls.popleft()
+        queue.active += 1
+        queue.next_start = self._clock() + self.per_host_min_interval
+        self._pending -= 1
+        self._active += 1
+        self._schedule(queue)
+        return url, queue
+
+    async def _next(self) -> tuple[str, _HostQueue] | None:
+        """Waits for the next dispatchable URL; None once all work is done."""
+        assert self._wakeup is not None
+        while True:
+            item = self._take()
+            if item is not None:
+                return item
+            if self._pending == 0 and self._active == 0:
+                self._wakeup.set()  # let the other workers exit too
+                return None
+            timeout = None
+            if self._delayed:
+                timeout = max(0.0, self._delayed[0][0] - self._clock())
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _release(self, queue: _HostQueue) -> None:
+        queue.active -= 1
+        self._active -= 1
+        self._schedule(queue)
+        assert self._wakeup is not None
+        self._wakeup.set()
+
+    async def _worker(self, fetch: Callable[[str], Awaitable[None]]) -> None:
+        while (item := await self._next()) is not None:
+            url, queue = item
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire()
+                await fetch(url)
+            except Exception as e:  # noqa: BLE001 # pylint: disable=broad-except
+                logger.error("Unhandled exception while fetching %s: %s", url, e)
+            finally:
+                self._release(queue)
+
+    async def run(
+        self, fetch: Callable[[str], Awaitable[None]], workers: int = 8
+    ) -> None:
+        """
+        Dispatches every queued URL (including ones added while running).
+
+        Args:
+            fetch: Coroutine function called once per URL.
+            workers: Maximum number of fetches in flight across all hosts.
+        """
+        self._wakeup = asyncio.Event()
+        logger.info(
+            "Fetch frontier starting: %s URLs across %s hosts, %s workers.",
+            self._pending,
+            len(self._hosts),
+            workers,
+        )
+        try:
+            await asyncio.gather(*(self._worker(fetch) for _ in range(workers)))
+        finally:
+            self._wakeup = None
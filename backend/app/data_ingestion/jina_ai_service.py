@@ -2,24 +2,94 @@
 This module provides a function to fetch the primary textual content of
 a given URL using the Jina AI Reader API. It handles HTTP requests and
 responses, including error handling for various scenarios.
+
+Every request takes a token from the shared Jina rate limit (see
+rate_limiter), so fetches from the scheduler, manual triggers and workers
+all draw on one budget; a 429 pauses that budget for every process until
+the Retry-After time has passed. create_jina_client() builds the client
+for these requests, recording or replaying them if JINA_ARCHIVE_MODE asks.
+
+It also provides HedgedFetcher, which cuts tail latency by sending a second
+request for a URL once the first has run past the observed p95 latency.
 """
 
+import asyncio
 import logging
+import math
+import time
 import urllib.parse
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 
 import httpx
 
+from backend.app.core.config import settings
+from backend.app.data_ingestion.jina_archive import (
+    RecordingTransport,
+    get_archive_writer,
+    get_replay_transport,
+)
+from backend.app.data_ingestion.rate_limiter import (
+    SharedBucket,
+    TokenBucket,
+    get_rate_limiter,
+)
+
 logger = logging.getLogger(__name__)
 
 USER_AGENT = "MailchimpTrendsEngine/1.0"
 JINA_READER_BASE_URL = "https://r.jina.ai/"
 DEFAULT_TIMEOUT = 30.0  # seconds
+# Pause after a 429 that carries no usable Retry-After header
+DEFAULT_RETRY_AFTER = 60.0  # seconds
+
+
+def jina_rate_limit() -> SharedBucket:
+    """Returns the shared token bucket every Jina request draws from."""
+    return get_rate_limiter().bucket(settings.JINA_RATE_LIMIT_KEY)
+
+
+def rate_limited() -> bool:
+    """False when replaying an archive at full speed, which sends no requests."""
+    return settings.JINA_ARCHIVE_MODE != "replay" or settings.JINA_REPLAY_REALTIME
+
+
+def create_jina_client() -> httpx.AsyncClient:
+    """
+    Returns a client for Jina requests. Per JINA_ARCHIVE_MODE, its requests
+    are also recorded to the archive, or answered from it.
+    """
+    if settings.JINA_ARCHIVE_MODE == "record":
+        return httpx.AsyncClient(transport=RecordingTransport(get_archive_writer()))
+    if settings.JINA_ARCHIVE_MODE == "replay":
+        return httpx.AsyncClient(transport=get_replay_transport())
+    return httpx.AsyncClient()
+
+
+def retry_after_seconds(response: httpx.Response) -> float:
+    """Reads Retry-After (seconds or an HTTP date) from a 429 response."""
+    value = response.headers.get("Retry-After")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            pass
+    return DEFAULT_RETRY_AFTER
 
 
 async def fetch_article_content(url: str, client: httpx.AsyncClient) -> str | None:
     """
     Fetches the primary textual content of a given URL using the Jina AI Reader API.
 
+    Waits for a token from the shared Jina rate limit first (see rate_limited).
+
     Args:
         url: The URL of the article to fetch.
         client: An instance of httpx.AsyncClient.
@@ -30,7 +100,13 @@ async def fetch_article_content(url: str, client: httpx.AsyncClient) -> str | No
     if not url:
         logger.warning("fetch_article_content called with empty URL.")
         return None
+    if rate_limited():
+        await jina_rate_limit().acquire()
+    return await _request_article_content(url, client)
 
+
+async def _request_article_content(url: str, client: httpx.AsyncClient) -> str | None:
+    """Sends one Jina request; the caller must already hold a rate-limit token."""
     encoded_url = urllib.parse.quote(url, safe="")
     jina_url = f"{JINA_READER_BASE_URL}{encoded_url}"
     headers = {
@@ -46,6 +122,10 @@ async def fetch_article_content(url: str, client: httpx.AsyncClient) -> str | No
         logger.info("Successfully fetched content from Jina for URL: %s", url)
         return response.text
     except httpx.HTTPStatusError as e:
+        if e.response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+            pause = retry_after_seconds(e.response)
+            logger.warning("Jina rate limit hit; pausing requests for %.0fs.", pause)
+            await asyncio.to_thread(jina_rate_limit().pause, pause)
         logger.error(
             "HTTP error occurred when fetching %s "
             "via Jina: Status %s for %s. Response: %s",
@@ -72,3 +152,130 @@ async def fetch_article_content(url: str, client: httpx.AsyncClient) -> str | No
             e.__class__.__name__,
         )
         return None
+
+
+class LatencyTracker:
+    """Keeps a rolling window of request latencies for percentile estimates."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self._samples: deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def record(self, seconds: float) -> None:
+        """Adds a latency observation."""
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """
+        Returns the q-quantile (0 < q <= 1) of recorded latencies, or None
+        while fewer than min_samples observations are available.
+        """
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+
+class HedgedFetcher:  # pylint: disable=too-few-public-methods
+    """
+    Fetches articles through Jina with optional request hedging.
+
+    When a request runs past the tracked latency percentile, a second
+    (hedge) request for the same URL is sent and whichever returns content
+    first wins; the other is cancelled. Hedges are capped at
+    `max_hedge_ratio` of all requests and, when a rate limiter is given,
+    must take a token from it without waiting, so they never exceed the
+    Jina budget. Primary requests wait for a token as usual.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        max_hedge_ratio: float = 0.1,
+        tracker: LatencyTracker | None = None,
+        rate_limiter: TokenBucket | SharedBucket | None = None,
+    ):
+        self.percentile = percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.tracker = tracker or LatencyTracker()
+        self.rate_limiter = rate_limiter
+        self.requests = 0
+        self.hedges = 0
+
+    async def _timed_fetch(self, url: str, client: httpx.AsyncClient) -> str | None:
+        start = time.perf_counter()
+        content = await _request_article_content(url, client)
+        if content is not None:
+            self.tracker.record(time.perf_counter() - start)
+        return content
+
+    async def _hedge_allowed(self) -> bool:
+        if self.hedges + 1 > self.max_hedge_ratio * self.requests:
+            return False
+        if self.rate_limiter is None:
+            return True
+        # A database-backed bucket takes a write lock, so keep it off the loop.
+        return await asyncio.to_thread(self.rate_limiter.try_acquire)
+
+    async def fetch(self, url: str, client: httpx.AsyncClient) -> str | None:
+        """
+        Fetches a URL, hedging the request if it runs unusually long.
+
+        Args:
+            url: The URL of the article to fetch.
+            client: An instance of httpx.AsyncClient.
+
+        Returns:
+            The extracted text content as a string if successful, otherwise None.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        self.requests += 1
+        pending = {asyncio.create_task(self._timed_fetch(url, client))}
+        try:
+            threshold = self.tracker.percentile(self.percentile)
+            if threshold is not None:
+                done, pending = await asyncio.wait(pending, timeout=threshold)
+                if done:
+                    return done.pop().result()
+                if await self._hedge_allowed():
+                    self.hedges += 1
+                    logger.info(
+                        "Hedging Jina request for %s after %.2fs (hedge %s of %s).",
+                        url,
+                        threshold,
+                        self.hedges,
+                        self.requests,
+                    )
+                    pending.add(asyncio.create_task(self._timed_fetch(url, client)))
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    content = task.result()
+                    if content is not None:
+                        return content
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+@lru_cache(maxsize=1)
+def get_hedged_fetcher() -> HedgedFetcher:
+    """
+    Returns the process-wide HedgedFetcher configured from settings, drawing
+    primaries and hedges from the shared Jina rate limit.
+    """
+    return HedgedFetcher(
+        percentile=settings.JINA_HEDGE_PERCENTILE,
+        max_hedge_ratio=settings.JINA_HEDGE_MAX_RATIO,
+        tracker=LatencyTracker(min_samples=settings.JINA_HEDGE_MIN_SAMPLES),
+        rate_limiter=jina_rate_limit() if rate_limited() else None,
+    )
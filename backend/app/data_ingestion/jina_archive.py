@@ -0,0 +1,254 @@
+"""Record/replay archive of Jina AI Reader traffic.
+
+In record mode, the transport of the Jina client appends every request and
+response (headers, timing and body) to an archive. In replay mode, a
+transport serves responses from the archive instead of the network, so
+whole historical fetch cycles can be re-run offline and downstream stages
+benchmarked on real data (see replay).
+
+An archive is a directory of append-only segments, one per recording
+process: zstd-compressed JSON lines, each record flushed as a zstd block.
+A crash loses at most the record being written, and processes recording at
+the same time (the API and several workers) never share a file. Bodies are
+stored decoded, so recorded responses carry no Content-Encoding, and
+credentials in request headers are redacted.
+"""
+
+import asyncio
+import io
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+
+import httpx
+import zstandard as zstd
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".jsonl.zst"
+REDACTED_HEADERS = frozenset({"authorization", "cookie", "x-api-key"})
+# Describe the encoded body on the wire, not the decoded body that is kept.
+DROPPED_RESPONSE_HEADERS = frozenset({"content-encoding", "content-length"})
+
+
+@dataclass(frozen=True)
+class Exchange:  # pylint: disable=too-many-instance-attributes
+    """One recorded request and its response."""
+
+    method: str
+    url: str
+    request_headers: list[tuple[str, str]]
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    started_at: float
+    elapsed: float
+
+    def to_json(self) -> str:
+        """Serializes the exchange as one JSON line (without the newline)."""
+        record = asdict(self)
+        # surrogateescape round-trips bodies that are not valid UTF-8.
+        record["body"] = self.body.decode("utf-8", "surrogateescape")
+        return json.dumps(record, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str | bytes) -> "Exchange":
+        """Parses a line written by to_json."""
+        record = json.loads(line)
+        record["body"] = record["body"].encode("utf-8", "surrogateescape")
+        record["request_headers"] = [tuple(h) for h in record["request_headers"]]
+        record["headers"] = [tuple(h) for h in record["headers"]]
+        return cls(**record)
+
+
+class ArchiveWriter:
+    """Appends exchanges to a new segment of an archive directory."""
+
+    def __init__(self, directory: str | Path, level: int = 3):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        started = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        name = f"{started}-{os.getpid()}-{uuid.uuid4().hex[:8]}{SEGMENT_SUFFIX}"
+        self.path = self.directory / name
+        self._lock = threading.Lock()
+        self._file = open(self.path, "xb")  # pylint: disable=consider-using-with
+        self._writer = zstd.ZstdCompressor(level=level).stream_writer(
+            self._file, closefd=False
+        )
+        self.count = 0
+
+    def append(self, exchange: Exchange) -> None:
+        """Writes an exchange and flushes it to the segment file."""
+        line = exchange.to_json().encode() + b"\n"
+        with self._lock:
+            self._writer.write(line)
+            self._writer.flush(zstd.FLUSH_BLOCK)
+            self.count += 1
+
+    def close(self) -> None:
+        """Ends the zstd frame and closes the segment."""
+        with self._lock:
+            if not self._file.closed:
+                self._writer.flush(zstd.FLUSH_FRAME)
+                self._writer.close()
+                self._file.close()
+
+
+def read_archive(directory: str | Path) -> Iterator[Exchange]:
+    """
+    Yields every exchange in an archive, segment by segment.
+
+    A segment cut short by a crash yields the records that were flushed.
+
+    Raises:
+        FileNotFoundError: If the archive directory does not exist.
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        raise FileNotFoundError(f"Jina archive {directory} not found.")
+    for path in sorted(directory.glob(f"*{SEGMENT_SUFFIX}")):
+        with open(path, "rb") as segment:
+            reader = zstd.ZstdDecompressor().stream_reader(
+                segment, read_across_frames=True
+            )
+            try:
+                for line in io.BufferedReader(reader):
+                    if line.endswith(b"\n"):
+                        yield Exchange.from_json(line)
+            except zstd.ZstdError as e:
+                logger.warning("Jina archive segment %s is damaged: %s", path, e)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Sends requests through another transport and archives each exchange."""
+
+    def __init__(
+        self, archive: ArchiveWriter, transport: httpx.AsyncBaseTransport | None = None
+    ):
+        self.archive = archive
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.time()
+        start = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in DROPPED_RESPONSE_HEADERS
+        ]
+        self.archive.append(
+            Exchange(
+                method=request.method,
+                url=str(request.url),
+                request_headers=[
+                    (name, "<redacted>" if name.lower() in REDACTED_HEADERS else value)
+                    for name, value in request.headers.items()
+                ],
+                status_code=response.status_code,
+                headers=headers,
+                body=body,
+                started_at=started_at,
+                elapsed=time.perf_counter() - start,
+            )
+        )
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=body,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class ReplayMissError(httpx.TransportError):
+    """Raised when the archive has no (more) responses for a request."""
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Serves recorded responses instead of sending requests.
+
+    Responses for the same method and URL are served in the order they
+    were recorded, each once; a request with none left raises
+    ReplayMissError. With realtime, each response is delayed by its
+    recorded latency, otherwise it is returned at once.
+    """
+
+    def __init__(self, exchanges: Iterable[Exchange], *, realtime: bool = False):
+        self.realtime = realtime
+        self._responses: dict[tuple[str, str], deque[Exchange]] = defaultdict(deque)
+        for exchange in sorted(exchanges, key=lambda e: e.started_at):
+            self._responses[(exchange.method, exchange.url)].append(exchange)
+
+    @classmethod
+    def from_archive(
+        cls, directory: str | Path, *, realtime: bool = False
+    ) -> "ReplayTransport":
+        """Loads every exchange of an archive."""
+        return cls(read_archive(directory), realtime=realtime)
+
+    @property
+    def remaining(self) -> int:
+        """Responses not yet served."""
+        return sum(len(responses) for responses in self._responses.values())
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        responses = self._responses.get((request.method, str(request.url)))
+        if not responses:
+            raise ReplayMissError(
+                f"No recorded response left for {request.method} {request.url}",
+                request=request,
+            )
+        exchange = responses.popleft()
+        if self.realtime:
+            await asyncio.sleep(exchange.elapsed)
+        return httpx.Response(
+            exchange.status_code,
+            headers=exchange.headers,
+            content=exchange.body,
+            request=request,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_archive_writer() -> ArchiveWriter:
+    """Returns this process's segment writer for JINA_ARCHIVE_PATH."""
+    return ArchiveWriter(settings.JINA_ARCHIVE_PATH)
+
+
+def close_archive_writer() -> None:
+    """Closes the process-wide ArchiveWriter if it was opened."""
+    # pylint: disable-next=too-many-function-args
+    if get_archive_writer.cache_info().currsize:
+        get_archive_writer().close()
+        get_archive_writer.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def get_replay_transport() -> ReplayTransport:
+    """
+    Returns the process-wide ReplayTransport over JINA_ARCHIVE_PATH, shared
+    by every client so successive cycles get successive recordings.
+    """
+    return ReplayTransport.from_archive(
+        settings.JINA_ARCHIVE_PATH, realtime=settings.JINA_REPLAY_REALTIME
+    )
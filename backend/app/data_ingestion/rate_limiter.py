@@ -0,0 +1,362 @@
+"""Rate limiting primitives for outbound Jina AI Reader requests.
+
+TokenBucket paces the coroutines of one process. RateLimiter keeps one
+token bucket per key in a BucketStore, so every process sharing the store
+draws on the same budget:
+
+- LocalBucketStore: a dict, for a single process;
+- SharedMemoryBucketStore: a small memory-mapped file per key on a tmpfs
+  such as /dev/shm, locked with flock, for every process on one host;
+- SQLiteBucketStore: a row per key in the shared database, read and
+  updated in one IMMEDIATE transaction, for replicas on several hosts.
+
+Shared bucket state is (tokens, updated_at) in wall-clock seconds, as the
+monotonic clock is not comparable across hosts. Pausing a key (after an
+upstream 429) empties its bucket and holds refills for every process.
+"""
+
+import asyncio
+import fcntl
+import hashlib
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol
+
+from backend.app.core.config import settings
+from backend.app.db.database import connect
+
+# A bucket's (tokens, updated_at); None until the key is first used.
+BucketState = tuple[float, float]
+# Maps the current state to the new state and a result for the caller.
+Transition = Callable[[BucketState | None], tuple[BucketState, float]]
+
+
+class TokenBucket:
+    """
+    An in-process token bucket for asyncio callers.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. The
+    bucket is not bound to an event loop, so one instance can be shared by
+    every coroutine in the process.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Takes tokens if they are available right now; never waits."""
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Waits until tokens are available, then takes them."""
+        if tokens > self.capacity:
+            raise ValueError("Cannot acquire more tokens than the bucket capacity")
+        while not self.try_acquire(tokens):
+            await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+@dataclass(frozen=True)
+class Quota:
+    """A key's refill rate in tokens per second and its burst size."""
+
+    rate: float
+    burst: float = 1.0
+
+    def __post_init__(self):
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.burst <= 0:
+            raise ValueError("burst must be positive")
+
+
+class BucketStore(Protocol):
+    """Holds bucket states and applies transitions to them atomically."""
+
+    def update(self, key: str, transition: Transition) -> float:
+        """Replaces the key's state by transition(state); returns its result."""
+
+    def close(self) -> None:
+        """Releases the store's resources."""
+
+
+class LocalBucketStore:
+    """Bucket states in a dict, shared by the threads of one process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states: dict[str, BucketState] = {}
+
+    def update(self, key: str, transition: Transition) -> float:
+        """Replaces the key's state by transition(state); returns its result."""
+        with self._lock:
+            self._states[key], result = transition(self._states.get(key))
+        return result
+
+    def close(self) -> None:
+        """Forgets every bucket."""
+        self._states.clear()
+
+
+_STATE = struct.Struct("<dd")
+
+
+class SharedMemoryBucketStore:
+    """
+    Bucket states in memory-mapped files shared by the processes of a host.
+
+    Each key maps to a 16-byte file named after a hash of the key (keys may
+    be API keys). flock serializes processes and a thread lock serializes
+    threads, which share the descriptor. A zeroed file is an unused bucket.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._maps: dict[str, tuple[int, mmap.mmap]] = {}
+
+    def _open(self, key: str) -> tuple[int, mmap.mmap]:
+        if key not in self._maps:
+            name = hashlib.sha256(key.encode()).hexdigest()[:32]
+            fd = os.open(self.directory / f"{name}.bucket", os.O_RDWR | os.O_CREAT)
+            if os.fstat(fd).st_size < _STATE.size:
+                os.ftruncate(fd, _STATE.size)
+            self._maps[key] = (fd, mmap.mmap(fd, _STATE.size))
+        return self._maps[key]
+
+    def update(self, key: str, transition: Transition) -> float:
+        """Replaces the key's state by transition(state); returns its result."""
+        with self._lock:
+            fd, view = self._open(key)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                tokens, updated_at = _STATE.unpack_from(view)
+                state, result = transition((tokens, updated_at) if updated_at else None)
+                _STATE.pack_into(view, 0, *state)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        return result
+
+    def close(self) -> None:
+        """Unmaps and closes every bucket file."""
+        with self._lock:
+            for fd, view in self._maps.values():
+                view.close()
+                os.close(fd)
+            self._maps.clear()
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    key TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class SQLiteBucketStore:
+    """Bucket states in the database, shared by every replica using it."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._conn = connection
+        self._lock = threading.Lock()
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def update(self, key: str, transition: Transition) -> float:
+        """
+        Replaces the key's state by transition(state); returns its result.
+
+        BEGIN IMMEDIATE takes the write lock before the read, so concurrent
+        writers queue (up to the busy timeout) instead of racing.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at FROM rate_limit_buckets WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                state, result = transition(
+                    (row["tokens"], row["updated_at"]) if row else None
+                )
+                self._conn.execute(
+                    "INSERT INTO rate_limit_buckets (key, tokens, updated_at) "
+                    "VALUES (?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                    "tokens = excluded.tokens, updated_at = excluded.updated_at",
+                    (key, *state),
+                )
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        return result
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._conn.close()
+
+
+class RateLimiter:
+    """
+    Token buckets per key, held in a store that processes can share.
+
+    Each key refills at its own Quota; keys without a quota are not
+    limited. Buckets start full, so a key may burst up to its quota's burst
+    size and is then held to its rate.
+    """
+
+    def __init__(
+        self,
+        store: BucketStore,
+        quotas: Mapping[str, Quota] | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.store = store
+        self.quotas = dict(quotas or {})
+        self._clock = clock
+
+    def _take(self, key: str, tokens: float) -> float:
+        """Takes tokens now if possible; else returns the seconds to wait."""
+        quota = self.quotas.get(key)
+        if quota is None:
+            return 0.0
+        if tokens > quota.burst:
+            raise ValueError("Cannot acquire more tokens than the bucket capacity")
+        now = self._clock()
+
+        def take(state: BucketState | None) -> tuple[BucketState, float]:
+            available, updated_at = state or (quota.burst, now)
+            elapsed = max(0.0, now - updated_at)
+            available = min(quota.burst, available + elapsed * quota.rate)
+            updated_at = max(updated_at, now)
+            if available >= tokens:
+                return (available - tokens, updated_at), 0.0
+            wait = updated_at - now + (tokens - available) / quota.rate
+            return (available, updated_at), wait
+
+        return self.store.update(key, take)
+
+    def try_acquire(self, key: str, tokens: float = 1.0) -> bool:
+        """Takes tokens from the key's bucket if available now; never waits."""
+        return self._take(key, tokens) == 0.0
+
+    async def acquire(self, key: str, tokens: float = 1.0) -> None:
+        """Waits until the key's bucket has tokens, then takes them."""
+        while (wait := await asyncio.to_thread(self._take, key, tokens)) > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, key: str, seconds: float) -> None:
+        """Empties the key's bucket and holds its refill for seconds."""
+        if key not in self.quotas:
+            return
+        resume_at = self._clock() + seconds
+
+        def empty(state: BucketState | None) -> tuple[BucketState, float]:
+            return (0.0, max(state[1] if state else 0.0, resume_at)), 0.0
+
+        self.store.update(key, empty)
+
+    def bucket(self, key: str) -> "SharedBucket":
+        """Returns the key's bucket with the TokenBucket interface."""
+        return SharedBucket(self, key)
+
+    def close(self) -> None:
+        """Closes the bucket store."""
+        self.store.close()
+
+
+@dataclass(frozen=True)
+class SharedBucket:
+    """One key of a RateLimiter, usable wherever a TokenBucket is."""
+
+    limiter: RateLimiter
+    key: str
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Takes tokens if they are available right now; never waits."""
+        return self.limiter.try_acquire(self.key, tokens)
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Waits until tokens are available, then takes them."""
+        await self.limiter.acquire(self.key, tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Empties the bucket and holds its refill for seconds."""
+        self.limiter.pause(self.key, seconds)
+
+
+def configured_quotas() -> dict[str, Quota]:
+    """
+    Quotas from settings: the Jina key gets one request per
+    JINA_FETCH_DELAY_SECONDS with a burst of JINA_RATE_LIMIT_BURST, and
+    RATE_LIMIT_QUOTAS adds or overrides (rate, burst) per key.
+    """
+    quotas = {}
+    delay = settings.JINA_FETCH_DELAY_SECONDS
+    if delay > 0:
+        quotas[settings.JINA_RATE_LIMIT_KEY] = Quota(
+            rate=1.0 / delay, burst=settings.JINA_RATE_LIMIT_BURST
+        )
+    for key, (rate, burst) in settings.RATE_LIMIT_QUOTAS.items():
+        quotas[key] = Quota(rate=rate, burst=burst)
+    return quotas
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> RateLimiter:
+    """Returns the process-wide RateLimiter on the configured bucket store."""
+    store: BucketStore
+    if settings.RATE_LIMIT_BACKEND == "database":
+        store = SQLiteBucketStore(connect(settings.DATABASE_PATH))
+    elif settings.RATE_LIMIT_BACKEND == "shm":
+        store = SharedMemoryBucketStore(settings.RATE_LIMIT_SHM_PATH)
+    else:
+        store = LocalBucketStore()
+    return RateLimiter(store, configured_quotas())
+
+
+def close_rate_limiter() -> None:
+    """Closes the process-wide RateLimiter if it was created."""
+    # pylint: disable-next=too-many-function-args
+    if get_rate_limiter.cache_info().currsize:
+        get_rate_limiter().close()
+        get_rate_limiter.cache_clear()
@@ -0,0 +1,215 @@
+"""Command line tools for re-running fetch cycles from a Jina archive.
+
+Record an archive by running the API or workers with
+JINA_ARCHIVE_MODE=record, then inspect it or replay it offline:
+
+    python -m backend.app.data_ingestion.replay info jina_archive
+    python -m backend.app.data_ingestion.replay run jina_archive --cycles 3
+
+`run` calls perform_scheduled_article_fetch once per cycle with the Jina
+client answering from the archive. The sources are exactly those in the
+archive, in the order they were first recorded, and all are fetched every
+cycle, so the n-th cycle gets the n-th recording of each source. Everything
+a cycle writes (the database, embeddings, trend history, the dashboard
+snapshot and shared-memory rate limits) goes to a scratch directory,
+--scratch-dir, never to the configured paths.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import time
+import urllib.parse
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from backend.app.core.config import settings
+from backend.app.data_ingestion.checkpoint import close_checkpoint_store
+from backend.app.data_ingestion.content_store import close_article_store
+from backend.app.data_ingestion.jina_ai_service import JINA_READER_BASE_URL
+from backend.app.data_ingestion.jina_archive import (
+    Exchange,
+    get_replay_transport,
+    read_archive,
+)
+from backend.app.data_ingestion.rate_limiter import close_rate_limiter
+from backend.app.data_ingestion.scheduler import perform_scheduled_article_fetch
+from backend.app.data_ingestion.source_registry import close_source_registry
+from backend.app.nlp_processing.analyses import close_analysis_store
+from backend.app.nlp_processing.clustering import close_topic_cluster_store
+from backend.app.nlp_processing.embeddings import close_embedding_store
+from backend.app.trend_identification.dashboard import get_dashboard_store
+from backend.app.trend_identification.history import close_trend_history_store
+
+logger = logging.getLogger(__name__)
+
+
+def source_url(exchange: Exchange) -> str | None:
+    """Returns the article URL a Jina Reader request fetched, or None."""
+    if not exchange.url.startswith(JINA_READER_BASE_URL):
+        return None
+    return urllib.parse.unquote(exchange.url[len(JINA_READER_BASE_URL) :])
+
+
+def recorded_sources(exchanges: Iterable[Exchange]) -> Counter[str]:
+    """Counts recordings per source URL, in order of first recording."""
+    ordered = sorted(exchanges, key=lambda e: e.started_at)
+    return Counter(url for e in ordered if (url := source_url(e)) is not None)
+
+
+@contextlib.contextmanager
+def overridden_settings(**values: Any) -> Iterator[None]:
+    """Temporarily replaces settings values."""
+    previous = {name: getattr(settings, name) for name in values}
+    for name, value in values.items():
+        setattr(settings, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(settings, name, value)
+
+
+def scratch_paths(scratch_dir: str | Path) -> dict[str, str]:
+    """
+    Returns the settings that point at on-disk state, under scratch_dir.
+
+    Raises:
+        ValueError: If one of them is the configured (live) path.
+    """
+    scratch = Path(scratch_dir)
+    paths = {
+        "DATABASE_PATH": str(scratch / "mailchimp_trends.db"),
+        "EMBEDDING_STORE_PATH": str(scratch / "embeddings"),
+        "TREND_HISTORY_PATH": str(scratch / "trend_history"),
+        "DASHBOARD_SNAPSHOT_PATH": str(scratch / "dashboard_snapshot.json.gz"),
+        "RATE_LIMIT_SHM_PATH": str(scratch / "rate_limits"),
+    }
+    for name, path in paths.items():
+        if Path(path).resolve() == Path(getattr(settings, name)).resolve():
+            raise ValueError(f"Scratch {name} {path} is the configured one.")
+    return paths
+
+
+def close_stores() -> None:
+    """Closes the process-wide stores, so they reopen at the current paths."""
+    close_article_store()
+    close_source_registry()
+    close_checkpoint_store()
+    close_rate_limiter()
+    close_analysis_store()
+    close_topic_cluster_store()
+    close_embedding_store()
+    close_trend_history_store()
+    get_dashboard_store.cache_clear()
+
+
+async def replay_cycles(
+    directory: str | Path,
+    scratch_dir: str | Path,
+    cycles: int | None = None,
+    realtime: bool = False,
+) -> list[float]:
+    """
+    Runs fetch cycles against an archive.
+
+    Args:
+        directory: The archive directory.
+        scratch_dir: Directory for everything the cycles write; created if
+            needed. Reusing one continues from its state.
+        cycles: Number of cycles; defaults to the most recordings of a source.
+        realtime: Delay responses by their recorded latency (and apply the
+            Jina rate limit) instead of replaying at full speed.
+
+    Returns:
+        The duration of each cycle in seconds.
+
+    Raises:
+        ValueError: If a scratch path is one of the configured paths.
+    """
+    paths = scratch_paths(scratch_dir)
+    sources = recorded_sources(read_archive(directory))
+    cycles = max(sources.values(), default=0) if cycles is None else cycles
+    durations = []
+    Path(scratch_dir).mkdir(parents=True, exist_ok=True)
+    close_stores()
+    with overridden_settings(
+        JINA_ARCHIVE_MODE="replay",
+        JINA_ARCHIVE_PATH=str(directory),
+        JINA_REPLAY_REALTIME=realtime,
+        NEWS_SOURCES=list(sources),
+        SOURCE_REGISTRY_PATH="",
+        FETCH_CHECKPOINT_STALENESS_SECONDS=0.0,
+        **paths,
+    ):
+        get_replay_transport.cache_clear()
+        try:
+            for cycle in range(1, cycles + 1):
+                start = time.perf_counter()
+                await perform_scheduled_article_fetch()
+                durations.append(time.perf_counter() - start)
+                logger.info(
+                    "Replayed cycle %s of %s in %.2fs.", cycle, cycles, durations[-1]
+                )
+        finally:
+            get_replay_transport.cache_clear()
+            close_stores()
+    return durations
+
+
+def describe(directory: str | Path) -> str:
+    """Summarizes an archive: exchanges, time span, statuses and sources."""
+    exchanges = list(read_archive(directory))
+    if not exchanges:
+        return f"{directory}: empty"
+    first = min(e.started_at for e in exchanges)
+    last = max(e.started_at for e in exchanges)
+    statuses = Counter(e.status_code for e in exchanges)
+    lines = [
+        f"{directory}: {len(exchanges)} exchanges, "
+        f"{sum(len(e.body) for e in exchanges) / 2**20:.1f} MiB of bodies, "
+        f"{(last - first) / 3600:.1f} hours",
+        "statuses: " + ", ".join(f"{s}: {n}" for s, n in sorted(statuses.items())),
+    ]
+    lines += [f"{n:5}  {url}" for url, n in recorded_sources(exchanges).items()]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Main function of the replay command line.
+    """
+    logging.basicConfig(level=settings.LOG_LEVEL.upper())
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    info = commands.add_parser("info", help="Summarize an archive")
+    info.add_argument("archive")
+    run = commands.add_parser("run", help="Re-run fetch cycles from an archive")
+    run.add_argument("archive")
+    run.add_argument("--cycles", type=int, default=None)
+    run.add_argument(
+        "--scratch-dir",
+        default="replay_scratch",
+        help="Directory for the database and files the cycles write",
+    )
+    run.add_argument(
+        "--realtime", action="store_true", help="Replay at recorded latency"
+    )
+    args = parser.parse_args(argv)
+    if args.command == "info":
+        print(describe(args.archive))
+    else:
+        durations = asyncio.run(
+            replay_cycles(args.archive, args.scratch_dir, args.cycles, args.realtime)
+        )
+        print(
+            f"Replayed {len(durations)} cycles in {sum(durations):.2f}s "
+            f"into {args.scratch_dir}."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,79 +9,240 @@ for content fetching.
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 
 import httpx  # Third-party import
 from apscheduler.schedulers.asyncio import AsyncIOScheduler  # type: ignore
 
 from backend.app.core.config import settings  # First-party import
-from backend.app.data_ingestion.jina_ai_service import (
-    fetch_article_content,  # First-party import
+from backend.app.core.memory import get_memory_profiler
+from backend.app.data_ingestion.checkpoint import (
+    CycleCheckpointStore,
+    CycleInProgressError,
+    FetchCycle,
+    get_checkpoint_store,
 )
+from backend.app.data_ingestion.content_store import get_article_store
+from backend.app.data_ingestion.frontier import FetchFrontier
+from backend.app.data_ingestion.jina_ai_service import (  # First-party import
+    create_jina_client,
+    fetch_article_content,
+    get_hedged_fetcher,
+)
+from backend.app.data_ingestion.source_registry import get_source_registry
+from backend.app.nlp_processing.analyses import get_analysis_store
+from backend.app.nlp_processing.clustering import cluster_new_articles
+from backend.app.nlp_processing.inference import get_inference_service
+from backend.app.trend_identification.dashboard import publish_dashboard_snapshot
+from backend.app.trend_identification.history import record_trend_history
+from backend.app.trend_identification.updates import notify_trend_update
 
 logger = logging.getLogger(__name__)
 
 scheduler = AsyncIOScheduler()
 
+FetchFunction = Callable[..., Awaitable[str | None]]
+ProcessFunction = Callable[[str], Awaitable[bool]]
+# Attempts every pending source of a cycle, marking each done; returns the
+# number fetched.
+FetchSources = Callable[[FetchCycle], Awaitable[int]]
+
+# Fetch cycles currently running in this process, drained on shutdown.
+_in_flight_cycles: set[asyncio.Task] = set()
+
 
-# Placeholder for actual content processing/storage (Story 2.3)
 async def process_fetched_content(url: str, content: str):
-    """Placeholder function to process fetched content."""
+    """Stores fetched content, then analyzes it and stores the analysis."""
+    article_id = await asyncio.to_thread(get_article_store().save_article, url, content)
+    logger.info("Stored article %s from %s.", article_id, url)
+    analysis = await get_inference_service().analyze_document(content)
+    await asyncio.to_thread(
+        get_analysis_store().save, article_id, analysis, settings.ANALYSIS_VERSION
+    )
     logger.info(
-        "Placeholder: Processing content from %s. Length: %s", url, len(content)
+        "Article %s sentiment: %s (%.2f), nearest topic: %s.",
+        article_id,
+        analysis.sentiment.label,
+        analysis.sentiment.score,
+        analysis.topic_id,
     )
-    # In Story 2.3, this will involve saving to the database.
-    await asyncio.sleep(
-        settings.SCHEDULER_PROCESSING_DELAY_SECONDS
-    )  # Simulate processing delay
 
 
-async def perform_scheduled_article_fetch():
+async def fetch_and_process_url(
+    url: str, client: httpx.AsyncClient, fetch: FetchFunction
+) -> bool:
     """
-    Fetches articles from configured news sources.
-    This job is intended to be scheduled.
+    Fetches one URL and processes its content.
+
+    Returns:
+        True if content was fetched and processed, otherwise False.
+    """
+    logger.info("Fetching content from URL: %s", url)
+    try:
+        content = await fetch(url, client=client)
+        if content:
+            logger.info(
+                "Successfully fetched content from %s. Length: %s",
+                url,
+                len(content),
+            )
+            await process_fetched_content(url, content)
+            await asyncio.to_thread(get_source_registry().record_success, url)
+            return True
+        # Error logging is handled within fetch_article_content
+        logger.warning("No content fetched for URL: %s", url)
+    except Exception as e:  # noqa: BLE001 # pylint: disable=broad-except
+        logger.error("Unhandled exception during processing of URL %s: %s", url, e)
+    await asyncio.to_thread(get_source_registry().record_failure, url)
+    return False
+
+
+async def _fetch_sequentially(urls: list[str], process: ProcessFunction) -> int:
+    """
+    Fetches URLs one at a time. The pace is set by the shared Jina rate
+    limit that every fetch waits on, not by a delay here.
     """
-    logger.info("Starting scheduled article fetch cycle...")
-    source_count = 0
     fetched_count = 0
+    for url in urls:
+        if await process(url):
+            fetched_count += 1
+    return fetched_count
 
-    async with httpx.AsyncClient() as client:
-        for url in settings.NEWS_SOURCES:
-            source_count += 1
-            logger.info("Fetching content from URL: %s", url)
-            try:
-                content = await fetch_article_content(url, client=client)
-                if content:
-                    logger.info(
-                        "Successfully fetched content from %s. Length: %s",
-                        url,
-                        len(content),
-                    )
-                    # For MVP, log a snippet. Actual storage in Story 2.3
-                    # logger.debug("Content snippet for %s: %s", url, content[:200])
-                    await process_fetched_content(url, content)
-                    fetched_count += 1
-                else:
-                    # Error logging is handled within fetch_article_content
-                    logger.warning("No content fetched for URL: %s", url)
-            except Exception as e:  # noqa: BLE001 # pylint: disable=broad-except
-                logger.error(
-                    "Unhandled exception during processing of URL %s: %s", url, e
-                )
 
-            # Delay should happen after processing each URL (success or fail),
-            # but not after the very last one.
-            if source_count < len(settings.NEWS_SOURCES):
-                logger.info(
-                    "Waiting for %s seconds before next fetch...",
-                    settings.JINA_FETCH_DELAY_SECONDS,
+async def _fetch_with_frontier(urls: list[str], process: ProcessFunction) -> int:
+    """
+    Fetches URLs concurrently through per-host queues, with per-host
+    politeness limits. The global Jina budget is the shared rate limit that
+    every fetch waits on.
+    """
+    frontier = FetchFrontier(
+        per_host_concurrency=settings.FETCH_HOST_CONCURRENCY,
+        per_host_min_interval=settings.FETCH_HOST_MIN_INTERVAL_SECONDS,
+    )
+    frontier.add_many(urls)
+    fetched_count = 0
+
+    async def fetch_one(url: str) -> None:
+        nonlocal fetched_count
+        if await process(url):
+            fetched_count += 1
+
+    await frontier.run(fetch_one, workers=settings.FETCH_FRONTIER_WORKERS)
+    return fetched_count
+
+
+async def _keep_alive(
+    checkpoints: CycleCheckpointStore, cycle_id: int, stop: asyncio.Event
+) -> None:
+    """Renews a cycle's heartbeat until stop is set, even while fetches stall."""
+    interval = settings.FETCH_CHECKPOINT_HEARTBEAT_TIMEOUT_SECONDS / 3
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except TimeoutError:
+            if not await asyncio.to_thread(checkpoints.heartbeat, cycle_id):
+                logger.warning(
+                    "Lost fetch cycle %s to another process while running it.",
+                    cycle_id,
                 )
-                await asyncio.sleep(settings.JINA_FETCH_DELAY_SECONDS)
+                return
+
 
+def article_fetcher() -> FetchFunction:
+    """Returns the configured fetch function, hedged or plain."""
+    if settings.JINA_HEDGING_ENABLED:
+        return get_hedged_fetcher().fetch
+    return fetch_article_content
+
+
+async def _fetch_in_process(cycle: FetchCycle) -> int:
+    checkpoints = get_checkpoint_store()
+    fetch = article_fetcher()
+    async with create_jina_client() as client:
+
+        async def process(url: str) -> bool:
+            fetched = await fetch_and_process_url(url, client, fetch)
+            await asyncio.to_thread(checkpoints.mark_done, cycle.id, url)
+            return fetched
+
+        if settings.FETCH_FRONTIER_ENABLED:
+            return await _fetch_with_frontier(cycle.pending_urls, process)
+        return await _fetch_sequentially(cycle.pending_urls, process)
+
+
+async def perform_scheduled_article_fetch(fetch_sources: FetchSources | None = None):
+    """
+    Fetches articles from configured news sources.
+    This job is intended to be scheduled.
+
+    Progress is checkpointed per source, so a cycle interrupted by a restart
+    or shutdown is resumed (only its outstanding sources are fetched) if the
+    next run starts within FETCH_CHECKPOINT_STALENESS_SECONDS. While another
+    process's cycle is still heartbeating, the run is skipped.
+
+    Args:
+        fetch_sources: How the cycle's sources are fetched. Defaults to
+            fetching them in this process; ingestion workers distribute
+            them over the work queue instead.
+    """
+    task = asyncio.current_task()
+    if task is not None:
+        _in_flight_cycles.add(task)
+    try:
+        async with get_memory_profiler().track("fetch cycle"):
+            await _run_fetch_cycle(fetch_sources or _fetch_in_process)
+    finally:
+        if task is not None:
+            _in_flight_cycles.discard(task)
+
+
+async def _run_fetch_cycle(fetch_sources: FetchSources) -> None:
+    logger.info("Starting scheduled article fetch cycle...")
+    registry = get_source_registry()
+    await asyncio.to_thread(registry.refresh, settings.NEWS_SOURCES)
+    checkpoints = get_checkpoint_store()
+    try:
+        cycle = await asyncio.to_thread(
+            checkpoints.start_or_resume,
+            [source.url for source in registry.due_sources()],
+            settings.FETCH_CHECKPOINT_STALENESS_SECONDS,
+            heartbeat_timeout_seconds=(
+                settings.FETCH_CHECKPOINT_HEARTBEAT_TIMEOUT_SECONDS
+            ),
+        )
+    except CycleInProgressError as e:
+        logger.info("Skipping fetch cycle: %s", e)
+        return
+    if cycle.resumed:
+        logger.info(
+            "Resuming fetch cycle %s: %s of %s sources outstanding.",
+            cycle.id,
+            len(cycle.pending_urls),
+            cycle.total,
+        )
+    stop_keep_alive = asyncio.Event()
+    keep_alive = asyncio.create_task(
+        _keep_alive(checkpoints, cycle.id, stop_keep_alive)
+    )
+    try:
+        fetched_count = await fetch_sources(cycle)
+    finally:
+        stop_keep_alive.set()
+        await asyncio.gather(keep_alive, return_exceptions=True)
+
+    await asyncio.to_thread(checkpoints.complete, cycle.id)
     logger.info(
         "Scheduled article fetch cycle completed. Fetched %s out of %s sources.",
         fetched_count,
-        len(settings.NEWS_SOURCES),
+        len(cycle.pending_urls),
     )
+    if settings.TOPIC_CLUSTERING_ENABLED:
+        clustered = await asyncio.to_thread(cluster_new_articles)
+        logger.info("Clustered %s new articles into topics.", clustered)
+        await asyncio.to_thread(record_trend_history)
+    await asyncio.to_thread(publish_dashboard_snapshot)
+    if settings.TOPIC_CLUSTERING_ENABLED:
+        await notify_trend_update()
 
 
 async def start_scheduler():
@@ -93,10 +254,34 @@ async def start_scheduler():
         logger.info("Scheduler is already running.")
 
 
+async def _drain_in_flight_cycles(timeout: float) -> None:
+    """
+    Waits up to `timeout` seconds for running fetch cycles to finish, then
+    cancels any that remain. Cancelled cycles keep their checkpoint and are
+    resumed by the next run.
+    """
+    running = {task for task in _in_flight_cycles if task is not asyncio.current_task()}
+    if not running:
+        return
+    logger.info("Waiting for %s in-flight fetch cycle(s) to finish...", len(running))
+    _, pending = await asyncio.wait(running, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.warning(
+            "Cancelled %s fetch cycle(s) still running after %ss; "
+            "they will resume from their checkpoint.",
+            len(pending),
+            timeout,
+        )
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
 async def shutdown_scheduler():
-    """Shuts down the APScheduler."""
+    """Shuts down the APScheduler and drains in-flight fetch cycles."""
     if scheduler.running:
         scheduler.shutdown(wait=False)
         logger.info("Scheduler shut down.")
     else:
         logger.info("Scheduler is not running.")
+    await _drain_in_flight_cycles(settings.SCHEDULER_SHUTDOWN_DRAIN_SECONDS)
@@ -0,0 +1,60 @@
+"""Command line tools for the article full-text search index.
+
+save_article keeps the index up to date, so a rebuild is only needed for
+databases holding articles stored before the index existed, or after the
+tokenizer changes:
+
+    python -m backend.app.data_ingestion.search_index rebuild
+    python -m backend.app.data_ingestion.search_index search "email automation"
+"""
+
+import argparse
+import logging
+import time
+
+from backend.app.core.config import settings
+from backend.app.data_ingestion.content_store import (
+    close_article_store,
+    get_article_store,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild() -> int:
+    """Rebuilds the index from every stored article and returns their count."""
+    start = time.perf_counter()
+    count = get_article_store().rebuild_search_index()
+    logger.info(
+        "Indexed %s articles in %.1fs; the index is %.1f MiB.",
+        count,
+        time.perf_counter() - start,
+        get_article_store().search_index_bytes() / 2**20,
+    )
+    return count
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Main function of the search index command line.
+    """
+    logging.basicConfig(level=settings.LOG_LEVEL.upper())
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("rebuild", help="Rebuild the index from stored articles")
+    search = commands.add_parser("search", help="Search stored articles")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "rebuild":
+            rebuild()
+        else:
+            for hit in get_article_store().search(args.query, args.limit):
+                print(f"{hit.score:8.3f}  {hit.source_url}\n          {hit.snippet}")
+    finally:
+        close_article_store()
+
+
+if __name__ == "__main__":
+    main()
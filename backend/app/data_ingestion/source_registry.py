@@ -0,0 +1,234 @@
+"""Hot-reloadable registry of news sources.
+
+Source configuration (URL, priority, poll interval, enabled flag) is read
+from a JSON file named by settings.SOURCE_REGISTRY_PATH and reloaded whenever
+the file changes, so sources can be edited without a redeploy. When no file
+is configured, settings.NEWS_SOURCES is used with default metadata.
+
+Runtime status (last success, failure streak) is persisted in SQLite.
+
+Readers never lock: snapshot() returns an immutable tuple that is replaced
+wholesale on refresh, so a running fetch cycle keeps the view it started with.
+
+Example registry file:
+
+    {
+      "sources": [
+        {"url": "https://www.wired.com/most-recent/", "priority": 10,
+         "poll_interval_seconds": 3600},
+        {"url": "https://www.marketingdive.com/", "enabled": false}
+      ]
+    }
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+from backend.app.core.config import settings
+from backend.app.db.database import connect
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS news_source_status (
+    url TEXT PRIMARY KEY,
+    last_success_at TEXT,
+    last_failure_at TEXT,
+    failure_streak INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+@dataclass(frozen=True)
+class NewsSource:
+    """A configured news source and its latest fetch status."""
+
+    url: str
+    priority: int = 0
+    poll_interval_seconds: float = 0.0
+    enabled: bool = True
+    last_success_at: datetime | None = None
+    failure_streak: int = 0
+
+    def is_due(self, now: datetime) -> bool:
+        """True if the source is enabled and its poll interval has elapsed."""
+        if not self.enabled:
+            return False
+        if self.last_success_at is None:
+            return True
+        interval = timedelta(seconds=self.poll_interval_seconds)
+        return now - self.last_success_at >= interval
+
+
+class SourceRegistryError(ValueError):
+    """Raised when the registry file cannot be parsed."""
+
+
+def parse_registry_file(text: str) -> list[NewsSource]:
+    """
+    Parses registry file contents into NewsSource entries.
+
+    Raises:
+        SourceRegistryError: If the content is not a valid registry document.
+    """
+    try:
+        document = json.loads(text)
+        entries = document["sources"]
+        return [
+            NewsSource(
+                url=str(entry["url"]),
+                priority=int(entry.get("priority", 0)),
+                poll_interval_seconds=float(entry.get("poll_interval_seconds", 0)),
+                enabled=bool(entry.get("enabled", True)),
+            )
+            for entry in entries
+        ]
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        raise SourceRegistryError(f"Invalid source registry: {e}") from e
+
+
+class SourceRegistry:
+    """News source registry with lock-free snapshots for readers."""
+
+    def __init__(self, connection: sqlite3.Connection, path: str | None = None):
+        self.path = path or None
+        self._conn = connection
+        self._write_lock = threading.Lock()
+        self._snapshot: tuple[NewsSource, ...] = ()
+        self._configured: list[NewsSource] = []
+        self._file_signature: tuple[int, int] | None = None
+        self._default_urls: tuple[str, ...] | None = None
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def snapshot(self) -> tuple[NewsSource, ...]:
+        """Returns the current sources, highest priority first, in file order."""
+        return self._snapshot
+
+    def due_sources(self, now: datetime | None = None) -> list[NewsSource]:
+        """Returns enabled sources whose poll interval has elapsed."""
+        now = now or datetime.now(timezone.utc)
+        return [source for source in self._snapshot if source.is_due(now)]
+
+    def _file_changed(self) -> bool:
+        assert self.path is not None
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            logger.error("Source registry file %s not found.", self.path)
+            return False
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._file_signature:
+            return False
+        self._file_signature = signature
+        return True
+
+    def _load_configuration(self, default_urls: Iterable[str]) -> None:
+        if self.path is None:
+            urls = tuple(default_urls)
+            if urls != self._default_urls:
+                self._default_urls = urls
+                self._configured = [NewsSource(url=url) for url in urls]
+            return
+        if not self._file_changed():
+            return
+        try:
+            with open(self.path, encoding="utf-8") as registry_file:
+                self._configured = parse_registry_file(registry_file.read())
+            logger.info(
+                "Loaded %s sources from registry %s.",
+                len(self._configured),
+                self.path,
+            )
+        except (OSError, SourceRegistryError) as e:
+            logger.error(
+                "Keeping previous sources; failed to load %s: %s", self.path, e
+            )
+
+    def refresh(self, default_urls: Iterable[str] = ()) -> tuple[NewsSource, ...]:
+        """
+        Reloads configuration if it changed and merges in fetch status.
+
+        Args:
+            default_urls: Sources to use when no registry file is configured.
+
+        Returns:
+            The new snapshot.
+        """
+        with self._write_lock:
+            self._load_configuration(default_urls)
+            status = {
+                row["url"]: row
+                for row in self._conn.execute("SELECT * FROM news_source_status")
+            }
+            merged = []
+            for source in self._configured:
+                row = status.get(source.url)
+                if row is not None:
+                    last_success = row["last_success_at"]
+                    source = replace(
+                        source,
+                        last_success_at=(
+                            datetime.fromisoformat(last_success)
+                            if last_success
+                            else None
+                        ),
+                        failure_streak=row["failure_streak"],
+                    )
+                merged.append(source)
+            merged.sort(key=lambda source: -source.priority)
+            self._snapshot = tuple(merged)
+        return self._snapshot
+
+    def record_success(self, url: str, at: datetime | None = None) -> None:
+        """Records a successful fetch; takes effect at the next refresh."""
+        at = at or datetime.now(timezone.utc)
+        with self._write_lock:
+            self._conn.execute(
+                "INSERT INTO news_source_status (url, last_success_at, failure_streak) "
+                "VALUES (?, ?, 0) ON CONFLICT (url) DO UPDATE SET "
+                "last_success_at = excluded.last_success_at, failure_streak = 0",
+                (url, at.isoformat()),
+            )
+            self._conn.commit()
+
+    def record_failure(self, url: str, at: datetime | None = None) -> None:
+        """Records a failed fetch; takes effect at the next refresh."""
+        at = at or datetime.now(timezone.utc)
+        with self._write_lock:
+            self._conn.execute(
+                "INSERT INTO news_source_status (url, last_failure_at, failure_streak) "
+                "VALUES (?, ?, 1) ON CONFLICT (url) DO UPDATE SET "
+                "last_failure_at = excluded.last_failure_at, "
+                "failure_streak = failure_streak + 1",
+                (url, at.isoformat()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        with self._write_lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_source_registry() -> SourceRegistry:
+    """Returns the process-wide SourceRegistry, creating it on first use."""
+    return SourceRegistry(
+        connect(settings.DATABASE_PATH), settings.SOURCE_REGISTRY_PATH
+    )
+
+
+def close_source_registry() -> None:
+    """Closes the process-wide SourceRegistry if it was opened."""
+    # pylint: disable-next=too-many-function-args
+    if get_source_registry.cache_info().currsize:
+        get_source_registry().close()
+        get_source_registry.cache_clear()
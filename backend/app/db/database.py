@@ -0,0 +1,40 @@
+"""SQLite connection helpers.
+This module centralizes how the application opens its SQLite database so
+that every store shares the same pragmas (WAL journaling, busy timeout and
+row factory) regardless of which thread or process opens the connection.
+"""
+
+import logging
+import sqlite3
+from pathlib import Path
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BUSY_TIMEOUT_MS = 5000
+
+
+def connect(path: str | None = None) -> sqlite3.Connection:
+    """
+    Opens a SQLite connection configured for concurrent use.
+
+    Args:
+        path: Database file path. Defaults to settings.DATABASE_PATH.
+              ":memory:" opens a private in-memory database.
+
+    Returns:
+        A sqlite3.Connection with rows returned as sqlite3.Row.
+    """
+    db_path = path or settings.DATABASE_PATH
+    if db_path != ":memory:":
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+    connection = sqlite3.connect(db_path, check_same_thread=False)
+    connection.row_factory = sqlite3.Row
+    connection.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    if db_path != ":memory:":
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+    logger.debug("Opened SQLite database at %s", db_path)
+    return connection
@@ -0,0 +1,66 @@
+"""Keyset (cursor) pagination helpers.
+
+Listings are ordered by a sort key with the row id as a tie-breaker, and
+each page continues strictly after the last row of the previous page
+(WHERE (key, id) < (?, ?)). With a matching index SQLite seeks straight to
+the start of the page, so deep pages cost the same as the first one, unlike
+OFFSET, which steps over every skipped row.
+
+Cursors are opaque to clients: the sort key of the last row returned,
+JSON-encoded and then base64url-encoded.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client-supplied cursor cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """One page of a listing and the cursor of the next page (None if last)."""
+
+    items: list[T]
+    next_cursor: str | None
+
+
+def encode_cursor(*values: str | int | float) -> str:
+    """Encodes the sort key of the last row of a page as an opaque cursor."""
+    data = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple:
+    """
+    Decodes a cursor made by encode_cursor.
+
+    Args:
+        cursor: The cursor string.
+        types: The expected type of each value; ints are accepted for float.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not match types.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError("Malformed cursor.") from e
+    if not isinstance(values, list) or len(values) != len(types):
+        raise InvalidCursorError("Malformed cursor.")
+    return tuple(_coerce(value, expected) for value, expected in zip(values, types))
+
+
+def _coerce(value: object, expected: type) -> object:
+    if expected is float and isinstance(value, int) and not isinstance(value, bool):
+        value = float(value)
+    if type(value) is not expected:  # pylint: disable=unidiomatic-typecheck
+        raise InvalidCursorError("Malformed cursor.")
+    return value
@@ -0,0 +1,206 @@
+"""Marketing content generation for trends, with caching and coalescing.
+
+Completions are cached by (trend id, trend version, prompt template version,
+generation parameters), so repeated requests for the same hot trend are
+served without calling the LLM until the trend changes or the entry
+expires. Concurrent identical requests that miss the cache share a single
+upstream call.
+
+stream() forwards text deltas while the completion is still being
+generated and caches the parsed result once it is complete.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from dataclasses import dataclass
+from functools import lru_cache
+
+from pydantic import ValidationError
+
+from backend.app.core.config import settings
+from backend.app.llm_integration.cache import SingleFlight, TTLCache
+from backend.app.llm_integration.providers import (
+    LLMProvider,
+    LLMProviderError,
+    close_llm_provider,
+    get_llm_provider,
+)
+from backend.app.schemas.content_generation import (
+    GenerateContentRequest,
+    GeneratedContentSchema,
+)
+from backend.app.trend_identification.trends import Trend
+
+logger = logging.getLogger(__name__)
+
+PROMPT_TEMPLATE = """You are a marketing strategist writing for Mailchimp customers.
+
+Trend: {name}
+Articles about this trend: {article_count}
+Recent coverage:
+{snippets}
+
+Write content ideas in a {tone} tone that help a small business use this trend.
+Reply with only a JSON object with these keys:
+- "email_subject_lines": {subject_line_count} concise email subject lines
+- "email_body_copy": one short paragraph (2-3 sentences) of email body copy
+- "campaign_themes": {campaign_theme_count} campaign theme ideas
+"""
+# Identifies the template in cache keys; changes whenever the text changes.
+PROMPT_TEMPLATE_VERSION = hashlib.sha256(PROMPT_TEMPLATE.encode()).hexdigest()[:12]
+
+CacheKey = tuple[str, str, str, str]
+
+
+class ContentParseError(LLMProviderError):
+    """Raised when a completion does not contain the expected JSON."""
+
+
+@dataclass(frozen=True)
+class GenerationResult:
+    """Generated content and whether it came from the cache."""
+
+    content: GeneratedContentSchema
+    cached: bool
+
+
+def build_prompt(trend: Trend, params: GenerateContentRequest) -> str:
+    """Fills the prompt template for a trend."""
+    return PROMPT_TEMPLATE.format(
+        name=trend.name,
+        article_count=trend.article_count,
+        snippets="\n".join(f"- {snippet}" for snippet in trend.snippets) or "- n/a",
+        tone=params.tone,
+        subject_line_count=params.subject_line_count,
+        campaign_theme_count=params.campaign_theme_count,
+    )
+
+
+def parse_generated_content(text: str) -> GeneratedContentSchema:
+    """
+    Extracts the content JSON object from a completion.
+
+    Raises:
+        ContentParseError: If no valid content object is found.
+    """
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end < start:
+        raise ContentParseError("Completion contains no JSON object.")
+    try:
+        return GeneratedContentSchema.model_validate(json.loads(text[start : end + 1]))
+    except (json.JSONDecodeError, ValidationError) as e:
+        raise ContentParseError(f"Completion is not valid content JSON: {e}") from e
+
+
+class ContentGenerator:
+    """Generates content ideas for trends through a cache and single-flight."""
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cache: TTLCache[CacheKey, GeneratedContentSchema],
+        *,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+    ):
+        self.provider = provider
+        self.cache = cache
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self._flight: SingleFlight[CacheKey, GeneratedContentSchema] = SingleFlight()
+
+    @staticmethod
+    def cache_key(trend: Trend, params: GenerateContentRequest) -> CacheKey:
+        """Key identifying a generation: trend version, template and params."""
+        return (
+            trend.id,
+            trend.version,
+            PROMPT_TEMPLATE_VERSION,
+            params.model_dump_json(),
+        )
+
+    async def generate(
+        self, trend: Trend, params: GenerateContentRequest
+    ) -> GenerationResult:
+        """Returns cached content for the trend, generating it on a miss."""
+        key = self.cache_key(trend, params)
+        content = self.cache.get(key)
+        if content is not None:
+            return GenerationResult(content=content, cached=True)
+
+        async def work() -> GeneratedContentSchema:
+            logger.info(
+                "Generating content for trend %s (version %s) with %s.",
+                trend.id,
+                trend.version,
+                self.provider.name,
+            )
+            text = await self.provider.complete(
+                build_prompt(trend, params),
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+            )
+            generated = parse_generated_content(text)
+            self.cache.set(key, generated)
+            return generated
+
+        return GenerationResult(content=await self._flight.do(key, work), cached=False)
+
+    async def stream(
+        self, trend: Trend, params: GenerateContentRequest
+    ) -> AsyncGenerator[str | GenerationResult, None]:
+        """
+        Yields completion text as it arrives, then the final GenerationResult.
+
+        A cache hit yields only the result. If the consumer stops early (for
+        example because the client disconnected), the upstream stream is
+        closed and nothing is cached.
+        """
+        key = self.cache_key(trend, params)
+        content = self.cache.get(key)
+        if content is not None:
+            yield GenerationResult(content=content, cached=True)
+            return
+
+        logger.info(
+            "Streaming content for trend %s (version %s) with %s.",
+            trend.id,
+            trend.version,
+            self.provider.name,
+        )
+        pieces: list[str] = []
+        upstream = self.provider.stream(
+            build_prompt(trend, params),
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+        )
+        async with aclosing(upstream):
+            async for piece in upstream:
+                pieces.append(piece)
+                yield piece
+        generated = parse_generated_content("".join(pieces))
+        self.cache.set(key, generated)
+        yield GenerationResult(content=generated, cached=False)
+
+
+@lru_cache(maxsize=1)
+def get_content_generator() -> ContentGenerator:
+    """Returns the process-wide ContentGenerator."""
+    return ContentGenerator(
+        get_llm_provider(),
+        TTLCache(
+            settings.GENERATION_CACHE_MAX_ENTRIES,
+            settings.GENERATION_CACHE_TTL_SECONDS,
+        ),
+        max_tokens=settings.LLM_MAX_TOKENS,
+        temperature=settings.LLM_TEMPERATURE,
+    )
+
+
+async def close_content_generator() -> None:
+    """Drops the process-wide ContentGenerator and closes its provider."""
+    get_content_generator.cache_clear()
+    await close_llm_provider()
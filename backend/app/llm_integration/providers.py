@@ -0,0 +1,240 @@
+"""LLM providers used for marketing content generation.
+
+AnthropicProvider calls the Claude Messages API. StubLLMProvider is a
+deterministic local stand-in with configurable latency: the same prompt
+always yields the same completion, so the whole generation path (API,
+caching, coalescing, streaming) can be exercised and load-tested offline.
+
+Providers return a whole completion from complete() and text deltas as
+they are generated from stream().
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from typing import Protocol
+
+import httpx
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ANTHROPIC_API_VERSION = "2023-06-01"
+
+
+class LLMProviderError(Exception):
+    """Raised when the LLM provider fails to produce a completion."""
+
+
+class LLMUnavailableError(LLMProviderError):
+    """Raised when the provider is rate limited or temporarily unavailable."""
+
+
+class LLMProvider(Protocol):
+    """Produces a text completion for a prompt."""
+
+    name: str
+
+    async def complete(
+        self, prompt: str, *, max_tokens: int, temperature: float
+    ) -> str:
+        """Returns the completion text for a single-turn prompt."""
+
+    def stream(
+        self, prompt: str, *, max_tokens: int, temperature: float
+    ) -> AsyncIterator[str]:
+        """Yields the completion text in pieces as it is generated."""
+
+
+class StubLLMProvider:
+    """Deterministic offline provider returning content-idea JSON."""
+
+    name = "stub"
+
+    SUBJECTS = [
+        "{topic}: what your audience wants next",
+        "3 ways to ride the {topic} wave",
+        "Your quick guide to {topic}",
+        "Why {topic} matters for your next campaign",
+        "{topic}, simplified",
+    ]
+    BODIES = [
+        "{topic} is shaping how customers discover brands. Here is how to "
+        "turn it into campaigns that feel timely and genuinely useful.",
+        "Audiences are paying attention to {topic}. Meet them there with "
+        "content that is short, specific and easy to act on.",
+    ]
+    THEMES = [
+        "{topic} in 30 days",
+        "Behind the scenes of {topic}",
+        "{topic} for small businesses",
+        "Ask the experts: {topic}",
+    ]
+
+    STREAM_CHUNK_CHARS = 16
+
+    def __init__(self, latency_seconds: float = 0.0):
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+
+    @staticmethod
+    def _topic(prompt: str) -> str:
+        for line in prompt.splitlines():
+            if line.startswith("Trend:"):
+                return line.removeprefix("Trend:").strip()
+        return "this trend"
+
+    def _content(self, prompt: str) -> dict[str, object]:
+        seed = int.from_bytes(hashlib.sha256(prompt.encode("utf-8")).digest()[:8])
+        rng = random.Random(seed)
+        topic = self._topic(prompt)
+        return {
+            "email_subject_lines": [
+                subject.format(topic=topic) for subject in rng.sample(self.SUBJECTS, 3)
+            ],
+            "email_body_copy": rng.choice(self.BODIES).format(topic=topic),
+            "campaign_themes": [
+                theme.format(topic=topic) for theme in rng.sample(self.THEMES, 2)
+            ],
+        }
+
+    async def complete(  # pylint: disable=unused-argument
+        self, prompt: str, *, max_tokens: int, temperature: float
+    ) -> str:
+        """Returns a deterministic JSON completion after the configured delay."""
+        self.calls += 1
+        await asyncio.sleep(self.latency_seconds)
+        return json.dumps(self._content(prompt))
+
+    async def stream(  # pylint: disable=unused-argument
+        self, prompt: str, *, max_tokens: int, temperature: float
+    ) -> AsyncIterator[str]:
+        """Yields the same completion a few characters at a time, spreading
+        the configured latency evenly across the pieces."""
+        self.calls += 1
+        text = json.dumps(self._content(prompt))
+        pieces = [
+            text[i : i + self.STREAM_CHUNK_CHARS]
+            for i in range(0, len(text), self.STREAM_CHUNK_CHARS)
+        ]
+        for piece in pieces:
+            await asyncio.sleep(self.latency_seconds / len(pieces))
+            yield piece
+
+
+class AnthropicProvider:
+    """Anthropic Claude Messages API provider."""
+
+    name = "anthropic"
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        *,
+        base_url: str = "https://api.anthropic.com/v1",
+        timeout: float = 60.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.model = model
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            transport=transport,
+            headers={
+                "x-api-key": api_key,
+                "anthropic-version": ANTHROPIC_API_VERSION,
+                "content-type": "application/json",
+            },
+        )
+
+    def _body(self, prompt: str, max_tokens: int, temperature: float) -> dict:
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    @staticmethod
+    def _error_for(response: httpx.Response) -> LLMProviderError:
+        status = response.status_code
+        logger.error("Claude API returned %s: %s", status, response.text[:500])
+        if status == 429 or status >= 500:
+            return LLMUnavailableError(f"Claude API unavailable ({status}).")
+        return LLMProviderError(f"Claude API error ({status}).")
+
+    async def complete(
+        self, prompt: str, *, max_tokens: int, temperature: float
+    ) -> str:
+        """Sends a single user message and returns the concatenated text."""
+        try:
+            response = await self._client.post(
+                "/messages", json=self._body(prompt, max_tokens, temperature)
+            )
+        except httpx.RequestError as e:
+            logger.error("Request to Claude API failed: %s", e.__class__.__name__)
+            raise LLMUnavailableError("Claude API request failed.") from e
+        if response.is_error:
+            raise self._error_for(response)
+        blocks = response.json().get("content", [])
+        return "".join(block.get("text", "") for block in blocks)
+
+    async def stream(
+        self, prompt: str, *, max_tokens: int, temperature: float
+    ) -> AsyncIterator[str]:
+        """
+        Streams a completion, yielding the text of each content_block_delta
+        server-sent event. Closing the iterator closes the HTTP stream.
+        """
+        body = self._body(prompt, max_tokens, temperature) | {"stream": True}
+        try:
+            async with self._client.stream("POST", "/messages", json=body) as response:
+                if response.is_error:
+                    await response.aread()
+                    raise self._error_for(response)
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    event = json.loads(line.removeprefix("data:"))
+                    if event.get("type") == "content_block_delta":
+                        yield event["delta"].get("text", "")
+                    elif event.get("type") == "error":
+                        message = event.get("error", {}).get("message", "")
+                        raise LLMUnavailableError(f"Claude stream error: {message}")
+        except httpx.RequestError as e:
+            logger.error("Claude API stream failed: %s", e.__class__.__name__)
+            raise LLMUnavailableError("Claude API request failed.") from e
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP client."""
+        await self._client.aclose()
+
+
+@lru_cache(maxsize=1)
+def get_llm_provider() -> LLMProvider:
+    """Returns the configured process-wide LLM provider."""
+    if settings.LLM_PROVIDER == "anthropic":
+        if not settings.ANTHROPIC_API_KEY:
+            raise LLMProviderError("LLM_PROVIDER is anthropic but no API key is set.")
+        return AnthropicProvider(
+            settings.ANTHROPIC_API_KEY,
+            settings.ANTHROPIC_MODEL,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+        )
+    return StubLLMProvider(latency_seconds=settings.LLM_STUB_LATENCY_SECONDS)
+
+
+async def close_llm_provider() -> None:
+    """Releases the process-wide provider's resources if it was created."""
+    # pylint: disable-next=too-many-function-args
+    if get_llm_provider.cache_info().currsize:
+        provider = get_llm_provider()
+        if isinstance(provider, AnthropicProvider):
+            await provider.aclose()
+        get_llm_provider.cache_clear()
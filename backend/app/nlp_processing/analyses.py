@@ -0,0 +1,271 @@
+"""Persisted sentiment and topic analyses of stored articles.
+
+Every analysis is tagged with the ANALYSIS_VERSION it was computed under.
+When the models, the topic ontology or the scoring change, the version is
+bumped and a backfill (see backfill.py) recomputes the stored articles.
+Backfill progress is checkpointed in the same transaction as each batch of
+results, so an interrupted backfill resumes right after the last batch it
+saved and never skips or double-counts an article.
+"""
+
+import logging
+import sqlite3
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from backend.app.core.config import settings
+from backend.app.db.database import connect
+from backend.app.nlp_processing.inference import ArticleAnalysis
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS article_analyses (
+    article_id INTEGER PRIMARY KEY,
+    sentiment_label TEXT NOT NULL,
+    sentiment_score REAL NOT NULL,
+    topic_id INTEGER,
+    version TEXT NOT NULL,
+    analyzed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_article_analyses_version
+    ON article_analyses (version);
+CREATE TABLE IF NOT EXISTS analysis_backfills (
+    version TEXT PRIMARY KEY,
+    target_article_id INTEGER NOT NULL,
+    last_article_id INTEGER NOT NULL,
+    processed INTEGER NOT NULL,
+    started_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    completed_at TEXT
+);
+"""
+
+UPSERT_ANALYSIS_SQL = (
+    "INSERT INTO article_analyses (article_id, sentiment_label, sentiment_score, "
+    "topic_id, version, analyzed_at) VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (article_id) DO UPDATE SET "
+    "sentiment_label = excluded.sentiment_label, "
+    "sentiment_score = excluded.sentiment_score, topic_id = excluded.topic_id, "
+    "version = excluded.version, analyzed_at = excluded.analyzed_at"
+)
+
+
+@dataclass(frozen=True)
+class StoredAnalysis:
+    """An article's persisted analysis."""
+
+    article_id: int
+    sentiment_label: str
+    sentiment_score: float
+    topic_id: int | None
+    version: str
+    analyzed_at: datetime
+
+
+@dataclass(frozen=True)
+class SentimentSummary:
+    """Sentiment of the articles analyzed under one version."""
+
+    articles: int
+    mean_score: float
+    label_counts: dict[str, int]
+
+
+@dataclass(frozen=True)
+class BackfillRun:
+    """Progress of recomputing articles up to target_article_id for a version."""
+
+    version: str
+    target_article_id: int
+    last_article_id: int
+    processed: int
+    completed: bool
+
+
+def _row_to_run(row: sqlite3.Row) -> BackfillRun:
+    return BackfillRun(
+        version=row["version"],
+        target_article_id=row["target_article_id"],
+        last_article_id=row["last_article_id"],
+        processed=row["processed"],
+        completed=row["completed_at"] is not None,
+    )
+
+
+class AnalysisStore:
+    """SQLite-backed store of article analyses and backfill checkpoints."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._conn = connection
+        self._lock = threading.Lock()
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def save(self, article_id: int, analysis: ArticleAnalysis, version: str) -> None:
+        """Stores (or replaces) the analysis of one article."""
+        self.save_batch([(article_id, analysis)], version)
+
+    def save_batch(
+        self,
+        results: Sequence[tuple[int, ArticleAnalysis]],
+        version: str,
+        backfilled_through: int | None = None,
+    ) -> None:
+        """
+        Stores analyses in one transaction.
+
+        Args:
+            results: (article id, analysis) pairs.
+            version: The analysis version they were computed under.
+            backfilled_through: If set, the version's backfill checkpoint is
+                advanced to this article id in the same transaction.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    UPSERT_ANALYSIS_SQL,
+                    [
+                        (
+                            article_id,
+                            analysis.sentiment.label,
+                            analysis.sentiment.score,
+                            analysis.topic_id,
+                            version,
+                            now,
+                        )
+                        for article_id, analysis in results
+                    ],
+                )
+                if backfilled_through is not None:
+                    self._conn.execute(
+                        "UPDATE analysis_backfills SET last_article_id = ?, "
+                        "processed = processed + ?, updated_at = ? WHERE version = ?",
+                        (backfilled_through, len(results), now, version),
+                    )
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+                raise
+
+    def get(self, article_id: int) -> StoredAnalysis | None:
+        """Returns an article's analysis, or None if it has none."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM article_analyses WHERE article_id = ?", (article_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return StoredAnalysis(
+            article_id=row["article_id"],
+            sentiment_label=row["sentiment_label"],
+            sentiment_score=row["sentiment_score"],
+            topic_id=row["topic_id"],
+            version=row["version"],
+            analyzed_at=datetime.fromisoformat(row["analyzed_at"]),
+        )
+
+    def version_counts(self) -> dict[str, int]:
+        """Returns the number of stored analyses per version."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT version, COUNT(*) AS n FROM article_analyses GROUP BY version"
+            ).fetchall()
+        return {row["version"]: row["n"] for row in rows}
+
+    def sentiment_summary(self, version: str) -> SentimentSummary:
+        """Returns article counts per sentiment label and the mean score."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT sentiment_label, COUNT(*) AS n, SUM(sentiment_score) AS total "
+                "FROM article_analyses WHERE version = ? GROUP BY sentiment_label",
+                (version,),
+            ).fetchall()
+        articles = sum(row["n"] for row in rows)
+        return SentimentSummary(
+            articles=articles,
+            mean_score=sum(row["total"] for row in rows) / articles
+            if articles
+            else 0.0,
+            label_counts={row["sentiment_label"]: row["n"] for row in rows},
+        )
+
+    def start_backfill(
+        self, version: str, target_article_id: int, restart: bool = False
+    ) -> BackfillRun:
+        """
+        Returns the version's backfill, creating it if there is none.
+
+        An existing run keeps its target and checkpoint, so it resumes where
+        it stopped; with restart it starts over, targeting target_article_id.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO analysis_backfills (version, target_article_id, "
+                "last_article_id, processed, started_at, updated_at) "
+                "VALUES (?, ?, 0, 0, ?, ?) ON CONFLICT (version) DO "
+                + (
+                    "UPDATE SET target_article_id = excluded.target_article_id, "
+                    "last_article_id = 0, processed = 0, completed_at = NULL, "
+                    "started_at = excluded.started_at, "
+                    "updated_at = excluded.updated_at"
+                    if restart
+                    else "NOTHING"
+                ),
+                (version, target_article_id, now, now),
+            )
+            self._conn.commit()
+        run = self.backfill(version)
+        assert run is not None
+        return run
+
+    def backfill(self, version: str) -> BackfillRun | None:
+        """Returns the version's backfill, or None if it never started."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM analysis_backfills WHERE version = ?", (version,)
+            ).fetchone()
+        return _row_to_run(row) if row else None
+
+    def complete_backfill(self, version: str) -> None:
+        """Marks the version's backfill as completed."""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE analysis_backfills SET completed_at = ?, updated_at = ? "
+                "WHERE version = ?",
+                (now, now, version),
+            )
+            self._conn.commit()
+
+    def backfills(self) -> list[BackfillRun]:
+        """Returns every backfill, most recently started first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM analysis_backfills ORDER BY started_at DESC"
+            ).fetchall()
+        return [_row_to_run(row) for row in rows]
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_analysis_store() -> AnalysisStore:
+    """Returns the process-wide AnalysisStore, creating it on first use."""
+    return AnalysisStore(connect(settings.DATABASE_PATH))
+
+
+def close_analysis_store() -> None:
+    """Closes the process-wide AnalysisStore if it was opened."""
+    # pylint: disable-next=too-many-function-args
+    if get_analysis_store.cache_info().currsize:
+        get_analysis_store().close()
+        get_analysis_store.cache_clear()
@@ -0,0 +1,361 @@
+"""Parallel, resumable reprocessing of every stored article.
+
+After ANALYSIS_VERSION is bumped (the models, the topic ontology or the
+scoring changed), a backfill recomputes the analysis of every article
+stored before it started:
+
+    python -m backend.app.nlp_processing.backfill run
+    python -m backend.app.nlp_processing.backfill status
+
+The parent process streams article ids from the database in batches and
+hands each batch to a pool of worker processes, which read and decompress
+the bodies themselves and analyze a whole batch with one call per model.
+Results are written back in order, one transaction per batch that also
+advances the backfill checkpoint, so an interrupted run (Ctrl-C, SIGTERM,
+a crash) resumes after the last saved batch when started again.
+
+To leave room for live ingestion and the API, workers run at a lower CPU
+priority (BACKFILL_NICE) and batches are paced to at most
+BACKFILL_MAX_ARTICLES_PER_SECOND. Topics are assigned against a snapshot
+of the cluster centroids taken when the run starts, so every article in a
+run is scored against the same model.
+"""
+
+import argparse
+import logging
+import os
+import signal
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+
+import numpy as np
+
+from backend.app.core.config import settings
+from backend.app.data_ingestion.content_store import (
+    ArticleStore,
+    close_article_store,
+    get_article_store,
+)
+from backend.app.data_ingestion.rate_limiter import TokenBucket
+from backend.app.db.database import connect
+from backend.app.nlp_processing.analyses import (
+    BackfillRun,
+    close_analysis_store,
+    get_analysis_store,
+)
+from backend.app.nlp_processing.chunking import iter_windows
+from backend.app.nlp_processing.clustering import (
+    close_topic_cluster_store,
+    get_topic_cluster_store,
+)
+from backend.app.nlp_processing.embeddings import HashingEmbedder
+from backend.app.nlp_processing.inference import ArticleAnalysis, aggregate_analyses
+from backend.app.nlp_processing.models import LexiconSentimentModel, TopicModel
+
+logger = logging.getLogger(__name__)
+
+
+def analyze_documents(
+    texts: Sequence[str],
+    sentiment_model: LexiconSentimentModel,
+    topic_model: TopicModel,
+    window_chars: int = 2000,
+    window_overlap_chars: int = 200,
+) -> list[ArticleAnalysis]:
+    """
+    Analyzes texts window by window with one call per model for all texts.
+
+    Gives the same results as InferenceService.analyze_document, without
+    the micro-batching that only pays off for concurrent live callers.
+    """
+    windows = [
+        list(iter_windows(text, window_chars, window_overlap_chars)) for text in texts
+    ]
+    window_texts: list[str] = []
+    for text, text_windows in zip(texts, windows):
+        window_texts += [w.text for w in text_windows] if text_windows else [text]
+    sentiments = sentiment_model.predict_batch(window_texts)
+    topics = topic_model.predict_batch(window_texts)
+
+    results = []
+    start = 0
+    for text_windows in windows:
+        end = start + max(len(text_windows), 1)
+        analyses = [
+            ArticleAnalysis(sentiment=sentiment, topic_id=topic_id)
+            for sentiment, topic_id in zip(sentiments[start:end], topics[start:end])
+        ]
+        if len(analyses) > 1:
+            results.append(
+                aggregate_analyses(analyses, [w.end - w.start for w in text_windows])
+            )
+        else:
+            results.append(analyses[0])
+        start = end
+    return results
+
+
+@dataclass(frozen=True)
+class WorkerConfig:
+    """Everything a worker process needs, sent once when it starts."""
+
+    database_path: str
+    centroid_ids: np.ndarray
+    centroids: np.ndarray
+    embedding_dimension: int
+    window_chars: int
+    window_overlap_chars: int
+    nice: int = 0
+
+
+class _Worker:  # pylint: disable=too-few-public-methods
+    """Per-process state of a backfill worker."""
+
+    def __init__(self, config: WorkerConfig):
+        self.config = config
+        self.articles = ArticleStore(connect(config.database_path))
+        self.sentiment = LexiconSentimentModel()
+        self.topics = TopicModel(
+            HashingEmbedder(config.embedding_dimension),
+            lambda: (config.centroid_ids, config.centroids),
+        )
+
+
+_workers: list[_Worker] = []
+
+
+def _init_worker(config: WorkerConfig) -> None:
+    # The parent handles Ctrl-C and stops the pool itself.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if config.nice:
+        os.nice(config.nice)
+    _workers[:] = [_Worker(config)]
+
+
+def analyze_batch(after_id: int, limit: int) -> list[tuple[int, ArticleAnalysis]]:
+    """Analyzes up to `limit` articles above after_id in a worker process."""
+    worker = _workers[0]
+    batch = worker.articles.get_articles_after(after_id, limit)
+    analyses = analyze_documents(
+        [article.content for article in batch],
+        worker.sentiment,
+        worker.topics,
+        worker.config.window_chars,
+        worker.config.window_overlap_chars,
+    )
+    return [(article.id, analysis) for article, analysis in zip(batch, analyses)]
+
+
+@dataclass
+class BackfillProgress:
+    """Throughput and time remaining of a running backfill."""
+
+    total: int
+    started_at: float
+    done: int = 0
+
+    def rate(self, now: float) -> float:
+        """Articles per second so far."""
+        elapsed = now - self.started_at
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def eta(self, now: float) -> float | None:
+        """Seconds until the remaining articles are done, or None if unknown."""
+        rate = self.rate(now)
+        return max(self.total - self.done, 0) / rate if rate > 0 else None
+
+    def describe(self, now: float) -> str:
+        """One line such as '300/1,000 (30.0%), 150.0 articles/s, ETA 0:00:05'."""
+        eta = self.eta(now)
+        percent = 100 * self.done / self.total if self.total else 100.0
+        return (
+            f"{self.done:,}/{self.total:,} ({percent:.1f}%), "
+            f"{self.rate(now):,.1f} articles/s, "
+            f"ETA {'?' if eta is None else timedelta(seconds=round(eta))}"
+        )
+
+
+def _id_batches(
+    articles: ArticleStore, after_id: int, up_to: int, batch_size: int
+) -> Iterator[list[int]]:
+    while ids := articles.article_ids_after(after_id, batch_size, up_to):
+        yield ids
+        after_id = ids[-1]
+
+
+def _throttle(bucket: TokenBucket | None, tokens: int) -> None:
+    if bucket is None:
+        return
+    while not bucket.try_acquire(tokens):
+        time.sleep((tokens - bucket.available) / bucket.rate)
+
+
+def run_backfill(  # pylint: disable=too-many-arguments,too-many-locals
+    version: str | None = None,
+    *,
+    workers: int | None = None,
+    batch_size: int | None = None,
+    max_rate: float | None = None,
+    restart: bool = False,
+    clock: Callable[[], float] = time.monotonic,
+) -> BackfillRun:
+    """
+    Recomputes the analysis of every article stored before the run started.
+
+    Args:
+        version: The analysis version; defaults to ANALYSIS_VERSION.
+        workers: Worker processes; defaults to BACKFILL_WORKERS (0 = CPUs).
+        batch_size: Articles per batch; defaults to BACKFILL_BATCH_SIZE.
+        max_rate: Articles per second (0 = unlimited); defaults to
+            BACKFILL_MAX_ARTICLES_PER_SECOND.
+        restart: Start over instead of resuming an unfinished run.
+        clock: Time source for progress reports.
+
+    Returns:
+        The run's final state.
+    """
+    version = version or settings.ANALYSIS_VERSION
+    workers = (workers or settings.BACKFILL_WORKERS) or os.cpu_count() or 1
+    batch_size = batch_size or settings.BACKFILL_BATCH_SIZE
+    max_rate = (
+        settings.BACKFILL_MAX_ARTICLES_PER_SECOND if max_rate is None else max_rate
+    )
+    articles = get_article_store()
+    analyses = get_analysis_store()
+
+    run = analyses.start_backfill(version, articles.max_article_id(), restart)
+    if run.completed:
+        logger.info(
+            "Backfill %s already completed (%s articles).", version, run.processed
+        )
+        return run
+    progress = BackfillProgress(
+        total=articles.count_articles(run.last_article_id, run.target_article_id),
+        started_at=clock(),
+    )
+    logger.info(
+        "%s backfill %s: %s articles up to id %s on %s workers.",
+        "Resuming" if run.last_article_id else "Starting",
+        version,
+        progress.total,
+        run.target_article_id,
+        workers,
+    )
+    centroid_ids, centroids = get_topic_cluster_store().centroid_snapshot()
+    config = WorkerConfig(
+        database_path=settings.DATABASE_PATH,
+        centroid_ids=centroid_ids,
+        centroids=centroids,
+        embedding_dimension=settings.EMBEDDING_DIMENSION,
+        window_chars=settings.ARTICLE_WINDOW_CHARS,
+        window_overlap_chars=settings.ARTICLE_WINDOW_OVERLAP_CHARS,
+        nice=settings.BACKFILL_NICE,
+    )
+    bucket = TokenBucket(max_rate, capacity=batch_size) if max_rate > 0 else None
+    # Batches in submission order with their last id; saved strictly in
+    # order so the checkpoint never passes an unsaved batch.
+    pending: deque[tuple[Future, int]] = deque()
+
+    def save_next() -> None:
+        future, last_id = pending.popleft()
+        results = future.result()
+        analyses.save_batch(results, version, backfilled_through=last_id)
+        progress.done += len(results)
+        logger.info("Backfill %s: %s.", version, progress.describe(clock()))
+
+    with ProcessPoolExecutor(
+        workers, initializer=_init_worker, initargs=(config,)
+    ) as pool:
+        try:
+            for ids in _id_batches(
+                articles, run.last_article_id, run.target_article_id, batch_size
+            ):
+                # Keep every worker busy, with one batch each queued behind.
+                if len(pending) >= 2 * workers:
+                    save_next()
+                _throttle(bucket, len(ids))
+                pending.append(
+                    (pool.submit(analyze_batch, ids[0] - 1, len(ids)), ids[-1])
+                )
+            while pending:
+                save_next()
+        except BaseException:
+            for future, _ in pending:
+                future.cancel()
+            raise
+
+    analyses.complete_backfill(version)
+    run = analyses.backfill(version) or run
+    logger.info(
+        "Backfill %s completed: %s articles, %.1f articles/s.",
+        version,
+        run.processed,
+        progress.rate(clock()),
+    )
+    return run
+
+
+def describe_backfills() -> str:
+    """Summarizes stored analyses per version and every backfill run."""
+    counts = get_analysis_store().version_counts()
+    lines = [f"current version: {settings.ANALYSIS_VERSION}"]
+    lines += [f"analyses v{version}: {n:,}" for version, n in sorted(counts.items())]
+    for run in get_analysis_store().backfills():
+        state = (
+            "completed"
+            if run.completed
+            else f"checkpoint at id {run.last_article_id:,}"
+        )
+        lines.append(
+            f"backfill v{run.version}: {run.processed:,} articles "
+            f"up to id {run.target_article_id:,}, {state}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Main function of the backfill command line.
+    """
+    logging.basicConfig(level=settings.LOG_LEVEL.upper())
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="Show analysis versions and backfills")
+    run = commands.add_parser("run", help="Recompute stored article analyses")
+    run.add_argument("--version", default=None)
+    run.add_argument("--workers", type=int, default=None)
+    run.add_argument("--batch-size", type=int, default=None)
+    run.add_argument(
+        "--max-rate", type=float, default=None, help="Articles per second (0 = no cap)"
+    )
+    run.add_argument(
+        "--restart", action="store_true", help="Start over instead of resuming"
+    )
+    args = parser.parse_args(argv)
+    # SIGTERM stops a run like Ctrl-C; either way it resumes from its checkpoint.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        if args.command == "status":
+            print(describe_backfills())
+        else:
+            run_backfill(
+                args.version,
+                workers=args.workers,
+                batch_size=args.batch_size,
+                max_rate=args.max_rate,
+                restart=args.restart,
+            )
+    except KeyboardInterrupt:
+        logger.warning("Backfill interrupted; run it again to resume.")
+    finally:
+        close_analysis_store()
+        close_topic_cluster_store()
+        close_article_store()
+
+
+if __name__ == "__main__":
+    main()
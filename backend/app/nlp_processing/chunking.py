@@ -0,0 +1,87 @@
+"""Sentence-aligned windows over long article text.
+
+Models have context limits, and tokenizing a very long page in one go means
+one large temporary allocation per article. iter_windows lazily yields
+overlapping windows of at most max_chars characters that start and end on
+sentence boundaries, so downstream work per step is bounded by the window
+size rather than the document size. Sentences longer than a window are
+split at the last whitespace that fits (or hard-split if there is none).
+"""
+
+import re
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+|\n\s*\n\s*")
+_WHITESPACE_RE = re.compile(r"\s")
+
+
+@dataclass(frozen=True)
+class TextWindow:
+    """A slice of a document, with its character offsets."""
+
+    start: int
+    end: int
+    text: str
+
+
+def iter_sentence_spans(text: str) -> Iterator[tuple[int, int]]:
+    """Yields (start, end) offsets of each sentence, without trailing space."""
+    start = 0
+    for match in _SENTENCE_BREAK_RE.finditer(text):
+        if match.start() > start:
+            yield start, match.start()
+        start = match.end()
+    if start < len(text):
+        yield start, len(text)
+
+
+def _bounded_spans(text: str, max_chars: int) -> Iterator[tuple[int, int]]:
+    """Sentence spans, with sentences longer than max_chars split up."""
+    for start, end in iter_sentence_spans(text):
+        while end - start > max_chars:
+            limit = start + max_chars
+            split = limit
+            for match in _WHITESPACE_RE.finditer(text, start + 1, limit):
+                split = match.start()
+            yield start, split
+            start = split
+            while start < end and text[start].isspace():
+                start += 1
+        if start < end:
+            yield start, end
+
+
+def iter_windows(
+    text: str, max_chars: int = 2000, overlap_chars: int = 200
+) -> Iterator[TextWindow]:
+    """
+    Yields overlapping, sentence-aligned windows covering text.
+
+    Args:
+        text: The document.
+        max_chars: Maximum window length in characters.
+        overlap_chars: Up to this many characters of whole trailing sentences
+            from one window are repeated at the start of the next.
+
+    Raises:
+        ValueError: If max_chars < 1 or overlap_chars is not in [0, max_chars).
+    """
+    if max_chars < 1:
+        raise ValueError("max_chars must be at least 1")
+    if not 0 <= overlap_chars < max_chars:
+        raise ValueError("overlap_chars must be in [0, max_chars)")
+    window: deque[tuple[int, int]] = deque()
+    for start, end in _bounded_spans(text, max_chars):
+        if window and end - window[0][0] > max_chars:
+            first, last = window[0][0], window[-1][1]
+            yield TextWindow(first, last, text[first:last])
+            while window and (
+                last - window[0][0] > overlap_chars or end - window[0][0] > max_chars
+            ):
+                window.popleft()
+        window.append((start, end))
+    if window:
+        first, last = window[0][0], window[-1][1]
+        yield TextWindow(first, last, text[first:last])
@@ -0,0 +1,673 @@
+"""Online incremental topic clustering of article embeddings.
+
+Each ingestion batch is folded into the existing topic clusters instead of
+re-clustering the whole corpus, so the cost of a cycle depends on the batch
+size and the (bounded) number of clusters, never on history:
+
+- every article joins the most similar cluster if its cosine similarity
+  reaches spawn_threshold, otherwise it seeds a new cluster;
+- joined clusters move towards their new members (mini-batch spherical
+  k-means). A cluster's weight is capped at max_weight, so old articles are
+  gradually forgotten and clusters follow topic drift;
+- clusters whose centroids drift to within merge_threshold of each other
+  are merged, and the smallest clusters are merged into their nearest
+  neighbour whenever max_clusters is exceeded.
+
+Cluster state and article assignments are persisted in SQLite, together
+with a watermark of the last clustered article, so clustering resumes where
+it left off after a restart.
+
+Every process sharing the database (API, worker replicas) may cluster, but
+only one at a time: a batch is folded in under BEGIN IMMEDIATE, after
+reloading the clusters if another process has committed since this one
+last did (a revision counter tracks commits), and articles already below
+the watermark are skipped.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import numpy as np
+
+from backend.app.core.config import settings
+from backend.app.data_ingestion.content_store import get_article_store
+from backend.app.db.database import connect
+from backend.app.db.pagination import Page, decode_cursor, encode_cursor
+from backend.app.nlp_processing.embeddings import (
+    content_hash,
+    get_embedding_store,
+    normalize,
+)
+from backend.app.nlp_processing.keywords import topic_name
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS topic_clusters (
+    id INTEGER PRIMARY KEY,
+    centroid BLOB NOT NULL,
+    weight REAL NOT NULL,
+    article_count INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    merged_into INTEGER REFERENCES topic_clusters (id),
+    name TEXT
+);
+CREATE TABLE IF NOT EXISTS article_topics (
+    article_id INTEGER PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    cluster_id INTEGER NOT NULL REFERENCES topic_clusters (id)
+);
+CREATE INDEX IF NOT EXISTS ix_article_topics_cluster
+    ON article_topics (cluster_id, article_id);
+-- Covers list_clusters; active clusters are the merged_into IS NULL prefix.
+CREATE INDEX IF NOT EXISTS ix_topic_clusters_listing ON topic_clusters
+    (merged_into, weight, id, article_count, created_at, updated_at, name);
+CREATE TABLE IF NOT EXISTS topic_clustering_state (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Databases created before cluster names: add the column and widen the
+# covering index; names are filled in as clusters are listed or touched.
+MIGRATE_NAMES = """
+ALTER TABLE topic_clusters ADD COLUMN name TEXT;
+DROP INDEX IF EXISTS ix_topic_clusters_weight;
+"""
+
+WATERMARK_KEY = "last_article_id"
+# Incremented by every committed batch, so stale in-memory clusters show.
+REVISION_KEY = "revision"
+
+# Articles a cluster is named after: its most recent ones.
+NAME_SAMPLE_ARTICLES = 5
+
+CLUSTER_COLUMNS = "id, article_count, weight, created_at, updated_at, name"
+# Heaviest first; the second form continues after a cursor.
+LIST_CLUSTERS_SQL = (
+    f"SELECT {CLUSTER_COLUMNS} FROM topic_clusters "
+    "WHERE merged_into IS NULL ORDER BY weight DESC, id DESC LIMIT ?"
+)
+LIST_CLUSTERS_AFTER_SQL = (
+    f"SELECT {CLUSTER_COLUMNS} FROM topic_clusters "
+    "WHERE merged_into IS NULL AND (weight, id) < (?, ?) "
+    "ORDER BY weight DESC, id DESC LIMIT ?"
+)
+
+
+@dataclass
+class ClusterUpdate:
+    """What a call to OnlineClusterer.partial_fit changed."""
+
+    assignments: list[int]
+    spawned: list[int] = field(default_factory=list)
+    # Absorbed cluster id -> surviving cluster id.
+    merged: dict[int, int] = field(default_factory=dict)
+    touched: set[int] = field(default_factory=set)
+
+
+class OnlineClusterer:  # pylint: disable=too-many-instance-attributes
+    """In-memory online spherical clustering over unit vectors."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        dimension: int,
+        *,
+        spawn_threshold: float = 0.35,
+        merge_threshold: float = 0.8,
+        max_clusters: int = 200,
+        max_weight: float = 500.0,
+    ):
+        self.dimension = dimension
+        self.spawn_threshold = spawn_threshold
+        self.merge_threshold = merge_threshold
+        self.max_clusters = max_clusters
+        self.max_weight = max_weight
+        self.centroids = np.zeros((0, dimension), dtype=np.float32)
+        self.weights = np.zeros(0, dtype=np.float64)
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.next_id = 1
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def load(
+        self,
+        ids: np.ndarray,
+        centroids: np.ndarray,
+        weights: np.ndarray,
+        counts: np.ndarray,
+    ) -> None:
+        """Replaces the cluster state, e.g. with clusters read from storage."""
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.centroids = np.asarray(centroids, dtype=np.float32).reshape(
+            -1, self.dimension
+        )
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.next_id = max(self.next_id, int(self.ids.max(initial=0)) + 1)
+
+    def _index_of(self, cluster_id: int) -> int:
+        return int(np.flatnonzero(self.ids == cluster_id)[0])
+
+    def _spawn(self, vectors: np.ndarray, update: ClusterUpdate) -> np.ndarray:
+        """Leader clustering of outliers; returns each vector's cluster index."""
+        first = len(self.ids)
+        leaders: list[np.ndarray] = []
+        indices = np.empty(len(vectors), dtype=np.int64)
+        for i, vector in enumerate(vectors):
+            if leaders:
+                similarity = np.stack(leaders) @ vector
+                best = int(np.argmax(similarity))
+                if similarity[best] >= self.spawn_threshold:
+                    indices[i] = first + best
+                    continue
+            leaders.append(vector)
+            indices[i] = first + len(leaders) - 1
+        new_ids = np.arange(self.next_id, self.next_id + len(leaders))
+        self.next_id += len(leaders)
+        self.ids = np.concatenate((self.ids, new_ids))
+        self.centroids = np.concatenate((self.centroids, np.stack(leaders)))
+        self.weights = np.concatenate((self.weights, np.zeros(len(leaders))))
+        self.counts = np.concatenate((self.counts, np.zeros(len(leaders), np.int64)))
+        update.spawned.extend(int(i) for i in new_ids)
+        return indices
+
+    def _absorb(self, keep: int, drop: int, update: ClusterUpdate) -> None:
+        """Merges cluster index `drop` into cluster index `keep`."""
+        total = self.weights[keep] + self.weights[drop]
+        merged = (
+            self.centroids[keep] * self.weights[keep]
+            + self.centroids[drop] * self.weights[drop]
+        )
+        self.centroids[keep] = normalize(merged) if total else self.centroids[keep]
+        self.weights[keep] = min(total, self.max_weight)
+        self.counts[keep] += self.counts[drop]
+        survivor, absorbed = int(self.ids[keep]), int(self.ids[drop])
+        for old, new in list(update.merged.items()):
+            if new == absorbed:
+                update.merged[old] = survivor
+        update.merged[absorbed] = survivor
+        update.touched.discard(absorbed)
+        update.touched.add(survivor)
+        mask = np.ones(len(self.ids), dtype=bool)
+        mask[drop] = False
+        self.ids = self.ids[mask]
+        self.centroids = self.centroids[mask]
+        self.weights = self.weights[mask]
+        self.counts = self.counts[mask]
+
+    def _merge_drifted(self, update: ClusterUpdate) -> None:
+        """Merges touched clusters that drifted close to another cluster."""
+        pending = set(update.touched)
+        while pending:
+            cluster_id = pending.pop()
+            if cluster_id not in self.ids:
+                continue
+            index = self._index_of(cluster_id)
+            similarity = self.centroids @ self.centroids[index]
+            similarity[index] = -np.inf
+            other = int(np.argmax(similarity))
+            if similarity[other] < self.merge_threshold:
+                continue
+            # The heavier cluster survives and keeps its id.
+            keep, drop = (
+                (index, other)
+                if self.weights[index] >= self.weights[other]
+                else (other, index)
+            )
+            survivor = int(self.ids[keep])
+            self._absorb(keep, drop, update)
+            pending.add(survivor)  # it may now be close to yet another cluster
+
+    def _enforce_max_clusters(self, update: ClusterUpdate) -> None:
+        while len(self.ids) > self.max_clusters:
+            smallest = int(np.argmin(self.weights))
+            similarity = self.centroids @ self.centroids[smallest]
+            similarity[smallest] = -np.inf
+            self._absorb(int(np.argmax(similarity)), smallest, update)
+
+    def partial_fit(self, vectors: np.ndarray) -> ClusterUpdate:
+        """
+        Folds a batch of unit vectors into the clusters.
+
+        Returns:
+            The cluster id of every vector (after any merges) and the ids of
+            spawned, merged and touched clusters.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dimension)
+        update = ClusterUpdate(assignments=[])
+        if len(vectors) == 0:
+            return update
+
+        indices = np.full(len(vectors), -1, dtype=np.int64)
+        if len(self.ids):
+            similarity = vectors @ self.centroids.T
+            best = np.argmax(similarity, axis=1)
+            joins = similarity[np.arange(len(vectors)), best] >= self.spawn_threshold
+            indices[joins] = best[joins]
+        outliers = np.flatnonzero(indices < 0)
+        if len(outliers):
+            indices[outliers] = self._spawn(vectors[outliers], update)
+
+        # Mini-batch update: move each centroid towards its new members, with
+        # the accumulated weight capped so that old articles fade out.
+        sums = np.zeros_like(self.centroids)
+        np.add.at(sums, indices, vectors)
+        batch_counts = np.bincount(indices, minlength=len(self.ids))
+        touched = np.flatnonzero(batch_counts)
+        weighted = self.centroids[touched] * self.weights[touched, None]
+        self.centroids[touched] = normalize(weighted + sums[touched])
+        self.weights[touched] = np.minimum(
+            self.weights[touched] + batch_counts[touched], self.max_weight
+        )
+        self.counts[touched] += batch_counts[touched]
+        update.touched.update(int(i) for i in self.ids[touched])
+        assigned_ids = self.ids[indices]
+
+        self._merge_drifted(update)
+        self._enforce_max_clusters(update)
+        update.assignments = [
+            update.merged.get(int(cluster_id), int(cluster_id))
+            for cluster_id in assigned_ids
+        ]
+        return update
+
+
+@dataclass(frozen=True)
+class TopicCluster:
+    """A persisted topic cluster."""
+
+    id: int
+    article_count: int
+    weight: float
+    created_at: datetime
+    updated_at: datetime
+    # None until the cluster is first named.
+    name: str | None = None
+
+
+def _row_to_cluster(row: sqlite3.Row) -> TopicCluster:
+    return TopicCluster(
+        id=row["id"],
+        article_count=row["article_count"],
+        weight=row["weight"],
+        created_at=datetime.fromisoformat(row["created_at"]),
+        updated_at=datetime.fromisoformat(row["updated_at"]),
+        name=row["name"],
+    )
+
+
+class TopicClusterStore:
+    """Persists an OnlineClusterer and the article -> cluster assignments."""
+
+    def __init__(self, connection: sqlite3.Connection, clusterer: OnlineClusterer):
+        self._conn = connection
+        self._lock = threading.Lock()
+        self.clusterer = clusterer
+        # Revision the in-memory clusterer reflects; None forces a reload.
+        self._revision: int | None = None
+        columns = {
+            row["name"]
+            for row in self._conn.execute("PRAGMA table_info(topic_clusters)")
+        }
+        if columns and "name" not in columns:
+            self._conn.executescript(MIGRATE_NAMES)
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self._reset_if_dimension_changed()
+        self._load()
+
+    def _reset_if_dimension_changed(self) -> None:
+        sizes = self._conn.execute(
+            "SELECT DISTINCT length(centroid) FROM topic_clusters "
+            "WHERE merged_into IS NULL"
+        ).fetchall()
+        if any(row[0] != 4 * self.clusterer.dimension for row in sizes):
+            # The embedding model changed, so old centroids are not comparable
+            # with new vectors: start over and re-cluster every article.
+            logger.warning("Embedding dimension changed; resetting topic clusters.")
+            self._conn.executescript(
+                "DELETE FROM article_topics; DELETE FROM topic_clusters; "
+                "DELETE FROM topic_clustering_state;"
+            )
+            self._conn.commit()
+
+    def _state(self, key: str) -> int:
+        row = self._conn.execute(
+            "SELECT value FROM topic_clustering_state WHERE key = ?", (key,)
+        ).fetchone()
+        return row["value"] if row else 0
+
+    def _load(self) -> None:
+        """Reads the active clusters into the clusterer."""
+        revision = self._state(REVISION_KEY)
+        rows = self._conn.execute(
+            "SELECT id, centroid, weight, article_count FROM topic_clusters "
+            "WHERE merged_into IS NULL ORDER BY id"
+        ).fetchall()
+        self.clusterer.load(
+            ids=np.array([row["id"] for row in rows], dtype=np.int64),
+            centroids=np.array(
+                [np.frombuffer(row["centroid"], dtype=np.float32) for row in rows],
+                dtype=np.float32,
+            ),
+            weights=np.array([row["weight"] for row in rows], dtype=np.float64),
+            counts=np.array([row["article_count"] for row in rows], dtype=np.int64),
+        )
+        max_id = self._conn.execute("SELECT MAX(id) FROM topic_clusters").fetchone()[0]
+        self.clusterer.next_id = max(self.clusterer.next_id, (max_id or 0) + 1)
+        self._revision = revision
+
+    def _refresh(self) -> None:
+        """Reloads the clusters if another process committed a batch since."""
+        if self._state(REVISION_KEY) != self._revision:
+            self._load()
+
+    @property
+    def watermark(self) -> int:
+        """Id of the last raw article that has been clustered."""
+        with self._lock:
+            return self._state(WATERMARK_KEY)
+
+    def add_batch(
+        self,
+        article_ids: list[int],
+        hashes: list[str],
+        vectors: np.ndarray,
+        texts: list[str] | None = None,
+    ) -> ClusterUpdate:
+        """
+        Clusters a batch of articles and persists the result atomically.
+
+        The database write lock is held from reading the current clusters to
+        committing the new ones. Articles at or below the watermark were
+        clustered by another process in the meantime and are skipped.
+
+        Args:
+            article_ids: Raw article ids; the highest becomes the watermark.
+            hashes: Content hash of each article.
+            vectors: Embedding of each article, one row per article.
+            texts: Body of each article. If given, every touched cluster is
+                renamed after its most recent articles.
+
+        Returns:
+            What changed; assignments cover the articles not skipped.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._refresh()
+                watermark = self._state(WATERMARK_KEY)
+                fresh = [i for i, a in enumerate(article_ids) if a > watermark]
+                article_ids = [article_ids[i] for i in fresh]
+                update = self.clusterer.partial_fit(np.asarray(vectors)[fresh])
+                if article_ids:
+                    self._write(update, article_ids, [hashes[i] for i in fresh], now)
+                if article_ids and texts is not None:
+                    self._write_names(
+                        update.touched,
+                        dict(zip(article_ids, (texts[i] for i in fresh))),
+                    )
+                self._conn.commit()
+                self._revision = self._state(REVISION_KEY)
+            except BaseException:
+                self._conn.rollback()
+                # The clusterer may hold changes that were never committed.
+                self._revision = None
+                raise
+        if update.spawned or update.merged:
+            logger.info(
+                "Topic clustering: %s articles, %s new clusters, %s merged, %s active.",
+                len(article_ids),
+                len(update.spawned),
+                len(update.merged),
+                len(self.clusterer),
+            )
+        return update
+
+    def _write(
+        self,
+        update: ClusterUpdate,
+        article_ids: list[int],
+        hashes: list[str],
+        now: str,
+    ) -> None:
+        clusterer = self.clusterer
+        for cluster_id in update.touched:
+            index = clusterer._index_of(  # pylint: disable=protected-access
+                cluster_id
+            )
+            self._conn.execute(
+                "INSERT INTO topic_clusters "
+                "(id, centroid, weight, article_count, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (id) DO UPDATE SET "
+                "centroid = excluded.centroid, weight = excluded.weight, "
+                "article_count = excluded.article_count, "
+                "updated_at = excluded.updated_at",
+                (
+                    cluster_id,
+                    clusterer.centroids[index].tobytes(),
+                    float(clusterer.weights[index]),
+                    int(clusterer.counts[index]),
+                    now,
+                    now,
+                ),
+            )
+        for absorbed, survivor in update.merged.items():
+            # Clusters spawned and absorbed within this batch were never
+            # written; record them so merged_into stays a valid reference.
+            self._conn.execute(
+                "INSERT INTO topic_clusters "
+                "(id, centroid, weight, article_count, created_at, updated_at, "
+                "merged_into) VALUES (?, x'', 0, 0, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET "
+                "merged_into = excluded.merged_into, "
+                "updated_at = excluded.updated_at",
+                (absorbed, now, now, survivor),
+            )
+            self._conn.execute(
+                "UPDATE article_topics SET cluster_id = ? WHERE cluster_id = ?",
+                (survivor, absorbed),
+            )
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO article_topics "
+            "(article_id, content_hash, cluster_id) VALUES (?, ?, ?)",
+            zip(article_ids, hashes, update.assignments),
+        )
+        self._conn.executemany(
+            "INSERT INTO topic_clustering_state (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = ?",
+            [
+                (WATERMARK_KEY, max(article_ids), max(article_ids)),
+                (REVISION_KEY, 1, self._state(REVISION_KEY) + 1),
+            ],
+        )
+
+    def _write_names(self, cluster_ids: set[int], known: dict[int, str]) -> None:
+        """
+        Names clusters after their most recent articles, taking bodies from
+        known where present and from the article store otherwise.
+        """
+        articles = get_article_store()
+        for cluster_id in cluster_ids:
+            rows = self._conn.execute(
+                "SELECT article_id FROM article_topics WHERE cluster_id = ? "
+                "ORDER BY article_id DESC LIMIT ?",
+                (cluster_id, NAME_SAMPLE_ARTICLES),
+            ).fetchall()
+            texts = []
+            for row in rows:
+                text = known.get(row["article_id"])
+                if text is None and (
+                    article := articles.get_article(row["article_id"])
+                ):
+                    text = article.content
+                if text is not None:
+                    texts.append(text)
+            self._conn.execute(
+                "UPDATE topic_clusters SET name = ? WHERE id = ?",
+                (topic_name(texts, cluster_id), cluster_id),
+            )
+
+    def name_clusters(self, cluster_ids: list[int]) -> dict[int, str]:
+        """
+        Names clusters that have no name yet (e.g. from before names were
+        stored) and returns the names of the given clusters.
+        """
+        with self._lock:
+            self._write_names(set(cluster_ids), {})
+            self._conn.commit()
+            rows = self._conn.execute(
+                "SELECT id, name FROM topic_clusters "
+                "WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(cluster_ids),),
+            ).fetchall()
+        return {row["id"]: row["name"] for row in rows}
+
+    def revision(self) -> str:
+        """
+        Returns a token that changes whenever clusters or assignments do,
+        cheap enough to poll.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*), MAX(updated_at) FROM topic_clusters"
+            ).fetchone()
+        return f"{self.watermark}-{row[0]}-{row[1] or ''}"
+
+    def clusters(self) -> list[TopicCluster]:
+        """Returns active clusters, largest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {CLUSTER_COLUMNS} FROM topic_clusters "
+                "WHERE merged_into IS NULL ORDER BY article_count DESC, id"
+            ).fetchall()
+        return [_row_to_cluster(row) for row in rows]
+
+    def list_clusters(
+        self, limit: int = 50, cursor: str | None = None
+    ) -> Page[TopicCluster]:
+        """
+        Returns a page of active clusters, highest weight first.
+
+        Args:
+            limit: Maximum number of clusters in the page.
+            cursor: next_cursor of the previous page, or None for the first.
+
+        Raises:
+            InvalidCursorError: If cursor is malformed.
+        """
+        if cursor is None:
+            sql, params = LIST_CLUSTERS_SQL, (limit + 1,)
+        else:
+            weight, cluster_id = decode_cursor(cursor, float, int)
+            sql, params = LIST_CLUSTERS_AFTER_SQL, (weight, cluster_id, limit + 1)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last["weight"], last["id"])
+        return Page([_row_to_cluster(row) for row in rows[:limit]], next_cursor)
+
+    def centroid_snapshot(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns copies of the active cluster ids and their centroids,
+        reloaded first if another process has clustered since.
+        """
+        with self._lock:
+            self._refresh()
+            return self.clusterer.ids.copy(), self.clusterer.centroids.copy()
+
+    def get_cluster(self, cluster_id: int) -> TopicCluster | None:
+        """Returns an active cluster by id, or None if unknown or merged."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {CLUSTER_COLUMNS} FROM topic_clusters "
+                "WHERE id = ? AND merged_into IS NULL",
+                (cluster_id,),
+            ).fetchone()
+        return _row_to_cluster(row) if row else None
+
+    def article_ids(self, cluster_id: int, limit: int = 10) -> list[int]:
+        """Returns the ids of a cluster's most recent articles, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT article_id FROM article_topics WHERE cluster_id = ? "
+                "ORDER BY article_id DESC LIMIT ?",
+                (cluster_id, limit),
+            ).fetchall()
+        return [row["article_id"] for row in rows]
+
+    def cluster_of(self, article_id: int) -> int | None:
+        """Returns the cluster an article is assigned to, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cluster_id FROM article_topics WHERE article_id = ?",
+                (article_id,),
+            ).fetchone()
+        return row["cluster_id"] if row else None
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_topic_cluster_store() -> TopicClusterStore:
+    """Returns the process-wide TopicClusterStore, creating it on first use."""
+    return TopicClusterStore(
+        connect(settings.DATABASE_PATH),
+        OnlineClusterer(
+            settings.EMBEDDING_DIMENSION,
+            spawn_threshold=settings.TOPIC_CLUSTER_SPAWN_THRESHOLD,
+            merge_threshold=settings.TOPIC_CLUSTER_MERGE_THRESHOLD,
+            max_clusters=settings.TOPIC_CLUSTER_MAX_CLUSTERS,
+            max_weight=settings.TOPIC_CLUSTER_MAX_WEIGHT,
+        ),
+    )
+
+
+def close_topic_cluster_store() -> None:
+    """Closes the process-wide TopicClusterStore if it was opened."""
+    # pylint: disable-next=too-many-function-args
+    if get_topic_cluster_store.cache_info().currsize:
+        get_topic_cluster_store().close()
+        get_topic_cluster_store.cache_clear()
+
+
+def cluster_new_articles(batch_size: int | None = None) -> int:
+    """
+    Embeds and clusters every stored article not clustered yet.
+
+    Articles are read after the store's watermark in batches of batch_size,
+    so each call only does work proportional to the new articles.
+
+    Returns:
+        The number of articles clustered.
+    """
+    batch_size = batch_size or settings.TOPIC_CLUSTER_BATCH_SIZE
+    articles = get_article_store()
+    embeddings = get_embedding_store()
+    clusters = get_topic_cluster_store()
+    clustered = 0
+    while batch := articles.get_articles_after(clusters.watermark, batch_size):
+        texts = [article.content for article in batch]
+        clusters.add_batch(
+            [article.id for article in batch],
+            [content_hash(text) for text in texts],
+            embeddings.embed_texts(texts),
+            texts,
+        )
+        clustered += len(batch)
+    return clustered
@@ -0,0 +1,296 @@
+"""Article embeddings, computed once per unique article and cached on disk.
+
+Embeddings are keyed by a hash of the article text, so re-fetched or
+duplicated articles reuse the vector that was already computed. Vectors are
+kept in a memory-mapped float32 matrix (one L2-normalised row per article)
+next to an append-only file mapping each row to its content hash. Readers
+get zero-copy views of the matrix, which keeps similarity search vectorized.
+
+Several processes may share a store directory: writes hold an exclusive
+lock on a file in it and first read the ids other processes appended, so
+every process assigns rows past the end of the shared matrix.
+
+The default HashingEmbedder is a dependency-free feature-hashing model. Any
+object implementing the Embedder protocol (for example a wrapper around a
+Hugging Face sentence-transformer) can be used instead.
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import zlib
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol
+
+import numpy as np
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+VECTORS_FILE = "vectors.f32"
+IDS_FILE = "ids.txt"
+META_FILE = "meta.json"
+LOCK_FILE = "embeddings.lock"
+INITIAL_CAPACITY = 1024
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def content_hash(text: str) -> str:
+    """Returns the cache key for an article body."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class Embedder(Protocol):  # pylint: disable=too-few-public-methods
+    """Turns texts into fixed-size float vectors."""
+
+    name: str
+    dimension: int
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Returns a (len(texts), dimension) float32 matrix."""
+
+
+class HashingEmbedder:  # pylint: disable=too-few-public-methods
+    """
+    Signed feature hashing of word unigrams and bigrams.
+
+    Deterministic across processes (crc32 rather than Python's salted hash),
+    so vectors computed by different workers are comparable.
+    """
+
+    def __init__(self, dimension: int = 256):
+        if dimension < 1:
+            raise ValueError("dimension must be at least 1")
+        self.dimension = dimension
+        self.name = f"hashing-{dimension}"
+
+    def _embed_one(self, text: str, out: np.ndarray) -> None:
+        tokens = _TOKEN_RE.findall(text.lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        for feature in features:
+            digest = zlib.crc32(feature.encode("utf-8"))
+            sign = 1.0 if digest & 0x80000000 else -1.0
+            out[digest % self.dimension] += sign
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Returns L2-normalised float32 embeddings, one row per text."""
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            self._embed_one(text, vectors[row])
+        # Sublinear term frequency, then unit length so dot product = cosine.
+        np.copysign(np.log1p(np.abs(vectors)), vectors, out=vectors)
+        return normalize(vectors)
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scales each row to unit length (zero rows are left as zeros)."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+class EmbeddingStore:  # pylint: disable=too-many-instance-attributes
+    """
+    Content-addressed cache of embeddings in a memory-mapped matrix.
+
+    Usage:
+        store = EmbeddingStore("data/embeddings", HashingEmbedder())
+        vectors = store.embed_texts(article_bodies)  # computes only new ones
+        matrix = store.matrix()                      # (len(store), dimension)
+    """
+
+    def __init__(self, directory: str | Path, embedder: Embedder):
+        self.directory = Path(directory)
+        self.embedder = embedder
+        self.dimension = embedder.dimension
+        self._lock = threading.Lock()
+        self._rows: dict[str, int] = {}
+        self._hashes: list[str] = []
+        # Bytes of IDS_FILE already read into _hashes.
+        self._ids_offset = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock_fd = os.open(self.directory / LOCK_FILE, os.O_RDWR | os.O_CREAT)
+        with self._locked():
+            self._check_metadata()
+            self._vectors = self._open_vectors()
+            self._load_ids()
+        self._ids_file = open(  # pylint: disable=consider-using-with
+            self.directory / IDS_FILE, "a", encoding="ascii"
+        )
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Serializes threads, then processes sharing the directory."""
+        with self._lock:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _check_metadata(self) -> None:
+        meta_path = self.directory / META_FILE
+        meta = {"model": self.embedder.name, "dimension": self.dimension}
+        if meta_path.exists():
+            stored = json.loads(meta_path.read_text(encoding="utf-8"))
+            if stored == meta:
+                return
+            logger.warning(
+                "Embedding model changed from %s to %s; discarding cached vectors.",
+                stored,
+                meta,
+            )
+            for name in (VECTORS_FILE, IDS_FILE):
+                (self.directory / name).unlink(missing_ok=True)
+        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+    def _open_vectors(self, capacity: int = 0) -> np.memmap:
+        path = self.directory / VECTORS_FILE
+        row_bytes = self.dimension * np.dtype(np.float32).itemsize
+        current = path.stat().st_size // row_bytes if path.exists() else 0
+        capacity = max(capacity, current, INITIAL_CAPACITY)
+        if capacity > current:
+            with open(path, "ab") as vectors_file:
+                vectors_file.truncate(capacity * row_bytes)
+        return np.memmap(
+            path, dtype=np.float32, mode="r+", shape=(capacity, self.dimension)
+        )
+
+    def _load_ids(self) -> None:
+        """Reads the ids appended since the last read, by any process."""
+        path = self.directory / IDS_FILE
+        if not path.exists():
+            return
+        with open(path, "rb") as ids_file:
+            ids_file.seek(self._ids_offset)
+            tail = ids_file.read()
+        if not tail:
+            return
+        self._ids_offset += len(tail)
+        for key in tail.decode("ascii").split():
+            self._rows[key] = len(self._hashes)
+            self._hashes.append(key)
+        if len(self._hashes) > len(self._vectors):
+            # Another process grew the matrix.
+            self._vectors = self._open_vectors()
+        if len(self._hashes) > len(self._vectors):
+            # Ids are written after their vectors, so this only happens if
+            # the vector file was truncated externally.
+            logger.warning("Embedding id map is longer than the matrix; trimming.")
+            self._hashes = self._hashes[: len(self._vectors)]
+            self._rows = {h: row for row, h in enumerate(self._hashes)}
+            data = "".join(f"{h}\n" for h in self._hashes)
+            path.write_text(data, encoding="ascii")
+            self._ids_offset = len(data)
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def row_of(self, key: str) -> int | None:
+        """Returns the matrix row holding the embedding for a content hash."""
+        return self._rows.get(key)
+
+    def hash_at(self, row: int) -> str:
+        """Returns the content hash stored at a matrix row."""
+        return self._hashes[row]
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Returns the cached embedding for a content hash, or None."""
+        row = self._rows.get(key)
+        return None if row is None else np.array(self._vectors[row])
+
+    def matrix(self) -> np.ndarray:
+        """Returns a read-only view of all cached embeddings, in row order."""
+        view = self._vectors[: len(self._hashes)].view(np.ndarray)
+        view.flags.writeable = False
+        return view
+
+    def add(self, keys: Sequence[str], vectors: np.ndarray) -> list[int]:
+        """
+        Stores embeddings for content hashes that are not cached yet.
+
+        Args:
+            keys: Content hashes, one per row of vectors.
+            vectors: A (len(keys), dimension) matrix.
+
+        Returns:
+            The matrix row of each key (existing rows are reused).
+        """
+        if vectors.shape != (len(keys), self.dimension):
+            raise ValueError(
+                f"Expected a ({len(keys)}, {self.dimension}) matrix, "
+                f"got {vectors.shape}."
+            )
+        with self._locked():
+            self._load_ids()
+            new = [i for i, key in enumerate(keys) if key not in self._rows]
+            new = list({keys[i]: i for i in new}.values())  # drop repeats
+            start = len(self._hashes)
+            end = start + len(new)
+            if end > len(self._vectors):
+                self._vectors.flush()
+                self._vectors = self._open_vectors(max(end, 2 * len(self._vectors)))
+            if new:
+                self._vectors[start:end] = vectors[new]
+                self._vectors.flush()
+                data = "".join(f"{keys[i]}\n" for i in new)
+                self._ids_file.write(data)
+                self._ids_file.flush()
+                self._ids_offset += len(data)
+                for row, i in enumerate(new, start):
+                    self._hashes.append(keys[i])
+                    self._rows[keys[i]] = row
+            return [self._rows[key] for key in keys]
+
+    def embed_texts(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Returns embeddings for texts, computing only those not cached yet.
+
+        All missing texts are embedded in a single batch call.
+        """
+        keys = [content_hash(text) for text in texts]
+        missing = {key: text for key, text in zip(keys, texts) if key not in self}
+        if missing:
+            vectors = self.embedder.embed(list(missing.values()))
+            self.add(list(missing), np.asarray(vectors, dtype=np.float32))
+            logger.debug(
+                "Computed %s new embeddings (%s cached).",
+                len(missing),
+                len(texts) - len(missing),
+            )
+        rows = [self._rows[key] for key in keys]
+        return np.array(self._vectors[rows])
+
+    def close(self) -> None:
+        """Flushes the matrix and closes the id map."""
+        with self._lock:
+            self._vectors.flush()
+            self._ids_file.close()
+            os.close(self._lock_fd)
+
+
+@lru_cache(maxsize=1)
+def get_embedding_store() -> EmbeddingStore:
+    """Returns the process-wide EmbeddingStore, creating it on first use."""
+    return EmbeddingStore(
+        settings.EMBEDDING_STORE_PATH, HashingEmbedder(settings.EMBEDDING_DIMENSION)
+    )
+
+
+def close_embedding_store() -> None:
+    """Closes the process-wide EmbeddingStore if it was opened."""
+    # pylint: disable-next=too-many-function-args
+    if get_embedding_store.cache_info().currsize:
+        get_embedding_store().close()
+        get_embedding_store.cache_clear()
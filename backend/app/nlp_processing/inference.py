@@ -0,0 +1,278 @@
+"""Micro-batching inference for sentiment and topic models.
+
+Calling a model once per article spends most of the time on per-call
+overhead. MicroBatcher lets many asyncio callers submit single items while
+the models see batches: items are collected until max_batch_size are queued
+or max_wait_ms has passed since the first one arrived, sorted by length (so
+padded models waste less work on short items), and run on a dedicated
+thread pool. Each caller awaits a future for its own result.
+
+Long articles are analyzed window by window (see chunking.py) and the
+per-window results are combined, weighted by window length.
+"""
+
+import asyncio
+import itertools
+import logging
+from collections import Counter
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Generic, TypeVar
+
+from backend.app.core.config import settings
+from backend.app.nlp_processing.chunking import iter_windows
+from backend.app.nlp_processing.clustering import get_topic_cluster_store
+from backend.app.nlp_processing.embeddings import HashingEmbedder
+from backend.app.nlp_processing.models import (
+    LexiconSentimentModel,
+    SentimentResult,
+    TopicModel,
+    sentiment_from_score,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):  # pylint: disable=too-many-instance-attributes
+    """
+    Coalesces single-item async calls into batched calls of batch_fn.
+
+    Usage:
+        batcher = MicroBatcher(model.predict_batch, executor=pool)
+        result = await batcher.submit(text)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        batch_fn: Callable[[list[T]], Sequence[R]],
+        *,
+        executor: ThreadPoolExecutor,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 10.0,
+        sort_key: Callable[[T], int] | None = None,
+        max_concurrent_batches: int = 1,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.sort_key = sort_key
+        self._executor = executor
+        self._slots = asyncio.Semaphore(max_concurrent_batches)
+        self._queue: asyncio.Queue[tuple[T, asyncio.Future[R]]] = asyncio.Queue()
+        self._collector: asyncio.Task | None = None
+        self._batches: set[asyncio.Task] = set()
+        self.batch_sizes: list[int] = []
+
+    async def submit(self, item: T) -> R:
+        """Queues one item and waits for its result."""
+        if self._collector is None:
+            self._collector = asyncio.create_task(self._collect())
+        future: asyncio.Future[R] = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _next_batch(self) -> list[tuple[T, asyncio.Future[R]]]:
+        """Waits for one item, then gathers more until full or timed out."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _collect(self) -> None:
+        while True:
+            await self._slots.acquire()
+            try:
+                batch = await self._next_batch()
+            except asyncio.CancelledError:
+                self._slots.release()
+                raise
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        try:
+            live = [(item, future) for item, future in batch if not future.done()]
+            if not live:
+                return
+            if self.sort_key is not None:
+                sort_key = self.sort_key
+                live.sort(key=lambda entry: sort_key(entry[0]))
+            items = [item for item, _ in live]
+            self.batch_sizes.append(len(items))
+            loop = asyncio.get_running_loop()
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, self.batch_fn, items
+                )
+                if len(results) != len(items):
+                    raise RuntimeError(
+                        f"Batch function returned {len(results)} results "
+                        f"for {len(items)} items."
+                    )
+            except Exception as e:  # noqa: BLE001 # pylint: disable=broad-except
+                logger.error("Inference batch of %s items failed: %s", len(items), e)
+                for _, future in live:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            for (_, future), result in zip(live, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._slots.release()
+
+    async def close(self) -> None:
+        """Stops collecting, waits for running batches and fails queued items."""
+        if self._collector is not None:
+            self._collector.cancel()
+            await asyncio.gather(self._collector, return_exceptions=True)
+            self._collector = None
+        await asyncio.gather(*self._batches, return_exceptions=True)
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Inference batcher closed."))
+
+
+@dataclass(frozen=True)
+class ArticleAnalysis:
+    """Model outputs for one article (or one chunk of an article)."""
+
+    sentiment: SentimentResult
+    topic_id: int | None
+
+
+def aggregate_analyses(
+    analyses: Sequence[ArticleAnalysis], weights: Sequence[float]
+) -> ArticleAnalysis:
+    """
+    Combines per-window results into one result for the whole article.
+
+    Sentiment is the weighted mean score; the topic is the one with the
+    largest total weight (the earliest such topic on ties).
+    """
+    if not analyses:
+        raise ValueError("No analyses to aggregate.")
+    total = sum(weights)
+    score = sum(a.sentiment.score * w for a, w in zip(analyses, weights)) / total
+    votes: Counter[int] = Counter()
+    for analysis, weight in zip(analyses, weights):
+        if analysis.topic_id is not None:
+            votes[analysis.topic_id] += weight
+    topic_id = votes.most_common(1)[0][0] if votes else None
+    return ArticleAnalysis(sentiment=sentiment_from_score(score), topic_id=topic_id)
+
+
+class InferenceService:
+    """Runs sentiment and topic inference through micro-batchers."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        sentiment_model: LexiconSentimentModel,
+        topic_model: TopicModel,
+        *,
+        workers: int = 2,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 10.0,
+        window_chars: int = 2000,
+        window_overlap_chars: int = 200,
+    ):
+        self.max_batch_size = max_batch_size
+        self.window_chars = window_chars
+        self.window_overlap_chars = window_overlap_chars
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="inference"
+        )
+        self.sentiment = MicroBatcher(
+            sentiment_model.predict_batch,
+            executor=self._executor,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            sort_key=len,
+            max_concurrent_batches=workers,
+        )
+        self.topics = MicroBatcher(
+            topic_model.predict_batch,
+            executor=self._executor,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            sort_key=len,
+            max_concurrent_batches=workers,
+        )
+
+    async def analyze(self, text: str) -> ArticleAnalysis:
+        """Returns the sentiment and nearest topic of a text."""
+        sentiment, topic_id = await asyncio.gather(
+            self.sentiment.submit(text), self.topics.submit(text)
+        )
+        return ArticleAnalysis(sentiment=sentiment, topic_id=topic_id)
+
+    async def analyze_document(self, text: str) -> ArticleAnalysis:
+        """
+        Analyzes a text of any length window by window.
+
+        At most max_batch_size windows are in flight at once, so memory use
+        is bounded by the window size rather than the document size.
+        """
+        windows = iter_windows(text, self.window_chars, self.window_overlap_chars)
+        analyses: list[ArticleAnalysis] = []
+        weights: list[float] = []
+        while group := list(itertools.islice(windows, self.max_batch_size)):
+            analyses.extend(
+                await asyncio.gather(*(self.analyze(window.text) for window in group))
+            )
+            weights.extend(window.end - window.start for window in group)
+        if not analyses:
+            return await self.analyze(text)
+        return aggregate_analyses(analyses, weights)
+
+    async def close(self) -> None:
+        """Stops the batchers and shuts down the worker pool."""
+        await self.sentiment.close()
+        await self.topics.close()
+        self._executor.shutdown(wait=False)
+
+
+@lru_cache(maxsize=1)
+def get_inference_service() -> InferenceService:
+    """Returns the process-wide InferenceService, creating it on first use."""
+    topic_model = TopicModel(
+        HashingEmbedder(settings.EMBEDDING_DIMENSION),
+        lambda: get_topic_cluster_store().centroid_snapshot(),
+    )
+    return InferenceService(
+        LexiconSentimentModel(),
+        topic_model,
+        workers=settings.INFERENCE_WORKERS,
+        max_batch_size=settings.INFERENCE_MAX_BATCH_SIZE,
+        max_wait_ms=settings.INFERENCE_MAX_WAIT_MS,
+        window_chars=settings.ARTICLE_WINDOW_CHARS,
+        window_overlap_chars=settings.ARTICLE_WINDOW_OVERLAP_CHARS,
+    )
+
+
+async def close_inference_service() -> None:
+    """Closes the process-wide InferenceService if it was created."""
+    # pylint: disable-next=too-many-function-args
+    if get_inference_service.cache_info().currsize:
+        await get_inference_service().close()
+        get_inference_service.cache_clear()
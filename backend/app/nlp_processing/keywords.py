@@ -0,0 +1,35 @@
+"""Keyword extraction used to name topic clusters."""
+
+import re
+from collections import Counter
+
+NAME_KEYWORDS = 3
+
+_WORD_RE = re.compile(r"[a-z][a-z'-]{2,}")
+STOP_WORDS = frozenset(
+    """
+    about after again also among and any are because been before being but
+    can could did does doing down during each few for from further had has
+    have having her here hers him his how into its itself just more most
+    new not now off once only other our ours out over own same she should
+    some such than that the their theirs them then there these they this
+    those through too under until very was were what when where which while
+    who whom why will with would you your yours
+    """.split()
+)
+
+
+def top_keywords(texts: list[str], count: int = NAME_KEYWORDS) -> list[str]:
+    """Returns the most frequent non-stop-words across texts."""
+    words = Counter(
+        word
+        for text in texts
+        for word in _WORD_RE.findall(text.lower())
+        if word not in STOP_WORDS
+    )
+    return [word for word, _ in words.most_common(count)]
+
+
+def topic_name(texts: list[str], topic_id: int) -> str:
+    """Names a topic after the top keywords of its articles."""
+    return " ".join(top_keywords(texts)).title() or f"Topic {topic_id}"
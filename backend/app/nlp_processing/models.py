@@ -0,0 +1,107 @@
+"""Batch sentiment and topic models for article text.
+
+Both models take a list of texts and return one result per text, so they
+can be driven by the micro-batching InferenceService. LexiconSentimentModel
+is a small dependency-free scorer; TopicModel assigns texts to the nearest
+topic cluster centroid with a single matrix product per batch.
+"""
+
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from backend.app.nlp_processing.embeddings import Embedder
+
+_WORD_RE = re.compile(r"[a-z']+")
+
+POSITIVE_WORDS = frozenset(
+    """
+    achieve advantage amazing benefit best better boost breakthrough easy
+    effective efficient engaging excellent exciting favorite gain good great
+    grow growth happy improve improved innovative love loyal opportunity
+    popular positive powerful profit profitable record success successful
+    thrive top trust win winning
+    """.split()
+)
+NEGATIVE_WORDS = frozenset(
+    """
+    bad ban breach complaint concern crisis decline difficult drop fail
+    failure fear fine harm lawsuit lose loss negative outage poor problem
+    recall risk scandal slow spam struggle threat unhappy violation weak
+    worse worst
+    """.split()
+)
+
+
+@dataclass(frozen=True)
+class SentimentResult:
+    """Sentiment label and its score in [-1, 1]."""
+
+    label: str
+    score: float
+
+
+def sentiment_from_score(score: float, neutral_band: float = 0.05) -> SentimentResult:
+    """Labels a score in [-1, 1], treating |score| <= neutral_band as neutral."""
+    if score > neutral_band:
+        label = "positive"
+    elif score < -neutral_band:
+        label = "negative"
+    else:
+        label = "neutral"
+    return SentimentResult(label=label, score=score)
+
+
+class LexiconSentimentModel:  # pylint: disable=too-few-public-methods
+    """Scores sentiment from counts of positive and negative words."""
+
+    def __init__(self, neutral_band: float = 0.05):
+        self.neutral_band = neutral_band
+
+    def predict_batch(self, texts: Sequence[str]) -> list[SentimentResult]:
+        """Returns one SentimentResult per text."""
+        counts = np.zeros((len(texts), 3), dtype=np.float64)
+        for row, text in enumerate(texts):
+            words = _WORD_RE.findall(text.lower())
+            counts[row] = (
+                sum(word in POSITIVE_WORDS for word in words),
+                sum(word in NEGATIVE_WORDS for word in words),
+                len(words),
+            )
+        positive, negative, total = counts.T
+        polar = positive + negative
+        scores = np.divide(
+            positive - negative, polar, out=np.zeros_like(polar), where=polar > 0
+        )
+        # Damp scores for texts where sentiment words are rare.
+        scores *= np.minimum(1.0, 20 * polar / np.maximum(total, 1))
+        return [
+            sentiment_from_score(float(score), self.neutral_band) for score in scores
+        ]
+
+
+class TopicModel:  # pylint: disable=too-few-public-methods
+    """Assigns texts to the most similar topic cluster centroid."""
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        centroids: Callable[[], tuple[np.ndarray, np.ndarray]],
+    ):
+        """
+        Args:
+            embedder: Embeds texts into the same space as the centroids.
+            centroids: Returns the current (cluster ids, centroid matrix).
+        """
+        self.embedder = embedder
+        self._centroids = centroids
+
+    def predict_batch(self, texts: Sequence[str]) -> list[int | None]:
+        """Returns the nearest cluster id per text (None if no clusters)."""
+        ids, centroids = self._centroids()
+        if len(ids) == 0:
+            return [None] * len(texts)
+        best = np.argmax(self.embedder.embed(texts) @ centroids.T, axis=1)
+        return [int(ids[i]) for i in best]
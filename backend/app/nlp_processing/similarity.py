@@ -0,0 +1,210 @@
+"""Vectorized top-k similarity search over cached article embeddings.
+
+Embeddings are unit length, so cosine similarity is a single matrix-vector
+product. Small collections are searched exhaustively. Larger ones use an
+IVF (inverted file) index: vectors are partitioned around spherical k-means
+centroids and a query only scans the few partitions whose centroids are
+closest to it, trading a little recall for a large cut in work.
+"""
+
+import logging
+import math
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from backend.app.nlp_processing.embeddings import (
+    EmbeddingStore,
+    content_hash,
+    normalize,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SimilarityMatch:
+    """A search hit: the article's content hash and its cosine similarity."""
+
+    content_hash: str
+    score: float
+
+
+def top_k(
+    vectors: np.ndarray, query: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Exhaustive top-k search by dot product.
+
+    Returns:
+        (rows, scores) for the best k rows of vectors, best first.
+    """
+    if k <= 0 or len(vectors) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    scores = vectors @ query
+    k = min(k, len(scores))
+    best = np.argpartition(-scores, k - 1)[:k]
+    best = best[np.argsort(-scores[best], kind="stable")]
+    return best, scores[best]
+
+
+def _seed_centroids(
+    vectors: np.ndarray, n_clusters: int, rng: np.random.Generator
+) -> np.ndarray:
+    """k-means++ seeding: favours points far from the centroids chosen so far."""
+    chosen = [int(rng.integers(len(vectors)))]
+    best = vectors @ vectors[chosen[0]]
+    for _ in range(1, n_clusters):
+        distance = np.clip(1.0 - best, 0.0, None)
+        total = distance.sum()
+        row = (
+            int(rng.choice(len(vectors), p=distance / total))
+            if total > 0
+            else int(rng.integers(len(vectors)))
+        )
+        chosen.append(row)
+        np.maximum(best, vectors @ vectors[row], out=best)
+    return vectors[chosen].copy()
+
+
+def spherical_kmeans(
+    vectors: np.ndarray,
+    n_clusters: int,
+    *,
+    iterations: int = 10,
+    seed: int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Clusters unit vectors by cosine similarity.
+
+    Returns:
+        (centroids, assignments): unit-length centroids and the centroid
+        index of every vector.
+    """
+    rng = np.random.default_rng(seed)
+    n_clusters = max(1, min(n_clusters, len(vectors)))
+    centroids = _seed_centroids(vectors, n_clusters, rng)
+    assignments = np.zeros(len(vectors), dtype=np.int64)
+    for _ in range(iterations):
+        assignments = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, vectors)
+        # Empty clusters keep their previous centroid.
+        occupied = np.bincount(assignments, minlength=n_clusters) > 0
+        centroids[occupied] = normalize(sums[occupied])
+    return centroids, assignments
+
+
+class IVFIndex:
+    """
+    Inverted-file index over a fixed snapshot of vectors.
+
+    Centroids are trained on a random sample of at most
+    TRAINING_SAMPLES_PER_LIST * n_lists vectors, then every vector is
+    assigned to its nearest centroid.
+    """
+
+    TRAINING_SAMPLES_PER_LIST = 64
+
+    def __init__(self, vectors: np.ndarray, n_lists: int, *, seed: int = 0):
+        self.vectors = vectors
+        sample_size = self.TRAINING_SAMPLES_PER_LIST * max(1, n_lists)
+        sample = vectors
+        if len(vectors) > sample_size:
+            rng = np.random.default_rng(seed)
+            sample = vectors[rng.choice(len(vectors), sample_size, replace=False)]
+        self.centroids, _ = spherical_kmeans(sample, n_lists, seed=seed)
+        assignments = np.argmax(vectors @ self.centroids.T, axis=1)
+        # Rows grouped by partition: rows of list i are
+        # self._order[self._offsets[i]:self._offsets[i + 1]].
+        self._order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=len(self.centroids))
+        self._offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def search(
+        self, query: np.ndarray, k: int, n_probe: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Searches the n_probe partitions nearest to the query."""
+        probes, _ = top_k(self.centroids, query, n_probe)
+        candidates = np.concatenate(
+            [self._order[self._offsets[i] : self._offsets[i + 1]] for i in probes]
+        )
+        rows, scores = top_k(self.vectors[candidates], query, k)
+        return candidates[rows], scores
+
+
+class SimilarityIndex:
+    """
+    Top-k search over an EmbeddingStore.
+
+    Uses exhaustive search below ivf_threshold vectors and an IVF index above
+    it. The IVF index is rebuilt once the store has grown by half since the
+    last build; vectors added in between are searched exhaustively, so new
+    articles are always visible.
+    """
+
+    def __init__(
+        self,
+        store: EmbeddingStore,
+        *,
+        ivf_threshold: int = 5000,
+        n_lists: int = 0,
+        n_probe: int = 8,
+    ):
+        self.store = store
+        self.ivf_threshold = ivf_threshold
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self._ivf: IVFIndex | None = None
+        self._build_lock = threading.Lock()
+
+    def _index(self, size: int) -> IVFIndex | None:
+        if size < self.ivf_threshold:
+            return None
+        with self._build_lock:
+            if self._ivf is None or size >= 1.5 * len(self._ivf):
+                n_lists = self.n_lists or int(math.sqrt(size))
+                self._ivf = IVFIndex(self.store.matrix()[:size], n_lists)
+                logger.info(
+                    "Built IVF similarity index over %s vectors, %s lists.",
+                    size,
+                    len(self._ivf.centroids),
+                )
+            return self._ivf
+
+    def search(self, query: np.ndarray, k: int = 10) -> list[SimilarityMatch]:
+        """Returns the k cached articles most similar to a query vector."""
+        matrix = self.store.matrix()
+        query = np.asarray(query, dtype=np.float32)
+        ivf = self._index(len(matrix))
+        if ivf is None:
+            rows, scores = top_k(matrix, query, k)
+        else:
+            rows, scores = ivf.search(query, k, self.n_probe)
+            built = len(ivf)
+            if len(matrix) > built:
+                tail_rows, tail_scores = top_k(matrix[built:], query, k)
+                rows = np.concatenate((rows, tail_rows + built))
+                scores = np.concatenate((scores, tail_scores))
+                best = np.argsort(-scores, kind="stable")[:k]
+                rows, scores = rows[best], scores[best]
+        return [
+            SimilarityMatch(self.store.hash_at(int(row)), float(score))
+            for row, score in zip(rows, scores)
+        ]
+
+    def search_text(self, text: str, k: int = 10) -> list[SimilarityMatch]:
+        """
+        Searches for articles similar to a piece of text.
+
+        The query is embedded without being added to the store, so ad-hoc
+        queries do not show up as articles.
+        """
+        query = self.store.get(content_hash(text))
+        if query is None:
+            query = self.store.embedder.embed([text])[0]
+        return self.search(query, k)
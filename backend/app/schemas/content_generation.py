@@ -0,0 +1,30 @@
+"""API schemas for LLM content generation."""
+
+from pydantic import BaseModel, Field
+
+
+class GenerateContentRequest(BaseModel):
+    """Optional knobs for POST /trends/{trend_id}/generate-content."""
+
+    tone: str = Field("friendly", max_length=40, description="Desired writing tone")
+    subject_line_count: int = Field(3, ge=1, le=5)
+    campaign_theme_count: int = Field(2, ge=1, le=3)
+
+
+class GeneratedContentSchema(BaseModel):
+    """Structure of LLM-generated content ideas."""
+
+    email_subject_lines: list[str] = Field(..., description="Email subject line ideas")
+    email_body_copy: str = Field(
+        ..., description="One short paragraph of engaging email body copy"
+    )
+    campaign_themes: list[str] = Field(..., description="Campaign theme ideas")
+
+
+class LLMContentResponse(BaseModel):
+    """Response for POST /trends/{trend_id}/generate-content."""
+
+    trend_id: str
+    trend_name: str
+    generated_content: GeneratedContentSchema
+    cached: bool = Field(False, description="True if served from the generation cache")
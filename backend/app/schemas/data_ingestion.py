@@ -0,0 +1,47 @@
+"""API schemas for ingested articles."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ArticleSummarySchema(BaseModel):
+    """A stored article without its content."""
+
+    id: int
+    source_url: str
+    source: str = Field(..., description="Host the article was fetched from")
+    content_size: int = Field(..., description="Uncompressed content size in bytes")
+    fetched_at: datetime
+
+
+class ArticleListResponse(BaseModel):
+    """Response for GET /data-ingestion/articles: newest first."""
+
+    items: list[ArticleSummarySchema]
+    next_cursor: str | None = Field(
+        None, description="Pass as `cursor` to get the next page; null on the last"
+    )
+
+
+class ArticleSearchHitSchema(BaseModel):
+    """An article matching a full-text search."""
+
+    id: int
+    source_url: str
+    source: str
+    fetched_at: datetime
+    snippet: str = Field(
+        ...,
+        description=(
+            "HTML-escaped text around the matches, which are wrapped in <mark></mark>."
+        ),
+    )
+    score: float = Field(..., description="BM25 relevance; higher is better")
+
+
+class ArticleSearchResponse(BaseModel):
+    """Response for GET /data-ingestion/articles/search: best match first."""
+
+    query: str
+    results: list[ArticleSearchHitSchema]
@@ -0,0 +1,54 @@
+"""API schemas for debug endpoints."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class MemorySampleSchema(BaseModel):
+    """Process memory and GC counters at one point in time."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    taken_at: datetime
+    rss_bytes: int
+    gc_counts: list[int] = Field(..., description="Pending objects per generation")
+    gc_collections: list[int] = Field(..., description="Collections per generation")
+    traced_bytes: int | None = None
+    traced_peak_bytes: int | None = None
+
+
+class AllocationSiteSchema(BaseModel):
+    """Live allocations at one traceback, and their change over a cycle."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    location: str
+    size_bytes: int
+    count: int
+    size_diff_bytes: int = 0
+    count_diff: int = 0
+
+
+class CycleMemoryReportSchema(BaseModel):
+    """Memory at the start and end of one ingestion cycle."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    label: str
+    start: MemorySampleSchema
+    end: MemorySampleSchema
+    rss_delta_bytes: int
+    top_growth: list[AllocationSiteSchema]
+    top_allocations: list[AllocationSiteSchema]
+
+
+class MemoryDebugResponse(BaseModel):
+    """Response for GET /debug/memory."""
+
+    tracing: bool = Field(..., description="True if tracemalloc is running")
+    current: MemorySampleSchema
+    current_allocations: list[AllocationSiteSchema]
+    cycles: list[CycleMemoryReportSchema] = Field(
+        ..., description="Most recent ingestion cycles, oldest first"
+    )
@@ -0,0 +1,41 @@
+"""API schemas for readiness checks."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class DependencyStatusSchema(BaseModel):
+    """Whether a dependency is usable."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str
+    ok: bool
+    critical: bool = Field(..., description="True if the pod is not ready without it")
+    detail: str | None = None
+
+
+class BacklogSchema(BaseModel):
+    """Ingestion backlog figures."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    ingestion_lag_seconds: float | None = Field(
+        ..., description="Time since the last fetch cycle completed"
+    )
+    queue_depth: int = Field(..., description="Queued ingestion tasks")
+    queue_oldest_age_seconds: float | None = Field(
+        ..., description="How long the oldest ready task has waited"
+    )
+
+
+class ReadinessResponse(BaseModel):
+    """Response for GET /ready (status 503 when not ready)."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    ready: bool
+    version: str
+    event_loop_lag_seconds: float
+    backlog: BacklogSchema | None
+    dependencies: list[DependencyStatusSchema]
+    reasons: list[str] = Field(..., description="Why the pod is not ready")
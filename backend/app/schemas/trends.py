@@ -0,0 +1,47 @@
+"""API schemas for trends."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class TrendDataPointSchema(BaseModel):
+    """One historical data point of a trend."""
+
+    date: datetime = Field(..., description="Start of the period (ISO8601, UTC)")
+    score: float = Field(..., description="Score at the end of the period")
+    mention_frequency: int | None = Field(
+        None, description="Articles that joined the trend during the period"
+    )
+
+
+class TrendSummarySchema(BaseModel):
+    """A trend as listed by GET /trends."""
+
+    id: str = Field(..., description="Unique identifier for the trend")
+    name: str = Field(..., description="Name of the trend")
+    identified_date: datetime = Field(
+        ..., description="ISO8601 timestamp of when the trend was last updated"
+    )
+    score: float = Field(..., description="Current trend strength")
+    source_articles_count: int | None = Field(
+        None, description="Number of source articles contributing to this trend"
+    )
+
+
+class TrendListResponse(BaseModel):
+    """Response for GET /trends: one page of trends, highest score first."""
+
+    items: list[TrendSummarySchema]
+    next_cursor: str | None = Field(
+        None, description="Pass as `cursor` to get the next page; null on the last"
+    )
+
+
+class TrendDetailResponse(TrendSummarySchema):
+    """Response for GET /trends/{trend_id}."""
+
+    resolution: str = Field(..., description="Period of each history point")
+    history: list[TrendDataPointSchema] = Field(
+        ..., description="Historical data points for the trend, oldest first"
+    )
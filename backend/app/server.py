@@ -1,16 +1,45 @@
 """FastAPI server with logging and health check endpoint."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from backend.app.__about__ import __version__
+from backend.app.api.v1.routers import dashboard as dashboard_router
 from backend.app.api.v1.routers import data_ingestion as data_ingestion_router
+from backend.app.api.v1.routers import debug as debug_router
+from backend.app.api.v1.routers import trends as trends_router
 from backend.app.core.config import settings
+from backend.app.core.health import (
+    close_readiness_monitor,
+    format_metrics,
+    get_readiness_monitor,
+)
+from backend.app.core.memory import (
+    close_memory_profiler,
+    get_memory_profiler,
+    take_sample,
+)
+from backend.app.data_ingestion.checkpoint import close_checkpoint_store
+from backend.app.data_ingestion.content_store import close_article_store
+from backend.app.data_ingestion.jina_archive import close_archive_writer
+from backend.app.data_ingestion.rate_limiter import close_rate_limiter
 from backend.app.data_ingestion.scheduler import shutdown_scheduler, start_scheduler
+from backend.app.data_ingestion.source_registry import close_source_registry
+from backend.app.llm_integration.generation import close_content_generator
+from backend.app.nlp_processing.analyses import close_analysis_store
+from backend.app.nlp_processing.clustering import close_topic_cluster_store
+from backend.app.nlp_processing.embeddings import close_embedding_store
+from backend.app.nlp_processing.inference import close_inference_service
+from backend.app.schemas.health import ReadinessResponse
+from backend.app.trend_identification.history import close_trend_history_store
+from backend.app.trend_identification.updates import close_trend_broadcaster
+from backend.app.worker.queue import close_work_queue
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -22,10 +51,28 @@ async def lifespan(current_app: FastAPI):
     """Ensure proper startup and shutdown of the application."""
     logger.info("Application startup. Version: %s", current_app.version)
     logger.info("API documentation available at /docs or /redoc")
+    # Start tracing early so cycle snapshots see allocations made at startup.
+    get_memory_profiler()
+    get_readiness_monitor().start()
     await start_scheduler()
     yield
     # Shutdown
+    await close_readiness_monitor()
+    await close_trend_broadcaster()
     await shutdown_scheduler()
+    close_article_store()
+    close_source_registry()
+    close_checkpoint_store()
+    close_rate_limiter()
+    close_archive_writer()
+    close_work_queue()
+    await close_inference_service()
+    close_analysis_store()
+    close_topic_cluster_store()
+    close_embedding_store()
+    close_trend_history_store()
+    await close_content_generator()
+    close_memory_profiler()
     logger.info("Application shutdown.")
 
 
@@ -51,6 +98,21 @@ app.include_router(
     prefix="/api/v1/data-ingestion",
     tags=["Data Ingestion"],
 )
+app.include_router(
+    trends_router.router,
+    prefix="/api/v1/trends",
+    tags=["Trends"],
+)
+app.include_router(
+    dashboard_router.router,
+    prefix="/api/v1/dashboard",
+    tags=["Dashboard"],
+)
+app.include_router(
+    debug_router.router,
+    prefix="/api/v1/debug",
+    tags=["Debug"],
+)
 
 
 @app.get("/health")
@@ -61,6 +123,35 @@ async def health_check():
     return {"status": "healthy", "version": app.version}
 
 
+@app.get("/ready", response_model=ReadinessResponse)
+async def readiness_check(response: Response) -> ReadinessResponse:
+    """
+    Readiness endpoint: 200 when the pod should receive traffic, else 503.
+
+    Reports event-loop lag, ingestion backlog and dependency state.
+    Database reads and dependency checks are cached for
+    READINESS_CACHE_SECONDS, so probes stay cheap.
+    """
+    report = await get_readiness_monitor().report()
+    if not report.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadinessResponse.model_validate(
+        {**vars(report), "version": app.version}, from_attributes=True
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> str:
+    """
+    Readiness figures and this process's memory (RSS, GC generation counts)
+    as Prometheus gauges, for scraping and for exposure to a
+    HorizontalPodAutoscaler through a metrics adapter.
+    """
+    return format_metrics(
+        await get_readiness_monitor().report(), await asyncio.to_thread(take_sample)
+    )
+
+
 def main(log_level: str = "info") -> None:
     """
     Main function to run the FastAPI application.
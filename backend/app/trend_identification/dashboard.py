@@ -0,0 +1,188 @@
+"""Precomputed dashboard snapshot.
+
+The dashboard's first paint needs the top trends, a sparkline per trend
+and a sentiment summary. Building those per request would cost several
+queries and a lot of serialization, growing with the data. Instead, every
+ingestion cycle ends by building one snapshot: serialized to JSON once,
+gzip-compressed once, versioned, and written atomically to
+DASHBOARD_SNAPSHOT_PATH. The API serves the bytes from memory, so
+cold-load latency does not depend on data volume.
+
+The file is the source of truth shared by every process: it survives
+restarts, and an API process notices a snapshot published by an ingestion
+worker with one stat() of the file per request.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any
+
+from backend.app.core.config import settings
+from backend.app.nlp_processing.analyses import get_analysis_store
+from backend.app.trend_identification.history import (
+    bucket_of,
+    bucket_start,
+    get_trend_history_store,
+)
+from backend.app.trend_identification.trends import list_trends
+from backend.app.trend_identification.updates import trend_summary
+
+logger = logging.getLogger(__name__)
+
+SPARKLINE_RESOLUTION = "day"
+
+
+@dataclass(frozen=True)
+class DashboardSnapshot:
+    """One published snapshot: its JSON body and the gzip of it."""
+
+    version: int
+    built_at: datetime
+    body: bytes
+    gzipped: bytes
+
+    @cached_property
+    def etag(self) -> str:
+        """Strong entity tag of the snapshot's version and body."""
+        # Two processes may publish the same version number with different
+        # bodies, so the tag carries a digest of the body as well.
+        digest = hashlib.blake2b(self.body, digest_size=8).hexdigest()
+        return f'"dashboard-{self.version}-{digest}"'
+
+    @property
+    def gzip_etag(self) -> str:
+        """Strong entity tag of the gzip-encoded representation."""
+        return f'{self.etag[:-1]}-gz"'
+
+
+def build_dashboard(now: datetime | None = None) -> dict[str, Any]:
+    """
+    Reads everything the dashboard shows on first paint.
+
+    Sparklines hold the last score of each of the last
+    DASHBOARD_SPARKLINE_DAYS days, oldest first, with null for days in
+    which the trend was not recorded.
+    """
+    now = now or datetime.now(timezone.utc)
+    today = bucket_of(int(now.timestamp()), SPARKLINE_RESOLUTION)
+    start = bucket_start(
+        today - settings.DASHBOARD_SPARKLINE_DAYS + 1, SPARKLINE_RESOLUTION
+    )
+    end = bucket_start(today + 1, SPARKLINE_RESOLUTION)
+    history = get_trend_history_store()
+    trends = []
+    for trend in list_trends(settings.DASHBOARD_MAX_TRENDS).items:
+        series = history.rollup(int(trend.id), start, end, SPARKLINE_RESOLUTION)
+        trends.append(
+            {
+                **trend_summary(trend).model_dump(mode="json"),
+                "sparkline": [
+                    score if points else None
+                    for score, points in zip(
+                        series.score_last.tolist(), series.points.tolist()
+                    )
+                ],
+            }
+        )
+    sentiment = get_analysis_store().sentiment_summary(settings.ANALYSIS_VERSION)
+    return {
+        "trends": trends,
+        "sparkline": {
+            "resolution": SPARKLINE_RESOLUTION,
+            "start": datetime.fromtimestamp(start, timezone.utc).isoformat(),
+        },
+        "sentiment": {
+            "articles": sentiment.articles,
+            "mean_score": sentiment.mean_score,
+            "labels": sentiment.label_counts,
+        },
+    }
+
+
+class DashboardSnapshotStore:
+    """Publishes snapshots to a file and serves the latest from memory."""
+
+    def __init__(self, path: str | Path, compression_level: int = 6):
+        self.path = Path(path)
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        self._snapshot: DashboardSnapshot | None = None
+        self._mtime_ns: int | None = None
+
+    def _load(self) -> None:
+        try:
+            stat = self.path.stat()
+            if stat.st_mtime_ns == self._mtime_ns:
+                return
+            gzipped = self.path.read_bytes()
+        except FileNotFoundError:
+            return
+        try:
+            body = gzip.decompress(gzipped)
+            meta = json.loads(body)
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Ignoring unreadable dashboard snapshot %s: %s", self.path, e
+            )
+        else:
+            self._snapshot = DashboardSnapshot(
+                version=meta["version"],
+                built_at=datetime.fromisoformat(meta["built_at"]),
+                body=body,
+                gzipped=gzipped,
+            )
+        self._mtime_ns = stat.st_mtime_ns
+
+    def current(self) -> DashboardSnapshot | None:
+        """Returns the latest published snapshot, or None if there is none."""
+        with self._lock:
+            self._load()
+            return self._snapshot
+
+    def publish(self, dashboard: dict[str, Any]) -> DashboardSnapshot:
+        """Serializes, compresses and atomically writes a new version."""
+        built_at = datetime.now(timezone.utc)
+        with self._lock:
+            self._load()
+            version = self._snapshot.version + 1 if self._snapshot else 1
+            body = json.dumps(
+                {"version": version, "built_at": built_at.isoformat(), **dashboard},
+                separators=(",", ":"),
+            ).encode()
+            # mtime=0 keeps the bytes (and any proxy's copy) reproducible.
+            gzipped = gzip.compress(body, self.compression_level, mtime=0)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self.path.parent, prefix=f".{self.path.name}.", delete=False
+            ) as temporary:
+                temporary.write(gzipped)
+            os.replace(temporary.name, self.path)
+            self._snapshot = DashboardSnapshot(version, built_at, body, gzipped)
+            self._mtime_ns = self.path.stat().st_mtime_ns
+        logger.info(
+            "Published dashboard snapshot %s (%s bytes, %s gzipped).",
+            version,
+            len(body),
+            len(gzipped),
+        )
+        return self._snapshot
+
+
+@lru_cache(maxsize=1)
+def get_dashboard_store() -> DashboardSnapshotStore:
+    """Returns the process-wide DashboardSnapshotStore, creating it on first use."""
+    return DashboardSnapshotStore(settings.DASHBOARD_SNAPSHOT_PATH)
+
+
+def publish_dashboard_snapshot() -> DashboardSnapshot:
+    """Builds the dashboard from current data and publishes it."""
+    return get_dashboard_store().publish(build_dashboard())
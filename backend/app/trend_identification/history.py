@@ -0,0 +1,463 @@
+"""Append-only time-series store for trend history.
+
+Each fetch cycle appends one point per active trend: the number of articles
+the trend gained since the previous point (mentions) and its score (the
+cluster's decayed weight). Points are written to columnar raw segments, one
+directory per UTC day holding one append-only file per column.
+
+Every append also updates precomputed hourly, daily and weekly rollups.
+Each rollup is a dense, fixed-size, memory-mapped array per trend and
+partition of PARTITION_BUCKETS buckets. A bucket's position is computed from
+its time, so a range read is a slice: within a partition it is a zero-copy
+view of the mapped file, and a year of daily points touches at most two
+partitions. Chart queries therefore cost the same however long the history
+grows.
+
+compact() enforces retention by deleting whole raw segments and hourly
+partitions older than their retention window. Daily and weekly rollups are
+kept, so long-range charts survive compaction.
+
+Every process on the host may write (API, worker replicas): writers hold
+an exclusive flock on history.lock and re-read state.json under it, so
+mention deltas and the last timestamp are never stale, and readers hold a
+shared lock. Rollups are shared memory maps, so writes show up in other
+processes' open partitions.
+
+Layout under the store directory:
+
+    raw/<YYYY-MM-DD>/{time,trend,mentions,score}.bin
+    rollups/<hour|day|week>/<trend id>/<partition>.npy
+    state.json
+    history.lock
+"""
+
+import fcntl
+import json
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+
+from backend.app.core.config import settings
+from backend.app.nlp_processing.clustering import get_topic_cluster_store
+
+logger = logging.getLogger(__name__)
+
+Resolution = Literal["hour", "day", "week"]
+
+# Bucket width and origin per resolution; weeks start on Monday (UTC).
+BUCKET_SECONDS: dict[str, int] = {"hour": 3600, "day": 86400, "week": 7 * 86400}
+BUCKET_ORIGIN: dict[str, int] = {"hour": 0, "day": 0, "week": 4 * 86400}
+PARTITION_BUCKETS = 1024
+
+RAW_COLUMNS: dict[str, np.dtype] = {
+    "time": np.dtype("<i8"),
+    "trend": np.dtype("<i8"),
+    "mentions": np.dtype("<i4"),
+    "score": np.dtype("<f4"),
+}
+ROLLUP_DTYPE = np.dtype(
+    [
+        ("points", "<u4"),
+        ("mentions", "<u4"),
+        ("score_sum", "<f8"),
+        ("score_last", "<f4"),
+        ("score_max", "<f4"),
+    ]
+)
+STATE_FILE = "state.json"
+LOCK_FILE = "history.lock"
+# Mapped partitions kept open. Mappings do not hold file descriptors, so
+# this is sized for every active trend at all three resolutions.
+MAX_OPEN_PARTITIONS = 4096
+
+
+def bucket_of(timestamp: int, resolution: str) -> int:
+    """Index of the bucket containing a Unix timestamp."""
+    return (timestamp - BUCKET_ORIGIN[resolution]) // BUCKET_SECONDS[resolution]
+
+
+def bucket_start(bucket: int, resolution: str) -> int:
+    """Unix timestamp at which a bucket starts."""
+    return bucket * BUCKET_SECONDS[resolution] + BUCKET_ORIGIN[resolution]
+
+
+@dataclass(frozen=True)
+class RollupSeries:
+    """
+    Rollup buckets of one trend over a time range.
+
+    All arrays have one entry per bucket, including empty buckets (points
+    == 0). They are read-only views of the mapped rollup files when the
+    range lies within one partition.
+    """
+
+    resolution: str
+    start: np.ndarray
+    points: np.ndarray
+    mentions: np.ndarray
+    score_sum: np.ndarray
+    score_last: np.ndarray
+    score_max: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def score_mean(self) -> np.ndarray:
+        """Mean score per bucket (NaN for empty buckets)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.score_sum / self.points
+
+
+@dataclass(frozen=True)
+class RawSegment:
+    """Zero-copy views of the raw points of one day segment in a range."""
+
+    time: np.ndarray
+    trend: np.ndarray
+    mentions: np.ndarray
+    score: np.ndarray
+
+
+def _map_column(path: Path, dtype: np.dtype) -> np.ndarray:
+    """Maps a raw column file read-only (mmap cannot map empty files)."""
+    if not path.exists() or path.stat().st_size < dtype.itemsize:
+        return np.empty(0, dtype)
+    return np.memmap(
+        path, dtype=dtype, mode="r", shape=(path.stat().st_size // dtype.itemsize,)
+    )
+
+
+class TrendHistoryStore:  # pylint: disable=too-many-instance-attributes
+    """Append-only columnar trend history with precomputed rollups."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self._raw = self.directory / "raw"
+        self._rollups = self.directory / "rollups"
+        self._raw.mkdir(parents=True, exist_ok=True)
+        self._rollups.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._lock_fd = os.open(self.directory / LOCK_FILE, os.O_RDWR | os.O_CREAT)
+        self._open: OrderedDict[tuple[str, int, int], np.memmap] = OrderedDict()
+        self._last_counts: dict[int, int] = {}
+        self._last_time = 0
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """
+        Serializes threads, then processes. Writers re-read the state
+        another process may have saved.
+        """
+        with self._lock:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                if exclusive:
+                    self._load_state()
+                yield
+            finally:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _load_state(self) -> None:
+        state_path = self.directory / STATE_FILE
+        if state_path.exists():
+            state = json.loads(state_path.read_text(encoding="utf-8"))
+            self._last_counts = {int(k): v for k, v in state["counts"].items()}
+            self._last_time = state["last_time"]
+
+    def _partition_path(self, resolution: str, trend_id: int, partition: int) -> Path:
+        return self._rollups / resolution / str(trend_id) / f"{partition}.npy"
+
+    def _partition(
+        self, resolution: str, trend_id: int, partition: int, create: bool
+    ) -> np.memmap | None:
+        """Returns a mapped partition, creating it if asked; None if absent."""
+        key = (resolution, trend_id, partition)
+        mapped = self._open.get(key)
+        if mapped is not None:
+            self._open.move_to_end(key)
+            return mapped
+        path = self._partition_path(resolution, trend_id, partition)
+        if path.exists():
+            mapped = np.lib.format.open_memmap(path, mode="r+")
+        elif create:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            mapped = np.lib.format.open_memmap(
+                path, mode="w+", dtype=ROLLUP_DTYPE, shape=(PARTITION_BUCKETS,)
+            )
+        else:
+            return None
+        self._open[key] = mapped
+        if len(self._open) > MAX_OPEN_PARTITIONS:
+            _, evicted = self._open.popitem(last=False)
+            evicted.flush()
+        return mapped
+
+    def _update_rollups(
+        self,
+        timestamp: int,
+        trends: np.ndarray,
+        mentions: np.ndarray,
+        scores: np.ndarray,
+    ) -> None:
+        for resolution in BUCKET_SECONDS:
+            partition, offset = divmod(
+                bucket_of(timestamp, resolution), PARTITION_BUCKETS
+            )
+            for trend_id, mention, score in zip(
+                trends.tolist(), mentions.tolist(), scores.tolist()
+            ):
+                rollup = self._partition(resolution, trend_id, partition, create=True)
+                assert rollup is not None
+                # A record of a structured array is a view; writes go to the map.
+                bucket = rollup[offset]
+                bucket["points"] += 1
+                bucket["mentions"] += mention
+                bucket["score_sum"] += score
+                bucket["score_last"] = score
+                bucket["score_max"] = max(bucket["score_max"], score)
+
+    def append(
+        self,
+        timestamp: int,
+        trend_ids: np.ndarray,
+        mentions: np.ndarray,
+        scores: np.ndarray,
+    ) -> None:
+        """
+        Appends one point per trend at timestamp (Unix seconds).
+
+        Raises:
+            ValueError: If the arrays differ in length or timestamp is older
+                than the last appended point (the history is append-only).
+        """
+        with self._locked(exclusive=True):
+            self._append_locked(timestamp, trend_ids, mentions, scores)
+            self._save_state()
+
+    def _append_locked(
+        self,
+        timestamp: int,
+        trend_ids: np.ndarray,
+        mentions: np.ndarray,
+        scores: np.ndarray,
+    ) -> None:
+        trends = np.asarray(trend_ids, dtype=RAW_COLUMNS["trend"])
+        columns = {
+            "time": np.full(len(trends), timestamp, dtype=RAW_COLUMNS["time"]),
+            "trend": trends,
+            "mentions": np.asarray(mentions, dtype=RAW_COLUMNS["mentions"]),
+            "score": np.asarray(scores, dtype=RAW_COLUMNS["score"]),
+        }
+        if len({len(column) for column in columns.values()}) != 1:
+            raise ValueError("trend_ids, mentions and scores must have equal length.")
+        if timestamp < self._last_time:
+            raise ValueError(
+                f"Timestamp {timestamp} is older than the last point "
+                f"({self._last_time})."
+            )
+        if len(trends) == 0:
+            return
+        day = datetime.fromtimestamp(timestamp, timezone.utc).date().isoformat()
+        segment = self._raw / day
+        segment.mkdir(exist_ok=True)
+        for name, column in columns.items():
+            with open(segment / f"{name}.bin", "ab") as column_file:
+                column_file.write(column.tobytes())
+        self._update_rollups(timestamp, trends, columns["mentions"], columns["score"])
+        self._last_time = timestamp
+
+    def record_counts(
+        self, timestamp: int, counts: dict[int, int], scores: dict[int, float]
+    ) -> int:
+        """
+        Appends a point per trend from cumulative article counts.
+
+        Mentions are the growth in each trend's article count since the
+        previous call by any process (all of it for a trend seen for the
+        first time). A timestamp older than the last point, recorded by a
+        process that got the lock first, is moved up to it.
+
+        Returns:
+            The number of points appended.
+        """
+        trend_ids = sorted(counts)
+        with self._locked(exclusive=True):
+            timestamp = max(timestamp, self._last_time)
+            mentions = [
+                max(0, counts[t] - self._last_counts.get(t, 0)) for t in trend_ids
+            ]
+            self._append_locked(
+                timestamp,
+                np.array(trend_ids, dtype=np.int64),
+                np.array(mentions, dtype=np.int32),
+                np.array([scores[t] for t in trend_ids], dtype=np.float32),
+            )
+            self._last_counts.update(counts)
+            self._save_state()
+        return len(trend_ids)
+
+    def _save_state(self) -> None:
+        for mapped in self._open.values():
+            mapped.flush()
+        state_path = self.directory / STATE_FILE
+        temporary = state_path.with_suffix(".tmp")
+        temporary.write_text(
+            json.dumps({"last_time": self._last_time, "counts": self._last_counts}),
+            encoding="utf-8",
+        )
+        os.replace(temporary, state_path)
+
+    def _read_buckets(
+        self, trend_id: int, resolution: Resolution, first: int, stop: int
+    ) -> Iterator[np.ndarray]:
+        """Yields read-only views (or zeros) covering buckets [first, stop)."""
+        bucket = first
+        while bucket < stop:
+            partition, offset = divmod(bucket, PARTITION_BUCKETS)
+            length = min(stop - bucket, PARTITION_BUCKETS - offset)
+            mapped = self._partition(resolution, trend_id, partition, create=False)
+            if mapped is None:
+                yield np.zeros(length, dtype=ROLLUP_DTYPE)
+            else:
+                view = mapped[offset : offset + length].view(np.ndarray)
+                view.flags.writeable = False
+                yield view
+            bucket += length
+
+    def rollup(
+        self, trend_id: int, start: int, end: int, resolution: Resolution = "day"
+    ) -> RollupSeries:
+        """
+        Returns the buckets of a trend overlapping [start, end) (Unix seconds).
+
+        Raises:
+            ValueError: If resolution is unknown.
+        """
+        if resolution not in BUCKET_SECONDS:
+            raise ValueError(f"Unknown resolution {resolution!r}.")
+        first = bucket_of(start, resolution)
+        stop = max(first, bucket_of(end - 1, resolution) + 1)
+        with self._locked(exclusive=False):
+            pieces = list(self._read_buckets(trend_id, resolution, first, stop))
+        data = pieces[0] if len(pieces) == 1 else np.concatenate(pieces)
+        starts = bucket_start(np.arange(first, stop, dtype=np.int64), resolution)
+        return RollupSeries(
+            resolution=resolution,
+            start=starts,
+            points=data["points"],
+            mentions=data["mentions"],
+            score_sum=data["score_sum"],
+            score_last=data["score_last"],
+            score_max=data["score_max"],
+        )
+
+    def raw_segments(self, start: int, end: int) -> Iterator[RawSegment]:
+        """Yields zero-copy views of raw points in [start, end), per day."""
+        first_day = datetime.fromtimestamp(start, timezone.utc).date().isoformat()
+        last_day = datetime.fromtimestamp(end, timezone.utc).date().isoformat()
+        for segment in sorted(self._raw.iterdir()):
+            if not first_day <= segment.name <= last_day:
+                continue
+            columns = {
+                name: _map_column(segment / f"{name}.bin", dtype)
+                for name, dtype in RAW_COLUMNS.items()
+            }
+            # A crash between column writes can leave columns uneven.
+            rows = min(len(column) for column in columns.values())
+            times = columns["time"][:rows]
+            low, high = np.searchsorted(times, [start, end])
+            yield RawSegment(
+                **{name: column[low:high] for name, column in columns.items()}
+            )
+
+    def compact(
+        self,
+        raw_retention_days: float,
+        hourly_retention_days: float,
+        now: datetime | None = None,
+    ) -> int:
+        """
+        Deletes raw segments and hourly partitions past their retention.
+
+        Returns:
+            The number of segments and partitions deleted.
+        """
+        now = now or datetime.now(timezone.utc)
+        raw_cutoff = (now - timedelta(days=raw_retention_days)).date().isoformat()
+        hourly_cutoff = bucket_of(
+            int((now - timedelta(days=hourly_retention_days)).timestamp()), "hour"
+        )
+        removed = 0
+        with self._locked(exclusive=True):
+            for segment in list(self._raw.iterdir()):
+                if segment.name < raw_cutoff:
+                    shutil.rmtree(segment)
+                    removed += 1
+            for path in list((self._rollups / "hour").glob("*/*.npy")):
+                last_bucket = (int(path.stem) + 1) * PARTITION_BUCKETS - 1
+                if last_bucket < hourly_cutoff:
+                    self._open.pop(
+                        ("hour", int(path.parent.name), int(path.stem)), None
+                    )
+                    path.unlink()
+                    removed += 1
+        if removed:
+            logger.info("Trend history compaction removed %s files.", removed)
+        return removed
+
+    def close(self) -> None:
+        """Flushes and unmaps all open rollup partitions."""
+        with self._lock:
+            for mapped in self._open.values():
+                mapped.flush()
+            self._open.clear()
+            os.close(self._lock_fd)
+
+
+@lru_cache(maxsize=1)
+def get_trend_history_store() -> TrendHistoryStore:
+    """Returns the process-wide TrendHistoryStore, creating it on first use."""
+    return TrendHistoryStore(settings.TREND_HISTORY_PATH)
+
+
+def close_trend_history_store() -> None:
+    """Closes the process-wide TrendHistoryStore if it was opened."""
+    # pylint: disable-next=too-many-function-args
+    if get_trend_history_store.cache_info().currsize:
+        get_trend_history_store().close()
+        get_trend_history_store.cache_clear()
+
+
+def record_trend_history(now: datetime | None = None) -> int:
+    """
+    Appends the current article count and score of every active trend, and
+    compacts history past its retention.
+
+    Returns:
+        The number of points appended.
+    """
+    now = now or datetime.now(timezone.utc)
+    clusters = get_topic_cluster_store().clusters()
+    history = get_trend_history_store()
+    appended = history.record_counts(
+        int(now.timestamp()),
+        {cluster.id: cluster.article_count for cluster in clusters},
+        {cluster.id: cluster.weight for cluster in clusters},
+    )
+    history.compact(
+        settings.TREND_HISTORY_RAW_RETENTION_DAYS,
+        settings.TREND_HISTORY_HOURLY_RETENTION_DAYS,
+        now,
+    )
+    return appended
@@ -0,0 +1,97 @@
+"""Marketing trends derived from topic clusters.
+
+A trend is an active topic cluster described by its most recent articles.
+Its version changes whenever the cluster absorbs new articles, so anything
+derived from a trend (such as generated content) can be keyed on
+(trend id, version) and goes stale exactly when the trend does.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from backend.app.data_ingestion.content_store import get_article_store
+from backend.app.db.pagination import Page
+from backend.app.nlp_processing.clustering import (
+    TopicCluster,
+    get_topic_cluster_store,
+)
+
+SAMPLE_ARTICLES = 5
+SNIPPET_CHARS = 300
+
+
+@dataclass(frozen=True)
+class Trend:  # pylint: disable=too-many-instance-attributes
+    """A trend and the context used to prompt content generation."""
+
+    id: str
+    name: str
+    version: str
+    article_count: int
+    identified_at: datetime
+    updated_at: datetime
+    snippets: tuple[str, ...]
+    score: float = 0.0
+
+
+def get_trend(trend_id: str) -> Trend | None:
+    """
+    Returns the trend with the given id, with snippets of its most recent
+    articles, or None if there is none.
+    """
+    try:
+        cluster_id = int(trend_id)
+    except ValueError:
+        return None
+    clusters = get_topic_cluster_store()
+    cluster = clusters.get_cluster(cluster_id)
+    if cluster is None:
+        return None
+    articles = get_article_store()
+    texts = [
+        article.content
+        for article_id in clusters.article_ids(cluster.id, SAMPLE_ARTICLES)
+        if (article := articles.get_article(article_id)) is not None
+    ]
+    return _trend_from_cluster(
+        cluster,
+        snippets=tuple(" ".join(text.split())[:SNIPPET_CHARS] for text in texts),
+    )
+
+
+def list_trends(limit: int = 20, cursor: str | None = None) -> Page[Trend]:
+    """
+    Returns a page of trends, highest score first, without snippets.
+
+    Names are stored with the clusters, so a page is served from the
+    covering index; only clusters never named yet are named here.
+
+    Raises:
+        InvalidCursorError: If cursor is malformed.
+    """
+    clusters = get_topic_cluster_store()
+    page = clusters.list_clusters(limit, cursor)
+    unnamed = [cluster.id for cluster in page.items if cluster.name is None]
+    names = clusters.name_clusters(unnamed) if unnamed else {}
+    return Page(
+        [
+            _trend_from_cluster(cluster, name=names.get(cluster.id))
+            for cluster in page.items
+        ],
+        page.next_cursor,
+    )
+
+
+def _trend_from_cluster(
+    cluster: TopicCluster, name: str | None = None, snippets: tuple[str, ...] = ()
+) -> Trend:
+    return Trend(
+        id=str(cluster.id),
+        name=name or cluster.name or f"Topic {cluster.id}",
+        version=f"{cluster.updated_at.isoformat()}/{cluster.article_count}",
+        article_count=cluster.article_count,
+        identified_at=cluster.created_at,
+        updated_at=cluster.updated_at,
+        snippets=snippets,
+        score=cluster.weight,
+    )
@@ -0,0 +1,260 @@
+"""Push of trend changes to dashboard subscribers.
+
+Instead of every open dashboard tab polling the trends API, each API
+process runs one TrendBroadcaster. It holds the current snapshot of the
+top trends and, when a trend cycle commits, loads a new one and wakes
+every subscriber; each subscriber is then sent a compact diff (the trends
+whose summary changed and the ids of those that disappeared).
+
+In-process fetch cycles notify the broadcaster directly. Cycles run by
+separate ingestion workers are picked up by a poller that checks the
+cheap TopicClusterStore.revision() token every few seconds, once per
+process however many clients are connected.
+
+A subscription only remembers the last snapshot it delivered, so its
+buffer is bounded to one pending update: a slow consumer that misses
+several cycles gets a single diff from what it last saw to the latest
+snapshot, and the diff for a given pair of snapshots is computed once for
+all subscribers that share it.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from backend.app.core.config import settings
+from backend.app.nlp_processing.clustering import get_topic_cluster_store
+from backend.app.schemas.trends import TrendSummarySchema
+from backend.app.trend_identification.trends import Trend, list_trends
+
+logger = logging.getLogger(__name__)
+
+# Trend id -> JSON-ready trend summary.
+TrendState = Mapping[str, dict[str, Any]]
+
+
+class TooManySubscribersError(RuntimeError):
+    """Raised when a broadcaster already has its maximum of subscribers."""
+
+
+@dataclass(frozen=True)
+class TrendSnapshot:
+    """The trends at one revision, highest score first."""
+
+    revision: str
+    trends: TrendState
+
+    def to_json(self) -> dict[str, Any]:
+        """The payload of a full snapshot event."""
+        return {"revision": self.revision, "trends": list(self.trends.values())}
+
+
+def diff_trends(old: TrendState, new: TrendState) -> dict[str, Any]:
+    """Returns the summaries that are new or changed and the removed ids."""
+    return {
+        "changed": [trend for key, trend in new.items() if old.get(key) != trend],
+        "removed": [key for key in old if key not in new],
+    }
+
+
+class Subscription:
+    """One subscriber: the last snapshot it was sent and a wakeup flag."""
+
+    def __init__(self, broadcaster: "TrendBroadcaster", delivered: TrendSnapshot):
+        self._broadcaster = broadcaster
+        self.delivered = delivered
+        self._changed = asyncio.Event()
+        self.closed = False
+
+    def notify(self) -> None:
+        """Marks the subscription as having a newer snapshot to fetch."""
+        self._changed.set()
+
+    def close(self) -> None:
+        """Ends the subscription; a waiting next() returns None."""
+        self.closed = True
+        self._changed.set()
+
+    async def next(self, timeout: float | None = None) -> dict[str, Any] | None:
+        """
+        Waits for the snapshot to move past the one last delivered.
+
+        Returns:
+            The diff to the latest snapshot (with its revision), or None if
+            nothing changed within timeout or the subscription was closed.
+        """
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self._changed.clear()
+        current = self._broadcaster.snapshot
+        if self.closed or current.revision == self.delivered.revision:
+            return None
+        update = self._broadcaster.diff_from(self.delivered)
+        self.delivered = current
+        return update
+
+
+class TrendBroadcaster:  # pylint: disable=too-many-instance-attributes
+    """Holds the latest trend snapshot and fans changes out to subscribers."""
+
+    def __init__(
+        self,
+        load: Callable[[], TrendState],
+        revision: Callable[[], str],
+        *,
+        poll_interval: float = 5.0,
+        max_subscribers: int = 1000,
+    ):
+        """
+        Args:
+            load: Reads the current trends (a blocking call).
+            revision: Returns a token that changes with the trends (a cheap
+                blocking call).
+            poll_interval: Seconds between revision checks while anyone is
+                subscribed (0 disables polling).
+            max_subscribers: Subscribers beyond this are refused.
+        """
+        self._load = load
+        self._revision = revision
+        self.poll_interval = poll_interval
+        self.max_subscribers = max_subscribers
+        self.snapshot = TrendSnapshot(revision="", trends={})
+        self._subscribers: set[Subscription] = set()
+        # Diffs to the current snapshot, by the revision they start from.
+        self._diffs: dict[str, dict[str, Any]] = {}
+        self._refresh_lock = asyncio.Lock()
+        self._poller: asyncio.Task | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of open subscriptions."""
+        return len(self._subscribers)
+
+    async def refresh(self) -> bool:
+        """
+        Loads a new snapshot if the trends changed and wakes subscribers.
+
+        Returns:
+            True if the snapshot changed.
+        """
+        async with self._refresh_lock:
+            revision = await asyncio.to_thread(self._revision)
+            if revision == self.snapshot.revision:
+                return False
+            trends = await asyncio.to_thread(self._load)
+            self.snapshot = TrendSnapshot(revision=revision, trends=trends)
+            self._diffs.clear()
+        for subscription in self._subscribers:
+            subscription.notify()
+        logger.debug(
+            "Trend revision %s pushed to %s subscribers.",
+            revision,
+            len(self._subscribers),
+        )
+        return True
+
+    def diff_from(self, delivered: TrendSnapshot) -> dict[str, Any]:
+        """Returns the update from a delivered snapshot to the current one."""
+        current = self.snapshot
+        update = self._diffs.get(delivered.revision)
+        if update is None:
+            update = {
+                "revision": current.revision,
+                **diff_trends(delivered.trends, current.trends),
+            }
+            self._diffs[delivered.revision] = update
+        return update
+
+    async def subscribe(self) -> Subscription:
+        """
+        Opens a subscription positioned at the current snapshot.
+
+        Raises:
+            TooManySubscribersError: If max_subscribers are already open.
+        """
+        if len(self._subscribers) >= self.max_subscribers:
+            raise TooManySubscribersError(
+                f"Already streaming to {self.max_subscribers} subscribers."
+            )
+        if not self.snapshot.revision:
+            await self.refresh()
+        subscription = Subscription(self, self.snapshot)
+        self._subscribers.add(subscription)
+        if self._poller is None and self.poll_interval > 0:
+            self._poller = asyncio.create_task(self._poll())
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Closes a subscription and forgets it."""
+        subscription.close()
+        self._subscribers.discard(subscription)
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            if not self._subscribers:
+                continue
+            try:
+                await self.refresh()
+            # The poller is never restarted, so nothing may end it.
+            except Exception as e:  # noqa: BLE001 # pylint: disable=broad-except
+                logger.warning("Could not refresh trends for subscribers: %s", e)
+
+    async def close(self) -> None:
+        """Stops polling and ends every subscription."""
+        if self._poller is not None:
+            self._poller.cancel()
+            await asyncio.gather(self._poller, return_exceptions=True)
+            self._poller = None
+        for subscription in list(self._subscribers):
+            self.unsubscribe(subscription)
+
+
+def trend_summary(trend: Trend) -> TrendSummarySchema:
+    """Returns the API summary of a trend."""
+    return TrendSummarySchema(
+        id=trend.id,
+        name=trend.name,
+        identified_date=trend.updated_at,
+        score=trend.score,
+        source_articles_count=trend.article_count,
+    )
+
+
+def load_top_trends(limit: int) -> TrendState:
+    """Returns JSON-ready summaries of the top trends, highest score first."""
+    return {
+        trend.id: trend_summary(trend).model_dump(mode="json")
+        for trend in list_trends(limit).items
+    }
+
+
+@lru_cache(maxsize=1)
+def get_trend_broadcaster() -> TrendBroadcaster:
+    """Returns the process-wide TrendBroadcaster, creating it on first use."""
+    return TrendBroadcaster(
+        lambda: load_top_trends(settings.TREND_STREAM_MAX_TRENDS),
+        lambda: get_topic_cluster_store().revision(),
+        poll_interval=settings.TREND_STREAM_POLL_SECONDS,
+        max_subscribers=settings.TREND_STREAM_MAX_SUBSCRIBERS,
+    )
+
+
+async def notify_trend_update() -> None:
+    """Pushes committed trend changes to subscribers of this process, if any."""
+    # pylint: disable-next=too-many-function-args
+    if get_trend_broadcaster.cache_info().currsize:
+        await get_trend_broadcaster().refresh()
+
+
+async def close_trend_broadcaster() -> None:
+    """Closes the process-wide TrendBroadcaster if it was created."""
+    # pylint: disable-next=too-many-function-args
+    if get_trend_broadcaster.cache_info().currsize:
+        await get_trend_broadcaster().close()
+        get_trend_broadcaster.cache_clear()
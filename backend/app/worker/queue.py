@@ -0,0 +1,264 @@
+"""Durable SQLite-backed work queue for ingestion workers.
+
+Producers (the API) enqueue tasks; worker processes claim them. A claim
+hides the task for a visibility timeout instead of removing it, so a task
+whose worker dies before acknowledging it becomes visible again and is
+retried by another worker. Workers extend the lease of a long-running
+task while they still hold it. Tasks that keep failing are moved to the
+'dead' state after max_attempts.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from backend.app.core.config import settings
+from backend.app.db.database import connect
+
+logger = logging.getLogger(__name__)
+
+# Task kinds understood by the ingestion worker.
+FETCH_CYCLE_TASK = "fetch_cycle"
+FETCH_URL_TASK = "fetch_url"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease_token TEXT,
+    created_at REAL NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_work_queue_ready
+    ON work_queue (status, available_at, id);
+"""
+
+
+@dataclass(frozen=True)
+class WorkItem:
+    """A claimed task. lease_token must be presented to ack or nack it."""
+
+    id: int
+    kind: str
+    payload: dict[str, Any]
+    attempts: int
+    lease_token: str
+
+
+class WorkQueue:
+    """A multi-process work queue with visibility timeouts and acks."""
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        *,
+        max_attempts: int = 5,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._conn = connection
+        self._lock = threading.Lock()
+        self.max_attempts = max_attempts
+        self._clock = clock
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def enqueue(
+        self, kind: str, payload: dict[str, Any] | None = None, delay: float = 0.0
+    ) -> int:
+        """
+        Adds a task to the queue.
+
+        Args:
+            kind: Task type, used by workers to pick a handler.
+            payload: JSON-serializable task arguments.
+            delay: Seconds before the task becomes visible to workers.
+
+        Returns:
+            The task id.
+        """
+        now = self._clock()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO work_queue (kind, payload, available_at, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (kind, json.dumps(payload or {}), now + delay, now),
+            )
+            self._conn.commit()
+        task_id = int(cursor.lastrowid or 0)
+        logger.info("Enqueued %s task %s.", kind, task_id)
+        return task_id
+
+    def enqueue_many(self, kind: str, payloads: list[dict[str, Any]]) -> int:
+        """
+        Adds one task per payload in a single transaction.
+
+        Returns:
+            The number of tasks added.
+        """
+        now = self._clock()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO work_queue (kind, payload, available_at, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                [(kind, json.dumps(payload), now, now) for payload in payloads],
+            )
+            self._conn.commit()
+        logger.info("Enqueued %s %s tasks.", len(payloads), kind)
+        return len(payloads)
+
+    def claim(
+        self, visibility_timeout: float, kinds: Collection[str] | None = None
+    ) -> WorkItem | None:
+        """
+        Claims the oldest visible task, hiding it for visibility_timeout.
+
+        Args:
+            visibility_timeout: Seconds the task stays hidden from others.
+            kinds: Only claim tasks of these kinds. Defaults to any kind.
+
+        Returns:
+            The claimed task, or None if no task is ready.
+        """
+        now = self._clock()
+        token = uuid.uuid4().hex
+        kinds_json = None if kinds is None else json.dumps(list(kinds))
+        with self._lock:
+            row = self._conn.execute(
+                "UPDATE work_queue SET available_at = ?, lease_token = ?, "
+                "attempts = attempts + 1 WHERE id = ("
+                "  SELECT id FROM work_queue WHERE status = 'queued' "
+                "  AND available_at <= ? AND (? IS NULL OR kind IN "
+                "  (SELECT value FROM json_each(?))) ORDER BY available_at, id LIMIT 1"
+                ") RETURNING id, kind, payload, attempts",
+                (now + visibility_timeout, token, now, kinds_json, kinds_json),
+            ).fetchone()
+            self._conn.commit()
+        if row is None:
+            return None
+        return WorkItem(
+            id=row["id"],
+            kind=row["kind"],
+            payload=json.loads(row["payload"]),
+            attempts=row["attempts"],
+            lease_token=token,
+        )
+
+    def extend(self, item: WorkItem, visibility_timeout: float) -> bool:
+        """
+        Keeps a claimed task hidden for visibility_timeout from now.
+
+        Returns:
+            False if the lease was lost.
+        """
+        with self._lock:
+            updated = self._conn.execute(
+                "UPDATE work_queue SET available_at = ? "
+                "WHERE id = ? AND lease_token = ?",
+                (self._clock() + visibility_timeout, item.id, item.lease_token),
+            ).rowcount
+            self._conn.commit()
+        return bool(updated)
+
+    def ack(self, item: WorkItem) -> bool:
+        """
+        Removes a completed task.
+
+        Returns:
+            False if the lease was lost (the task timed out and was
+            re-claimed), in which case nothing is removed.
+        """
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM work_queue WHERE id = ? AND lease_token = ?",
+                (item.id, item.lease_token),
+            ).rowcount
+            self._conn.commit()
+        return bool(deleted)
+
+    def nack(self, item: WorkItem, error: str, retry_delay: float = 0.0) -> bool:
+        """
+        Returns a failed task to the queue, or marks it dead once it has
+        used up max_attempts.
+
+        Returns:
+            False if the lease was lost.
+        """
+        dead = item.attempts >= self.max_attempts
+        with self._lock:
+            updated = self._conn.execute(
+                "UPDATE work_queue SET status = ?, available_at = ?, "
+                "lease_token = NULL, last_error = ? "
+                "WHERE id = ? AND lease_token = ?",
+                (
+                    "dead" if dead else "queued",
+                    self._clock() + retry_delay,
+                    error[:1000],
+                    item.id,
+                    item.lease_token,
+                ),
+            ).rowcount
+            self._conn.commit()
+        if dead and updated:
+            logger.error(
+                "Task %s (%s) failed %s times; marked dead: %s",
+                item.id,
+                item.kind,
+                item.attempts,
+                error,
+            )
+        return bool(updated)
+
+    def depth(self, kind: str | None = None) -> int:
+        """Number of queued tasks (of a kind), including ones currently leased."""
+        with self._lock:
+            if kind is None:
+                return self._conn.execute(
+                    "SELECT COUNT(*) FROM work_queue WHERE status = 'queued'"
+                ).fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM work_queue WHERE status = 'queued' AND kind = ?",
+                (kind,),
+            ).fetchone()[0]
+
+    def oldest_ready_age(self) -> float | None:
+        """Seconds the longest-waiting visible task has been ready, or None."""
+        now = self._clock()
+        with self._lock:
+            oldest = self._conn.execute(
+                "SELECT MIN(available_at) FROM work_queue "
+                "WHERE status = 'queued' AND available_at <= ?",
+                (now,),
+            ).fetchone()[0]
+        return None if oldest is None else now - oldest
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_work_queue() -> WorkQueue:
+    """Returns the process-wide WorkQueue, creating it on first use."""
+    return WorkQueue(
+        connect(settings.DATABASE_PATH), max_attempts=settings.WORKER_MAX_ATTEMPTS
+    )
+
+
+def close_work_queue() -> None:
+    """Closes the process-wide WorkQueue if it was opened."""
+    # pylint: disable-next=too-many-function-args
+    if get_work_queue.cache_info().currsize:
+        get_work_queue().close()
+        get_work_queue.cache_clear()
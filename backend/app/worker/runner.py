@@ -0,0 +1,242 @@
+"""Ingestion worker process.
+
+Runs outside the API process and executes fetch and process tasks claimed
+from the durable work queue, so ingestion load no longer competes with
+request serving. Start it with `python -m backend.worker` (or
+`make run-worker`); scale by running more processes or replicas.
+
+A fetch_cycle task claims the cycle and fans its sources out as one
+fetch_url task each, so every replica shares the fetching. The worker
+holding the cycle works through fetch_url tasks too until none of the
+cycle's sources is outstanding, then finishes the cycle (clustering,
+history, dashboard) as an in-process cycle would.
+
+While a task runs, its lease is extended every third of
+WORKER_VISIBILITY_TIMEOUT_SECONDS, so a long fetch cycle is not redelivered
+to another worker. On SIGTERM/SIGINT the worker stops claiming new tasks
+and exits once the task in hand has finished.
+"""
+
+import asyncio
+import logging
+import signal
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from backend.app.core.config import settings
+from backend.app.core.memory import close_memory_profiler, get_memory_profiler
+from backend.app.data_ingestion.checkpoint import (
+    FetchCycle,
+    close_checkpoint_store,
+    get_checkpoint_store,
+)
+from backend.app.data_ingestion.content_store import close_article_store
+from backend.app.data_ingestion.jina_ai_service import create_jina_client
+from backend.app.data_ingestion.jina_archive import close_archive_writer
+from backend.app.data_ingestion.rate_limiter import close_rate_limiter
+from backend.app.data_ingestion.scheduler import (
+    article_fetcher,
+    fetch_and_process_url,
+    perform_scheduled_article_fetch,
+)
+from backend.app.data_ingestion.source_registry import close_source_registry
+from backend.app.nlp_processing.analyses import close_analysis_store
+from backend.app.nlp_processing.clustering import close_topic_cluster_store
+from backend.app.nlp_processing.embeddings import close_embedding_store
+from backend.app.nlp_processing.inference import close_inference_service
+from backend.app.trend_identification.history import close_trend_history_store
+from backend.app.worker.queue import (
+    FETCH_CYCLE_TASK,
+    FETCH_URL_TASK,
+    WorkItem,
+    WorkQueue,
+    close_work_queue,
+    get_work_queue,
+)
+
+logger = logging.getLogger(__name__)
+
+TaskHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+async def handle_fetch_cycle(_payload: dict[str, Any]) -> None:
+    """Runs a full (checkpointed) article fetch cycle across the workers."""
+    await perform_scheduled_article_fetch(distribute_fetch_cycle)
+
+
+async def handle_fetch_url(payload: dict[str, Any]) -> None:
+    """
+    Fetches and processes a single URL. With a cycle_id, the URL is skipped
+    unless it is still outstanding in that running cycle, and marked done
+    afterwards.
+    """
+    url, cycle_id = payload["url"], payload.get("cycle_id")
+    checkpoints = get_checkpoint_store()
+    if cycle_id is not None and not await asyncio.to_thread(
+        checkpoints.is_pending, cycle_id, url
+    ):
+        logger.info("Skipping %s: no longer outstanding in cycle %s.", url, cycle_id)
+        return
+    async with create_jina_client() as client:
+        await fetch_and_process_url(url, client, article_fetcher())
+    if cycle_id is not None:
+        await asyncio.to_thread(checkpoints.mark_done, cycle_id, url)
+
+
+async def distribute_fetch_cycle(cycle: FetchCycle) -> int:
+    """
+    Enqueues a fetch_url task per pending source and runs such tasks until
+    the cycle has no outstanding source.
+
+    A resumed cycle whose tasks are still queued is not enqueued again.
+    Sources whose tasks died are left outstanding and logged.
+
+    Returns:
+        The number of sources attempted.
+    """
+    queue = get_work_queue()
+    checkpoints = get_checkpoint_store()
+    if not cycle.resumed or not await asyncio.to_thread(queue.depth, FETCH_URL_TASK):
+        await asyncio.to_thread(
+            queue.enqueue_many,
+            FETCH_URL_TASK,
+            [{"url": url, "cycle_id": cycle.id} for url in cycle.pending_urls],
+        )
+    while outstanding := await asyncio.to_thread(checkpoints.outstanding, cycle.id):
+        item = await asyncio.to_thread(
+            queue.claim, settings.WORKER_VISIBILITY_TIMEOUT_SECONDS, (FETCH_URL_TASK,)
+        )
+        if item is not None:
+            await process_item(queue, item, TASK_HANDLERS)
+        elif await asyncio.to_thread(queue.depth, FETCH_URL_TASK):
+            # Other workers hold the rest.
+            await asyncio.sleep(settings.WORKER_POLL_INTERVAL_SECONDS)
+        elif outstanding := await asyncio.to_thread(checkpoints.outstanding, cycle.id):
+            logger.warning(
+                "Fetch cycle %s: %s sources left unfetched; their tasks died.",
+                cycle.id,
+                outstanding,
+            )
+            break
+    return len(cycle.pending_urls) - outstanding
+
+
+TASK_HANDLERS: dict[str, TaskHandler] = {
+    FETCH_CYCLE_TASK: handle_fetch_cycle,
+    FETCH_URL_TASK: handle_fetch_url,
+}
+
+
+async def _renew_lease(queue: WorkQueue, item: WorkItem) -> None:
+    timeout = settings.WORKER_VISIBILITY_TIMEOUT_SECONDS
+    while True:
+        await asyncio.sleep(timeout / 3)
+        if not await asyncio.to_thread(queue.extend, item, timeout):
+            logger.warning(
+                "Lost the lease on task %s while running it; it may run again.",
+                item.id,
+            )
+            return
+
+
+async def process_item(
+    queue: WorkQueue, item: WorkItem, handlers: dict[str, TaskHandler]
+) -> bool:
+    """
+    Runs the handler for a claimed task and acks or nacks it.
+
+    Returns:
+        True if the task succeeded.
+    """
+    handler = handlers.get(item.kind)
+    if handler is None:
+        logger.error("No handler for task %s of kind %r.", item.id, item.kind)
+        await asyncio.to_thread(queue.nack, item, f"Unknown task kind {item.kind!r}")
+        return False
+
+    logger.info("Running %s task %s (attempt %s).", item.kind, item.id, item.attempts)
+    renewal = asyncio.create_task(_renew_lease(queue, item))
+    try:
+        await handler(item.payload)
+    except Exception as e:  # noqa: BLE001 # pylint: disable=broad-except
+        logger.error("Task %s (%s) failed: %s", item.id, item.kind, e, exc_info=True)
+        await asyncio.to_thread(
+            queue.nack, item, repr(e), settings.WORKER_RETRY_DELAY_SECONDS
+        )
+        return False
+    finally:
+        renewal.cancel()
+        await asyncio.gather(renewal, return_exceptions=True)
+
+    if not await asyncio.to_thread(queue.ack, item):
+        logger.warning(
+            "Lease on task %s expired before it finished; it may run again.", item.id
+        )
+    return True
+
+
+async def run_worker(
+    queue: WorkQueue,
+    stop: asyncio.Event,
+    handlers: dict[str, TaskHandler] | None = None,
+) -> int:
+    """
+    Claims and runs tasks until `stop` is set.
+
+    Returns:
+        The number of tasks that succeeded.
+    """
+    handlers = handlers or TASK_HANDLERS
+    succeeded = 0
+    logger.info("Ingestion worker started.")
+    while not stop.is_set():
+        item = await asyncio.to_thread(
+            queue.claim, settings.WORKER_VISIBILITY_TIMEOUT_SECONDS
+        )
+        if item is None:
+            try:
+                await asyncio.wait_for(
+                    stop.wait(), settings.WORKER_POLL_INTERVAL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+            continue
+        if await process_item(queue, item, handlers):
+            succeeded += 1
+    logger.info("Ingestion worker stopped after %s successful tasks.", succeeded)
+    return succeeded
+
+
+async def _serve() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop.set)
+    get_memory_profiler()
+    try:
+        await run_worker(get_work_queue(), stop)
+    finally:
+        close_work_queue()
+        close_archive_writer()
+        close_article_store()
+        close_source_registry()
+        close_checkpoint_store()
+        close_rate_limiter()
+        await close_inference_service()
+        close_topic_cluster_store()
+        close_embedding_store()
+        close_trend_history_store()
+        close_analysis_store()
+        close_memory_profiler()
+
+
+def main() -> None:
+    """
+    Main function to run an ingestion worker.
+    """
+    logging.basicConfig(level=settings.LOG_LEVEL.upper())
+    asyncio.run(_serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""Performance benchmarks for the backend.
+
+Run all benchmarks with ``make bench`` or a single one with
+``PYTHONPATH=.. uv run python -m benchmarks.<module>`` from ``backend/``.
+
+``make loadtest`` runs the HTTP load test in ``loadtest.py``, which is not
+part of ``make bench`` because it fails when latency SLOs are breached.
+"""
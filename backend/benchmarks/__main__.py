@@ -0,0 +1,20 @@
+"""Runs every bench_* module in this package in turn."""
+
+import importlib
+import pkgutil
+
+import benchmarks
+
+
+def main() -> None:
+    """Discovers and runs all benchmark modules."""
+    for module_info in sorted(pkgutil.iter_modules(benchmarks.__path__)):
+        if module_info.name.startswith("bench_"):
+            module = importlib.import_module(f"benchmarks.{module_info.name}")
+            print(f"== {module_info.name}")
+            module.main()
+            print()
+
+
+if __name__ == "__main__":
+    main()
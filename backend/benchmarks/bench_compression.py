@@ -0,0 +1,86 @@
+"""Benchmark: per-document vs. dictionary zstd compression of article bodies.
+
+Reports compression ratio and encode/decode throughput (MB/s) for plain zstd
+and for a dictionary trained on earlier samples from the same source.
+"""
+
+import random
+import time
+
+from backend.app.data_ingestion.compression import ZstdCodec, train_dictionary
+
+SOURCES = 3
+ARTICLES_PER_SOURCE = 400
+TRAINING_SAMPLES = 200
+DICT_SIZE = 64 * 1024
+VOCABULARY = [
+    "marketing",
+    "campaign",
+    "email",
+    "audience",
+    "brand",
+    "engagement",
+    "growth",
+    "analytics",
+    "content",
+    "strategy",
+    "customer",
+    "social",
+    "ai",
+    "automation",
+    "trend",
+]
+
+
+def make_corpus(seed: int = 42) -> dict[str, list[bytes]]:
+    """Builds synthetic Jina-style markdown with per-source boilerplate."""
+    rng = random.Random(seed)
+    corpus: dict[str, list[bytes]] = {}
+    for source in range(SOURCES):
+        nav = " | ".join(f"[Section {source}-{i}](/s{i})" for i in range(30))
+        footer = " ".join(f"Footer link {source}-{i}." for i in range(60))
+        docs = []
+        for _ in range(ARTICLES_PER_SOURCE):
+            body = " ".join(
+                rng.choice(VOCABULARY) for _ in range(rng.randint(300, 900))
+            )
+            doc = f"Title: Source {source}\n\n{nav}\n\n{body}\n\n---\n{footer}\n"
+            docs.append(doc.encode("utf-8"))
+        corpus[f"source-{source}"] = docs
+    return corpus
+
+
+def measure(codec: ZstdCodec, docs: list[bytes]) -> tuple[float, float, float]:
+    """Returns (compression ratio, encode MB/s, decode MB/s) over docs."""
+    raw_bytes = sum(len(doc) for doc in docs)
+    start = time.perf_counter()
+    frames = [codec.compress(doc) for doc in docs]
+    encode_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for frame in frames:
+        codec.decompress(frame)
+    decode_seconds = time.perf_counter() - start
+    megabytes = raw_bytes / 1e6
+    return (
+        raw_bytes / sum(len(frame) for frame in frames),
+        megabytes / encode_seconds,
+        megabytes / decode_seconds,
+    )
+
+
+def main() -> None:
+    """Runs the benchmark and prints a results table."""
+    print(f"{'source':<10} {'mode':<12} {'ratio':>8} {'enc MB/s':>10} {'dec MB/s':>10}")
+    for source, docs in make_corpus().items():
+        training, evaluation = docs[:TRAINING_SAMPLES], docs[TRAINING_SAMPLES:]
+        codecs = {
+            "plain": ZstdCodec(),
+            "dictionary": ZstdCodec(train_dictionary(training, DICT_SIZE)),
+        }
+        for mode, codec in codecs.items():
+            ratio, enc, dec = measure(codec, evaluation)
+            print(f"{source:<10} {mode:<12} {ratio:>8.2f} {enc:>10.1f} {dec:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Benchmark: chunk deduplication of repeatedly fetched listing pages.
+
+Simulates fetch cycles over listing pages that change slightly between
+cycles (a few new headlines at the top, the oldest falling off the end),
+stores every version in an ArticleStore, and reports the dedup ratio, the
+stored size against compressing each version whole, the ingest rate and
+the throughput of rebuilding documents from their chunks on read.
+
+Chunks compress worse one by one than a body does whole, so chunking only
+pays for pages that repeat. Next to the dedup ratio, the benchmark reports
+what chunking one-off articles would cost against the whole bodies the
+store keeps for them.
+"""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from backend.app.data_ingestion.chunking import split_chunks
+from backend.app.data_ingestion.compression import ZstdCodec
+from backend.app.data_ingestion.content_store import ArticleStore
+from backend.app.db.database import connect
+
+SOURCES = 3
+CYCLES = 200
+HEADLINES = 120
+ARTICLES = 200
+WORDS = (
+    "marketing campaign email audience brand engagement growth analytics "
+    "content strategy customer social automation trend retail loyalty"
+).split()
+
+
+def make_headline(rng: random.Random, source: int, index: int) -> str:
+    """One listing entry: a linked title and a short teaser."""
+    title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 10)))
+    teaser = " ".join(rng.choice(WORDS) for _ in range(rng.randint(15, 30)))
+    return f"## [{title.title()}](https://news{source}.example.com/{index})\n{teaser}\n"
+
+
+def listing_versions(seed: int = 42) -> list[tuple[str, str]]:
+    """Returns (url, page) for every source in every cycle."""
+    rng = random.Random(seed)
+    pages = []
+    headlines = {
+        source: [make_headline(rng, source, i) for i in range(HEADLINES)]
+        for source in range(SOURCES)
+    }
+    counters = dict.fromkeys(range(SOURCES), HEADLINES)
+    for _ in range(CYCLES):
+        for source in range(SOURCES):
+            for _ in range(rng.randint(0, 3)):
+                headlines[source].insert(
+                    0, make_headline(rng, source, counters[source])
+                )
+                headlines[source].pop()
+                counters[source] += 1
+            nav = " | ".join(f"[Section {i}](/s{i})" for i in range(20))
+            page = f"Title: News {source}\n\n{nav}\n\n" + "\n".join(headlines[source])
+            pages.append((f"https://news{source}.example.com/latest", page))
+    return pages
+
+
+def one_off_articles(seed: int = 7) -> list[tuple[str, str]]:
+    """Returns (url, body) for articles that are each fetched once."""
+    rng = random.Random(seed)
+    articles = []
+    for index in range(ARTICLES):
+        paragraphs = [
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 80)))
+            for _ in range(rng.randint(10, 40))
+        ]
+        body = f"Title: Story {index}\n\n" + "\n\n".join(paragraphs)
+        articles.append((f"https://news.example.com/story/{index}", body))
+    return articles
+
+
+def chunking_cost(articles: list[tuple[str, str]]) -> tuple[int, int, int]:
+    """Stores one-off articles; returns (stored, whole zstd, chunked zstd)."""
+    codec = ZstdCodec()
+    whole = chunked = 0
+    with tempfile.TemporaryDirectory() as directory:
+        store = ArticleStore(connect(str(Path(directory) / "bench.db")))
+        for url, body in articles:
+            store.save_article(url, body)
+            raw = body.encode()
+            whole += len(codec.compress(raw))
+            chunked += sum(
+                len(codec.compress(chunk))
+                for chunk in split_chunks(raw, *store.chunk_sizes)
+            )
+        stored = store.storage_stats().stored_bytes
+        store.close()
+    return stored, whole, chunked
+
+
+def main() -> None:
+    """Runs the benchmark and prints a results table."""
+    pages = listing_versions()
+    with tempfile.TemporaryDirectory() as directory:
+        store = ArticleStore(connect(str(Path(directory) / "bench.db")))
+        start = time.perf_counter()
+        ids = [store.save_article(url, page) for url, page in pages]
+        ingest_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for article_id in ids:
+            store.get_article(article_id)
+        read_seconds = time.perf_counter() - start
+
+        stats = store.storage_stats()
+        codec = ZstdCodec()
+        whole = sum(len(codec.compress(page.encode())) for _, page in pages)
+        megabytes = stats.raw_bytes / 1e6
+        print(
+            f"{len(pages):,} page versions, {megabytes:.1f} MB raw, "
+            f"{stats.chunk_count:,} unique chunks "
+            f"({stats.chunk_bytes / 1e6:.2f} MB raw)"
+        )
+        print(f"{'storage':<26} {'MB':>8} {'ratio':>8}")
+        print(
+            f"{'whole versions, zstd':<26} {whole / 1e6:>8.2f} "
+            f"{stats.raw_bytes / whole:>8.1f}"
+        )
+        print(
+            f"{'unique chunks, zstd':<26} {stats.stored_bytes / 1e6:>8.2f} "
+            f"{stats.compression_ratio:>8.1f}"
+        )
+        print(f"dedup ratio {stats.dedup_ratio:.1f}")
+        stored, whole, chunked = chunking_cost(one_off_articles())
+        print(
+            f"one-off articles ({ARTICLES}): stored {stored / 1e6:.2f} MB whole; "
+            f"chunking them would take {chunked / 1e6:.2f} MB "
+            f"({chunked / whole - 1:+.0%} against whole-body zstd)"
+        )
+        print(
+            f"ingest {len(pages) / ingest_seconds:,.0f} pages/s, "
+            f"reconstruct {megabytes / read_seconds:,.1f} MB/s "
+            f"({len(pages) / read_seconds:,.0f} pages/s)"
+        )
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
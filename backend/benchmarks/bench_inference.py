@@ -0,0 +1,65 @@
+"""Benchmark: article throughput of micro-batched inference.
+
+Submits a burst of synthetic articles to InferenceService, one analyze()
+call per article as the ingestion pipeline does, and reports articles per
+second and mean batch size for several max_batch_size settings. Batch size
+1 is the unbatched baseline.
+"""
+
+import asyncio
+import time
+
+import numpy as np
+
+from backend.app.nlp_processing.embeddings import HashingEmbedder
+from backend.app.nlp_processing.inference import InferenceService
+from backend.app.nlp_processing.models import LexiconSentimentModel, TopicModel
+
+DIMENSION = 256
+TOPICS = 200
+ARTICLES = 2_000
+BATCH_SIZES = [1, 8, 32, 128]
+WORDS = (
+    "email marketing campaign growth customer brand success risk decline "
+    "audience trend engagement loyal scandal record launch automation"
+).split()
+
+
+def make_articles(count: int, seed: int = 42) -> list[str]:
+    """Random articles of 50-400 words drawn from a small vocabulary."""
+    rng = np.random.default_rng(seed)
+    return [
+        " ".join(rng.choice(WORDS, size=int(rng.integers(50, 400))))
+        for _ in range(count)
+    ]
+
+
+async def measure(articles: list[str], batch_size: int) -> tuple[float, float]:
+    """Returns (articles per second, mean batch size) for one setting."""
+    embedder = HashingEmbedder(DIMENSION)
+    rng = np.random.default_rng(0)
+    centroids = embedder.embed([" ".join(rng.choice(WORDS, 20)) for _ in range(TOPICS)])
+    service = InferenceService(
+        LexiconSentimentModel(),
+        TopicModel(embedder, lambda: (np.arange(TOPICS), centroids)),
+        max_batch_size=batch_size,
+        max_wait_ms=5,
+    )
+    start = time.perf_counter()
+    await asyncio.gather(*(service.analyze(article) for article in articles))
+    elapsed = time.perf_counter() - start
+    await service.close()
+    return len(articles) / elapsed, float(np.mean(service.topics.batch_sizes))
+
+
+def main() -> None:
+    """Runs the benchmark and prints a results table."""
+    articles = make_articles(ARTICLES)
+    print(f"{'batch':>6} {'articles/s':>11} {'mean batch':>11}")
+    for batch_size in BATCH_SIZES:
+        throughput, mean_batch = asyncio.run(measure(articles, batch_size))
+        print(f"{batch_size:>6} {throughput:>11.0f} {mean_batch:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
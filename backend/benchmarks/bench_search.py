@@ -0,0 +1,90 @@
+"""Benchmark: size and query latency of the article full-text index.
+
+Stores a synthetic corpus in an ArticleStore, then reports the size of the
+FTS5 index next to the raw and compressed article bytes, the time of a bulk
+rebuild, and the median query latency of BM25-ranked, snippet-highlighted
+searches. The baseline is a LIKE scan over every decompressed body, which
+is what finding all matches (to rank them) would take without the index.
+"""
+
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from backend.app.data_ingestion.content_store import ArticleStore
+from backend.app.db.database import connect
+
+ARTICLES = 5_000
+REPEATS = 20
+LIMIT = 20
+COMMON = (
+    "marketing campaign email audience brand engagement growth analytics "
+    "content strategy customer social automation trend retail loyalty"
+).split()
+QUERIES = ["email automation", "retail loyalty campaign", "zyxel", "word1234"]
+
+
+def make_article(rng: random.Random) -> str:
+    """An article of common words plus a few of 20,000 rarer ones."""
+    words = [rng.choice(COMMON) for _ in range(rng.randint(200, 600))]
+    words += [f"word{rng.randrange(20_000)}" for _ in range(20)]
+    rng.shuffle(words)
+    return " ".join(words)
+
+
+def median_ms(run, repeats: int = REPEATS) -> float:
+    """Median wall time of run() in milliseconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    """Runs the benchmark and prints a results table."""
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as directory:
+        connection = connect(str(Path(directory) / "bench.db"))
+        store = ArticleStore(connection)
+        start = time.perf_counter()
+        for i in range(ARTICLES):
+            store.save_article(
+                f"https://news{i % 5}.example.com/{i}", make_article(rng)
+            )
+        ingest_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        store.rebuild_search_index()
+        rebuild_seconds = time.perf_counter() - start
+
+        stats = store.storage_stats()
+        print(
+            f"{ARTICLES:,} articles: raw {stats.raw_bytes / 2**20:.1f} MiB, "
+            f"stored {stats.stored_bytes / 2**20:.1f} MiB, "
+            f"index {store.search_index_bytes() / 2**20:.1f} MiB"
+        )
+        print(
+            f"ingest with indexing {ARTICLES / ingest_seconds:,.0f} articles/s, "
+            f"bulk rebuild {rebuild_seconds:.2f}s"
+        )
+        print(f"{'query':>26} {'hits':>5} {'fts5 ms':>9} {'LIKE ms':>9}")
+        for query in QUERIES:
+            hits = len(store.search(query, LIMIT))
+            fts_ms = median_ms(lambda q=query: store.search(q, LIMIT))
+            like = "%" + query.split()[0] + "%"
+            like_ms = median_ms(
+                lambda p=like: connection.execute(
+                    "SELECT COUNT(*) FROM raw_article_text WHERE content LIKE ?",
+                    (p,),
+                ).fetchall(),
+                repeats=3,
+            )
+            print(f"{query:>26} {hits:>5} {fts_ms:>9.2f} {like_ms:>9.2f}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark: exhaustive vs. IVF top-k similarity search.
+
+Reports index build time, per-query latency and recall@k of the IVF index
+against exhaustive search, on clustered synthetic unit vectors shaped like
+article embeddings.
+"""
+
+import math
+import time
+
+import numpy as np
+
+from backend.app.nlp_processing.embeddings import normalize
+from backend.app.nlp_processing.similarity import IVFIndex, top_k
+
+DIMENSION = 256
+TOPICS = 200
+SIZES = [5_000, 50_000]
+QUERIES = 200
+K = 10
+PROBES = [4, 8, 16]
+
+
+def make_vectors(count: int, seed: int = 42) -> np.ndarray:
+    """Unit vectors drawn around TOPICS random topic centres."""
+    rng = np.random.default_rng(seed)
+    centres = normalize(rng.normal(size=(TOPICS, DIMENSION)))
+    topics = rng.integers(TOPICS, size=count)
+    noise = rng.normal(scale=1.2 / math.sqrt(DIMENSION), size=(count, DIMENSION))
+    return normalize(centres[topics] + noise).astype(np.float32)
+
+
+def main() -> None:
+    """Runs the benchmark and prints a results table."""
+    print(f"{'vectors':>8} {'mode':<12} {'build s':>8} {'query ms':>9} {'recall':>7}")
+    for size in SIZES:
+        vectors = make_vectors(size)
+        queries = vectors[np.random.default_rng(0).choice(size, QUERIES)]
+
+        start = time.perf_counter()
+        exact = [set(top_k(vectors, query, K)[0].tolist()) for query in queries]
+        exact_ms = (time.perf_counter() - start) * 1e3 / QUERIES
+        print(f"{size:>8} {'exhaustive':<12} {0:>8.2f} {exact_ms:>9.3f} {1:>7.3f}")
+
+        start = time.perf_counter()
+        index = IVFIndex(vectors, int(math.sqrt(size)))
+        build_seconds = time.perf_counter() - start
+        for n_probe in PROBES:
+            start = time.perf_counter()
+            found = [set(index.search(q, K, n_probe)[0].tolist()) for q in queries]
+            query_ms = (time.perf_counter() - start) * 1e3 / QUERIES
+            recall = np.mean([len(f & e) / K for f, e in zip(found, exact)])
+            print(
+                f"{size:>8} {f'ivf/{n_probe}':<12} {build_seconds:>8.2f} "
+                f"{query_ms:>9.3f} {recall:>7.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark: year-long trend history queries.
+
+Fills a TrendHistoryStore with a year of hourly points for many trends, then
+times the chart queries the trend detail endpoint makes: a year of daily
+and weekly buckets and a month of hourly buckets for one trend. Reads come
+straight from the precomputed rollups, so they should take well under a
+millisecond regardless of how many raw points were recorded.
+"""
+
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from backend.app.trend_identification.history import TrendHistoryStore
+
+TRENDS = 50
+HOURS = 365 * 24
+REPEATS = 200
+START = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp())
+QUERIES = [("day", 365), ("week", 365), ("hour", 30)]
+
+
+def fill(store: TrendHistoryStore, seed: int = 42) -> float:
+    """Appends one point per trend per hour; returns points per second."""
+    rng = np.random.default_rng(seed)
+    trend_ids = np.arange(1, TRENDS + 1)
+    begin = time.perf_counter()
+    for hour in range(HOURS):
+        store.append(
+            START + hour * 3600,
+            trend_ids,
+            rng.poisson(3, TRENDS),
+            rng.random(TRENDS) * 10,
+        )
+    return TRENDS * HOURS / (time.perf_counter() - begin)
+
+
+def time_query(store: TrendHistoryStore, resolution: str, days: int) -> float:
+    """Median milliseconds to read one trend's buckets ending at the last hour."""
+    end = START + HOURS * 3600
+    start = end - days * 86400
+    timings = []
+    for repeat in range(REPEATS):
+        trend_id = repeat % TRENDS + 1
+        begin = time.perf_counter()
+        store.rollup(trend_id, start, end, resolution).score_mean()  # type: ignore[arg-type]
+        timings.append(time.perf_counter() - begin)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    """Runs the benchmark and prints a results table."""
+    with tempfile.TemporaryDirectory() as directory:
+        store = TrendHistoryStore(directory)
+        throughput = fill(store)
+        print(f"appended {TRENDS * HOURS:,} points at {throughput:,.0f} points/s")
+        print(f"{'resolution':>10} {'days':>5} {'median ms':>10}")
+        for resolution, days in QUERIES:
+            millis = time_query(store, resolution, days)
+            print(f"{resolution:>10} {days:>5} {millis:>10.3f}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
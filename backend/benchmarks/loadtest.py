@@ -0,0 +1,396 @@
+"""HTTP load test with latency SLO checks for the API.
+
+Starts the app under uvicorn on a free local port (or targets --url), then
+drives /health, /api/v1/data-ingestion/trigger-fetch and the trend content
+endpoints from --concurrency asyncio workers for --duration seconds. Prints
+throughput and p50/p95/p99 latency per endpoint and exits non-zero when an
+SLO is breached.
+
+The local server gets a throwaway database seeded with synthetic articles
+clustered into trends, runs in worker ingestion mode (trigger-fetch only
+enqueues, so no Jina traffic is generated) and uses the stub LLM provider.
+
+SLOs are given as [ENDPOINT:]METRIC=LIMIT, where METRIC is p50, p95 or p99
+(milliseconds) or error_rate (a fraction); without an endpoint they apply
+to every endpoint. Example:
+
+    PYTHONPATH=.. uv run python -m benchmarks.loadtest \\
+        --concurrency 32 --duration 20 --slo p99=500 --slo health:p95=20
+"""
+
+import argparse
+import asyncio
+import itertools
+import math
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_SLOS = ["p95=250", "p99=1000", "error_rate=0.01"]
+SLO_METRICS = ("p50", "p95", "p99", "error_rate")
+WORDS = (
+    "email marketing campaign growth customer brand audience engagement "
+    "automation launch loyalty retail holiday sale subscriber open rate "
+    "football league season match transfer coach stadium fans goal"
+).split()
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """One request the load generator sends."""
+
+    name: str
+    method: str
+    path: str
+    json: dict | None = None
+    stream: bool = False
+
+
+@dataclass(frozen=True)
+class SLO:
+    """A latency or error-rate threshold for one endpoint (or all: "*")."""
+
+    endpoint: str
+    metric: str
+    limit: float
+
+
+@dataclass
+class EndpointStats:
+    """Latencies (seconds) and error count recorded for one endpoint."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def count(self) -> int:
+        """Number of requests sent."""
+        return len(self.latencies)
+
+    def metric(self, name: str) -> float:
+        """Returns p50/p95/p99 in milliseconds, or the error rate."""
+        if name == "error_rate":
+            return self.errors / self.count if self.count else 0.0
+        return percentile(self.latencies, float(name[1:])) * 1000
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank q-th percentile of values (0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def parse_slo(text: str) -> SLO:
+    """
+    Parses "[ENDPOINT:]METRIC=LIMIT".
+
+    Raises:
+        ValueError: If the text is malformed or names an unknown metric.
+    """
+    target, _, limit = text.partition("=")
+    endpoint, _, metric = target.rpartition(":")
+    if metric not in SLO_METRICS or not limit:
+        raise ValueError(
+            f"Invalid SLO {text!r}; expected [ENDPOINT:]METRIC=LIMIT with "
+            f"METRIC one of {', '.join(SLO_METRICS)}."
+        )
+    return SLO(endpoint=endpoint or "*", metric=metric, limit=float(limit))
+
+
+def check_slos(stats: dict[str, EndpointStats], slos: Sequence[SLO]) -> list[str]:
+    """Returns a description of every breached SLO."""
+    breaches = []
+    for slo in slos:
+        for name, endpoint_stats in stats.items():
+            if slo.endpoint not in ("*", name) or not endpoint_stats.count:
+                continue
+            value = endpoint_stats.metric(slo.metric)
+            if value > slo.limit:
+                breaches.append(
+                    f"{name} {slo.metric} {value:.3f} exceeds {slo.limit:g}"
+                )
+    return breaches
+
+
+async def _send(client: httpx.AsyncClient, endpoint: Endpoint) -> bool:
+    """Sends one request; True if it succeeded."""
+    if endpoint.stream:
+        async with client.stream(
+            endpoint.method, endpoint.path, json=endpoint.json
+        ) as response:
+            body = await response.aread()
+        return response.is_success and b"event: error" not in body
+    response = await client.request(endpoint.method, endpoint.path, json=endpoint.json)
+    return response.is_success
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    endpoints: Sequence[Endpoint],
+    *,
+    concurrency: int,
+    duration: float,
+) -> tuple[dict[str, EndpointStats], float]:
+    """
+    Sends requests from concurrency workers until duration has elapsed.
+
+    Workers cycle through the endpoints, each starting at a different one.
+
+    Returns:
+        Per-endpoint stats and the elapsed time in seconds.
+    """
+    stats = {endpoint.name: EndpointStats() for endpoint in endpoints}
+    start = time.perf_counter()
+    deadline = start + duration
+
+    async def worker(offset: int) -> None:
+        rotation = itertools.islice(itertools.cycle(endpoints), offset, None)
+        for endpoint in rotation:
+            if time.perf_counter() >= deadline:
+                return
+            sent = time.perf_counter()
+            try:
+                ok = await _send(client, endpoint)
+            except httpx.HTTPError:
+                ok = False
+            endpoint_stats = stats[endpoint.name]
+            endpoint_stats.latencies.append(time.perf_counter() - sent)
+            endpoint_stats.errors += not ok
+
+    await asyncio.gather(*(worker(i % len(endpoints)) for i in range(concurrency)))
+    return stats, time.perf_counter() - start
+
+
+def format_report(stats: dict[str, EndpointStats], elapsed: float) -> str:
+    """Renders per-endpoint throughput and latency as a table."""
+    lines = [
+        f"{'endpoint':<16} {'requests':>9} {'errors':>7} {'req/s':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    ]
+    everything = EndpointStats()
+    for name, endpoint_stats in [*stats.items(), ("total", everything)]:
+        if name != "total":
+            everything.latencies.extend(endpoint_stats.latencies)
+            everything.errors += endpoint_stats.errors
+        lines.append(
+            f"{name:<16} {endpoint_stats.count:>9} {endpoint_stats.errors:>7} "
+            f"{endpoint_stats.count / elapsed:>8.1f} "
+            f"{endpoint_stats.metric('p50'):>8.1f} "
+            f"{endpoint_stats.metric('p95'):>8.1f} "
+            f"{endpoint_stats.metric('p99'):>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def build_endpoints(names: Sequence[str], trend_ids: Sequence[int]) -> list[Endpoint]:
+    """Endpoints to drive; trend endpoints are spread over trend_ids."""
+    endpoints = []
+    for name in names:
+        if name == "health":
+            endpoints.append(Endpoint("health", "GET", "/health"))
+        elif name == "trigger-fetch":
+            endpoints.append(
+                Endpoint(
+                    "trigger-fetch", "POST", "/api/v1/data-ingestion/trigger-fetch"
+                )
+            )
+        elif name in ("trend-content", "trend-stream"):
+            suffix = "/stream" if name == "trend-stream" else ""
+            endpoints.extend(
+                Endpoint(
+                    name,
+                    "POST",
+                    f"/api/v1/trends/{trend_id}/generate-content{suffix}",
+                    json={},
+                    stream=bool(suffix),
+                )
+                for trend_id in trend_ids
+            )
+        else:
+            raise ValueError(f"Unknown endpoint {name!r}.")
+    return endpoints
+
+
+def seed_trends(articles: int, seed: int = 42) -> list[int]:
+    """
+    Stores synthetic articles, clusters them, and returns the trend ids.
+
+    Must run after the server's environment has been applied to os.environ,
+    since settings are read when the application modules are imported.
+    """
+    # pylint: disable=import-outside-toplevel
+    import random
+
+    from backend.app.data_ingestion.content_store import (
+        close_article_store,
+        get_article_store,
+    )
+    from backend.app.nlp_processing.clustering import (
+        close_topic_cluster_store,
+        cluster_new_articles,
+        get_topic_cluster_store,
+    )
+    from backend.app.nlp_processing.embeddings import close_embedding_store
+
+    rng = random.Random(seed)
+    store = get_article_store()
+    for i in range(articles):
+        topic = WORDS[:16] if i % 2 else WORDS[16:]
+        text = " ".join(rng.choices(topic, k=120))
+        store.save_article(f"https://loadtest.example/{i % 4}/{i}", text)
+    cluster_new_articles()
+    trend_ids = [cluster.id for cluster in get_topic_cluster_store().clusters()]
+    close_topic_cluster_store()
+    close_embedding_store()
+    close_article_store()
+    return trend_ids
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def local_server(env: dict[str, str], startup_timeout: float = 30.0) -> Iterator[str]:
+    """Runs the app under uvicorn and yields its base URL."""
+    port = _free_port()
+    process = subprocess.Popen(  # pylint: disable=consider-using-with
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "backend.app.server:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=ROOT,
+        env={**os.environ, **env, "PYTHONPATH": str(ROOT)},
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited with code {process.returncode}.")
+            try:
+                if httpx.get(f"{base_url}/health", timeout=1).is_success:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("Server did not become healthy in time.")
+            time.sleep(0.2)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parses command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Target a running server instead")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds")
+    parser.add_argument(
+        "--endpoints",
+        default="health,trigger-fetch,trend-content,trend-stream",
+        help="Comma-separated subset of the default",
+    )
+    parser.add_argument(
+        "--trend-id",
+        type=int,
+        action="append",
+        default=[],
+        help="Trend id to request (with --url; repeatable)",
+    )
+    parser.add_argument(
+        "--articles", type=int, default=200, help="Articles seeded locally"
+    )
+    parser.add_argument(
+        "--llm-latency",
+        type=float,
+        default=0.05,
+        help="Stub LLM latency (seconds) on the local server",
+    )
+    parser.add_argument(
+        "--slo",
+        action="append",
+        default=[],
+        help=f"[ENDPOINT:]METRIC=LIMIT, repeatable (default: {' '.join(DEFAULT_SLOS)})",
+    )
+    return parser.parse_args(argv)
+
+
+async def _load(
+    base_url: str, endpoints: Sequence[Endpoint], args: argparse.Namespace
+) -> tuple[dict[str, EndpointStats], float]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=30
+    ) as client:
+        return await run_load(
+            client, endpoints, concurrency=args.concurrency, duration=args.duration
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs the load test; returns 1 if any SLO was breached."""
+    args = parse_args(argv)
+    slos = [parse_slo(text) for text in args.slo or DEFAULT_SLOS]
+    names = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+
+    if args.url:
+        endpoints = build_endpoints(names, args.trend_id)
+        if not endpoints:
+            print("No endpoints to load test (trend endpoints need --trend-id).")
+            return 2
+        stats, elapsed = asyncio.run(_load(args.url, endpoints, args))
+    else:
+        with tempfile.TemporaryDirectory(prefix="loadtest-") as workdir:
+            env = {
+                "DATABASE_PATH": str(Path(workdir, "loadtest.db")),
+                "EMBEDDING_STORE_PATH": str(Path(workdir, "embeddings")),
+                "SOURCE_REGISTRY_PATH": "",
+                "INGESTION_MODE": "worker",
+                "LLM_PROVIDER": "stub",
+                "LLM_STUB_LATENCY_SECONDS": str(args.llm_latency),
+                "LOG_LEVEL": "WARNING",
+            }
+            os.environ.update(env)
+            trend_ids = seed_trends(args.articles)
+            endpoints = build_endpoints(names, trend_ids)
+            with local_server(env) as base_url:
+                stats, elapsed = asyncio.run(_load(base_url, endpoints, args))
+
+    print(format_report(stats, elapsed))
+    breaches = check_slos(stats, slos)
+    for breach in breaches:
+        print(f"SLO breached: {breach}")
+    if not breaches:
+        print(f"All {len(slos)} SLOs met.")
+    return 1 if breaches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@
 import os
 import sys
 from collections.abc import Iterator
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
@@ -24,6 +25,69 @@ if project_root_top_level not in sys.path:
     sys.path.insert(0, project_root_top_level)
 
 
+def close_shared_stores() -> None:
+    """Closes every lazily opened process-wide store."""
+    # pylint: disable=import-outside-toplevel,too-many-locals
+    from backend.app.core import health, memory
+    from backend.app.data_ingestion import (
+        checkpoint,
+        content_store,
+        jina_ai_service,
+        jina_archive,
+        rate_limiter,
+        source_registry,
+    )
+    from backend.app.llm_integration import generation, providers
+    from backend.app.nlp_processing import analyses, clustering, embeddings, inference
+    from backend.app.trend_identification import dashboard, history, updates
+    from backend.app.worker import queue
+
+    content_store.close_article_store()
+    source_registry.close_source_registry()
+    checkpoint.close_checkpoint_store()
+    rate_limiter.close_rate_limiter()
+    jina_ai_service.get_hedged_fetcher.cache_clear()
+    jina_archive.close_archive_writer()
+    jina_archive.get_replay_transport.cache_clear()
+    queue.close_work_queue()
+    analyses.close_analysis_store()
+    clustering.close_topic_cluster_store()
+    embeddings.close_embedding_store()
+    history.close_trend_history_store()
+    updates.get_trend_broadcaster.cache_clear()
+    dashboard.get_dashboard_store.cache_clear()
+    inference.get_inference_service.cache_clear()
+    generation.get_content_generator.cache_clear()
+    providers.get_llm_provider.cache_clear()
+    health.get_readiness_monitor.cache_clear()
+    memory.close_memory_profiler()
+
+
+@pytest.fixture(autouse=True)
+def isolated_database(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    """
+    Points the application database at a per-test SQLite file so tests never
+    touch a real database and do not share stored state.
+    """
+
+    from backend.app.core.config import (  # pylint: disable=import-outside-toplevel
+        settings,
+    )
+
+    monkeypatch.setattr(settings, "DATABASE_PATH", str(tmp_path / "test.db"))
+    monkeypatch.setattr(settings, "SOURCE_REGISTRY_PATH", "")
+    monkeypatch.setattr(settings, "EMBEDDING_STORE_PATH", str(tmp_path / "embeddings"))
+    monkeypatch.setattr(settings, "TREND_HISTORY_PATH", str(tmp_path / "trend_history"))
+    monkeypatch.setattr(
+        settings, "DASHBOARD_SNAPSHOT_PATH", str(tmp_path / "dashboard.json.gz")
+    )
+    close_shared_stores()
+    yield
+    close_shared_stores()
+
+
 @pytest.fixture(scope="session")  # Changed scope to session for efficiency
 def client() -> Iterator[TestClient]:
     """
@@ -0,0 +1,73 @@
+"""Unit tests for the dashboard API router."""
+
+import json
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from backend.app.server import app
+from backend.app.trend_identification.dashboard import get_dashboard_store
+
+client = TestClient(app)
+
+
+def test_dashboard_is_built_on_first_request_and_served_gzipped():
+    """Without a published snapshot, one is built; gzip is served as stored."""
+    response = client.get("/api/v1/dashboard")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-encoding"] == "gzip"
+    body = response.json()
+    assert response.headers["etag"] == get_dashboard_store().current().gzip_etag
+    assert (body["version"], body["trends"]) == (1, [])
+    assert body["sentiment"]["articles"] == 0
+
+
+def test_dashboard_serves_the_published_snapshot():
+    """The latest snapshot is served as is, compressed only when accepted."""
+    get_dashboard_store().publish({"trends": [{"id": "1"}]})
+    snapshot = get_dashboard_store().publish({"trends": [{"id": "2"}]})
+
+    plain = client.get("/api/v1/dashboard", headers={"Accept-Encoding": "identity"})
+    refused = client.get(
+        "/api/v1/dashboard", headers={"Accept-Encoding": "br, gzip;q=0"}
+    )
+
+    wildcard = client.get(
+        "/api/v1/dashboard", headers={"Accept-Encoding": "*;q=0, gzip"}
+    )
+
+    assert "content-encoding" not in plain.headers
+    assert plain.content == snapshot.body
+    assert plain.headers["etag"] == snapshot.etag
+    assert json.loads(plain.content)["trends"] == [{"id": "2"}]
+    assert "content-encoding" not in refused.headers
+    assert wildcard.headers["content-encoding"] == "gzip"
+    assert wildcard.headers["etag"] == snapshot.gzip_etag != snapshot.etag
+
+
+def test_dashboard_honours_if_none_match():
+    """A client holding the current version gets 304 without a body."""
+    snapshot = get_dashboard_store().publish({"trends": []})
+
+    response = client.get(
+        "/api/v1/dashboard", headers={"If-None-Match": snapshot.gzip_etag}
+    )
+    weak = client.get(
+        "/api/v1/dashboard",
+        headers={"If-None-Match": f"W/{snapshot.etag}", "Accept-Encoding": "identity"},
+    )
+    anything = client.get("/api/v1/dashboard", headers={"If-None-Match": "*"})
+    stale = client.get("/api/v1/dashboard", headers={"If-None-Match": '"dashboard-0"'})
+    other_coding = client.get(
+        "/api/v1/dashboard", headers={"If-None-Match": snapshot.etag}
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == snapshot.gzip_etag
+    assert not response.content
+    assert weak.status_code == status.HTTP_304_NOT_MODIFIED
+    assert anything.status_code == status.HTTP_304_NOT_MODIFIED
+    assert stale.status_code == status.HTTP_200_OK
+    assert stale.json()["version"] == snapshot.version
+    assert other_coding.status_code == status.HTTP_200_OK
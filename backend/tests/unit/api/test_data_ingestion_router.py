@@ -6,7 +6,9 @@ from unittest.mock import AsyncMock, patch
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from backend.app.data_ingestion.content_store import get_article_store
 from backend.app.server import app
+from backend.app.worker.queue import FETCH_CYCLE_TASK, get_work_queue
 
 client = TestClient(app)
 
@@ -45,3 +47,68 @@ def test_trigger_fetch_error():
         finally:
             # Re-enable logging
             logging.disable(logging.NOTSET)
+
+
+def test_trigger_fetch_enqueues_in_worker_mode():
+    """In worker mode the endpoint only enqueues a fetch cycle task."""
+    with (
+        patch(
+            "backend.app.api.v1.routers.data_ingestion.settings.INGESTION_MODE",
+            "worker",
+        ),
+        patch(
+            "backend.app.api.v1.routers.data_ingestion.perform_scheduled_article_fetch",
+            new_callable=AsyncMock,
+        ) as mock_fetch,
+    ):
+        response = client.post("/api/v1/data-ingestion/trigger-fetch")
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    task_id = response.json()["task_id"]
+    mock_fetch.assert_not_called()
+
+    item = get_work_queue().claim(60)
+    assert item is not None
+    assert (item.id, item.kind) == (task_id, FETCH_CYCLE_TASK)
+
+
+def test_list_articles_pages_with_cursor():
+    """Articles are listed newest first without their content."""
+    store = get_article_store()
+    for i in range(3):
+        store.save_article(f"http://a.com/{i}", f"article {i}")
+
+    first = client.get("/api/v1/data-ingestion/articles", params={"limit": 2}).json()
+    second = client.get(
+        "/api/v1/data-ingestion/articles",
+        params={"limit": 2, "cursor": first["next_cursor"]},
+    ).json()
+
+    assert [a["source_url"] for a in first["items"]] == [
+        "http://a.com/2",
+        "http://a.com/1",
+    ]
+    assert "content" not in first["items"][0]
+    assert [a["id"] for a in second["items"]] == [1]
+    assert second["next_cursor"] is None
+    bad = client.get("/api/v1/data-ingestion/articles", params={"cursor": "x"})
+    assert bad.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_search_articles_returns_ranked_snippets():
+    """Search results carry highlighted snippets; the query is required."""
+    store = get_article_store()
+    store.save_article("http://a.com/1", "Email automation for retail brands")
+    store.save_article("http://a.com/2", "Football league results")
+
+    response = client.get(
+        "/api/v1/data-ingestion/articles/search", params={"q": "retail email"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["query"] == "retail email"
+    assert [hit["source_url"] for hit in body["results"]] == ["http://a.com/1"]
+    assert "<mark>retail</mark>" in body["results"][0]["snippet"]
+    missing = client.get("/api/v1/data-ingestion/articles/search")
+    assert missing.status_code == 422
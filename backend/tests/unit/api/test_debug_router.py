@@ -0,0 +1,32 @@
+"""Unit tests for the debug API router."""
+
+from unittest.mock import patch
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from backend.app.core.config import settings
+from backend.app.server import app
+
+client = TestClient(app)
+
+
+def test_memory_endpoint_is_hidden_by_default():
+    """Debug endpoints are not served unless enabled."""
+    response = client.get("/api/v1/debug/memory")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_memory_endpoint_reports_current_usage_and_cycles():
+    """The endpoint returns a current sample and recorded cycle reports."""
+    with patch.object(settings, "DEBUG_ENDPOINTS_ENABLED", True):
+        response = client.get("/api/v1/debug/memory", params={"top": 5})
+
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["tracing"] is False
+    assert body["current"]["rss_bytes"] > 0
+    assert len(body["current"]["gc_counts"]) == 3
+    assert body["current_allocations"] == []
+    assert isinstance(body["cycles"], list)
@@ -3,6 +3,7 @@
 from fastapi.testclient import TestClient
 
 from backend.app.__about__ import __version__ as app_version
+from backend.app.core.health import get_readiness_monitor
 from backend.app.server import app  # Import your FastAPI app instance
 
 client = TestClient(app)
@@ -25,3 +26,35 @@ def test_health_check_returns_correct_payload():
     assert app_version == payload_version, (
         f"App version mismatch: expected {app_version}, got {payload_version}"
     )
+
+
+def test_ready_reports_backlog_and_dependencies():
+    """/ready returns 200 with the readiness figures when the pod is ready."""
+    response = client.get("/ready")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ready"] is True
+    assert body["backlog"]["queue_depth"] == 0
+    assert [d["name"] for d in body["dependencies"]] == ["database", "llm"]
+
+
+def test_ready_returns_503_when_not_ready():
+    """A lagging event loop makes /ready fail so traffic is shed."""
+    get_readiness_monitor().event_loop.lag_seconds = 5.0
+
+    response = client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["reasons"] == ["event loop lag 5.000s exceeds 0.5s"]
+
+
+def test_metrics_are_served_as_prometheus_text():
+    """/metrics serves the same figures as Prometheus gauges."""
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "trends_work_queue_depth 0.0" in response.text
+    assert "process_resident_memory_bytes " in response.text
+    assert 'trends_gc_collections{generation="0"}' in response.text
@@ -0,0 +1,256 @@
+"""Unit tests for the trends API router."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from backend.app.api.v1.routers import trends as trends_router
+from backend.app.core.config import settings
+from backend.app.core.sse import HEARTBEAT
+from backend.app.data_ingestion.content_store import get_article_store
+from backend.app.llm_integration.providers import (
+    LLMProviderError,
+    LLMUnavailableError,
+)
+from backend.app.nlp_processing.clustering import (
+    cluster_new_articles,
+    get_topic_cluster_store,
+)
+from backend.app.server import app
+from backend.app.trend_identification.history import record_trend_history
+from backend.app.trend_identification.updates import (
+    get_trend_broadcaster,
+    notify_trend_update,
+)
+
+client = TestClient(app)
+
+
+def make_trend() -> None:
+    """Stores and clusters articles so that trend 1 exists."""
+    get_article_store().save_article("http://a.com/1", "Email automation for retail")
+    cluster_new_articles()
+
+
+def test_list_trends_pages_by_score():
+    """Trends are listed highest score first, one page per cursor."""
+    articles = get_article_store()
+    for i, text in enumerate(["Email automation", "Email automation", "Football"]):
+        articles.save_article(f"http://a.com/{i}", text)
+    cluster_new_articles()
+
+    first = client.get("/api/v1/trends", params={"limit": 1}).json()
+    second = client.get(
+        "/api/v1/trends", params={"limit": 1, "cursor": first["next_cursor"]}
+    ).json()
+
+    assert [t["source_articles_count"] for t in first["items"]] == [2]
+    assert [t["source_articles_count"] for t in second["items"]] == [1]
+    assert first["items"][0]["score"] > second["items"][0]["score"]
+    assert second["next_cursor"] is None
+
+
+def test_list_trends_rejects_bad_cursors():
+    """Malformed cursors return 400."""
+    response = client.get("/api/v1/trends", params={"cursor": "garbage"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_trend_returns_recorded_history():
+    """A trend is returned with its daily history from the rollups."""
+    make_trend()
+    record_trend_history()
+
+    response = client.get("/api/v1/trends/1", params={"days": 7})
+
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["id"] == "1"
+    assert body["source_articles_count"] == 1
+    assert body["resolution"] == "day"
+    assert len(body["history"]) == 1
+    assert body["history"][0]["mention_frequency"] == 1
+    assert body["history"][0]["score"] == body["score"]
+
+
+def test_get_trend_validates_parameters():
+    """Unknown trends return 404 and unsupported resolutions 422."""
+    make_trend()
+
+    assert client.get("/api/v1/trends/42").status_code == status.HTTP_404_NOT_FOUND
+    assert client.get("/api/v1/trends/1?resolution=month").status_code == 422
+
+
+def test_generate_content_returns_and_caches_ideas():
+    """Content is generated once and then served from the cache."""
+    make_trend()
+
+    with patch.object(settings, "LLM_STUB_LATENCY_SECONDS", 0):
+        first = client.post("/api/v1/trends/1/generate-content", json={})
+        second = client.post("/api/v1/trends/1/generate-content")
+
+    assert first.status_code == status.HTTP_200_OK
+    body = first.json()
+    assert body["trend_id"] == "1"
+    assert body["cached"] is False
+    assert len(body["generated_content"]["email_subject_lines"]) == 3
+    assert second.json()["cached"] is True
+    assert second.json()["generated_content"] == body["generated_content"]
+
+
+def test_generate_content_unknown_trend():
+    """Unknown trends return 404."""
+    response = client.post("/api/v1/trends/42/generate-content")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_generate_content_validates_parameters():
+    """Out-of-range parameters are rejected."""
+    make_trend()
+
+    response = client.post(
+        "/api/v1/trends/1/generate-content", json={"subject_line_count": 50}
+    )
+
+    assert response.status_code == 422
+
+
+def test_generate_content_provider_unavailable():
+    """Provider outages map to 503."""
+    make_trend()
+
+    with patch(
+        "backend.app.llm_integration.providers.StubLLMProvider.complete",
+        new_callable=AsyncMock,
+        side_effect=LLMUnavailableError("down"),
+    ):
+        response = client.post("/api/v1/trends/1/generate-content")
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+def read_events(response) -> list[tuple[str, dict]]:
+    """Parses a server-sent event stream into (event, data) pairs."""
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_content_sends_tokens_then_result():
+    """Tokens are streamed before the final result, which is then cached."""
+    make_trend()
+
+    with patch.object(settings, "LLM_STUB_LATENCY_SECONDS", 0):
+        response = client.post("/api/v1/trends/1/generate-content/stream")
+        cached = client.post("/api/v1/trends/1/generate-content")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = read_events(response)
+    kinds = [kind for kind, _ in events]
+    assert kinds[-1] == "done" and set(kinds[:-1]) == {"token"}
+    streamed = json.loads("".join(data["text"] for kind, data in events[:-1]))
+    done = events[-1][1]
+    assert done["generated_content"] == streamed
+    assert done["cached"] is False
+    assert cached.json()["cached"] is True
+    assert cached.json()["generated_content"] == streamed
+
+
+def test_stream_content_unknown_trend():
+    """Unknown trends return 404 before any stream starts."""
+    response = client.post("/api/v1/trends/42/generate-content/stream")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_stream_content_reports_errors_as_events():
+    """Provider failures after the stream started arrive as an error event."""
+    make_trend()
+
+    async def failing_stream(*_args, **_kwargs):
+        raise LLMUnavailableError("down")
+        yield  # pylint: disable=unreachable
+
+    with patch(
+        "backend.app.llm_integration.providers.StubLLMProvider.stream",
+        failing_stream,
+    ):
+        response = client.post("/api/v1/trends/1/generate-content/stream")
+
+    assert read_events(response) == [("error", {"status_code": 503, "detail": "down"})]
+
+
+def test_stream_content_reports_provider_setup_errors_as_events():
+    """A provider that cannot be built also ends the stream with an error."""
+    make_trend()
+
+    with patch(
+        "backend.app.api.v1.routers.trends.get_content_generator",
+        side_effect=LLMProviderError("ANTHROPIC_API_KEY is not set"),
+    ):
+        response = client.post("/api/v1/trends/1/generate-content/stream")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert read_events(response) == [
+        ("error", {"status_code": 500, "detail": "ANTHROPIC_API_KEY is not set"})
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_trends_sends_a_snapshot_then_updates():
+    """The stream opens with the top trends and pushes a diff per cycle."""
+    make_trend()
+    request = AsyncMock()
+    request.is_disconnected.return_value = False
+
+    response = await trends_router.stream_trends(request, last_event_id=None)
+    body = response.body_iterator
+    snapshot = read_events(SimpleNamespace(text=await anext(body)))
+    get_article_store().save_article("http://b.com/1", "Football league results")
+    cluster_new_articles()
+    await notify_trend_update()
+    update = read_events(SimpleNamespace(text=await anext(body)))
+    await body.aclose()
+
+    assert response.media_type == "text/event-stream"
+    assert [(kind, [t["id"] for t in data["trends"]]) for kind, data in snapshot] == [
+        ("snapshot", ["1"])
+    ]
+    assert [(kind, [t["id"] for t in data["changed"]]) for kind, data in update] == [
+        ("update", ["2"])
+    ]
+    assert update[0][1]["removed"] == []
+    assert get_trend_broadcaster().subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_trends_skips_the_snapshot_a_client_already_has():
+    """Reconnecting at the current revision only waits for changes."""
+    make_trend()
+    request = AsyncMock()
+    request.is_disconnected.return_value = False
+    revision = get_topic_cluster_store().revision()
+
+    with patch.object(settings, "TREND_STREAM_HEARTBEAT_SECONDS", 0.01):
+        response = await trends_router.stream_trends(request, last_event_id=revision)
+        first = await anext(response.body_iterator)
+        await response.body_iterator.aclose()
+
+    assert first == HEARTBEAT
+
+
+def test_stream_trends_refuses_subscribers_past_the_limit():
+    """A process at its subscriber limit answers 503."""
+    with patch.object(settings, "TREND_STREAM_MAX_SUBSCRIBERS", 0):
+        response = client.get("/api/v1/trends/stream")
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
@@ -0,0 +1,90 @@
+"""Unit tests for the HTTP load-test harness."""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from backend.benchmarks.loadtest import (
+    SLO,
+    Endpoint,
+    EndpointStats,
+    build_endpoints,
+    check_slos,
+    parse_slo,
+    percentile,
+    run_load,
+)
+
+
+def test_percentile_uses_nearest_rank():
+    """Percentiles pick an observed value by nearest rank."""
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([3.0], 95) == 3
+    assert percentile([], 95) == 0
+
+
+def test_parse_slo():
+    """SLOs apply to every endpoint unless one is named."""
+    assert parse_slo("p99=500") == SLO("*", "p99", 500)
+    assert parse_slo("health:error_rate=0.01") == SLO("health", "error_rate", 0.01)
+    with pytest.raises(ValueError):
+        parse_slo("p42=1")
+    with pytest.raises(ValueError):
+        parse_slo("p95")
+
+
+def test_check_slos_reports_breaches():
+    """Only thresholds that are exceeded are reported."""
+    fast = EndpointStats(latencies=[0.001] * 99 + [0.002])
+    slow = EndpointStats(latencies=[0.5] * 10, errors=1)
+    stats = {"fast": fast, "slow": slow, "unused": EndpointStats()}
+
+    breaches = check_slos(
+        stats,
+        [SLO("*", "p95", 100), SLO("fast", "p99", 1), SLO("*", "error_rate", 0.05)],
+    )
+
+    assert breaches == [
+        "slow p95 500.000 exceeds 100",
+        "slow error_rate 0.100 exceeds 0.05",
+    ]
+
+
+def test_build_endpoints_spreads_trend_requests():
+    """Trend endpoints are generated per trend id."""
+    endpoints = build_endpoints(["health", "trend-stream"], [4, 7])
+
+    assert [e.path for e in endpoints] == [
+        "/health",
+        "/api/v1/trends/4/generate-content/stream",
+        "/api/v1/trends/7/generate-content/stream",
+    ]
+    assert [e.stream for e in endpoints] == [False, True, True]
+    with pytest.raises(ValueError):
+        build_endpoints(["nope"], [])
+
+
+@pytest.mark.asyncio
+async def test_run_load_records_latencies_and_errors():
+    """Every request is timed and non-2xx responses count as errors."""
+    app = FastAPI()
+
+    @app.get("/ok")
+    async def ok():
+        return {}
+
+    endpoints = [Endpoint("ok", "GET", "/ok"), Endpoint("missing", "GET", "/missing")]
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        stats, elapsed = await run_load(client, endpoints, concurrency=4, duration=0.2)
+
+    assert elapsed >= 0.2
+    assert stats["ok"].count > 0
+    assert stats["ok"].errors == 0
+    assert stats["missing"].count > 0
+    assert stats["missing"].errors == stats["missing"].count
@@ -0,0 +1 @@
+# This file makes the 'core' directory a Python package.
@@ -0,0 +1,146 @@
+"""Unit tests for readiness checks and metrics."""
+
+import asyncio
+import sqlite3
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.core.health import (
+    Backlog,
+    Cached,
+    EventLoopLagMonitor,
+    ReadinessMonitor,
+    format_metrics,
+    read_backlog,
+)
+from backend.app.core.memory import MemorySample
+from backend.app.data_ingestion.checkpoint import get_checkpoint_store
+from backend.app.worker.queue import FETCH_CYCLE_TASK, get_work_queue
+
+
+@pytest.mark.asyncio
+async def test_cached_reuses_results_and_errors_until_expiry():
+    """The wrapped call runs once per ttl, whether it returns or raises."""
+    calls = []
+    now = [0.0]
+
+    def flaky() -> int:
+        calls.append(now[0])
+        if len(calls) == 2:
+            raise sqlite3.OperationalError("database is locked")
+        return len(calls)
+
+    cached = Cached(flaky, ttl=10, clock=lambda: now[0])
+
+    assert await cached.get() == 1
+    assert await cached.get() == 1
+    now[0] = 10
+    with pytest.raises(sqlite3.OperationalError):
+        await cached.get()
+    with pytest.raises(sqlite3.OperationalError):
+        await cached.get()
+    now[0] = 20
+    assert await cached.get() == 3
+    assert calls == [0, 10, 20]
+
+
+@pytest.mark.asyncio
+async def test_event_loop_lag_monitor_sees_blocking_code():
+    """Blocking the loop shows up as lag."""
+    monitor = EventLoopLagMonitor(interval=0.01)
+    monitor.start()
+    await asyncio.sleep(0.02)
+    time.sleep(0.1)  # Blocks the event loop.
+    await asyncio.sleep(0.02)
+    await monitor.stop()
+
+    assert monitor.max_lag_seconds >= 0.05
+
+
+def test_read_backlog_reports_queue_and_ingestion_lag():
+    """Depth, oldest waiting task and time since the last cycle are read."""
+    assert read_backlog() == Backlog(None, 0, None)
+
+    get_work_queue().enqueue(FETCH_CYCLE_TASK)
+    checkpoints = get_checkpoint_store()
+    checkpoints.complete(checkpoints.start_or_resume(["http://a.com"], 0).id)
+    backlog = read_backlog()
+
+    assert backlog.queue_depth == 1
+    assert 0 <= backlog.queue_oldest_age_seconds < 5
+    assert 0 <= backlog.ingestion_lag_seconds < 5
+
+
+@pytest.mark.asyncio
+async def test_monitor_is_not_ready_with_lag_or_backlog():
+    """Event-loop lag and (when capped) queue depth make a pod unready."""
+    get_work_queue().enqueue(FETCH_CYCLE_TASK)
+    get_work_queue().enqueue(FETCH_CYCLE_TASK)
+    monitor = ReadinessMonitor(max_event_loop_lag=0.5, max_queue_depth=1)
+
+    report = await monitor.report()
+    assert not report.ready
+    assert report.reasons == ["queue depth 2 exceeds 1"]
+
+    monitor.max_queue_depth = 0
+    monitor.event_loop.lag_seconds = 0.8
+    report = await monitor.report()
+    assert report.reasons == ["event loop lag 0.800s exceeds 0.5s"]
+
+
+@pytest.mark.asyncio
+async def test_only_critical_dependencies_gate_readiness():
+    """A missing LLM key is reported; an unreadable database is fatal."""
+    with (
+        patch.object(settings, "LLM_PROVIDER", "anthropic"),
+        patch.object(settings, "ANTHROPIC_API_KEY", None),
+    ):
+        report = await ReadinessMonitor().report()
+    assert report.ready
+    assert [(d.name, d.ok) for d in report.dependencies] == [
+        ("database", True),
+        ("llm", False),
+    ]
+
+    with patch(
+        "backend.app.core.health.read_backlog",
+        side_effect=sqlite3.OperationalError("disk I/O error"),
+    ):
+        report = await ReadinessMonitor().report()
+    assert not report.ready
+    assert report.backlog is None
+    assert report.reasons == ["database unavailable: disk I/O error"]
+
+
+@pytest.mark.asyncio
+async def test_format_metrics_renders_prometheus_gauges():
+    """Every figure is a gauge; unknown figures are omitted."""
+    text = format_metrics(await ReadinessMonitor().report())
+
+    assert "# TYPE trends_ready gauge\ntrends_ready 1.0\n" in text
+    assert 'trends_dependency_up{dependency="database"} 1.0' in text
+    assert "trends_work_queue_depth 0.0" in text
+    assert "trends_ingestion_lag_seconds" not in text
+    assert "process_resident_memory_bytes" not in text
+
+
+@pytest.mark.asyncio
+async def test_format_metrics_renders_memory_gauges():
+    """RSS and per-generation GC figures are exported when sampled."""
+    sample = MemorySample(
+        taken_at=datetime.now(timezone.utc),
+        rss_bytes=1024,
+        gc_counts=(5, 1, 0),
+        gc_collections=(40, 3, 1),
+    )
+
+    text = format_metrics(await ReadinessMonitor().report(), sample)
+
+    assert "process_resident_memory_bytes 1024.0" in text
+    assert 'trends_gc_objects{generation="0"} 5.0' in text
+    assert 'trends_gc_collections{generation="2"} 1.0' in text
+    assert "trends_traced_memory_bytes" not in text
@@ -0,0 +1,57 @@
+"""Unit tests for per-cycle memory instrumentation."""
+
+import tracemalloc
+
+import pytest
+
+from backend.app.core.memory import MemoryProfiler, read_rss_bytes, take_sample
+
+_retained: list[bytes] = []
+
+
+def test_sample_reports_rss_and_gc_generations():
+    """Samples carry RSS and one GC counter per generation."""
+    sample = take_sample()
+
+    assert sample.rss_bytes > 0
+    assert read_rss_bytes() > 0
+    assert len(sample.gc_counts) == len(sample.gc_collections) == 3
+
+
+@pytest.mark.asyncio
+async def test_untraced_cycles_record_samples_only():
+    """Without tracing, reports have samples but no allocation sites."""
+    profiler = MemoryProfiler(tracing=False, history=2)
+
+    for _ in range(3):
+        async with profiler.track("cycle"):
+            pass
+
+    reports = profiler.reports()
+    assert len(reports) == 2
+    assert reports[0].top_growth == []
+    assert reports[0].start.traced_bytes is None
+    assert reports[0].start.taken_at <= reports[0].end.taken_at
+
+
+@pytest.mark.asyncio
+async def test_traced_cycle_finds_the_growing_allocation_site():
+    """Memory retained during a cycle shows up as the top growth site."""
+    was_tracing = tracemalloc.is_tracing()
+    profiler = MemoryProfiler(tracing=True, top_n=5)
+    try:
+        async with profiler.track("leaky cycle"):
+            _retained.extend(bytes(1024) for _ in range(2000))
+        report = profiler.reports()[-1]
+        current = profiler.current_allocations(limit=3)
+    finally:
+        _retained.clear()
+        profiler.close()
+
+    assert tracemalloc.is_tracing() == was_tracing
+    assert report.label == "leaky cycle"
+    assert __file__ in report.top_growth[0].location
+    assert report.top_growth[0].size_diff_bytes >= 2000 * 1024
+    assert report.top_growth[0].count_diff >= 2000
+    assert report.end.traced_bytes is not None
+    assert len(current) == 3
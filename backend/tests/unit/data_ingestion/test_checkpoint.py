@@ -0,0 +1,122 @@
+"""Unit tests for fetch cycle checkpoints."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.app.data_ingestion.checkpoint import (
+    CycleCheckpointStore,
+    CycleInProgressError,
+)
+from backend.app.db.database import connect
+
+NOW = datetime(2025, 5, 20, 12, 0, tzinfo=timezone.utc)
+# Past the default heartbeat timeout, within the staleness window.
+EXPIRED = NOW + timedelta(minutes=10)
+URLS = ["http://a.com", "http://b.com", "http://c.com"]
+
+
+@pytest.fixture(name="store")
+def fixture_store() -> CycleCheckpointStore:
+    """An in-memory checkpoint store."""
+    return CycleCheckpointStore(connect(":memory:"))
+
+
+def test_new_cycle_has_all_urls_pending(store: CycleCheckpointStore):
+    """A fresh cycle starts with every source outstanding."""
+    cycle = store.start_or_resume(URLS, 3600, NOW)
+
+    assert not cycle.resumed
+    assert cycle.pending_urls == URLS
+    assert cycle.total == 3
+
+
+def test_interrupted_cycle_resumes_outstanding_sources(store: CycleCheckpointStore):
+    """An unfinished cycle within the window resumes its pending sources."""
+    first = store.start_or_resume(URLS, 3600, NOW)
+    store.mark_done(first.id, "http://a.com", NOW)
+
+    resumed = store.start_or_resume(["http://ignored.com"], 3600, EXPIRED)
+
+    assert resumed.resumed
+    assert resumed.id == first.id
+    assert resumed.pending_urls == ["http://b.com", "http://c.com"]
+    assert resumed.total == 3
+
+
+def test_stale_cycle_is_abandoned(store: CycleCheckpointStore):
+    """A cycle older than the staleness window is replaced by a new one."""
+    first = store.start_or_resume(URLS, 3600, NOW)
+    store.mark_done(first.id, "http://a.com", NOW)
+
+    later = NOW + timedelta(hours=2)
+    fresh = store.start_or_resume(URLS, 3600, later)
+
+    assert not fresh.resumed
+    assert fresh.id != first.id
+    assert fresh.pending_urls == URLS
+    status = store._conn.execute(  # pylint: disable=protected-access
+        "SELECT status FROM fetch_cycles WHERE id = ?", (first.id,)
+    ).fetchone()["status"]
+    assert status == "abandoned"
+
+
+def test_completed_cycle_is_not_resumed(store: CycleCheckpointStore):
+    """Completing a cycle means the next run starts over."""
+    first = store.start_or_resume(URLS, 3600, NOW)
+    store.complete(first.id, NOW)
+
+    assert not store.start_or_resume(URLS, 3600, NOW).resumed
+
+
+def test_zero_staleness_disables_resume(store: CycleCheckpointStore):
+    """A staleness window of zero always starts a new cycle."""
+    store.start_or_resume(URLS, 3600, NOW)
+
+    assert not store.start_or_resume(URLS, 0, EXPIRED).resumed
+
+
+def test_live_cycle_is_neither_resumed_nor_abandoned(tmp_path):
+    """While a cycle's heartbeat is live, other processes leave it alone."""
+    path = str(tmp_path / "checkpoints.db")
+    runner, other = (
+        CycleCheckpointStore(connect(path)),
+        CycleCheckpointStore(connect(path)),
+    )
+    first = runner.start_or_resume(URLS, 3600, NOW)
+
+    with pytest.raises(CycleInProgressError):
+        other.start_or_resume(URLS, 3600, NOW + timedelta(minutes=1))
+    # Heartbeats keep a cycle that outlives the staleness window alive.
+    runner.mark_done(first.id, "http://a.com", NOW + timedelta(hours=2))
+    with pytest.raises(CycleInProgressError):
+        other.start_or_resume(URLS, 3600, NOW + timedelta(hours=2, minutes=1))
+
+    fresh = other.start_or_resume(URLS, 3600, NOW + timedelta(hours=3))
+    assert not fresh.resumed
+    assert fresh.id != first.id
+    runner.close()
+    other.close()
+
+
+def test_heartbeat_renews_only_running_cycles(store: CycleCheckpointStore):
+    """A heartbeat without progress keeps a cycle owned; finished ones refuse."""
+    cycle = store.start_or_resume(URLS, 3600, NOW)
+
+    assert store.heartbeat(cycle.id, NOW + timedelta(minutes=4))
+    with pytest.raises(CycleInProgressError):
+        store.start_or_resume(URLS, 3600, NOW + timedelta(minutes=8))
+
+    store.complete(cycle.id, NOW + timedelta(minutes=9))
+    assert not store.heartbeat(cycle.id, NOW + timedelta(minutes=10))
+
+
+def test_mark_done_uses_the_url_index(store: CycleCheckpointStore):
+    """Marking a source done does not scan the cycle's items."""
+    plan = store._conn.execute(  # pylint: disable=protected-access
+        "EXPLAIN QUERY PLAN UPDATE fetch_cycle_items SET done = 1 "
+        "WHERE cycle_id = ? AND url = ?",
+        (1, "http://a.com"),
+    ).fetchall()
+
+    assert "ix_fetch_cycle_items_url" in " ".join(row["detail"] for row in plan)
@@ -0,0 +1,62 @@
+"""Unit tests for content-defined chunking."""
+
+import random
+
+import pytest
+
+from backend.app.data_ingestion.chunking import (
+    GEAR,
+    _rolling_hashes,
+    chunk_boundaries,
+    split_chunks,
+)
+
+
+def random_bytes(size: int, seed: int = 7) -> bytes:
+    """Deterministic pseudo-random bytes."""
+    return random.Random(seed).randbytes(size)
+
+
+def test_rolling_hashes_match_the_sequential_gear_hash():
+    """The vectorized hash equals h = (h << 1) + GEAR[byte] per position."""
+    data = random_bytes(300)
+    expected, value = [], 0
+    for byte in data:
+        value = ((value << 1) + int(GEAR[byte])) % 2**64
+        expected.append(value)
+
+    assert _rolling_hashes(data).tolist() == expected
+    assert _rolling_hashes(data[:3]).tolist() == expected[:3]
+
+
+def test_chunks_cover_data_within_size_bounds():
+    """Chunks rebuild the input and respect the minimum and maximum sizes."""
+    data = random_bytes(100_000)
+
+    chunks = split_chunks(data, min_size=128, avg_size=512, max_size=2048)
+
+    assert b"".join(chunks) == data
+    assert all(128 <= len(chunk) <= 2048 for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1]) <= 2048
+    assert split_chunks(b"") == []
+    assert split_chunks(b"tiny") == [b"tiny"]
+
+
+def test_boundaries_realign_after_an_edit():
+    """An insertion only changes the chunks around it."""
+    data = random_bytes(50_000)
+    edited = data[:20_000] + b"breaking news" + data[20_000:]
+
+    before = split_chunks(data)
+    after = split_chunks(edited)
+
+    assert len(set(before) - set(after)) <= 2
+    assert len(set(after) - set(before)) <= 2
+
+
+def test_invalid_sizes_rejected():
+    """Sizes must be ordered and the average a power of two."""
+    with pytest.raises(ValueError):
+        chunk_boundaries(b"data", min_size=512, avg_size=256, max_size=1024)
+    with pytest.raises(ValueError):
+        chunk_boundaries(b"data", min_size=100, avg_size=300, max_size=1024)
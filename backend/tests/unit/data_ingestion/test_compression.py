@@ -0,0 +1,60 @@
+"""Unit tests for zstd dictionary compression helpers."""
+
+import pytest
+
+from backend.app.data_ingestion.compression import (
+    DictionaryTrainingError,
+    ZstdCodec,
+    train_dictionary,
+)
+
+BOILERPLATE_HEADER = (
+    "Title: Latest News\n\nURL Source: https://news.example.com/\n\n"
+    "Markdown Content:\n[Skip to main content](#main) | [Home](/) | [Business](/b) "
+    "| [Culture](/c) | [Gear](/g) | [Science](/s) | [Security](/sec)\n\n"
+)
+BOILERPLATE_FOOTER = (
+    "\n\n---\nSubscribe to our newsletter for the latest marketing insights. "
+    "© 2025 Example Media. All rights reserved. [Privacy Policy](/privacy) | "
+    "[Terms of Use](/terms) | [Cookie Settings](/cookies)\n"
+)
+
+
+def make_article(index: int) -> bytes:
+    """Builds a synthetic Jina-style article sharing header/footer boilerplate."""
+    body = " ".join(f"story{index}-word{i}" for i in range(40))
+    return (BOILERPLATE_HEADER + body + BOILERPLATE_FOOTER).encode("utf-8")
+
+
+def test_codec_round_trip_without_dictionary():
+    """A codec without dictionary round-trips data unchanged."""
+    codec = ZstdCodec()
+    data = make_article(1)
+    assert not codec.has_dictionary
+    assert codec.decompress(codec.compress(data)) == data
+
+
+def test_trained_dictionary_round_trips_and_compresses_better():
+    """A trained dictionary round-trips and beats per-document compression."""
+    samples = [make_article(i) for i in range(60)]
+    dictionary = train_dictionary(samples, 4096)
+    codec = ZstdCodec(dictionary)
+    plain = ZstdCodec()
+
+    data = make_article(999)
+    compressed = codec.compress(data)
+    assert codec.has_dictionary
+    assert codec.decompress(compressed) == data
+    assert len(compressed) < len(plain.compress(data))
+
+
+def test_train_dictionary_rejects_empty_samples():
+    """Training with no samples raises DictionaryTrainingError."""
+    with pytest.raises(DictionaryTrainingError):
+        train_dictionary([], 4096)
+
+
+def test_train_dictionary_wraps_zstd_errors():
+    """zstd failures on unusable samples surface as DictionaryTrainingError."""
+    with pytest.raises(DictionaryTrainingError):
+        train_dictionary([b"x"], 4096)
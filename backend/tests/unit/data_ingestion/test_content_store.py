@@ -0,0 +1,297 @@
+"""Unit tests for the raw article content store."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.data_ingestion.compression import ZstdCodec
+from backend.app.data_ingestion.content_store import (
+    ArticleStore,
+    get_article_store,
+    match_query,
+    source_key,
+)
+from backend.app.db.database import connect
+
+
+def make_article(index: int) -> bytes:
+    """Builds a synthetic article sharing boilerplate with its siblings."""
+    nav = " | ".join(f"[Section {i}](/s{i})" for i in range(20))
+    body = " ".join(f"story{index}-word{i}" for i in range(40))
+    return f"Title: Latest\n\n{nav}\n\n{body}\n\n---\nAll rights reserved.\n".encode()
+
+
+@pytest.fixture(name="store")
+def fixture_store() -> ArticleStore:
+    """An in-memory store that trains small dictionaries quickly."""
+    return ArticleStore(
+        connect(":memory:"),
+        dict_size=4096,
+        sample_count=50,
+        min_samples=20,
+        retrain_every=30,
+    )
+
+
+def test_source_key_uses_lowercased_host():
+    """Articles are grouped by the host of their URL."""
+    assert source_key("https://WWW.Wired.com/most-recent/") == "www.wired.com"
+    assert source_key("not a url") == "unknown"
+
+
+def test_save_and_get_article_round_trip(store: ArticleStore):
+    """Saved content is returned unchanged with its metadata."""
+    fetched_at = datetime(2025, 5, 1, 12, 0, tzinfo=timezone.utc)
+    article_id = store.save_article("https://a.example.com/x", "héllo", fetched_at)
+
+    article = store.get_article(article_id)
+    assert article is not None
+    assert article.content == "héllo"
+    assert article.source == "a.example.com"
+    assert article.fetched_at == fetched_at
+    assert store.get_article(article_id + 1) is None
+
+
+def test_get_latest_article_returns_newest_fetch(store: ArticleStore):
+    """Repeated fetches of a URL are all kept; the newest is returned."""
+    store.save_article("https://a.example.com/x", "first")
+    store.save_article("https://a.example.com/x", "second")
+
+    latest = store.get_latest_article("https://a.example.com/x")
+    assert latest is not None and latest.content == "second"
+    assert [a.content for a in store.get_recent_articles(limit=5)] == [
+        "second",
+        "first",
+    ]
+
+
+def test_dictionary_trained_after_min_samples(store: ArticleStore):
+    """A dictionary is trained once min_samples articles exist for a source."""
+    url = "https://news.example.com/latest"
+    ids = [store.save_article(url, make_article(i).decode()) for i in range(20)]
+
+    row = store._conn.execute(  # pylint: disable=protected-access
+        "SELECT id, trained_through_id FROM compression_dictionaries"
+    ).fetchone()
+    assert row is not None
+    assert row["trained_through_id"] == ids[-1]
+
+    new_id = store.save_article(url, make_article(100).decode())
+    stored = store._conn.execute(  # pylint: disable=protected-access
+        "SELECT dictionary_id FROM raw_articles WHERE id = ?", (new_id,)
+    ).fetchone()
+    assert stored["dictionary_id"] == row["id"]
+    # Older articles written without the dictionary still read back.
+    assert store.get_article(ids[0]).content == make_article(0).decode()
+    assert store.get_article(new_id).content == make_article(100).decode()
+
+
+def test_dictionary_is_versioned_on_retrain(store: ArticleStore):
+    """Retraining adds a new dictionary version; old articles stay readable."""
+    url = "https://news.example.com/latest"
+    ids = [store.save_article(url, make_article(i).decode()) for i in range(51)]
+
+    versions = store._conn.execute(  # pylint: disable=protected-access
+        "SELECT id FROM compression_dictionaries ORDER BY id"
+    ).fetchall()
+    assert len(versions) == 2
+    for i, article_id in enumerate(ids):
+        assert store.get_article(article_id).content == make_article(i).decode()
+
+
+def test_dictionaries_are_per_source(store: ArticleStore):
+    """Training for one source does not affect another source."""
+    for i in range(20):
+        store.save_article("https://one.example.com/", make_article(i).decode())
+    store.save_article("https://two.example.com/", "other source")
+
+    assert store.train_dictionary("two.example.com") is None
+    sources = store._conn.execute(  # pylint: disable=protected-access
+        "SELECT DISTINCT source FROM compression_dictionaries"
+    ).fetchall()
+    assert [row["source"] for row in sources] == ["one.example.com"]
+
+
+def test_storage_stats_reports_compression_ratio(store: ArticleStore):
+    """storage_stats() reports raw and stored sizes."""
+    assert store.storage_stats().compression_ratio == 1.0
+    for i in range(30):
+        store.save_article("https://news.example.com/", make_article(i).decode())
+
+    stats = store.storage_stats()
+    assert stats.article_count == 30
+    assert stats.raw_bytes == sum(len(make_article(i)) for i in range(30))
+    assert stats.compression_ratio > 1.0
+
+
+def listing_page(version: int) -> str:
+    """A listing page whose successive versions add one headline at the top."""
+    headlines = [
+        f"Headline {i}: " + " ".join(f"word{i * 31 + j * 7}" for j in range(12))
+        for i in range(version)
+    ]
+    return "\n".join(reversed(headlines))
+
+
+def test_repeated_fetches_store_shared_chunks_once(store: ArticleStore):
+    """Versions of a slowly changing page only add their new chunks."""
+    url = "https://news.example.com/latest"
+    ids = [store.save_article(url, listing_page(v)) for v in range(100, 110)]
+
+    stats = store.storage_stats()
+    # The first version is stored whole, the others as chunks.
+    assert stats.chunked_article_bytes == stats.raw_bytes - len(listing_page(100))
+    # Nine versions cost about two pages: the second one plus each new top chunk.
+    assert stats.chunk_bytes < 3 * len(listing_page(109).encode())
+    assert stats.dedup_ratio > 3
+    for version, article_id in zip(range(100, 110), ids):
+        assert store.get_article(article_id).content == listing_page(version)
+
+
+def test_first_fetch_of_a_url_is_stored_whole(store: ArticleStore):
+    """One-off articles skip chunking, which would only cost compression."""
+    article_id = store.save_article("https://a.example.com/1", listing_page(100))
+
+    stats = store.storage_stats()
+    assert stats.chunk_count == 0
+    assert stats.stored_bytes == len(ZstdCodec().compress(listing_page(100).encode()))
+    assert store.get_article(article_id).content == listing_page(100)
+    assert [hit.id for hit in store.search("headline word7")] == [article_id]
+
+
+def test_articles_stored_before_chunking_stay_readable():
+    """Opening an old database adds the chunk column and keeps old bodies."""
+    connection = connect(":memory:")
+    connection.executescript(
+        """
+        CREATE TABLE raw_articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_url TEXT NOT NULL,
+            source TEXT NOT NULL,
+            content BLOB NOT NULL,
+            content_size INTEGER NOT NULL,
+            dictionary_id INTEGER,
+            fetched_at TEXT NOT NULL
+        );
+        CREATE VIEW raw_article_text AS
+            SELECT id, article_text(content, dictionary_id) AS content
+            FROM raw_articles;
+        """
+    )
+    connection.execute(
+        "INSERT INTO raw_articles (source_url, source, content, content_size, "
+        "fetched_at) VALUES (?, ?, ?, ?, ?)",
+        (
+            "https://a.example.com/1",
+            "a.example.com",
+            ZstdCodec().compress(b"Legacy retail story"),
+            19,
+            "2025-01-01T00:00:00+00:00",
+        ),
+    )
+    connection.commit()
+
+    store = ArticleStore(connection)
+    new_id = store.save_article("https://a.example.com/2", "Chunked retail story")
+
+    assert store.get_article(1).content == "Legacy retail story"
+    assert store.get_article(new_id).content == "Chunked retail story"
+    assert store.rebuild_search_index() == 2
+    assert sorted(hit.id for hit in store.search("retail")) == [1, new_id]
+
+
+def test_get_article_store_uses_configured_database():
+    """The shared store is created once against settings.DATABASE_PATH."""
+    store = get_article_store()
+    assert store is get_article_store()
+    store.save_article("https://a.example.com/", "content")
+    assert (
+        connect(settings.DATABASE_PATH)
+        .execute("SELECT COUNT(*) FROM raw_articles")
+        .fetchone()[0]
+        == 1
+    )
+
+
+def test_list_articles_pages_newest_first(store: ArticleStore):
+    """Pages follow (fetched_at, id) descending, ties included, without gaps."""
+    same_time = datetime(2025, 5, 1, tzinfo=timezone.utc)
+    for i in range(5):
+        store.save_article(f"https://a.example.com/{i}", f"article {i}", same_time)
+    store.save_article("https://b.example.com/new", "newest")
+
+    first = store.list_articles(limit=4)
+    second = store.list_articles(limit=4, cursor=first.next_cursor)
+
+    assert [a.source_url for a in first.items[:2]] == [
+        "https://b.example.com/new",
+        "https://a.example.com/4",
+    ]
+    assert [a.id for a in first.items + second.items] == [6, 5, 4, 3, 2, 1]
+    assert first.items[0].content_size == len("newest")
+    assert second.next_cursor is None
+
+
+def test_match_query_quotes_every_word():
+    """User input never reaches FTS5 as operators or syntax."""
+    assert match_query('email "AND (automation*') == '"email" "AND" "automation"'
+    assert match_query("  -- ") is None
+
+
+def test_search_ranks_and_highlights_matches(store: ArticleStore):
+    """Articles with all the words are returned, best match first."""
+    store.save_article("https://a.example.com/1", "Email tips. " + "Filler. " * 50)
+    store.save_article("https://a.example.com/2", "Email automation for retail.")
+    store.save_article(
+        "https://a.example.com/3", "Automated emails for retail brands in many regions."
+    )
+    store.save_article("https://a.example.com/4", "Football results.")
+
+    hits = store.search("emails automation")
+
+    assert [hit.id for hit in hits] == [2, 3]
+    assert hits[0].snippet == "<mark>Email</mark> <mark>automation</mark> for retail."
+    assert hits[0].score > hits[1].score > 0
+    assert store.search("?!") == []
+    assert store.search('"unbalanced (') == []
+
+
+def test_search_escapes_snippet_text(store: ArticleStore):
+    """Scraped markup is escaped; only the highlights are tags."""
+    store.save_article(
+        "https://a.example.com/1", "<script>alert(1)</script> Email & retail"
+    )
+
+    hits = store.search("email")
+
+    assert hits[0].snippet == (
+        "&lt;script&gt;alert(1)&lt;/script&gt; <mark>Email</mark> &amp; retail"
+    )
+
+
+def test_search_reads_dictionary_compressed_articles(store: ArticleStore):
+    """Snippets come from bodies written with any dictionary version."""
+    for i in range(25):
+        store.save_article(f"https://a.example.com/{i}", make_article(i).decode())
+
+    hits = store.search("story24 word3")
+
+    assert [hit.id for hit in hits] == [25]
+    assert "<mark>story24</mark>" in hits[0].snippet
+
+
+def test_rebuild_indexes_existing_articles(caplog):
+    """A new index over an existing database is filled by a rebuild."""
+    connection = connect(":memory:")
+    ArticleStore(connection).save_article("https://a.example.com/1", "Retail news")
+    connection.execute("DROP TABLE article_search")
+
+    with caplog.at_level("WARNING"):
+        store = ArticleStore(connection)
+
+    assert "make search-index" in caplog.text
+    assert store.search("retail") == []
+    assert store.rebuild_search_index() == 1
+    assert [hit.id for hit in store.search("retail")] == [1]
+    assert store.search_index_bytes() > 0
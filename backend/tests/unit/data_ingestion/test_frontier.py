@@ -0,0 +1,144 @@
+"""Unit tests for the domain-sharded fetch frontier."""
+
+import asyncio
+import time
+from collections import defaultdict
+
+import pytest
+
+from backend.app.data_ingestion.frontier import FetchFrontier
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_hosts_are_served_round_robin():
+    """A host with many URLs does not starve a host with few."""
+    frontier = FetchFrontier(per_host_concurrency=1, per_host_min_interval=0)
+    frontier.add_many([f"http://a.example.com/{i}" for i in range(3)])
+    frontier.add_many(["http://b.example.com/0", "http://c.example.com/0"])
+    order: list[str] = []
+
+    async def fetch(url: str) -> None:
+        order.append(url)
+
+    await frontier.run(fetch, workers=1)
+
+    assert order == [
+        "http://a.example.com/0",
+        "http://b.example.com/0",
+        "http://c.example.com/0",
+        "http://a.example.com/1",
+        "http://a.example.com/2",
+    ]
+    assert len(frontier) == 0
+    assert frontier.host_count == 3
+
+
+async def test_per_host_concurrency_is_capped():
+    """No host ever has more than per_host_concurrency fetches in flight."""
+    frontier = FetchFrontier(per_host_concurrency=2, per_host_min_interval=0)
+    for host in ("a", "b"):
+        frontier.add_many([f"http://{host}.example.com/{i}" for i in range(6)])
+    active: dict[str, int] = defaultdict(int)
+    peak: dict[str, int] = defaultdict(int)
+
+    async def fetch(url: str) -> None:
+        host = url.split("/")[2]
+        active[host] += 1
+        peak[host] = max(peak[host], active[host])
+        await asyncio.sleep(0.005)
+        active[host] -= 1
+
+    await frontier.run(fetch, workers=10)
+
+    assert peak == {"a.example.com": 2, "b.example.com": 2}
+
+
+async def test_per_host_min_interval_is_respected():
+    """Request starts on one host are spaced by the minimum interval."""
+    frontier = FetchFrontier(per_host_concurrency=5, per_host_min_interval=0.03)
+    frontier.add_many([f"http://a.example.com/{i}" for i in range(3)])
+    starts: list[float] = []
+
+    async def fetch(_url: str) -> None:
+        starts.append(time.monotonic())
+
+    await frontier.run(fetch, workers=3)
+
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert len(starts) == 3
+    assert all(gap >= 0.025 for gap in gaps)
+
+
+async def test_slow_host_does_not_block_others():
+    """Other hosts keep flowing while one host's fetch is slow."""
+    frontier = FetchFrontier(per_host_concurrency=1, per_host_min_interval=0)
+    frontier.add_many(["http://slow.example.com/0", "http://slow.example.com/1"])
+    frontier.add_many([f"http://fast.example.com/{i}" for i in range(5)])
+    finished: list[str] = []
+
+    async def fetch(url: str) -> None:
+        if "slow" in url:
+            await asyncio.sleep(0.05)
+        finished.append(url)
+
+    await frontier.run(fetch, workers=2)
+
+    assert finished.index("http://fast.example.com/4") < finished.index(
+        "http://slow.example.com/0"
+    )
+
+
+async def test_fetch_errors_do_not_stop_the_frontier():
+    """An exception from one fetch is logged and the rest still run."""
+    frontier = FetchFrontier(per_host_min_interval=0)
+    frontier.add_many(["http://a.example.com/bad", "http://a.example.com/good"])
+    done: list[str] = []
+
+    async def fetch(url: str) -> None:
+        if url.endswith("bad"):
+            raise RuntimeError("boom")
+        done.append(url)
+
+    await frontier.run(fetch, workers=1)
+
+    assert done == ["http://a.example.com/good"]
+
+
+async def test_urls_added_while_running_are_fetched():
+    """URLs discovered during the run are dispatched before it completes."""
+    frontier = FetchFrontier(per_host_min_interval=0)
+    frontier.add("http://a.example.com/index")
+    done: list[str] = []
+
+    async def fetch(url: str) -> None:
+        done.append(url)
+        if url.endswith("index"):
+            frontier.add_many([f"http://b.example.com/{i}" for i in range(3)])
+
+    await frontier.run(fetch, workers=4)
+
+    assert len(done) == 4
+
+
+async def test_scales_to_tens_of_thousands_of_urls():
+    """Dispatching 20k URLs across 500 hosts completes quickly."""
+    frontier = FetchFrontier(per_host_concurrency=2, per_host_min_interval=0)
+    frontier.add_many(f"http://host{i % 500}.example.com/{i}" for i in range(20_000))
+    count = 0
+
+    async def fetch(_url: str) -> None:
+        nonlocal count
+        count += 1
+
+    start = time.perf_counter()
+    await frontier.run(fetch, workers=32)
+
+    assert count == 20_000
+    assert time.perf_counter() - start < 10
+
+
+async def test_invalid_concurrency_rejected():
+    """per_host_concurrency below 1 is rejected."""
+    with pytest.raises(ValueError):
+        FetchFrontier(per_host_concurrency=0)
@@ -1,5 +1,7 @@
 "Unit tests for Jina AI service integration."
 
+import asyncio
+import threading
 import urllib.parse
 from unittest.mock import AsyncMock, MagicMock
 
@@ -10,11 +12,17 @@ from pytest_mock import MockerFixture
 
 # Corrected import path based on project structure
 from backend.app.data_ingestion.jina_ai_service import (
+    DEFAULT_RETRY_AFTER,
     DEFAULT_TIMEOUT,
     JINA_READER_BASE_URL,
     USER_AGENT,
+    HedgedFetcher,
+    LatencyTracker,
     fetch_article_content,
+    jina_rate_limit,
+    retry_after_seconds,
 )
+from backend.app.data_ingestion.rate_limiter import Quota, TokenBucket
 
 
 @pytest.mark.asyncio
@@ -192,3 +200,151 @@ async def test_fetch_article_content_unexpected_error(
     assert (
         "Something totally unexpected happened (ValueError)" in caplog.text
     )  # Updated specific error message
+
+
+def test_latency_tracker_percentile():
+    """LatencyTracker reports None until warmed up, then the percentile."""
+    tracker = LatencyTracker(window=100, min_samples=10)
+    for i in range(9):
+        tracker.record(float(i))
+    assert tracker.percentile(0.95) is None
+
+    for i in range(9, 100):
+        tracker.record(float(i))
+    assert tracker.percentile(0.95) == 94.0
+    assert tracker.percentile(0.5) == 49.0
+
+
+def make_delayed_client(delays: list[float]) -> AsyncMock:
+    """Builds a client whose successive GETs answer after the given delays."""
+    calls = iter(delays)
+
+    async def delayed_get(*_args, **_kwargs):
+        delay = next(calls)
+        await asyncio.sleep(delay)
+        response = MagicMock(spec=httpx.Response)
+        response.text = f"answered after {delay}"
+        response.raise_for_status = MagicMock()
+        return response
+
+    client = AsyncMock(spec=httpx.AsyncClient)
+    client.get = AsyncMock(side_effect=delayed_get)
+    return client
+
+
+def warmed_tracker(latency: float) -> LatencyTracker:
+    """A tracker whose percentile is `latency`."""
+    tracker = LatencyTracker(min_samples=1)
+    tracker.record(latency)
+    return tracker
+
+
+@pytest.mark.asyncio
+async def test_hedged_fetcher_no_hedge_before_warmup():
+    """Without latency history, requests are never hedged."""
+    fetcher = HedgedFetcher(tracker=LatencyTracker(min_samples=5))
+    client = make_delayed_client([0.01])
+
+    content = await fetcher.fetch("http://example.com/a", client)
+
+    assert content == "answered after 0.01"
+    assert fetcher.hedges == 0
+    assert client.get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_fetcher_hedge_wins_and_primary_cancelled():
+    """A slow primary is hedged; the faster hedge answer is returned."""
+    fetcher = HedgedFetcher(max_hedge_ratio=1.0, tracker=warmed_tracker(0.01))
+    client = make_delayed_client([5.0, 0.01])
+
+    content = await asyncio.wait_for(fetcher.fetch("http://example.com/a", client), 2)
+
+    assert content == "answered after 0.01"
+    assert fetcher.hedges == 1
+    assert client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_hedged_fetcher_respects_hedge_ratio():
+    """Hedges beyond max_hedge_ratio of traffic are not sent."""
+    fetcher = HedgedFetcher(max_hedge_ratio=0.5, tracker=warmed_tracker(0.01))
+    client = make_delayed_client([0.05, 0.05])
+
+    content = await fetcher.fetch("http://example.com/a", client)
+
+    assert content == "answered after 0.05"
+    assert fetcher.hedges == 0
+    assert client.get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_fetcher_hedge_needs_rate_limit_token():
+    """A hedge is skipped when the rate limiter has no spare token."""
+    limiter = TokenBucket(rate=0.001)
+    fetcher = HedgedFetcher(
+        max_hedge_ratio=1.0, tracker=warmed_tracker(0.01), rate_limiter=limiter
+    )
+    client = make_delayed_client([0.05, 0.01])
+
+    content = await fetcher.fetch("http://example.com/a", client)
+
+    assert content == "answered after 0.05"
+    assert fetcher.hedges == 0
+    assert client.get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_fetcher_takes_hedge_token_off_the_event_loop():
+    """The hedge token is taken in a worker thread, since it may block."""
+    threads = []
+    limiter = MagicMock()
+    limiter.acquire = AsyncMock()
+    limiter.try_acquire.side_effect = lambda: threads.append(threading.get_ident())
+    fetcher = HedgedFetcher(
+        max_hedge_ratio=1.0, tracker=warmed_tracker(0.01), rate_limiter=limiter
+    )
+    client = make_delayed_client([0.05, 0.01])
+
+    await fetcher.fetch("http://example.com/a", client)
+
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_fetch_article_content_takes_shared_rate_limit_token():
+    """Each fetch takes a token from the shared Jina bucket."""
+    client = make_delayed_client([0.0])
+    await fetch_article_content("http://example.com/a", client)
+
+    assert not jina_rate_limit().try_acquire()
+
+
+@pytest.mark.asyncio
+async def test_fetch_article_content_429_pauses_shared_budget():
+    """A 429 empties the shared bucket until Retry-After has passed."""
+    request = httpx.Request("GET", "https://r.jina.ai/x")
+    response = httpx.Response(429, headers={"Retry-After": "120"}, request=request)
+    client = AsyncMock(spec=httpx.AsyncClient)
+    client.get = AsyncMock(return_value=response)
+
+    assert await fetch_article_content("http://example.com/a", client) is None
+
+    # Even at a rate that would refill at once, the pause holds the bucket.
+    jina_rate_limit().limiter.quotas["jina"] = Quota(rate=1000.0)
+    assert not jina_rate_limit().try_acquire()
+
+
+def test_retry_after_seconds_parses_seconds_and_dates():
+    """Retry-After may be seconds or an HTTP date; a default covers neither."""
+    request = httpx.Request("GET", "https://r.jina.ai/x")
+
+    def response(value: str | None) -> httpx.Response:
+        headers = {"Retry-After": value} if value else {}
+        return httpx.Response(429, headers=headers, request=request)
+
+    assert retry_after_seconds(response("7")) == 7.0
+    assert retry_after_seconds(response("Wed, 21 Oct 2015 07:28:00 GMT")) == 0.0
+    assert retry_after_seconds(response("soon")) == DEFAULT_RETRY_AFTER
+    assert retry_after_seconds(response(None)) == DEFAULT_RETRY_AFTER
@@ -0,0 +1,141 @@
+"""Unit tests for the Jina record/replay archive."""
+
+import gzip
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.data_ingestion.jina_ai_service import (
+    create_jina_client,
+    fetch_article_content,
+    jina_rate_limit,
+)
+from backend.app.data_ingestion.jina_archive import (
+    ArchiveWriter,
+    Exchange,
+    RecordingTransport,
+    ReplayMissError,
+    ReplayTransport,
+    read_archive,
+)
+
+
+def exchange(url: str, body: bytes, started_at: float, elapsed: float = 0.0):
+    """A recorded 200 response."""
+    return Exchange(
+        method="GET",
+        url=url,
+        request_headers=[],
+        status_code=200,
+        headers=[("content-type", "text/plain")],
+        body=body,
+        started_at=started_at,
+        elapsed=elapsed,
+    )
+
+
+def upstream(request: httpx.Request) -> httpx.Response:
+    """A gzip-encoding upstream that echoes the request path."""
+    return httpx.Response(
+        200,
+        headers={"Content-Encoding": "gzip", "X-Upstream": "yes"},
+        content=gzip.compress(f"body of {request.url.path}".encode()),
+    )
+
+
+@pytest.mark.asyncio
+async def test_recording_archives_decoded_exchanges(tmp_path: Path):
+    """Responses pass through unchanged and are archived decoded, redacted."""
+    writer = ArchiveWriter(tmp_path)
+    transport = RecordingTransport(writer, httpx.MockTransport(upstream))
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.get(
+            "https://r.jina.ai/a", headers={"Authorization": "Bearer secret"}
+        )
+    writer.close()
+
+    assert response.text == "body of /a"
+    (recorded,) = read_archive(tmp_path)
+    assert recorded.url == "https://r.jina.ai/a"
+    assert recorded.body == b"body of /a"
+    assert ("x-upstream", "yes") in recorded.headers
+    assert all(name != "content-encoding" for name, _ in recorded.headers)
+    assert ("authorization", "<redacted>") in recorded.request_headers
+    assert recorded.elapsed >= 0
+    assert recorded.started_at <= time.time()
+
+
+def test_segments_are_append_only_and_survive_crashes(tmp_path: Path):
+    """Each writer adds a segment; an unterminated segment stays readable."""
+    first = ArchiveWriter(tmp_path)
+    first.append(exchange("https://r.jina.ai/1", b"\xff not utf-8", 1.0))
+    first.close()
+    crashed = ArchiveWriter(tmp_path)
+    crashed.append(exchange("https://r.jina.ai/2", "héllo".encode(), 2.0))
+
+    records = list(read_archive(tmp_path))
+
+    assert len(list(tmp_path.iterdir())) == 2
+    assert [r.body for r in records] == [b"\xff not utf-8", "héllo".encode()]
+    crashed.close()
+    with pytest.raises(FileNotFoundError):
+        list(read_archive(tmp_path / "missing"))
+
+
+@pytest.mark.asyncio
+async def test_replay_serves_recordings_in_order_then_misses():
+    """Repeated requests get successive recordings; then ReplayMissError."""
+    transport = ReplayTransport(
+        [
+            exchange("https://r.jina.ai/a", b"second", 2.0),
+            exchange("https://r.jina.ai/a", b"first", 1.0),
+        ]
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        assert (await client.get("https://r.jina.ai/a")).text == "first"
+        assert transport.remaining == 1
+        assert (await client.get("https://r.jina.ai/a")).text == "second"
+        with pytest.raises(ReplayMissError):
+            await client.get("https://r.jina.ai/a")
+
+
+@pytest.mark.asyncio
+async def test_replay_at_recorded_timing():
+    """realtime replay delays each response by its recorded latency."""
+    transport = ReplayTransport(
+        [exchange("https://r.jina.ai/a", b"slow", 1.0, elapsed=0.05)], realtime=True
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        start = time.perf_counter()
+        await client.get("https://r.jina.ai/a")
+
+    assert time.perf_counter() - start >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_jina_client_replays_at_full_speed_without_rate_limit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """In replay mode, fetches come from the archive and take no tokens."""
+    writer = ArchiveWriter(tmp_path)
+    for i in range(3):
+        writer.append(
+            exchange("https://r.jina.ai/http%3A%2F%2Fa.com%2Fx", f"v{i}".encode(), i)
+        )
+    writer.close()
+    monkeypatch.setattr(settings, "JINA_ARCHIVE_MODE", "replay")
+    monkeypatch.setattr(settings, "JINA_ARCHIVE_PATH", str(tmp_path))
+
+    async with create_jina_client() as client:
+        contents = [
+            await fetch_article_content("http://a.com/x", client) for _ in "xyz"
+        ]
+    async with create_jina_client() as client:
+        missing = await fetch_article_content("http://a.com/x", client)
+
+    assert contents == ["v0", "v1", "v2"]
+    assert missing is None
+    assert jina_rate_limit().try_acquire()
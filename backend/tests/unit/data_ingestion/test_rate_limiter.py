@@ -0,0 +1,224 @@
+"""Unit tests for the in-process token bucket and the shared rate limiter."""
+
+import multiprocessing
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.data_ingestion.rate_limiter import (
+    BucketStore,
+    LocalBucketStore,
+    Quota,
+    RateLimiter,
+    SharedMemoryBucketStore,
+    SQLiteBucketStore,
+    TokenBucket,
+    configured_quotas,
+    get_rate_limiter,
+)
+from backend.app.db.database import connect
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """A manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_try_acquire_respects_capacity_and_refill():
+    """Tokens are consumed and refill at the configured rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2.0, clock=clock)
+
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    clock.now = 0.5
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    clock.now = 100.0
+    assert bucket.available == 2.0
+
+
+def test_invalid_parameters_rejected():
+    """Non-positive rate or capacity raises ValueError."""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, capacity=0)
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_refill():
+    """acquire() sleeps for the time needed to refill a token."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=0.25, clock=clock)
+    assert bucket.try_acquire()
+
+    async def advance(seconds: float) -> None:
+        clock.now += seconds
+
+    with patch(
+        "backend.app.data_ingestion.rate_limiter.asyncio.sleep",
+        new_callable=AsyncMock,
+        side_effect=advance,
+    ) as mock_sleep:
+        await bucket.acquire()
+
+    mock_sleep.assert_awaited_once_with(4.0)
+
+
+@pytest.mark.asyncio
+async def test_acquire_more_than_capacity_rejected():
+    """Requesting more tokens than capacity can never succeed."""
+    with pytest.raises(ValueError):
+        await TokenBucket(rate=1.0).acquire(2.0)
+
+
+StoreFactory = Callable[[], BucketStore]
+
+
+@pytest.fixture(name="open_store", params=["local", "shm", "database"])
+def fixture_open_store(request, tmp_path: Path) -> Iterator[StoreFactory]:
+    """
+    Opens stores on one backing, as separate processes would (the local
+    store can only be shared within a process, so it is the same instance).
+    """
+    local = LocalBucketStore()
+    opened: list[BucketStore] = []
+
+    def factory() -> BucketStore:
+        store: BucketStore
+        if request.param == "shm":
+            store = SharedMemoryBucketStore(tmp_path / "shm")
+        elif request.param == "database":
+            store = SQLiteBucketStore(connect(str(tmp_path / "limits.db")))
+        else:
+            store = local
+        opened.append(store)
+        return store
+
+    yield factory
+    for store in opened:
+        store.close()
+
+
+def test_limiters_on_one_store_share_the_budget(open_store: StoreFactory):
+    """Two limiters on the same backing draw from one bucket per key."""
+    clock = FakeClock()
+    clock.now = 1000.0
+    quotas = {"jina": Quota(rate=0.5, burst=2.0)}
+    first = RateLimiter(open_store(), quotas, clock=clock)
+    second = RateLimiter(open_store(), quotas, clock=clock)
+
+    assert first.try_acquire("jina")
+    assert second.try_acquire("jina")
+    assert not first.try_acquire("jina")
+    assert not second.try_acquire("jina")
+
+    clock.now += 2.0
+    assert second.try_acquire("jina")
+    assert not first.try_acquire("jina")
+
+
+def test_quotas_are_per_key(open_store: StoreFactory):
+    """Each key has its own rate and burst; unknown keys are not limited."""
+    clock = FakeClock()
+    clock.now = 1000.0
+    limiter = RateLimiter(
+        open_store(),
+        {"small": Quota(rate=1.0, burst=1.0), "large": Quota(rate=1.0, burst=3.0)},
+        clock=clock,
+    )
+
+    assert [limiter.try_acquire("small") for _ in range(2)] == [True, False]
+    assert [limiter.try_acquire("large") for _ in range(4)] == [True] * 3 + [False]
+    assert all(limiter.try_acquire("unlimited") for _ in range(10))
+    with pytest.raises(ValueError):
+        limiter.try_acquire("small", tokens=2.0)
+
+
+def test_pause_holds_refills_for_every_limiter(open_store: StoreFactory):
+    """After a pause, no limiter on the store gets a token until it ends."""
+    clock = FakeClock()
+    clock.now = 1000.0
+    quotas = {"jina": Quota(rate=10.0, burst=5.0)}
+    first = RateLimiter(open_store(), quotas, clock=clock)
+    second = RateLimiter(open_store(), quotas, clock=clock)
+
+    first.pause("jina", 30.0)
+    clock.now += 29.0
+    assert not second.try_acquire("jina")
+
+    clock.now += 1.5
+    assert second.try_acquire("jina")
+
+
+@pytest.mark.asyncio
+async def test_shared_acquire_waits_for_refill(open_store: StoreFactory):
+    """acquire() sleeps until the shared bucket has refilled."""
+    clock = FakeClock()
+    clock.now = 1000.0
+    bucket = RateLimiter(open_store(), {"jina": Quota(rate=0.25)}, clock=clock).bucket(
+        "jina"
+    )
+    await bucket.acquire()
+
+    async def advance(seconds: float) -> None:
+        clock.now += seconds
+
+    with patch(
+        "backend.app.data_ingestion.rate_limiter.asyncio.sleep",
+        new_callable=AsyncMock,
+        side_effect=advance,
+    ) as mock_sleep:
+        await bucket.acquire()
+
+    mock_sleep.assert_awaited_once_with(4.0)
+
+
+def _take_tokens(directory: str, attempts: int, results) -> None:
+    limiter = RateLimiter(
+        SharedMemoryBucketStore(directory), {"jina": Quota(rate=1e-6, burst=5.0)}
+    )
+    results.put(sum(limiter.try_acquire("jina") for _ in range(attempts)))
+    limiter.close()
+
+
+def test_shared_memory_budget_holds_across_processes(tmp_path: Path):
+    """Processes racing on one shared-memory bucket never exceed its burst."""
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    workers = [
+        context.Process(target=_take_tokens, args=(str(tmp_path), 20, results))
+        for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(10)
+
+    assert sum(results.get(timeout=5) for _ in workers) == 5
+
+
+def test_configured_quotas_and_backend(monkeypatch: pytest.MonkeyPatch):
+    """The Jina key follows the fetch delay; RATE_LIMIT_QUOTAS overrides keys."""
+    monkeypatch.setattr(settings, "JINA_FETCH_DELAY_SECONDS", 2.0)
+    monkeypatch.setattr(settings, "JINA_RATE_LIMIT_BURST", 3.0)
+    monkeypatch.setattr(settings, "RATE_LIMIT_QUOTAS", {"other": (5.0, 10.0)})
+    monkeypatch.setattr(settings, "RATE_LIMIT_BACKEND", "database")
+
+    assert configured_quotas() == {
+        "jina": Quota(rate=0.5, burst=3.0),
+        "other": Quota(rate=5.0, burst=10.0),
+    }
+    assert isinstance(get_rate_limiter().store, SQLiteBucketStore)
@@ -0,0 +1,90 @@
+"""Unit tests for the Jina archive replay command line."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.data_ingestion.content_store import ArticleStore, get_article_store
+from backend.app.data_ingestion.jina_archive import ArchiveWriter, Exchange
+from backend.app.data_ingestion.replay import describe, main, replay_cycles
+from backend.app.db.database import connect
+
+
+def record(writer: ArchiveWriter, source: str, body: str, started_at: float):
+    """Records a Jina Reader response for a source URL."""
+    writer.append(
+        Exchange(
+            method="GET",
+            url="https://r.jina.ai/" + source.replace(":", "%3A").replace("/", "%2F"),
+            request_headers=[],
+            status_code=200,
+            headers=[],
+            body=body.encode(),
+            started_at=started_at,
+            elapsed=0.01,
+        )
+    )
+
+
+@pytest.fixture(name="archive")
+def fixture_archive(tmp_path: Path) -> Path:
+    """Two cycles over two sources."""
+    writer = ArchiveWriter(tmp_path / "archive")
+    for cycle in range(2):
+        record(writer, "https://b.com/", f"B cycle {cycle}", cycle * 10 + 1)
+        record(writer, "https://a.com/", f"A cycle {cycle}", cycle * 10 + 2)
+    writer.close()
+    return tmp_path / "archive"
+
+
+@pytest.mark.asyncio
+async def test_replay_reruns_every_recorded_cycle(archive: Path, tmp_path: Path):
+    """Each cycle stores the matching recording of every source."""
+    news_sources = settings.NEWS_SOURCES
+    scratch = tmp_path / "scratch"
+
+    durations = await replay_cycles(archive, scratch)
+
+    assert len(durations) == 2
+    replayed = ArticleStore(connect(str(scratch / "mailchimp_trends.db")))
+    contents = [a.content for a in replayed.get_articles_after(0)]
+    replayed.close()
+    assert contents == ["B cycle 0", "A cycle 0", "B cycle 1", "A cycle 1"]
+    assert (scratch / "dashboard_snapshot.json.gz").exists()
+    assert (scratch / "trend_history").is_dir()
+    assert settings.NEWS_SOURCES == news_sources
+    assert settings.JINA_ARCHIVE_MODE == "off"
+    # The configured database and files are left alone.
+    assert get_article_store().get_articles_after(0) == []
+    assert not Path(settings.DASHBOARD_SNAPSHOT_PATH).exists()
+    assert not Path(settings.TREND_HISTORY_PATH).exists()
+
+
+@pytest.mark.asyncio
+async def test_replay_refuses_to_write_to_configured_paths(archive: Path):
+    """A scratch directory holding the live database is rejected."""
+    scratch = Path(settings.DATABASE_PATH).parent
+    with (
+        patch.object(settings, "DATABASE_PATH", str(scratch / "mailchimp_trends.db")),
+        pytest.raises(ValueError, match="DATABASE_PATH"),
+    ):
+        await replay_cycles(archive, scratch)
+
+
+def test_describe_empty_archive(tmp_path: Path):
+    """An archive without exchanges is reported as empty."""
+    (tmp_path / "empty").mkdir()
+
+    assert describe(tmp_path / "empty").endswith("empty")
+
+
+def test_info_describes_archive(archive: Path, capsys):
+    """info lists exchanges, statuses and sources in recording order."""
+    main(["info", str(archive)])
+
+    output = capsys.readouterr().out
+    assert "4 exchanges" in output
+    assert "200: 4" in output
+    assert output.index("https://b.com/") < output.index("https://a.com/")
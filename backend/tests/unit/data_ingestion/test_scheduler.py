@@ -1,12 +1,24 @@
 """Unit tests for the article fetching scheduler."""
 
+import asyncio
 import logging  # Added import
+from datetime import datetime, timedelta, timezone
 from unittest.mock import ANY, AsyncMock, patch  # Added ANY
 
 import httpx
 import pytest
 
+from backend.app.core.config import Settings
+from backend.app.core.memory import get_memory_profiler
+from backend.app.data_ingestion.checkpoint import (
+    CycleInProgressError,
+    get_checkpoint_store,
+)
+from backend.app.data_ingestion.content_store import get_article_store
 from backend.app.data_ingestion.scheduler import perform_scheduled_article_fetch
+from backend.app.data_ingestion.source_registry import get_source_registry
+from backend.app.nlp_processing.analyses import get_analysis_store
+from backend.app.nlp_processing.clustering import get_topic_cluster_store
 
 # Mark all tests in this file as asyncio
 pytestmark = pytest.mark.asyncio
@@ -15,9 +27,9 @@ pytestmark = pytest.mark.asyncio
 @patch(
     "backend.app.data_ingestion.scheduler.fetch_article_content", new_callable=AsyncMock
 )
-@patch("backend.app.data_ingestion.scheduler.settings")
+@patch("backend.app.data_ingestion.scheduler.settings", new_callable=Settings)
 async def test_perform_scheduled_article_fetch_success(
-    mock_settings_patch: AsyncMock,
+    mock_settings_patch: Settings,
     mock_fetch_article_content: AsyncMock,
     caplog: pytest.LogCaptureFixture,
 ):
@@ -55,11 +67,9 @@ async def test_perform_scheduled_article_fetch_success(
     mock_fetch_article_content.assert_any_call("http://example.com/news1", client=ANY)
     mock_fetch_article_content.assert_any_call("http://example.com/news2", client=ANY)
 
-    # Check if asyncio.sleep was called.
-    # 2 calls from process_fetched_content (mocked as 0.1s sleep)
-    # 1 call from the loop itself (JINA_FETCH_DELAY_SECONDS = 0.1s)
-    assert mock_sleep.call_count == 3
-    mock_sleep.assert_any_call(0.1)
+    # Processing adds no delay; pacing between fetches is left to the shared
+    # rate limit inside the fetch.
+    mock_sleep.assert_not_called()
 
     assert "Starting scheduled article fetch cycle..." in caplog.text
     assert "Fetching content from URL: http://example.com/news1" in caplog.text
@@ -67,32 +77,27 @@ async def test_perform_scheduled_article_fetch_success(
         "Successfully fetched content from http://example.com/news1. Length: 18"
         in caplog.text
     )
-    assert (
-        "Placeholder: Processing content from http://example.com/news1. Length: 18"
-        in caplog.text
-    )
+    assert "Stored article 1 from http://example.com/news1." in caplog.text
+    assert "sentiment: neutral (0.00), nearest topic: None." in caplog.text
     assert "Fetching content from URL: http://example.com/news2" in caplog.text
     assert (
         "Successfully fetched content from http://example.com/news2. Length: 18"
         in caplog.text
     )
-    assert (
-        "Placeholder: Processing content from http://example.com/news2. Length: 18"
-        in caplog.text
-    )
-    assert "Waiting for 0.1 seconds before next fetch..." in caplog.text
+    assert "Stored article 2 from http://example.com/news2." in caplog.text
     assert (
         "Scheduled article fetch cycle completed. Fetched 2 out of 2 sources."
         in caplog.text
     )
+    assert [r.label for r in get_memory_profiler().reports()] == ["fetch cycle"]
 
 
 @patch(
     "backend.app.data_ingestion.scheduler.fetch_article_content", new_callable=AsyncMock
 )
-@patch("backend.app.data_ingestion.scheduler.settings")
+@patch("backend.app.data_ingestion.scheduler.settings", new_callable=Settings)
 async def test_perform_scheduled_article_fetch_one_fails(
-    mock_settings_patch: AsyncMock,
+    mock_settings_patch: Settings,
     mock_fetch_article_content: AsyncMock,
     caplog: pytest.LogCaptureFixture,
 ):
@@ -135,15 +140,15 @@ async def test_perform_scheduled_article_fetch_one_fails(
         "Scheduled article fetch cycle completed. Fetched 1 out of 2 sources."
         in caplog.text
     )
-    assert mock_sleep.call_count == 2
+    mock_sleep.assert_not_called()
 
 
 @patch(
     "backend.app.data_ingestion.scheduler.fetch_article_content", new_callable=AsyncMock
 )
-@patch("backend.app.data_ingestion.scheduler.settings")
+@patch("backend.app.data_ingestion.scheduler.settings", new_callable=Settings)
 async def test_perform_scheduled_article_fetch_all_fail(
-    mock_settings_patch: AsyncMock,
+    mock_settings_patch: Settings,
     mock_fetch_article_content: AsyncMock,
     caplog: pytest.LogCaptureFixture,
 ):
@@ -170,15 +175,15 @@ async def test_perform_scheduled_article_fetch_all_fail(
         "Scheduled article fetch cycle completed. Fetched 0 out of 2 sources."
         in caplog.text
     )
-    assert mock_sleep.call_count == 1
+    mock_sleep.assert_not_called()
 
 
 @patch(
     "backend.app.data_ingestion.scheduler.fetch_article_content", new_callable=AsyncMock
 )
-@patch("backend.app.data_ingestion.scheduler.settings")
+@patch("backend.app.data_ingestion.scheduler.settings", new_callable=Settings)
 async def test_perform_scheduled_article_fetch_exception_during_fetch(
-    mock_settings_patch: AsyncMock,
+    mock_settings_patch: Settings,
     mock_fetch_article_content: AsyncMock,
     caplog: pytest.LogCaptureFixture,
 ):
@@ -208,9 +213,9 @@ async def test_perform_scheduled_article_fetch_exception_during_fetch(
     )
 
 
-@patch("backend.app.data_ingestion.scheduler.settings")
+@patch("backend.app.data_ingestion.scheduler.settings", new_callable=Settings)
 async def test_perform_scheduled_article_fetch_no_sources(
-    mock_settings_patch: AsyncMock, caplog: pytest.LogCaptureFixture
+    mock_settings_patch: Settings, caplog: pytest.LogCaptureFixture
 ):
     """
     Tests perform_scheduled_article_fetch with an empty list of news sources.
@@ -243,3 +248,215 @@ async def test_perform_scheduled_article_fetch_no_sources(
     assert (
         "Fetching content from URL" not in caplog.text
     )  # Ensure no fetch attempts logged
+
+
+@patch(
+    "backend.app.data_ingestion.scheduler.fetch_article_content", new_callable=AsyncMock
+)
+@patch("backend.app.data_ingestion.scheduler.settings", new_callable=Settings)
+async def test_perform_scheduled_article_fetch_stores_content(
+    mock_settings_patch: Settings,
+    mock_fetch_article_content: AsyncMock,
+):
+    """
+    Tests that fetched content and its analysis are persisted.
+    """
+    mock_settings_patch.NEWS_SOURCES = ["http://example.com/news1"]
+    mock_settings_patch.JINA_FETCH_DELAY_SECONDS = 0.1
+    mock_fetch_article_content.return_value = "Content from news1"
+
+    with patch(
+        "backend.app.data_ingestion.scheduler.asyncio.sleep", new_callable=AsyncMock
+    ):
+        await perform_scheduled_article_fetch()
+
+    stored = get_article_store().get_latest_article("http://example.com/news1")
+    assert stored is not None
+    assert stored.content == "Content from news1"
+    analysis = get_analysis_store().get(stored.id)
+    assert analysis is not None
+    assert analysis.version == mock_settings_patch.ANALYSIS_VERSION
+
+
+@patch(
+    "backend.app.data_ingestion.scheduler.fetch_article_content", new_callable=AsyncMock
+)
+@patch("backend.app.data_ingestion.scheduler.settings", new_callable=Settings)
+async def test_perform_scheduled_article_fetch_clusters_new_articles(
+    mock_settings_patch: Settings,
+    mock_fetch_article_content: AsyncMock,
+):
+    """
+    Tests that articles stored during a cycle are assigned to topic clusters.
+    """
+    mock_settings_patch.NEWS_SOURCES = ["http://example.com/news1"]
+    mock_settings_patch.JINA_FETCH_DELAY_SECONDS = 0
+    mock_fetch_article_content.return_value = "Email marketing automation trends"
+
+    with patch(
+        "backend.app.data_ingestion.scheduler.asyncio.sleep", new_callable=AsyncMock
+    ):
+        await perform_scheduled_article_fetch()
+
+    stored = get_article_store().get_latest_article("http://example.com/news1")
+    assert stored is not None
+    assert get_topic_cluster_store().cluster_of(stored.id) is not None
+
+
+@patch(
+    "backend.app.data_ingestion.scheduler.fetch_article_content", new_callable=AsyncMock
+)
+@patch("backend.app.data_ingestion.scheduler.settings", new_callable=Settings)
+async def test_perform_scheduled_article_fetch_with_frontier(
+    mock_settings_patch: Settings,
+    mock_fetch_article_content: AsyncMock,
+    caplog: pytest.LogCaptureFixture,
+):
+    """
+    Tests that the frontier path fetches every source without fixed sleeps.
+    """
+    mock_settings_patch.NEWS_SOURCES = [
+        "http://a.example.com/news",
+        "http://b.example.com/news",
+        "http://b.example.com/more",
+    ]
+    mock_settings_patch.FETCH_FRONTIER_ENABLED = True
+    mock_settings_patch.FETCH_HOST_MIN_INTERVAL_SECONDS = 0
+    mock_settings_patch.JINA_FETCH_DELAY_SECONDS = 0
+    mock_fetch_article_content.return_value = "content"
+    caplog.set_level(logging.INFO)
+
+    await perform_scheduled_article_fetch()
+
+    assert mock_fetch_article_content.call_count == 3
+    assert "Waiting for" not in caplog.text
+    assert (
+        "Scheduled article fetch cycle completed. Fetched 3 out of 3 sources."
+        in caplog.text
+    )
+
+
+@patch(
+    "backend.app.data_ingestion.scheduler.fetch_article_content", new_callable=AsyncMock
+)
+@patch("backend.app.data_ingestion.scheduler.settings", new_callable=Settings)
+async def test_perform_scheduled_article_fetch_records_source_status(
+    mock_settings_patch: Settings,
+    mock_fetch_article_content: AsyncMock,
+):
+    """
+    Tests that fetch outcomes are recorded in the source registry.
+    """
+    mock_settings_patch.NEWS_SOURCES = [
+        "http://example.com/ok",
+        "http://example.com/fail",
+    ]
+    mock_fetch_article_content.side_effect = lambda url, client: (
+        "content" if url.endswith("ok") else None
+    )
+
+    with patch(
+        "backend.app.data_ingestion.scheduler.asyncio.sleep", new_callable=AsyncMock
+    ):
+        await perform_scheduled_article_fetch()
+
+    sources = {
+        source.url: source
+        for source in get_source_registry().refresh(mock_settings_patch.NEWS_SOURCES)
+    }
+    assert sources["http://example.com/ok"].last_success_at is not None
+    assert sources["http://example.com/fail"].failure_streak == 1
+
+
+@patch(
+    "backend.app.data_ingestion.scheduler.fetch_article_content", new_callable=AsyncMock
+)
+@patch("backend.app.data_ingestion.scheduler.settings", new_callable=Settings)
+async def test_perform_scheduled_article_fetch_resumes_checkpoint(
+    mock_settings_patch: Settings,
+    mock_fetch_article_content: AsyncMock,
+    caplog: pytest.LogCaptureFixture,
+):
+    """
+    Tests that an interrupted cycle only fetches its outstanding sources.
+    """
+    urls = ["http://example.com/news1", "http://example.com/news2"]
+    mock_settings_patch.NEWS_SOURCES = urls
+    mock_fetch_article_content.return_value = "content"
+    caplog.set_level(logging.INFO)
+    checkpoints = get_checkpoint_store()
+    # The interrupted run's last heartbeat has expired.
+    interrupted = checkpoints.start_or_resume(urls, 3600)
+    checkpoints.mark_done(
+        interrupted.id,
+        "http://example.com/news1",
+        datetime.now(timezone.utc) - timedelta(minutes=10),
+    )
+
+    with patch(
+        "backend.app.data_ingestion.scheduler.asyncio.sleep", new_callable=AsyncMock
+    ):
+        await perform_scheduled_article_fetch()
+
+    mock_fetch_article_content.assert_called_once_with(
+        "http://example.com/news2", client=ANY
+    )
+    assert f"Resuming fetch cycle {interrupted.id}: 1 of 2" in caplog.text
+    assert not checkpoints.start_or_resume(urls, 3600).resumed
+
+
+@patch(
+    "backend.app.data_ingestion.scheduler.fetch_article_content", new_callable=AsyncMock
+)
+@patch("backend.app.data_ingestion.scheduler.settings", new_callable=Settings)
+async def test_perform_scheduled_article_fetch_skips_live_cycle(
+    mock_settings_patch: Settings,
+    mock_fetch_article_content: AsyncMock,
+    caplog: pytest.LogCaptureFixture,
+):
+    """
+    Tests that a cycle another run is still heartbeating is not fetched again.
+    """
+    urls = ["http://example.com/news1"]
+    mock_settings_patch.NEWS_SOURCES = urls
+    caplog.set_level(logging.INFO)
+    running = get_checkpoint_store().start_or_resume(urls, 3600)
+
+    await perform_scheduled_article_fetch()
+
+    mock_fetch_article_content.assert_not_called()
+    assert f"Fetch cycle {running.id} is still running" in caplog.text
+
+
+@patch(
+    "backend.app.data_ingestion.scheduler.fetch_article_content", new_callable=AsyncMock
+)
+@patch("backend.app.data_ingestion.scheduler.settings", new_callable=Settings)
+async def test_perform_scheduled_article_fetch_heartbeats_through_stalls(
+    mock_settings_patch: Settings,
+    mock_fetch_article_content: AsyncMock,
+):
+    """
+    Tests that a fetch stalled past the heartbeat timeout keeps its cycle.
+    """
+    mock_settings_patch.NEWS_SOURCES = ["http://example.com/news1"]
+    mock_settings_patch.FETCH_CHECKPOINT_HEARTBEAT_TIMEOUT_SECONDS = 0.06
+    taken_over = []
+
+    async def stalled_fetch(url: str, client: httpx.AsyncClient | None = None):
+        _ = url, client
+        await asyncio.sleep(0.2)
+        try:
+            get_checkpoint_store().start_or_resume(
+                ["http://example.com/other"], 3600, heartbeat_timeout_seconds=0.06
+            )
+            taken_over.append(True)
+        except CycleInProgressError:
+            taken_over.append(False)
+        return "content"
+
+    mock_fetch_article_content.side_effect = stalled_fetch
+
+    await perform_scheduled_article_fetch()
+
+    assert taken_over == [False]
@@ -1,12 +1,18 @@
 """Unit tests for the scheduler module functionality."""
 
+import asyncio
 import logging
 from unittest.mock import MagicMock, patch
 
 import pytest
 from pytest import LogCaptureFixture
 
-from backend.app.data_ingestion.scheduler import shutdown_scheduler, start_scheduler
+from backend.app.core.config import settings
+from backend.app.data_ingestion.scheduler import (
+    perform_scheduled_article_fetch,
+    shutdown_scheduler,
+    start_scheduler,
+)
 
 pytestmark = pytest.mark.asyncio
 
@@ -75,3 +81,45 @@ async def test_shutdown_scheduler_when_not_running(caplog: LogCaptureFixture):
 
         # Verify the log message was generated
         assert any("Scheduler is not running" in rec.message for rec in caplog.records)
+
+
+async def test_shutdown_scheduler_waits_for_in_flight_cycle():
+    """Shutdown lets a running fetch cycle finish before returning."""
+    finished = asyncio.Event()
+
+    async def cycle(_fetch_sources):
+        await asyncio.sleep(0.01)
+        finished.set()
+
+    with (
+        patch("backend.app.data_ingestion.scheduler._run_fetch_cycle", cycle),
+        patch("backend.app.data_ingestion.scheduler.scheduler", MagicMock()),
+    ):
+        task = asyncio.create_task(perform_scheduled_article_fetch())
+        await asyncio.sleep(0)
+        await shutdown_scheduler()
+
+    assert finished.is_set()
+    assert task.done() and not task.cancelled()
+
+
+async def test_shutdown_scheduler_cancels_cycle_after_drain_timeout(
+    caplog: LogCaptureFixture,
+):
+    """A cycle still running after the drain timeout is cancelled."""
+    caplog.set_level(logging.INFO)
+
+    async def cycle(_fetch_sources):
+        await asyncio.sleep(60)
+
+    with (
+        patch("backend.app.data_ingestion.scheduler._run_fetch_cycle", cycle),
+        patch("backend.app.data_ingestion.scheduler.scheduler", MagicMock()),
+        patch.object(settings, "SCHEDULER_SHUTDOWN_DRAIN_SECONDS", 0.01),
+    ):
+        task = asyncio.create_task(perform_scheduled_article_fetch())
+        await asyncio.sleep(0)
+        await shutdown_scheduler()
+
+    assert task.cancelled()
+    assert "will resume from their checkpoint" in caplog.text
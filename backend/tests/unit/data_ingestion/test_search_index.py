@@ -0,0 +1,24 @@
+"""Unit tests for the search index command line."""
+
+from backend.app.data_ingestion import search_index
+from backend.app.data_ingestion.content_store import get_article_store
+
+
+def test_rebuild_command_indexes_stored_articles():
+    """`rebuild` re-indexes every article in the configured database."""
+    store = get_article_store()
+    store.save_article("http://a.com/1", "Email automation")
+    store.save_article("http://a.com/2", "Retail email")
+
+    assert search_index.rebuild() == 2
+
+
+def test_search_command_prints_hits(capsys):
+    """`search` prints each hit's URL and snippet."""
+    get_article_store().save_article("http://a.com/1", "Email automation")
+
+    search_index.main(["search", "automation"])
+
+    output = capsys.readouterr().out
+    assert "http://a.com/1" in output
+    assert "<mark>automation</mark>" in output
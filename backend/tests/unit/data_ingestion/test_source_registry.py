@@ -0,0 +1,140 @@
+"""Unit tests for the hot-reloadable news source registry."""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from backend.app.data_ingestion.source_registry import (
+    NewsSource,
+    SourceRegistry,
+    SourceRegistryError,
+    get_source_registry,
+    parse_registry_file,
+)
+from backend.app.db.database import connect
+
+NOW = datetime(2025, 5, 20, 12, 0, tzinfo=timezone.utc)
+
+
+def write_registry(path: Path, sources: list[dict], mtime_offset: int = 0) -> None:
+    """Writes a registry file and bumps its mtime so the change is detected."""
+    path.write_text(json.dumps({"sources": sources}), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+
+
+def test_parse_registry_file_applies_defaults():
+    """Missing metadata fields fall back to defaults."""
+    sources = parse_registry_file(
+        '{"sources": [{"url": "http://a.com", "priority": 5}, {"url": "http://b.com"}]}'
+    )
+    assert sources == [
+        NewsSource(url="http://a.com", priority=5),
+        NewsSource(url="http://b.com"),
+    ]
+
+
+@pytest.mark.parametrize("text", ["not json", "{}", '{"sources": [{}]}'])
+def test_parse_registry_file_rejects_invalid_documents(text: str):
+    """Malformed registry documents raise SourceRegistryError."""
+    with pytest.raises(SourceRegistryError):
+        parse_registry_file(text)
+
+
+def test_defaults_used_without_registry_file():
+    """Without a file, the default URL list becomes the registry."""
+    registry = SourceRegistry(connect(":memory:"))
+    registry.refresh(["http://b.com", "http://a.com"])
+
+    assert [source.url for source in registry.snapshot()] == [
+        "http://b.com",
+        "http://a.com",
+    ]
+
+
+def test_file_is_reloaded_on_change(tmp_path: Path):
+    """Edits to the registry file take effect on the next refresh."""
+    path = tmp_path / "sources.json"
+    write_registry(path, [{"url": "http://a.com"}])
+    registry = SourceRegistry(connect(":memory:"), str(path))
+    first = registry.refresh()
+
+    write_registry(
+        path,
+        [{"url": "http://a.com"}, {"url": "http://b.com", "priority": 9}],
+        mtime_offset=1_000_000,
+    )
+    second = registry.refresh()
+
+    assert [source.url for source in first] == ["http://a.com"]
+    assert [source.url for source in second] == ["http://b.com", "http://a.com"]
+
+
+def test_invalid_file_keeps_previous_sources(tmp_path: Path):
+    """A broken edit does not wipe out the loaded sources."""
+    path = tmp_path / "sources.json"
+    write_registry(path, [{"url": "http://a.com"}])
+    registry = SourceRegistry(connect(":memory:"), str(path))
+    registry.refresh()
+
+    path.write_text("{broken", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert [source.url for source in registry.refresh()] == ["http://a.com"]
+
+
+def test_snapshot_is_not_disturbed_by_updates():
+    """A snapshot taken before a refresh is unaffected by the refresh."""
+    registry = SourceRegistry(connect(":memory:"))
+    before = registry.refresh(["http://a.com"])
+    registry.record_failure("http://a.com", NOW)
+    after = registry.refresh(["http://a.com"])
+
+    assert before[0].failure_streak == 0
+    assert after[0].failure_streak == 1
+
+
+def test_status_tracks_success_and_failure_streak():
+    """Failures increment the streak; a success resets it."""
+    registry = SourceRegistry(connect(":memory:"))
+    registry.record_failure("http://a.com", NOW)
+    registry.record_failure("http://a.com", NOW)
+    assert registry.refresh(["http://a.com"])[0].failure_streak == 2
+
+    registry.record_success("http://a.com", NOW)
+    source = registry.refresh(["http://a.com"])[0]
+    assert source.failure_streak == 0
+    assert source.last_success_at == NOW
+
+
+def test_due_sources_honours_poll_interval_and_enabled(tmp_path: Path):
+    """Only enabled sources whose interval has elapsed are due."""
+    path = tmp_path / "sources.json"
+    write_registry(
+        path,
+        [
+            {"url": "http://hourly.com", "poll_interval_seconds": 3600},
+            {"url": "http://off.com", "enabled": False},
+            {"url": "http://always.com"},
+        ],
+    )
+    registry = SourceRegistry(connect(":memory:"), str(path))
+    registry.record_success("http://hourly.com", NOW)
+    registry.record_success("http://always.com", NOW)
+    registry.refresh()
+
+    due_now = [source.url for source in registry.due_sources(NOW)]
+    later = NOW + timedelta(hours=1)
+    due_later = [source.url for source in registry.due_sources(later)]
+
+    assert due_now == ["http://always.com"]
+    assert due_later == ["http://hourly.com", "http://always.com"]
+
+
+def test_get_source_registry_is_shared():
+    """The process-wide registry is created once."""
+    assert get_source_registry() is get_source_registry()
@@ -0,0 +1,76 @@
+"""Unit tests for keyset pagination cursors and listing query plans."""
+
+import pytest
+
+from backend.app.data_ingestion.content_store import (
+    LIST_ARTICLES_AFTER_SQL,
+    LIST_ARTICLES_SQL,
+    ArticleStore,
+)
+from backend.app.db.database import connect
+from backend.app.db.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+from backend.app.nlp_processing.clustering import (
+    LIST_CLUSTERS_AFTER_SQL,
+    LIST_CLUSTERS_SQL,
+    OnlineClusterer,
+    TopicClusterStore,
+)
+
+
+def test_cursor_round_trip():
+    """Decoding returns the encoded sort key."""
+    cursor = encode_cursor("2025-05-01T12:00:00+00:00", 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, str, int) == ("2025-05-01T12:00:00+00:00", 42)
+    assert decode_cursor(encode_cursor(3, 7), float, int) == (3.0, 7)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor!",
+        encode_cursor(1),
+        encode_cursor("x", 1),
+        encode_cursor(True, 1),
+    ],
+)
+def test_invalid_cursors_are_rejected(cursor):
+    """Garbage, wrong arity and wrong types raise InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, float, int)
+
+
+@pytest.fixture(name="connection", scope="module")
+def fixture_connection():
+    """An in-memory database with every store's schema."""
+    connection = connect(":memory:")
+    ArticleStore(connection)
+    TopicClusterStore(connection, OnlineClusterer(4))
+    return connection
+
+
+@pytest.mark.parametrize(
+    ("sql", "params"),
+    [
+        (LIST_ARTICLES_SQL, (10,)),
+        (LIST_ARTICLES_AFTER_SQL, ("2025-05-01", 1, 10)),
+        (LIST_CLUSTERS_SQL, (10,)),
+        (LIST_CLUSTERS_AFTER_SQL, (1.0, 1, 10)),
+    ],
+)
+def test_listing_queries_use_covering_indexes(connection, sql, params):
+    """Listings neither scan a table nor sort rows; indexes cover them."""
+    plan = [
+        row["detail"] for row in connection.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+    ]
+
+    assert plan, sql
+    for detail in plan:
+        assert "USING COVERING INDEX" in detail, plan
+        assert "TEMP B-TREE" not in detail, plan
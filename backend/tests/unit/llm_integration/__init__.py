@@ -0,0 +1 @@
+# This file makes the 'llm_integration' directory a Python package.
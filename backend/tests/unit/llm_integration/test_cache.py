@@ -0,0 +1,123 @@
+"""Unit tests for TTLCache and SingleFlight."""
+
+import asyncio
+
+import pytest
+
+from backend.app.llm_integration.cache import SingleFlight, TTLCache
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """A manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries():
+    """Entries are served until their TTL elapses."""
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(10, ttl_seconds=5, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """The entry used longest ago is evicted when the cache is full."""
+    cache: TTLCache[str, int] = TTLCache(2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_rejects_zero_size():
+    """A cache must hold at least one entry."""
+    with pytest.raises(ValueError):
+        TTLCache(0, ttl_seconds=1)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_calls():
+    """Concurrent calls with the same key share one execution."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    tasks = [asyncio.create_task(flight.do("k", work)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert len(flight) == 1
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [42] * 5
+    assert calls == 1
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_exceptions_but_not_results_after():
+    """A failure reaches every waiter, and the next call runs again."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def failing() -> int:
+        await release.wait()
+        raise RuntimeError("upstream down")
+
+    tasks = [asyncio.create_task(flight.do("k", failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def succeeding() -> int:
+        return 1
+
+    assert await flight.do("k", succeeding) == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_waiter_takes_over_when_leader_is_cancelled():
+    """If the caller doing the work is cancelled, a waiter re-runs it."""
+    flight: SingleFlight[str, str] = SingleFlight()
+    started = asyncio.Event()
+    calls = 0
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.sleep(0.01)
+        return "done"
+
+    leader = asyncio.create_task(flight.do("k", work))
+    await started.wait()
+    follower = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "done"
+    assert calls == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
@@ -0,0 +1,289 @@
+"""Unit tests for cached, coalesced content generation."""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from backend.app.llm_integration.cache import TTLCache
+from backend.app.llm_integration.generation import (
+    ContentGenerator,
+    ContentParseError,
+    GenerationResult,
+    build_prompt,
+    parse_generated_content,
+)
+from backend.app.llm_integration.providers import (
+    AnthropicProvider,
+    LLMProviderError,
+    LLMUnavailableError,
+    StubLLMProvider,
+)
+from backend.app.schemas.content_generation import GenerateContentRequest
+from backend.app.trend_identification.trends import Trend
+
+NOW = datetime(2025, 5, 1, tzinfo=timezone.utc)
+
+
+def make_trend(version: str = "v1") -> Trend:
+    """A trend with fixed context."""
+    return Trend(
+        id="7",
+        name="Email Automation",
+        version=version,
+        article_count=4,
+        identified_at=NOW,
+        updated_at=NOW,
+        snippets=("Brands automate email journeys.",),
+    )
+
+
+def make_generator(latency: float = 0.0) -> ContentGenerator:
+    """A generator over a stub provider and an empty cache."""
+    return ContentGenerator(StubLLMProvider(latency), TTLCache(16, 60))
+
+
+@pytest.mark.asyncio
+async def test_stub_provider_is_deterministic():
+    """The same prompt always produces the same parseable content."""
+    provider = StubLLMProvider()
+    prompt = build_prompt(make_trend(), GenerateContentRequest())
+
+    first = await provider.complete(prompt, max_tokens=100, temperature=0.5)
+    second = await provider.complete(prompt, max_tokens=100, temperature=0.5)
+
+    assert first == second
+    content = parse_generated_content(first)
+    assert len(content.email_subject_lines) == 3
+    assert "Email Automation" in content.email_body_copy
+
+
+@pytest.mark.asyncio
+async def test_generate_serves_repeat_requests_from_cache():
+    """Only the first request for a trend version calls the provider."""
+    generator = make_generator()
+    trend, params = make_trend(), GenerateContentRequest()
+
+    first = await generator.generate(trend, params)
+    second = await generator.generate(trend, params)
+
+    assert not first.cached
+    assert second.cached
+    assert second.content == first.content
+    assert generator.provider.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_misses_on_new_trend_version_or_params():
+    """A changed trend or different parameters produce a new completion."""
+    generator = make_generator()
+    await generator.generate(make_trend("v1"), GenerateContentRequest())
+
+    assert not (
+        await generator.generate(make_trend("v2"), GenerateContentRequest())
+    ).cached
+    assert not (
+        await generator.generate(make_trend("v1"), GenerateContentRequest(tone="bold"))
+    ).cached
+    assert generator.provider.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call():
+    """Requests arriving while a generation is in flight wait for it."""
+    generator = make_generator(latency=0.05)
+    trend, params = make_trend(), GenerateContentRequest()
+
+    results = await asyncio.gather(
+        *(generator.generate(trend, params) for _ in range(10))
+    )
+
+    assert generator.provider.calls == 1
+    assert len({result.content.model_dump_json() for result in results}) == 1
+
+
+def test_parse_generated_content_tolerates_surrounding_text():
+    """JSON wrapped in prose is still extracted."""
+    body = {
+        "email_subject_lines": ["a"],
+        "email_body_copy": "b",
+        "campaign_themes": ["c"],
+    }
+
+    content = parse_generated_content(f"Sure! Here you go:\n{json.dumps(body)}\nEnjoy")
+
+    assert content.email_body_copy == "b"
+
+
+@pytest.mark.parametrize("text", ["no json here", '{"email_body_copy": "x"}', "{bad"])
+def test_parse_generated_content_rejects_invalid_output(text: str):
+    """Completions without the expected object raise ContentParseError."""
+    with pytest.raises(ContentParseError):
+        parse_generated_content(text)
+
+
+@pytest.mark.asyncio
+async def test_anthropic_provider_sends_messages_request():
+    """The Claude provider posts one user message and joins text blocks."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200, json={"content": [{"type": "text", "text": "hello"}]}
+        )
+
+    provider = AnthropicProvider(
+        "key", "claude-test", transport=httpx.MockTransport(handler)
+    )
+    text = await provider.complete("prompt", max_tokens=10, temperature=0.1)
+    await provider.aclose()
+
+    assert text == "hello"
+    assert seen[0].url.path == "/v1/messages"
+    assert seen[0].headers["x-api-key"] == "key"
+    assert json.loads(seen[0].content)["messages"] == [
+        {"role": "user", "content": "prompt"}
+    ]
+
+
+@pytest.mark.parametrize(
+    ("status_code", "error"),
+    [(429, LLMUnavailableError), (503, LLMUnavailableError), (400, LLMProviderError)],
+)
+@pytest.mark.asyncio
+async def test_anthropic_provider_maps_errors(status_code: int, error: type):
+    """Rate limits and server errors are reported as unavailability."""
+    provider = AnthropicProvider(
+        "key",
+        "claude-test",
+        transport=httpx.MockTransport(lambda _: httpx.Response(status_code)),
+    )
+
+    with pytest.raises(error):
+        await provider.complete("prompt", max_tokens=10, temperature=0.1)
+    await provider.aclose()
+
+
+class FakeStreamingProvider:
+    """Streams fixed pieces and records whether the stream was closed."""
+
+    name = "fake"
+
+    def __init__(self, pieces: list[str]):
+        self.pieces = pieces
+        self.closed = False
+
+    async def complete(
+        self, prompt: str, *, max_tokens: int, temperature: float
+    ) -> str:
+        """Unused by streaming tests."""
+        raise NotImplementedError
+
+    async def stream(self, *_args, **_kwargs):
+        """Yields the configured pieces."""
+        try:
+            for piece in self.pieces:
+                await asyncio.sleep(0)
+                yield piece
+        finally:
+            self.closed = True
+
+
+CONTENT_JSON = json.dumps(
+    {
+        "email_subject_lines": ["One", "Two"],
+        "email_body_copy": "Body.",
+        "campaign_themes": ["Theme"],
+    }
+)
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_pieces_then_caches_result():
+    """Pieces are forwarded as they arrive and the result is cached."""
+    pieces = [CONTENT_JSON[:10], CONTENT_JSON[10:30], CONTENT_JSON[30:]]
+    generator = ContentGenerator(FakeStreamingProvider(pieces), TTLCache(16, 60))
+    trend, params = make_trend(), GenerateContentRequest()
+
+    items = [item async for item in generator.stream(trend, params)]
+
+    assert items[:3] == pieces
+    assert isinstance(items[3], GenerationResult)
+    assert items[3].content.email_body_copy == "Body."
+    cached = await generator.generate(trend, params)
+    assert cached.cached
+    assert cached.content == items[3].content
+
+
+@pytest.mark.asyncio
+async def test_stream_cache_hit_yields_only_result():
+    """A cached generation is returned without streaming from the provider."""
+    generator = make_generator()
+    trend, params = make_trend(), GenerateContentRequest()
+    await generator.generate(trend, params)
+
+    items = [item async for item in generator.stream(trend, params)]
+
+    assert len(items) == 1
+    assert items[0].cached
+    assert generator.provider.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_early_closes_upstream_and_caches_nothing():
+    """Stopping the stream (client disconnect) cancels the upstream call."""
+    provider = FakeStreamingProvider(list(CONTENT_JSON))
+    generator = ContentGenerator(provider, TTLCache(16, 60))
+    stream = generator.stream(make_trend(), GenerateContentRequest())
+
+    assert await anext(stream) == CONTENT_JSON[0]
+    await stream.aclose()
+
+    assert provider.closed
+    assert len(generator.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_stub_stream_matches_complete():
+    """The stub streams exactly the text complete() would return."""
+    provider = StubLLMProvider()
+    prompt = build_prompt(make_trend(), GenerateContentRequest())
+
+    streamed = "".join(
+        [piece async for piece in provider.stream(prompt, max_tokens=1, temperature=0)]
+    )
+
+    assert streamed == await provider.complete(prompt, max_tokens=1, temperature=0)
+
+
+@pytest.mark.asyncio
+async def test_anthropic_provider_streams_text_deltas():
+    """content_block_delta events are yielded as text pieces."""
+    events = [
+        {"type": "message_start"},
+        {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hel"}},
+        {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "lo"}},
+        {"type": "message_stop"},
+    ]
+    body = "".join(
+        f"event: {event['type']}\ndata: {json.dumps(event)}\n\n" for event in events
+    )
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, text=body)
+
+    provider = AnthropicProvider(
+        "key", "claude-test", transport=httpx.MockTransport(handler)
+    )
+    pieces = [
+        piece async for piece in provider.stream("p", max_tokens=5, temperature=0)
+    ]
+    await provider.aclose()
+
+    assert pieces == ["Hel", "lo"]
+    assert json.loads(seen[0].content)["stream"] is True
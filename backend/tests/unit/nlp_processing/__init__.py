@@ -0,0 +1 @@
+# This file makes the 'nlp_processing' directory a Python package.
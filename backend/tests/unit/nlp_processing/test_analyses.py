@@ -0,0 +1,80 @@
+"""Unit tests for AnalysisStore."""
+
+import pytest
+
+from backend.app.db.database import connect
+from backend.app.nlp_processing.analyses import AnalysisStore
+from backend.app.nlp_processing.inference import ArticleAnalysis
+from backend.app.nlp_processing.models import sentiment_from_score
+
+
+@pytest.fixture(name="store")
+def fixture_store(tmp_path):
+    """An AnalysisStore over a fresh database."""
+    analysis_store = AnalysisStore(connect(str(tmp_path / "analyses.db")))
+    yield analysis_store
+    analysis_store.close()
+
+
+def analysis(score: float, topic_id: int | None = None) -> ArticleAnalysis:
+    """An ArticleAnalysis with the given sentiment score and topic."""
+    return ArticleAnalysis(sentiment=sentiment_from_score(score), topic_id=topic_id)
+
+
+def test_save_replaces_the_previous_analysis(store):
+    """An article keeps one analysis, the latest saved."""
+    store.save(1, analysis(0.5, 3), "1")
+    store.save(1, analysis(-0.5), "2")
+
+    stored = store.get(1)
+    assert stored is not None
+    assert (stored.sentiment_label, stored.topic_id, stored.version) == (
+        "negative",
+        None,
+        "2",
+    )
+    assert store.get(2) is None
+    assert store.version_counts() == {"2": 1}
+
+
+def test_save_batch_advances_the_backfill_checkpoint(store):
+    """Results and the checkpoint are saved together."""
+    store.start_backfill("2", target_article_id=10)
+
+    store.save_batch([(1, analysis(0.1)), (2, analysis(0.2))], "2", 2)
+
+    run = store.backfill("2")
+    assert run is not None
+    assert (run.last_article_id, run.processed, run.completed) == (2, 2, False)
+
+
+def test_start_backfill_resumes_unless_restarted(store):
+    """An unfinished run keeps its target and checkpoint; restart resets them."""
+    store.start_backfill("2", target_article_id=10)
+    store.save_batch([(1, analysis(0.1))], "2", 1)
+
+    resumed = store.start_backfill("2", target_article_id=20)
+    assert (resumed.target_article_id, resumed.last_article_id) == (10, 1)
+
+    store.complete_backfill("2")
+    assert store.start_backfill("2", target_article_id=20).completed
+
+    restarted = store.start_backfill("2", target_article_id=20, restart=True)
+    assert (restarted.target_article_id, restarted.last_article_id) == (20, 0)
+    assert not restarted.completed
+    assert [run.version for run in store.backfills()] == ["2"]
+
+
+def test_sentiment_summary_counts_labels_of_one_version(store):
+    """Only analyses of the requested version are summarized."""
+    store.save(1, analysis(0.8), "2")
+    store.save(2, analysis(0.4), "2")
+    store.save(3, analysis(-0.6), "2")
+    store.save(4, analysis(-0.9), "1")
+
+    summary = store.sentiment_summary("2")
+
+    assert summary.articles == 3
+    assert summary.mean_score == pytest.approx(0.2)
+    assert summary.label_counts == {"negative": 1, "positive": 2}
+    assert store.sentiment_summary("3").articles == 0
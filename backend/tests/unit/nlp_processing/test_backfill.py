@@ -0,0 +1,136 @@
+"""Unit tests for the analysis backfill."""
+
+import numpy as np
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.data_ingestion.content_store import get_article_store
+from backend.app.nlp_processing import backfill
+from backend.app.nlp_processing.analyses import get_analysis_store
+from backend.app.nlp_processing.embeddings import HashingEmbedder
+from backend.app.nlp_processing.inference import ArticleAnalysis, InferenceService
+from backend.app.nlp_processing.models import (
+    LexiconSentimentModel,
+    TopicModel,
+    sentiment_from_score,
+)
+
+TEXTS = [
+    "Great email growth. " * 30 + "A terrible outage and a costly breach. " * 20,
+    "Loyal customers love the new retail app.",
+    "",
+]
+
+
+@pytest.fixture(name="topic_model")
+def fixture_topic_model():
+    """A topic model over three fixed centroids."""
+    embedder = HashingEmbedder(32)
+    centroids = embedder.embed(["email growth", "retail app", "security breach"])
+    return TopicModel(embedder, lambda: (np.array([7, 8, 9]), centroids))
+
+
+def store_articles(count: int) -> list[int]:
+    """Stores `count` articles cycling through TEXTS and returns their ids."""
+    articles = get_article_store()
+    return [
+        articles.save_article(f"http://a.com/{i}", TEXTS[i % 2]) for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_analyze_documents_matches_the_inference_service(topic_model):
+    """Batch analysis gives what live inference gives, window by window."""
+    service = InferenceService(
+        LexiconSentimentModel(),
+        topic_model,
+        window_chars=200,
+        window_overlap_chars=40,
+    )
+    expected = [await service.analyze_document(text) for text in TEXTS]
+    await service.close()
+
+    results = backfill.analyze_documents(
+        TEXTS, LexiconSentimentModel(), topic_model, 200, 40
+    )
+
+    assert [r.topic_id for r in results] == [e.topic_id for e in expected]
+    assert [r.sentiment.label for r in results] == [e.sentiment.label for e in expected]
+    np.testing.assert_allclose(
+        [r.sentiment.score for r in results], [e.sentiment.score for e in expected]
+    )
+
+
+def test_run_backfill_analyzes_every_article_across_processes():
+    """Every stored article gets an analysis of the new version."""
+    ids = store_articles(7)
+
+    run = backfill.run_backfill("2", workers=2, batch_size=3, max_rate=0)
+
+    assert run.completed
+    assert (run.processed, run.last_article_id, run.target_article_id) == (
+        7,
+        ids[-1],
+        ids[-1],
+    )
+    analyses = get_analysis_store()
+    assert analyses.version_counts() == {"2": 7}
+    stored = analyses.get(ids[0])
+    assert stored is not None
+    # No topic clusters exist yet, so no article gets a topic.
+    assert (stored.sentiment_label, stored.topic_id) == ("positive", None)
+
+
+def test_run_backfill_resumes_after_the_checkpoint():
+    """Articles saved before an interruption are not processed again."""
+    ids = store_articles(5)
+    analyses = get_analysis_store()
+    analyses.start_backfill("2", target_article_id=ids[-1])
+    placeholder = ArticleAnalysis(sentiment_from_score(0.0), topic_id=999)
+    analyses.save_batch([(i, placeholder) for i in ids[:2]], "2", ids[1])
+
+    run = backfill.run_backfill("2", workers=1, batch_size=2, max_rate=0)
+
+    assert run.completed
+    assert run.processed == 5
+    assert [analyses.get(i).topic_id for i in ids[:2]] == [999, 999]  # type: ignore[union-attr]
+    assert analyses.get(ids[2]).topic_id != 999  # type: ignore[union-attr]
+    # A completed backfill does nothing when run again.
+    assert backfill.run_backfill("2", workers=1).processed == 5
+
+
+def test_run_backfill_targets_articles_stored_before_it_started(monkeypatch):
+    """The default version comes from settings; newer articles are left alone."""
+    monkeypatch.setattr(settings, "ANALYSIS_VERSION", "3")
+    ids = store_articles(2)
+    get_analysis_store().start_backfill("3", target_article_id=ids[0])
+
+    run = backfill.run_backfill(workers=1, max_rate=1000)
+
+    assert run.processed == 1
+    assert get_analysis_store().get(ids[1]) is None
+
+
+def test_progress_reports_rate_and_eta():
+    """Rate is articles per second so far; ETA extrapolates it."""
+    progress = backfill.BackfillProgress(total=1000, started_at=100.0)
+    assert progress.eta(100.0) is None
+
+    progress.done = 300
+    assert progress.rate(102.0) == 150
+    assert progress.eta(102.0) == pytest.approx(700 / 150)
+    assert progress.describe(102.0) == (
+        "300/1,000 (30.0%), 150.0 articles/s, ETA 0:00:05"
+    )
+
+
+def test_status_command_prints_versions_and_runs(capsys):
+    """`status` lists analysis counts per version and backfill progress."""
+    store_articles(1)
+    backfill.run_backfill("2", workers=1)
+
+    backfill.main(["status"])
+
+    output = capsys.readouterr().out
+    assert "analyses v2: 1" in output
+    assert "backfill v2: 1 articles up to id 1, completed" in output
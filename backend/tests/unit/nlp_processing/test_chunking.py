@@ -0,0 +1,95 @@
+"""Unit tests for sentence-aligned text windows."""
+
+import itertools
+
+import pytest
+
+from backend.app.nlp_processing.chunking import iter_sentence_spans, iter_windows
+
+
+def sentences(text: str) -> list[str]:
+    """The sentences of text, as strings."""
+    return [text[start:end] for start, end in iter_sentence_spans(text)]
+
+
+def test_sentence_spans_split_on_terminators_and_paragraphs():
+    """Sentences end at ., ! or ? followed by space, or at blank lines."""
+    text = "First one. Second one!  Third?\n\nA heading\n\nLast, v1.2 stays whole"
+
+    assert sentences(text) == [
+        "First one.",
+        "Second one!",
+        "Third?",
+        "A heading",
+        "Last, v1.2 stays whole",
+    ]
+
+
+def test_short_text_is_a_single_window():
+    """Text that fits is returned unchanged as one window."""
+    windows = list(iter_windows("One. Two.", max_chars=100, overlap_chars=10))
+
+    assert [(w.start, w.end, w.text) for w in windows] == [(0, 9, "One. Two.")]
+
+
+def test_windows_are_bounded_sentence_aligned_and_overlapping():
+    """Windows fit max_chars, hold whole sentences and share a tail sentence."""
+    text = " ".join(f"Sentence number {i} is here." for i in range(40))
+    all_sentences = set(sentences(text))
+
+    windows = list(iter_windows(text, max_chars=120, overlap_chars=40))
+
+    assert len(windows) > 1
+    for window in windows:
+        assert len(window.text) <= 120
+        assert window.text == text[window.start : window.end]
+        assert set(sentences(window.text)) <= all_sentences
+    for previous, current in itertools.pairwise(windows):
+        assert current.start < previous.end
+        assert previous.end - current.start <= 40
+    assert windows[0].start == 0
+    assert windows[-1].end == len(text)
+
+
+def test_zero_overlap_windows_cover_text_without_repeats():
+    """With no overlap every sentence appears in exactly one window."""
+    text = " ".join(f"Item {i}." for i in range(100))
+
+    windows = list(iter_windows(text, max_chars=50, overlap_chars=0))
+
+    covered = [s for window in windows for s in sentences(window.text)]
+    assert covered == sentences(text)
+
+
+def test_long_sentences_are_split_at_whitespace():
+    """A sentence longer than a window is broken between words."""
+    text = " ".join(["word"] * 100)
+
+    windows = list(iter_windows(text, max_chars=32, overlap_chars=0))
+
+    assert all(len(window.text) <= 32 for window in windows)
+    assert " ".join(window.text for window in windows) == text
+
+
+def test_unbroken_text_is_hard_split():
+    """Text without whitespace is cut at max_chars."""
+    windows = list(iter_windows("x" * 25, max_chars=10, overlap_chars=0))
+
+    assert [len(window.text) for window in windows] == [10, 10, 5]
+
+
+def test_windows_are_produced_lazily():
+    """The generator yields the first window before scanning the rest."""
+    text = "Short. " * 1_000_000
+
+    first = next(iter_windows(text, max_chars=100, overlap_chars=0))
+
+    assert first.start == 0
+    assert len(first.text) <= 100
+
+
+@pytest.mark.parametrize("max_chars, overlap_chars", [(0, 0), (10, 10), (10, -1)])
+def test_invalid_window_sizes_are_rejected(max_chars, overlap_chars):
+    """Window sizes must allow progress."""
+    with pytest.raises(ValueError):
+        next(iter_windows("text", max_chars, overlap_chars))
@@ -0,0 +1,193 @@
+"""Unit tests for online topic clustering."""
+
+import sqlite3
+
+import numpy as np
+import pytest
+
+from backend.app.data_ingestion.content_store import get_article_store
+from backend.app.db.database import connect
+from backend.app.nlp_processing.clustering import (
+    OnlineClusterer,
+    TopicClusterStore,
+    cluster_new_articles,
+    get_topic_cluster_store,
+)
+from backend.app.nlp_processing.embeddings import normalize
+
+
+def unit(*values: float) -> np.ndarray:
+    """A unit vector in 4 dimensions."""
+    return normalize(np.array(values, dtype=np.float32))
+
+
+X, Y, Z = unit(1, 0, 0, 0), unit(0, 1, 0, 0), unit(0, 0, 1, 0)
+
+
+def test_first_batch_spawns_one_cluster_per_topic():
+    """Dissimilar vectors seed separate clusters, similar ones share one."""
+    clusterer = OnlineClusterer(4, spawn_threshold=0.5)
+
+    update = clusterer.partial_fit(np.stack([X, unit(1, 0.1, 0, 0), Y]))
+
+    assert len(clusterer) == 2
+    assert update.assignments[0] == update.assignments[1] != update.assignments[2]
+    assert update.spawned == sorted(set(update.assignments))
+
+
+def test_later_batches_join_existing_clusters():
+    """Vectors close to a known topic are assigned to it without spawning."""
+    clusterer = OnlineClusterer(4, spawn_threshold=0.5)
+    first = clusterer.partial_fit(np.stack([X, Y]))
+
+    update = clusterer.partial_fit(np.stack([unit(0.1, 1, 0, 0), unit(1, 0, 0.1, 0)]))
+
+    assert not update.spawned
+    assert update.assignments == [first.assignments[1], first.assignments[0]]
+    assert clusterer.counts.tolist() == [2, 2]
+
+
+def test_centroids_follow_drift_within_weight_cap():
+    """With a small weight cap, a cluster tracks where its topic moves."""
+    clusterer = OnlineClusterer(4, spawn_threshold=0.3, max_weight=2)
+    clusterer.partial_fit(X[None, :])
+    target = unit(1, 1, 0, 0)
+
+    for _ in range(20):
+        clusterer.partial_fit(target[None, :])
+
+    assert len(clusterer) == 1
+    assert float(clusterer.centroids[0] @ target) > 0.99
+
+
+def test_drifted_clusters_are_merged():
+    """Clusters whose centroids converge are merged into the heavier one."""
+    clusterer = OnlineClusterer(4, spawn_threshold=0.9, merge_threshold=0.93)
+    first = clusterer.partial_fit(np.stack([X] * 7 + [unit(1, 0.6, 0, 0)]))
+    heavy, light = first.assignments[0], first.assignments[7]
+    assert heavy != light
+
+    update = clusterer.partial_fit(np.stack([unit(1, 0.3, 0, 0)] * 5))
+
+    assert update.merged == {light: heavy}
+    assert len(clusterer) == 1
+    assert clusterer.counts.tolist() == [13]
+    assert set(update.assignments) == {heavy}
+
+
+def test_max_clusters_merges_smallest_cluster():
+    """The number of clusters never exceeds max_clusters."""
+    clusterer = OnlineClusterer(4, spawn_threshold=0.99, max_clusters=2)
+
+    update = clusterer.partial_fit(np.stack([X, X, Y, Y, Z]))
+
+    assert len(clusterer) == 2
+    assert len(update.merged) == 1
+    assert len(set(update.assignments)) == 2
+
+
+@pytest.fixture(name="connection")
+def fixture_connection() -> sqlite3.Connection:
+    """An in-memory database."""
+    return connect(":memory:")
+
+
+@pytest.fixture(name="store")
+def fixture_store(connection: sqlite3.Connection) -> TopicClusterStore:
+    """A cluster store over the in-memory database."""
+    return TopicClusterStore(connection, OnlineClusterer(4, spawn_threshold=0.5))
+
+
+def test_store_persists_clusters_and_assignments(
+    store: TopicClusterStore, connection: sqlite3.Connection
+):
+    """Clusters, assignments and the watermark survive a reload."""
+    update = store.add_batch([1, 2, 3], ["a", "b", "c"], np.stack([X, X, Y]))
+
+    reloaded = TopicClusterStore(connection, OnlineClusterer(4, spawn_threshold=0.5))
+
+    assert reloaded.watermark == 3
+    assert len(reloaded.clusterer) == 2
+    assert [c.article_count for c in reloaded.clusters()] == [2, 1]
+    assert reloaded.cluster_of(3) == update.assignments[2]
+    assert reloaded.add_batch([4], ["d"], Y[None, :]).spawned == []
+
+
+def test_store_reassigns_articles_of_merged_clusters():
+    """Articles in an absorbed cluster are moved to the surviving cluster."""
+    store = TopicClusterStore(
+        connect(":memory:"),
+        OnlineClusterer(4, spawn_threshold=0.9, merge_threshold=0.93),
+    )
+    store.add_batch([1, 2, 3], ["a", "b", "c"], np.stack([X, X, unit(1, 0.6, 0, 0)]))
+
+    update = store.add_batch(
+        [4, 5, 6, 7, 8], list("defgh"), np.stack([unit(1, 0.3, 0, 0)] * 5)
+    )
+
+    (survivor,) = set(update.merged.values())
+    assert {store.cluster_of(i) for i in range(1, 9)} == {survivor}
+    assert [c.id for c in store.clusters()] == [survivor]
+
+
+def test_stores_sharing_a_database_take_turns(tmp_path):
+    """Each process reloads the other's clusters and skips clustered articles."""
+    path = str(tmp_path / "clusters.db")
+    first, second = (
+        TopicClusterStore(connect(path), OnlineClusterer(4, spawn_threshold=0.5))
+        for _ in range(2)
+    )
+
+    first.add_batch([1, 2], ["a", "b"], np.stack([X, Y]))
+    joined = second.add_batch([3], ["c"], X[None, :])
+    spawned = first.add_batch([4], ["d"], Z[None, :])
+    # The same batch read by both before either committed.
+    repeated = second.add_batch([3, 4, 5], ["c", "d", "e"], np.stack([X, Z, Y]))
+
+    assert joined.spawned == [] and joined.assignments == [first.cluster_of(1)]
+    assert spawned.spawned == [3]
+    assert repeated.assignments == [first.cluster_of(2)]
+    assert [c.article_count for c in first.clusters()] == [2, 2, 1]
+    assert second.watermark == 5
+    ids, _ = first.centroid_snapshot()
+    assert ids.tolist() == [1, 2, 3]
+    first.close()
+    second.close()
+
+
+def test_store_resets_when_dimension_changes(
+    store: TopicClusterStore, connection: sqlite3.Connection
+):
+    """Centroids from a different embedding model are discarded."""
+    store.add_batch([1], ["a"], X[None, :])
+
+    reloaded = TopicClusterStore(connection, OnlineClusterer(8))
+
+    assert len(reloaded.clusterer) == 0
+    assert reloaded.watermark == 0
+
+
+def test_cluster_new_articles_processes_only_new_articles():
+    """Each call clusters the articles stored since the previous call."""
+    articles = get_article_store()
+    for i in range(3):
+        articles.save_article(f"http://a.com/{i}", f"email marketing automation {i}")
+
+    assert cluster_new_articles(batch_size=2) == 3
+    assert cluster_new_articles() == 0
+
+    articles.save_article("http://b.com/1", "volcano eruption in iceland")
+    assert cluster_new_articles() == 1
+    assert get_topic_cluster_store().watermark == 4
+
+
+def test_list_clusters_pages_by_weight(store: TopicClusterStore):
+    """Active clusters are paged heaviest first with an opaque cursor."""
+    store.add_batch([1, 2, 3, 4, 5, 6], list("abcdef"), np.stack([X, X, X, Y, Y, Z]))
+
+    first = store.list_clusters(limit=2)
+    second = store.list_clusters(limit=2, cursor=first.next_cursor)
+
+    assert [c.article_count for c in first.items + second.items] == [3, 2, 1]
+    assert first.next_cursor is not None
+    assert second.next_cursor is None
@@ -0,0 +1,137 @@
+"""Unit tests for the embedding cache."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from backend.app.nlp_processing.embeddings import (
+    EmbeddingStore,
+    HashingEmbedder,
+    content_hash,
+    get_embedding_store,
+)
+
+
+@pytest.fixture(name="store")
+def fixture_store(tmp_path: Path) -> EmbeddingStore:
+    """An empty store with a small hashing embedder."""
+    return EmbeddingStore(tmp_path / "embeddings", HashingEmbedder(32))
+
+
+def test_hashing_embedder_is_deterministic_and_normalised():
+    """Vectors are unit length and identical for identical text."""
+    embedder = HashingEmbedder(64)
+    vectors = embedder.embed(["email marketing trends", "email marketing trends"])
+
+    assert vectors.shape == (2, 64)
+    assert vectors.dtype == np.float32
+    np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1.0, rtol=1e-6)
+    np.testing.assert_array_equal(vectors[0], vectors[1])
+
+
+def test_hashing_embedder_ranks_related_text_higher():
+    """Texts sharing vocabulary are more similar than unrelated ones."""
+    query, related, unrelated = HashingEmbedder(256).embed(
+        [
+            "email marketing automation for small business",
+            "small business email marketing automation tips",
+            "volcanic eruption forecast for the pacific rim",
+        ]
+    )
+
+    assert query @ related > query @ unrelated
+
+
+def test_embed_texts_computes_each_unique_text_once(store: EmbeddingStore):
+    """Cached and repeated texts are not sent to the embedder again."""
+    with patch.object(store.embedder, "embed", wraps=store.embedder.embed) as embed:
+        first = store.embed_texts(["a b", "c d", "a b"])
+        second = store.embed_texts(["c d", "e f"])
+
+    assert [call.args[0] for call in embed.call_args_list] == [
+        ["a b", "c d"],
+        ["e f"],
+    ]
+    assert len(store) == 3
+    np.testing.assert_array_equal(first[0], first[2])
+    np.testing.assert_array_equal(first[1], second[0])
+
+
+def test_store_grows_beyond_initial_capacity(store: EmbeddingStore):
+    """Adding more rows than the mapped capacity remaps the matrix."""
+    texts = [f"article {i}" for i in range(1500)]
+
+    vectors = store.embed_texts(texts)
+
+    assert len(store) == 1500
+    np.testing.assert_array_equal(store.matrix(), vectors)
+    assert store.row_of(content_hash("article 1499")) == 1499
+
+
+def test_store_reopens_with_cached_vectors(tmp_path: Path):
+    """Embeddings survive a restart and keep their rows."""
+    store = EmbeddingStore(tmp_path, HashingEmbedder(32))
+    expected = store.embed_texts(["first", "second"])
+    store.close()
+
+    reopened = EmbeddingStore(tmp_path, HashingEmbedder(32))
+
+    assert len(reopened) == 2
+    assert reopened.hash_at(1) == content_hash("second")
+    np.testing.assert_array_equal(reopened.matrix(), expected)
+
+
+def test_stores_sharing_a_directory_keep_rows_in_line(tmp_path: Path):
+    """Writers in several processes append after each other's rows."""
+    embedder = HashingEmbedder(32)
+    first = EmbeddingStore(tmp_path, embedder)
+    second = EmbeddingStore(tmp_path, embedder)
+
+    first.embed_texts(["first"])
+    second.embed_texts(["second"])
+    first.embed_texts(["second", "third"])
+
+    assert len(first) == 3
+    first.close()
+    second.close()
+    reopened = EmbeddingStore(tmp_path, embedder)
+    for text in ("first", "second", "third"):
+        np.testing.assert_array_equal(
+            reopened.get(content_hash(text)), embedder.embed([text])[0]
+        )
+    assert [reopened.hash_at(row) for row in range(3)] == [
+        content_hash(text) for text in ("first", "second", "third")
+    ]
+
+
+def test_model_change_discards_cache(tmp_path: Path):
+    """Vectors from a different embedding model are not reused."""
+    EmbeddingStore(tmp_path, HashingEmbedder(32)).embed_texts(["first"])
+
+    reopened = EmbeddingStore(tmp_path, HashingEmbedder(64))
+
+    assert len(reopened) == 0
+    assert reopened.embed_texts(["first"]).shape == (1, 64)
+
+
+def test_add_rejects_wrong_shape(store: EmbeddingStore):
+    """Vectors must match the store's dimension."""
+    with pytest.raises(ValueError):
+        store.add(["key"], np.zeros((1, 8), dtype=np.float32))
+
+
+def test_matrix_is_read_only(store: EmbeddingStore):
+    """Callers cannot modify cached vectors through matrix()."""
+    store.embed_texts(["a"])
+
+    with pytest.raises(ValueError):
+        store.matrix()[0, 0] = 1.0
+
+
+def test_shared_store_uses_configured_path(tmp_path: Path):
+    """The process-wide store lives under EMBEDDING_STORE_PATH."""
+    get_embedding_store().embed_texts(["a"])
+
+    assert (tmp_path / "embeddings" / "vectors.f32").exists()
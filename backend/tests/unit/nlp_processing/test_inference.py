@@ -0,0 +1,226 @@
+"""Unit tests for MicroBatcher and InferenceService."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from backend.app.nlp_processing.embeddings import HashingEmbedder
+from backend.app.nlp_processing.inference import (
+    ArticleAnalysis,
+    InferenceService,
+    MicroBatcher,
+    aggregate_analyses,
+)
+from backend.app.nlp_processing.models import (
+    LexiconSentimentModel,
+    SentimentResult,
+    TopicModel,
+)
+
+
+@pytest.fixture(name="executor")
+def fixture_executor():
+    """A small worker pool shut down after each test."""
+    pool = ThreadPoolExecutor(max_workers=2)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+class RecordingModel:  # pylint: disable=too-few-public-methods
+    """Upper-cases texts and records every batch it is given."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def predict_batch(self, texts: list[str]) -> list[str]:
+        """Returns each text upper-cased."""
+        self.batches.append(list(texts))
+        return [text.upper() for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_the_batch_is_full(executor):
+    """A full batch runs immediately instead of waiting for the timeout."""
+    model = RecordingModel()
+    batcher = MicroBatcher(
+        model.predict_batch, executor=executor, max_batch_size=4, max_wait_ms=10_000
+    )
+
+    start = time.monotonic()
+    results = await asyncio.gather(*(batcher.submit(t) for t in "abcd"))
+    elapsed = time.monotonic() - start
+    await batcher.close()
+
+    assert results == ["A", "B", "C", "D"]
+    assert batcher.batch_sizes == [4]
+    assert elapsed < 1
+
+
+@pytest.mark.asyncio
+async def test_flushes_a_partial_batch_after_max_wait(executor):
+    """A lone item is processed once max_wait_ms has passed."""
+    model = RecordingModel()
+    batcher = MicroBatcher(
+        model.predict_batch, executor=executor, max_batch_size=32, max_wait_ms=20
+    )
+
+    assert await asyncio.wait_for(batcher.submit("solo"), timeout=2) == "SOLO"
+    await batcher.close()
+
+    assert model.batches == [["solo"]]
+
+
+@pytest.mark.asyncio
+async def test_sorts_batches_by_length_and_routes_results(executor):
+    """Items run shortest first, but each caller gets its own result."""
+    model = RecordingModel()
+    batcher = MicroBatcher(
+        model.predict_batch,
+        executor=executor,
+        max_batch_size=3,
+        max_wait_ms=1_000,
+        sort_key=len,
+    )
+
+    results = await asyncio.gather(
+        batcher.submit("ccc"), batcher.submit("a"), batcher.submit("bb")
+    )
+    await batcher.close()
+
+    assert results == ["CCC", "A", "BB"]
+    assert model.batches == [["a", "bb", "ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_splits_a_burst_into_bounded_batches(executor):
+    """No batch exceeds max_batch_size."""
+    batcher = MicroBatcher(
+        RecordingModel().predict_batch,
+        executor=executor,
+        max_batch_size=8,
+        max_wait_ms=5,
+    )
+
+    results = await asyncio.gather(*(batcher.submit(str(i)) for i in range(50)))
+    await batcher.close()
+
+    assert results == [str(i) for i in range(50)]
+    assert sum(batcher.batch_sizes) == 50
+    assert max(batcher.batch_sizes) == 8
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_reach_every_caller(executor):
+    """An exception from the model fails each future in the batch."""
+
+    def failing(texts):
+        raise ValueError(f"cannot score {len(texts)} texts")
+
+    batcher = MicroBatcher(failing, executor=executor, max_batch_size=2)
+
+    results = await asyncio.gather(
+        batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+    )
+    await batcher.close()
+
+    assert [str(result) for result in results] == ["cannot score 2 texts"] * 2
+
+
+@pytest.mark.asyncio
+async def test_wrong_result_count_is_an_error(executor):
+    """A model returning too few results fails the batch."""
+    batcher = MicroBatcher(lambda texts: [], executor=executor, max_batch_size=1)
+
+    with pytest.raises(RuntimeError, match="returned 0 results for 1 items"):
+        await batcher.submit("a")
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_keeps_working_after_a_failed_batch(executor):
+    """A failing batch does not stop later batches."""
+    calls = []
+
+    def flaky(texts):
+        calls.append(texts)
+        if len(calls) == 1:
+            raise ValueError("first batch fails")
+        return texts
+
+    batcher = MicroBatcher(flaky, executor=executor, max_batch_size=1)
+
+    with pytest.raises(ValueError):
+        await batcher.submit("a")
+    assert await batcher.submit("b") == "b"
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_inference_service_analyzes_texts():
+    """Concurrent analyze() calls share batches and get their own results."""
+    embedder = HashingEmbedder(64)
+    centroids = embedder.embed(["email marketing", "football league"])
+    service = InferenceService(
+        LexiconSentimentModel(),
+        TopicModel(embedder, lambda: (np.array([1, 2]), centroids)),
+        max_batch_size=8,
+        max_wait_ms=5,
+    )
+
+    good, bad = await asyncio.gather(
+        service.analyze("Great email marketing success"),
+        service.analyze("A bad football league scandal"),
+    )
+    await service.close()
+
+    assert (good.sentiment.label, good.topic_id) == ("positive", 1)
+    assert (bad.sentiment.label, bad.topic_id) == ("negative", 2)
+    assert service.sentiment.batch_sizes == [2]
+
+
+def test_aggregate_weights_windows_by_length():
+    """Longer windows dominate both sentiment and topic."""
+    analyses = [
+        ArticleAnalysis(SentimentResult("positive", 1.0), topic_id=1),
+        ArticleAnalysis(SentimentResult("negative", -0.5), topic_id=2),
+        ArticleAnalysis(SentimentResult("neutral", 0.0), topic_id=None),
+    ]
+
+    combined = aggregate_analyses(analyses, [100, 300, 600])
+
+    assert combined.sentiment.score == pytest.approx(-0.05)
+    assert combined.sentiment.label == "neutral"
+    assert combined.topic_id == 2
+
+
+@pytest.mark.asyncio
+async def test_analyze_document_bounds_windows_in_flight():
+    """Long documents are analyzed in bounded groups of short windows."""
+    seen: list[list[str]] = []
+
+    def sentiment(texts):
+        seen.append(list(texts))
+        return LexiconSentimentModel().predict_batch(texts)
+
+    sentiment_model = LexiconSentimentModel()
+    sentiment_model.predict_batch = sentiment  # type: ignore[method-assign]
+    service = InferenceService(
+        sentiment_model,
+        TopicModel(HashingEmbedder(64), lambda: (np.array([]), np.empty((0, 64)))),
+        max_batch_size=4,
+        max_wait_ms=1,
+        window_chars=200,
+        window_overlap_chars=50,
+    )
+    text = "Great results and strong growth. " * 200
+
+    analysis = await service.analyze_document(text)
+    await service.close()
+
+    assert analysis.sentiment.label == "positive"
+    assert analysis.topic_id is None
+    assert max(len(batch) for batch in seen) <= 4
+    assert max(len(t) for batch in seen for t in batch) <= 200
@@ -0,0 +1,51 @@
+"""Unit tests for the batch sentiment and topic models."""
+
+import numpy as np
+
+from backend.app.nlp_processing.embeddings import HashingEmbedder
+from backend.app.nlp_processing.models import LexiconSentimentModel, TopicModel
+
+
+def test_sentiment_labels_follow_word_polarity():
+    """Positive, negative and neutral texts get matching labels and signs."""
+    results = LexiconSentimentModel().predict_batch(
+        [
+            "A great success: record growth and happy customers.",
+            "The breach caused a crisis and a costly lawsuit.",
+            "The meeting is on Tuesday.",
+        ]
+    )
+
+    assert [result.label for result in results] == ["positive", "negative", "neutral"]
+    assert results[0].score > 0 > results[1].score
+    assert results[2].score == 0
+
+
+def test_sentiment_batch_matches_single_predictions():
+    """Batching does not change any individual result."""
+    model = LexiconSentimentModel()
+    texts = ["good news", "bad news", "", "win some, lose some"]
+
+    batched = model.predict_batch(texts)
+
+    assert batched == [model.predict_batch([text])[0] for text in texts]
+
+
+def test_topic_model_picks_the_nearest_centroid():
+    """Each text is assigned the id of its most similar centroid."""
+    embedder = HashingEmbedder(64)
+    centroids = embedder.embed(["email marketing automation", "football league"])
+    model = TopicModel(embedder, lambda: (np.array([7, 9]), centroids))
+
+    assert model.predict_batch(
+        ["football league results", "email marketing automation tips"]
+    ) == [9, 7]
+
+
+def test_topic_model_without_clusters_returns_none():
+    """No topic is assigned before any clusters exist."""
+    model = TopicModel(
+        HashingEmbedder(64), lambda: (np.empty(0, np.int64), np.empty((0, 64)))
+    )
+
+    assert model.predict_batch(["anything", "at all"]) == [None, None]
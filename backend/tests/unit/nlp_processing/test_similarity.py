@@ -0,0 +1,111 @@
+"""Unit tests for vectorized similarity search."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from backend.app.nlp_processing.embeddings import (
+    EmbeddingStore,
+    HashingEmbedder,
+    normalize,
+)
+from backend.app.nlp_processing.similarity import (
+    IVFIndex,
+    SimilarityIndex,
+    spherical_kmeans,
+    top_k,
+)
+
+
+def clustered_vectors(
+    n_clusters: int, per_cluster: int, dimension: int = 16, seed: int = 0
+) -> np.ndarray:
+    """Unit vectors scattered tightly around random centres."""
+    rng = np.random.default_rng(seed)
+    centres = normalize(rng.normal(size=(n_clusters, dimension)))
+    noise = rng.normal(scale=0.05, size=(n_clusters, per_cluster, dimension))
+    points = centres[:, None, :] + noise
+    return normalize(points.reshape(-1, dimension)).astype(np.float32)
+
+
+def test_top_k_returns_best_rows_in_order():
+    """Rows are ordered by descending dot product."""
+    vectors = np.array([[0.1, 0], [0.9, 0], [0.5, 0], [-1, 0]], dtype=np.float32)
+
+    rows, scores = top_k(vectors, np.array([1, 0], dtype=np.float32), 3)
+
+    assert rows.tolist() == [1, 2, 0]
+    np.testing.assert_allclose(scores, [0.9, 0.5, 0.1])
+
+
+def test_top_k_handles_small_and_empty_inputs():
+    """k larger than the collection, and empty collections, are allowed."""
+    vectors = np.eye(2, dtype=np.float32)
+
+    assert len(top_k(vectors, vectors[0], 10)[0]) == 2
+    assert len(top_k(vectors[:0], vectors[0], 10)[0]) == 0
+
+
+def test_spherical_kmeans_recovers_clusters():
+    """Points around the same centre end up in the same cluster."""
+    vectors = clustered_vectors(4, 50)
+
+    centroids, assignments = spherical_kmeans(vectors, 4, iterations=20, seed=1)
+
+    assert centroids.shape == (4, 16)
+    for cluster in range(4):
+        assert len(set(assignments[cluster * 50 : (cluster + 1) * 50])) == 1
+
+
+def test_ivf_search_matches_exhaustive_search_on_clustered_data():
+    """Probing a few partitions finds the exact neighbours here."""
+    vectors = clustered_vectors(8, 100)
+    index = IVFIndex(vectors, n_lists=8)
+    query = vectors[123]
+
+    exact_rows, _ = top_k(vectors, query, 5)
+    ivf_rows, ivf_scores = index.search(query, 5, n_probe=2)
+
+    assert set(ivf_rows.tolist()) == set(exact_rows.tolist())
+    assert list(ivf_scores) == sorted(ivf_scores, reverse=True)
+
+
+@pytest.fixture(name="store")
+def fixture_store(tmp_path: Path) -> EmbeddingStore:
+    """A store holding three short articles."""
+    store = EmbeddingStore(tmp_path, HashingEmbedder(128))
+    store.embed_texts(
+        [
+            "email marketing automation",
+            "generative ai for marketing copy",
+            "pacific volcano eruption",
+        ]
+    )
+    return store
+
+
+def test_similarity_index_search_text(store: EmbeddingStore):
+    """The most similar cached article is returned first."""
+    index = SimilarityIndex(store)
+
+    matches = index.search_text("email marketing automation tools", k=2)
+
+    assert len(matches) == 2
+    assert matches[0].content_hash == store.hash_at(0)
+    assert matches[0].score > matches[1].score
+    assert len(store) == 3  # the query itself is not cached
+
+
+def test_similarity_index_includes_vectors_added_after_ivf_build(tmp_path: Path):
+    """New articles are searchable before the IVF index is rebuilt."""
+    store = EmbeddingStore(tmp_path, HashingEmbedder(64))
+    store.embed_texts([f"background article number {i}" for i in range(200)])
+    index = SimilarityIndex(store, ivf_threshold=100, n_lists=10, n_probe=2)
+    index.search_text("warm up", k=1)  # builds the IVF index over 200 rows
+
+    store.embed_texts(["brand new article about email deliverability"])
+    matches = index.search_text("brand new article about email deliverability", k=1)
+
+    assert matches[0].content_hash == store.hash_at(200)
+    assert matches[0].score == pytest.approx(1.0)
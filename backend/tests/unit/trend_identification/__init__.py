@@ -0,0 +1 @@
+# This file makes the 'trend_identification' directory a Python package.
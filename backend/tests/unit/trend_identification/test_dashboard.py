@@ -0,0 +1,98 @@
+"""Unit tests for the precomputed dashboard snapshot."""
+
+import gzip
+import json
+from unittest.mock import patch
+
+import pytest
+
+from backend.app.data_ingestion.content_store import get_article_store
+from backend.app.nlp_processing.analyses import get_analysis_store
+from backend.app.nlp_processing.clustering import cluster_new_articles
+from backend.app.nlp_processing.inference import ArticleAnalysis
+from backend.app.nlp_processing.models import sentiment_from_score
+from backend.app.trend_identification.dashboard import (
+    DashboardSnapshotStore,
+    build_dashboard,
+)
+from backend.app.trend_identification.history import record_trend_history
+
+
+@pytest.fixture(name="path")
+def fixture_path(tmp_path):
+    """Where snapshots are published."""
+    return tmp_path / "snapshots" / "dashboard.json.gz"
+
+
+def test_build_dashboard_collects_trends_sparklines_and_sentiment():
+    """Each trend carries its daily sparkline, ending with today."""
+    articles = get_article_store()
+    first = articles.save_article("http://a.com/1", "Email automation for retail")
+    articles.save_article("http://a.com/2", "Email automation for retail")
+    cluster_new_articles()
+    record_trend_history()
+    analyses = get_analysis_store()
+    analyses.save(first, ArticleAnalysis(sentiment_from_score(0.6), 1), "1")
+
+    dashboard = build_dashboard()
+
+    assert len(dashboard["trends"]) == 1
+    trend = dashboard["trends"][0]
+    assert trend["source_articles_count"] == 2
+    assert len(trend["sparkline"]) == 30
+    assert trend["sparkline"][:-1] == [None] * 29
+    assert trend["sparkline"][-1] == pytest.approx(trend["score"])
+    assert dashboard["sparkline"]["resolution"] == "day"
+    assert dashboard["sentiment"] == {
+        "articles": 1,
+        "mean_score": pytest.approx(0.6),
+        "labels": {"positive": 1},
+    }
+
+
+def test_publish_versions_and_compresses_the_snapshot(path):
+    """Every publish is a new version, stored gzipped."""
+    store = DashboardSnapshotStore(path)
+    assert store.current() is None
+
+    first = store.publish({"trends": []})
+    second = store.publish({"trends": [{"id": "1"}]})
+
+    assert (first.version, second.version) == (1, 2)
+    assert second.etag.startswith('"dashboard-2-')
+    assert gzip.decompress(path.read_bytes()) == second.body
+    assert json.loads(second.body)["trends"] == [{"id": "1"}]
+    assert store.current() is second
+
+
+def test_concurrent_publishers_never_share_an_etag(path):
+    """Two processes publishing the same version get different tags."""
+    first = DashboardSnapshotStore(path)
+    second = DashboardSnapshotStore(path)
+    assert first.current() is None and second.current() is None
+
+    one = first.publish({"trends": [{"id": "1"}]})
+    # The race: second publishes before it has read the file first wrote.
+    with patch.object(second, "_load"):
+        two = second.publish({"trends": [{"id": "2"}]})
+
+    assert one.version == two.version == 1
+    assert one.etag != two.etag
+
+
+def test_snapshot_survives_restarts_and_other_publishers(path):
+    """A new store loads the file; later publishes elsewhere are picked up."""
+    DashboardSnapshotStore(path).publish({"trends": []})
+
+    reader = DashboardSnapshotStore(path)
+    loaded = reader.current()
+    assert loaded is not None
+    assert loaded.version == 1
+    assert reader.current() is loaded
+
+    DashboardSnapshotStore(path).publish({"trends": [{"id": "2"}]})
+
+    reloaded = reader.current()
+    assert reloaded is not None
+    assert reloaded.version == 2
+    assert reader.publish({"trends": []}).version == 3
@@ -0,0 +1,174 @@
+"""Unit tests for the trend history time-series store."""
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from backend.app.data_ingestion.content_store import get_article_store
+from backend.app.nlp_processing.clustering import cluster_new_articles
+from backend.app.trend_identification.history import (
+    PARTITION_BUCKETS,
+    TrendHistoryStore,
+    bucket_of,
+    bucket_start,
+    get_trend_history_store,
+    record_trend_history,
+)
+
+HOUR = 3600
+DAY = 24 * HOUR
+# Monday 2024-01-01 00:00 UTC
+T0 = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp())
+
+
+def append(store: TrendHistoryStore, at: int, points: dict[int, tuple[int, float]]):
+    """Appends {trend: (mentions, score)} at a timestamp."""
+    store.append(
+        at,
+        np.array(list(points)),
+        np.array([mentions for mentions, _ in points.values()]),
+        np.array([score for _, score in points.values()]),
+    )
+
+
+def test_buckets_align_to_hours_days_and_monday_weeks():
+    """Bucket starts are whole hours, UTC midnights and Monday midnights."""
+    at = T0 + 3 * DAY + 5 * HOUR + 17
+
+    assert bucket_start(bucket_of(at, "hour"), "hour") == T0 + 3 * DAY + 5 * HOUR
+    assert bucket_start(bucket_of(at, "day"), "day") == T0 + 3 * DAY
+    assert bucket_start(bucket_of(at, "week"), "week") == T0
+
+
+def test_rollups_aggregate_points_per_bucket(tmp_path):
+    """Each resolution sums mentions and keeps the last and max score."""
+    store = TrendHistoryStore(tmp_path)
+    append(store, T0 + 1 * HOUR, {1: (3, 10.0), 2: (1, 1.0)})
+    append(store, T0 + 2 * HOUR, {1: (2, 30.0)})
+    append(store, T0 + DAY + HOUR, {1: (5, 20.0)})
+
+    daily = store.rollup(1, T0, T0 + 2 * DAY, "day")
+    hourly = store.rollup(1, T0, T0 + 3 * HOUR, "hour")
+    weekly = store.rollup(1, T0, T0 + 7 * DAY, "week")
+
+    assert daily.start.tolist() == [T0, T0 + DAY]
+    assert daily.points.tolist() == [2, 1]
+    assert daily.mentions.tolist() == [5, 5]
+    assert daily.score_last.tolist() == [30.0, 20.0]
+    assert daily.score_max.tolist() == [30.0, 20.0]
+    assert daily.score_mean().tolist() == [20.0, 20.0]
+    assert hourly.mentions.tolist() == [0, 3, 2]
+    assert weekly.mentions.tolist() == [10]
+    assert store.rollup(2, T0, T0 + DAY, "day").mentions.tolist() == [1]
+
+
+def test_rollup_reads_are_read_only_views(tmp_path):
+    """A range inside one partition is served without copying."""
+    store = TrendHistoryStore(tmp_path)
+    append(store, T0, {1: (1, 1.0)})
+
+    series = store.rollup(1, T0, T0 + 30 * DAY, "day")
+
+    assert not series.mentions.flags.owndata
+    assert not series.mentions.flags.writeable
+
+
+def test_rollups_span_partitions_and_missing_trends(tmp_path):
+    """Ranges crossing partitions are stitched; unknown trends read as zero."""
+    store = TrendHistoryStore(tmp_path)
+    boundary = bucket_start(
+        (bucket_of(T0, "hour") // PARTITION_BUCKETS + 1) * PARTITION_BUCKETS, "hour"
+    )
+    append(store, boundary - HOUR, {1: (1, 1.0)})
+    append(store, boundary, {1: (2, 2.0)})
+
+    series = store.rollup(1, boundary - HOUR, boundary + HOUR, "hour")
+
+    assert series.mentions.tolist() == [1, 2]
+    assert store.rollup(99, T0, T0 + DAY, "day").points.tolist() == [0]
+
+
+def test_history_is_append_only(tmp_path):
+    """Points older than the last append are rejected."""
+    store = TrendHistoryStore(tmp_path)
+    append(store, T0 + HOUR, {1: (1, 1.0)})
+
+    with pytest.raises(ValueError, match="older than the last point"):
+        append(store, T0, {1: (1, 1.0)})
+    with pytest.raises(ValueError, match="equal length"):
+        store.append(T0 + HOUR, np.array([1, 2]), np.array([1]), np.array([1.0]))
+
+
+def test_raw_segments_return_points_in_range(tmp_path):
+    """Raw points are read back per day segment, filtered by time."""
+    store = TrendHistoryStore(tmp_path)
+    append(store, T0 + HOUR, {1: (1, 1.0), 2: (2, 2.0)})
+    append(store, T0 + 2 * HOUR, {1: (3, 3.0)})
+    append(store, T0 + DAY, {1: (4, 4.0)})
+
+    segments = list(store.raw_segments(T0 + 2 * HOUR, T0 + DAY + 1))
+
+    assert [segment.mentions.tolist() for segment in segments] == [[3], [4]]
+    assert isinstance(segments[0].time.base, np.memmap)
+
+
+def test_state_and_rollups_survive_reopening(tmp_path):
+    """Counts recorded before a restart are used for the next deltas."""
+    store = TrendHistoryStore(tmp_path)
+    store.record_counts(T0, {1: 5}, {1: 2.0})
+    store.close()
+
+    reopened = TrendHistoryStore(tmp_path)
+    reopened.record_counts(T0 + HOUR, {1: 8}, {1: 3.0})
+
+    assert reopened.rollup(1, T0, T0 + DAY, "day").mentions.tolist() == [8]
+
+
+def test_writers_in_several_processes_share_state(tmp_path):
+    """Each writer takes deltas from the other's last counts, never twice."""
+    first, second = TrendHistoryStore(tmp_path), TrendHistoryStore(tmp_path)
+
+    first.record_counts(T0, {1: 5}, {1: 2.0})
+    second.record_counts(T0 + HOUR, {1: 8}, {1: 3.0})
+    # A cycle that took its timestamp before the other's append landed.
+    first.record_counts(T0 + HOUR - 60, {1: 9, 2: 1}, {1: 3.5, 2: 1.0})
+
+    hourly = second.rollup(1, T0, T0 + 2 * HOUR, "hour")
+    assert hourly.mentions.tolist() == [5, 4]
+    assert hourly.points.tolist() == [1, 2]
+    assert first.rollup(2, T0, T0 + 2 * HOUR, "hour").mentions.tolist() == [0, 1]
+    first.close()
+    second.close()
+
+
+def test_compaction_keeps_daily_rollups(tmp_path):
+    """Old raw segments and hourly partitions go; daily history stays."""
+    store = TrendHistoryStore(tmp_path)
+    append(store, T0, {1: (1, 1.0)})
+    now = datetime.fromtimestamp(T0 + 200 * DAY, timezone.utc)
+    append(store, int(now.timestamp()), {1: (2, 2.0)})
+
+    removed = store.compact(raw_retention_days=30, hourly_retention_days=90, now=now)
+
+    assert removed == 2
+    assert not list(store.raw_segments(T0, T0 + DAY))
+    assert store.rollup(1, T0, T0 + HOUR, "hour").points.tolist() == [0]
+    assert store.rollup(1, T0, T0 + DAY, "day").mentions.tolist() == [1]
+    assert store.compact(30, 90, now) == 0
+
+
+def test_record_trend_history_snapshots_clusters():
+    """Each record appends the growth of every active trend."""
+    articles = get_article_store()
+    articles.save_article("http://a.com/1", "Email automation for retail brands")
+    cluster_new_articles()
+    record_trend_history(datetime.fromtimestamp(T0, timezone.utc))
+    articles.save_article("http://a.com/2", "Email automation for retail shops")
+    cluster_new_articles()
+    record_trend_history(datetime.fromtimestamp(T0 + HOUR, timezone.utc))
+
+    series = get_trend_history_store().rollup(1, T0, T0 + 2 * HOUR, "hour")
+
+    assert series.mentions.tolist() == [1, 1]
+    assert series.score_last[1] >= series.score_last[0] > 0
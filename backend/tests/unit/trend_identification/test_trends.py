@@ -0,0 +1,83 @@
+"""Unit tests for trends derived from topic clusters."""
+
+from unittest.mock import patch
+
+from backend.app.data_ingestion.content_store import ArticleStore, get_article_store
+from backend.app.nlp_processing.clustering import (
+    cluster_new_articles,
+    get_topic_cluster_store,
+)
+from backend.app.nlp_processing.embeddings import HashingEmbedder
+from backend.app.nlp_processing.keywords import top_keywords
+from backend.app.trend_identification.trends import get_trend, list_trends
+
+
+def test_top_keywords_skips_stop_words():
+    """The most frequent meaningful words are returned, most frequent first."""
+    texts = ["The email campaign and the email list", "email automation campaign"]
+
+    assert top_keywords(texts, 2) == ["email", "campaign"]
+
+
+def test_get_trend_describes_cluster():
+    """A trend is built from its cluster's articles."""
+    store = get_article_store()
+    for i in range(3):
+        store.save_article(f"http://a.com/{i}", f"Email automation for retailers {i}")
+    cluster_new_articles()
+
+    trend = get_trend("1")
+
+    assert trend is not None
+    assert trend.article_count == 3
+    assert trend.name == "Email Automation Retailers"
+    assert len(trend.snippets) == 3
+
+
+def test_get_trend_version_changes_when_cluster_grows():
+    """New articles in a cluster produce a new trend version."""
+    store = get_article_store()
+    store.save_article("http://a.com/1", "Email automation for retailers")
+    cluster_new_articles()
+    before = get_trend("1")
+
+    store.save_article("http://a.com/2", "Email automation for retailers again")
+    cluster_new_articles()
+
+    assert get_trend("1").version != before.version
+
+
+def test_get_trend_unknown_ids():
+    """Missing and malformed ids return None."""
+    assert get_trend("999") is None
+    assert get_trend("not-a-number") is None
+
+
+def test_list_trends_uses_names_stored_by_clustering():
+    """Listing trends reads no article bodies; the name was stored."""
+    store = get_article_store()
+    for i in range(3):
+        store.save_article(f"http://a.com/{i}", f"Email automation for retailers {i}")
+    cluster_new_articles()
+
+    with patch.object(ArticleStore, "get_article") as get_article:
+        page = list_trends()
+
+    get_article.assert_not_called()
+    assert [trend.name for trend in page.items] == ["Email Automation Retailers"]
+    assert page.items[0].snippets == ()
+
+
+def test_list_trends_names_clusters_stored_without_a_name():
+    """Clusters from before names were stored are named once, then kept."""
+    article_id = get_article_store().save_article(
+        "http://a.com/1", "Retail loyalty programs for retail shoppers"
+    )
+    clusters = get_topic_cluster_store()
+    clusters.add_batch(
+        [article_id], ["h"], HashingEmbedder(clusters.clusterer.dimension).embed(["x"])
+    )
+    assert clusters.get_cluster(1).name is None
+
+    assert [trend.name for trend in list_trends().items] == ["Retail Loyalty Programs"]
+    assert clusters.get_cluster(1).name == "Retail Loyalty Programs"
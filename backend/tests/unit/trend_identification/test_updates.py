@@ -0,0 +1,172 @@
+"""Unit tests for the trend update broadcaster."""
+
+import asyncio
+
+import pytest
+
+from backend.app.trend_identification.updates import (
+    TooManySubscribersError,
+    TrendBroadcaster,
+    diff_trends,
+)
+
+
+class FakeTrends:
+    """Trend state whose revision changes on every set()."""
+
+    def __init__(self) -> None:
+        self.trends: dict[str, dict] = {}
+        self.revision = 0
+        self.loads = 0
+
+    def set(self, trend_id: str, score: float | None) -> None:
+        """Sets a trend's score, or removes the trend if score is None."""
+        if score is None:
+            self.trends.pop(trend_id, None)
+        else:
+            self.trends[trend_id] = {"id": trend_id, "score": score}
+        self.revision += 1
+
+    def load(self) -> dict[str, dict]:
+        """Returns a copy of the current trends."""
+        self.loads += 1
+        return dict(self.trends)
+
+
+@pytest.fixture(name="trends")
+def fixture_trends():
+    """Two trends at revision 2."""
+    state = FakeTrends()
+    state.set("1", 0.5)
+    state.set("2", 0.2)
+    return state
+
+
+def make_broadcaster(trends: FakeTrends, **kwargs) -> TrendBroadcaster:
+    """A broadcaster over fake trends, without polling unless asked."""
+    kwargs.setdefault("poll_interval", 0)
+    return TrendBroadcaster(trends.load, lambda: str(trends.revision), **kwargs)
+
+
+def test_diff_lists_changed_summaries_and_removed_ids():
+    """Unchanged trends are left out of the diff."""
+    old = {"1": {"score": 1}, "2": {"score": 2}, "3": {"score": 3}}
+    new = {"1": {"score": 1}, "2": {"score": 5}, "4": {"score": 4}}
+
+    assert diff_trends(old, new) == {
+        "changed": [{"score": 5}, {"score": 4}],
+        "removed": ["3"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_fans_one_diff_out_to_every_subscriber(trends):
+    """Subscribers at the same snapshot share one computed diff."""
+    broadcaster = make_broadcaster(trends)
+    first = await broadcaster.subscribe()
+    second = await broadcaster.subscribe()
+    assert first.delivered.trends == trends.trends
+
+    trends.set("1", 0.9)
+    assert await broadcaster.refresh()
+
+    update = await first.next(timeout=1)
+    assert update == {
+        "revision": "3",
+        "changed": [{"id": "1", "score": 0.9}],
+        "removed": [],
+    }
+    assert await second.next(timeout=1) is update
+    assert trends.loads == 2
+    await broadcaster.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesces_missed_updates_for_slow_subscribers(trends):
+    """A subscriber that misses cycles gets one diff to the latest snapshot."""
+    broadcaster = make_broadcaster(trends)
+    slow = await broadcaster.subscribe()
+
+    trends.set("1", 0.9)
+    await broadcaster.refresh()
+    trends.set("2", None)
+    trends.set("3", 0.1)
+    await broadcaster.refresh()
+
+    assert await slow.next(timeout=1) == {
+        "revision": "5",
+        "changed": [{"id": "1", "score": 0.9}, {"id": "3", "score": 0.1}],
+        "removed": ["2"],
+    }
+    assert await slow.next(timeout=0.01) is None
+    await broadcaster.close()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_revision_wakes_nobody(trends):
+    """Refreshing at the same revision neither reloads nor notifies."""
+    broadcaster = make_broadcaster(trends)
+    subscription = await broadcaster.subscribe()
+
+    assert not await broadcaster.refresh()
+
+    assert await subscription.next(timeout=0.01) is None
+    assert trends.loads == 1
+    await broadcaster.close()
+
+
+@pytest.mark.asyncio
+async def test_polls_for_changes_committed_elsewhere(trends):
+    """While anyone is subscribed, the revision is polled."""
+    broadcaster = make_broadcaster(trends, poll_interval=0.01)
+    subscription = await broadcaster.subscribe()
+
+    trends.set("2", 0.7)
+
+    update = await subscription.next(timeout=1)
+    assert update is not None
+    assert update["changed"] == [{"id": "2", "score": 0.7}]
+    await broadcaster.close()
+
+
+@pytest.mark.asyncio
+async def test_polling_survives_failed_loads(trends):
+    """A load that raises is logged and polling carries on."""
+    load = trends.load
+    failures = []
+
+    def flaky_load():
+        if failures:
+            raise failures.pop()
+        return load()
+
+    broadcaster = TrendBroadcaster(
+        flaky_load, lambda: str(trends.revision), poll_interval=0.01
+    )
+    subscription = await broadcaster.subscribe()
+    failures.append(LookupError("Content chunk 7 not found."))
+
+    trends.set("2", 0.7)
+
+    update = await subscription.next(timeout=1)
+    assert update is not None
+    assert update["changed"] == [{"id": "2", "score": 0.7}]
+    assert not failures
+    await broadcaster.close()
+
+
+@pytest.mark.asyncio
+async def test_limits_subscribers_and_ends_them_on_close(trends):
+    """Subscriptions past the maximum are refused; close ends the rest."""
+    broadcaster = make_broadcaster(trends, max_subscribers=1)
+    subscription = await broadcaster.subscribe()
+    with pytest.raises(TooManySubscribersError):
+        await broadcaster.subscribe()
+
+    waiting = asyncio.create_task(subscription.next())
+    await asyncio.sleep(0)
+    await broadcaster.close()
+
+    assert await waiting is None
+    assert subscription.closed
+    assert broadcaster.subscriber_count == 0
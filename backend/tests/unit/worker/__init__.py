@@ -0,0 +1 @@
+# This file makes the 'worker' directory a Python package.
@@ -0,0 +1,140 @@
+"""Unit tests for the durable SQLite work queue."""
+
+from pathlib import Path
+
+import pytest
+
+from backend.app.db.database import connect
+from backend.app.worker.queue import WorkQueue
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """A manually advanced wall clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name="clock")
+def fixture_clock() -> FakeClock:
+    """A controllable clock."""
+    return FakeClock()
+
+
+@pytest.fixture(name="queue")
+def fixture_queue(clock: FakeClock) -> WorkQueue:
+    """An in-memory queue allowing two attempts per task."""
+    return WorkQueue(connect(":memory:"), max_attempts=2, clock=clock)
+
+
+def test_enqueue_claim_ack(queue: WorkQueue):
+    """A claimed and acked task is removed from the queue."""
+    task_id = queue.enqueue("fetch_url", {"url": "http://a.com"})
+    assert queue.depth() == 1
+
+    item = queue.claim(visibility_timeout=60)
+    assert item is not None
+    assert (item.id, item.kind, item.payload) == (
+        task_id,
+        "fetch_url",
+        {"url": "http://a.com"},
+    )
+    assert item.attempts == 1
+    assert queue.claim(visibility_timeout=60) is None
+
+    assert queue.ack(item)
+    assert queue.depth() == 0
+
+
+def test_tasks_are_claimed_in_fifo_order(queue: WorkQueue):
+    """Older tasks are claimed first."""
+    first = queue.enqueue("a")
+    second = queue.enqueue("b")
+
+    assert queue.claim(60).id == first
+    assert queue.claim(60).id == second
+
+
+def test_enqueue_many_and_claim_by_kind(queue: WorkQueue):
+    """Batches are enqueued at once; claims can be limited to some kinds."""
+    queue.enqueue("fetch_cycle")
+    assert queue.enqueue_many("fetch_url", [{"n": 1}, {"n": 2}]) == 2
+
+    assert (queue.depth(), queue.depth("fetch_url")) == (3, 2)
+    item = queue.claim(60, ("fetch_url",))
+    assert item is not None
+    assert (item.kind, item.payload) == ("fetch_url", {"n": 1})
+    assert queue.claim(60).kind == "fetch_cycle"
+
+
+def test_delayed_task_is_hidden_until_due(queue: WorkQueue, clock: FakeClock):
+    """A task enqueued with a delay is not claimable before it is due."""
+    queue.enqueue("a", delay=30)
+    assert queue.claim(60) is None
+
+    clock.now += 30
+    assert queue.claim(60) is not None
+
+
+def test_unacked_task_reappears_after_visibility_timeout(
+    queue: WorkQueue, clock: FakeClock
+):
+    """A task whose worker disappeared is retried after the timeout."""
+    queue.enqueue("a")
+    lost = queue.claim(visibility_timeout=60)
+
+    clock.now += 61
+    retried = queue.claim(visibility_timeout=60)
+
+    assert retried is not None and retried.id == lost.id
+    assert retried.attempts == 2
+    # The first worker's lease is no longer valid.
+    assert not queue.ack(lost)
+    assert queue.ack(retried)
+
+
+def test_extended_lease_keeps_task_hidden(queue: WorkQueue, clock: FakeClock):
+    """Extending a lease pushes back redelivery; a lost lease cannot be extended."""
+    queue.enqueue("a")
+    item = queue.claim(visibility_timeout=60)
+
+    clock.now += 50
+    assert queue.extend(item, 60)
+    clock.now += 50
+    assert queue.claim(visibility_timeout=60) is None
+
+    clock.now += 11
+    assert queue.claim(visibility_timeout=60) is not None
+    assert not queue.extend(item, 60)
+
+
+def test_nack_retries_then_marks_dead(queue: WorkQueue, clock: FakeClock):
+    """Failed tasks are retried after a delay until max_attempts is reached."""
+    queue.enqueue("a")
+    item = queue.claim(60)
+    assert queue.nack(item, "boom", retry_delay=10)
+    assert queue.claim(60) is None
+
+    clock.now += 10
+    item = queue.claim(60)
+    assert item.attempts == 2
+    assert queue.nack(item, "boom again")
+
+    assert queue.claim(60) is None
+    assert queue.depth() == 0
+
+
+def test_queue_is_shared_between_connections(tmp_path: Path):
+    """Producers and workers in different processes share one database."""
+    path = str(tmp_path / "queue.db")
+    producer = WorkQueue(connect(path))
+    worker = WorkQueue(connect(path))
+
+    producer.enqueue("fetch_cycle")
+    item = worker.claim(60)
+
+    assert item is not None and item.kind == "fetch_cycle"
+    assert producer.claim(60) is None
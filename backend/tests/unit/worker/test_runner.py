@@ -0,0 +1,174 @@
+"""Unit tests for the ingestion worker loop."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.data_ingestion.checkpoint import get_checkpoint_store
+from backend.app.db.database import connect
+from backend.app.worker.queue import FETCH_CYCLE_TASK, WorkQueue, get_work_queue
+from backend.app.worker.runner import (
+    distribute_fetch_cycle,
+    handle_fetch_cycle,
+    handle_fetch_url,
+    process_item,
+    run_worker,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(name="queue")
+def fixture_queue() -> WorkQueue:
+    """An in-memory queue."""
+    return WorkQueue(connect(":memory:"), max_attempts=3)
+
+
+async def test_process_item_acks_successful_task(queue: WorkQueue):
+    """A task whose handler succeeds is removed from the queue."""
+    handled: list[dict[str, Any]] = []
+
+    async def handler(payload: dict[str, Any]) -> None:
+        handled.append(payload)
+
+    queue.enqueue("job", {"n": 1})
+    item = queue.claim(60)
+
+    assert await process_item(queue, item, {"job": handler})
+    assert handled == [{"n": 1}]
+    assert queue.depth() == 0
+
+
+async def test_process_item_nacks_failed_task(queue: WorkQueue):
+    """A task whose handler raises is returned to the queue for retry."""
+
+    async def handler(_payload: dict[str, Any]) -> None:
+        raise RuntimeError("boom")
+
+    queue.enqueue("job")
+    item = queue.claim(60)
+
+    with patch("backend.app.worker.runner.settings.WORKER_RETRY_DELAY_SECONDS", 0):
+        assert not await process_item(queue, item, {"job": handler})
+    assert queue.depth() == 1
+    assert queue.claim(60).attempts == 2
+
+
+async def test_process_item_extends_lease_while_running(queue: WorkQueue):
+    """A task outliving its visibility timeout is not redelivered."""
+
+    async def handler(_payload: dict[str, Any]) -> None:
+        await asyncio.sleep(0.3)
+        assert queue.claim(0.15) is None
+
+    queue.enqueue("job")
+    item = queue.claim(0.15)
+
+    with patch(
+        "backend.app.worker.runner.settings.WORKER_VISIBILITY_TIMEOUT_SECONDS", 0.15
+    ):
+        assert await process_item(queue, item, {"job": handler})
+    assert queue.depth() == 0
+
+
+async def test_process_item_rejects_unknown_kind(queue: WorkQueue):
+    """Tasks with no registered handler are nacked."""
+    queue.enqueue("mystery")
+    item = queue.claim(60)
+
+    assert not await process_item(queue, item, {})
+
+
+async def test_run_worker_drains_queue_until_stopped(queue: WorkQueue):
+    """The worker runs queued tasks and exits when asked to stop."""
+    stop = asyncio.Event()
+    seen: list[int] = []
+
+    async def handler(payload: dict[str, Any]) -> None:
+        seen.append(payload["n"])
+        if len(seen) == 3:
+            stop.set()
+
+    for n in range(3):
+        queue.enqueue("job", {"n": n})
+
+    succeeded = await asyncio.wait_for(run_worker(queue, stop, {"job": handler}), 5)
+
+    assert succeeded == 3
+    assert seen == [0, 1, 2]
+
+
+async def test_fetch_cycle_task_runs_scheduled_fetch(queue: WorkQueue):
+    """The default fetch_cycle handler runs a full fetch cycle."""
+    stop = asyncio.Event()
+    queue.enqueue(FETCH_CYCLE_TASK)
+
+    async def fetch_then_stop(fetch_sources) -> None:
+        assert fetch_sources is distribute_fetch_cycle
+        stop.set()
+
+    with patch(
+        "backend.app.worker.runner.perform_scheduled_article_fetch",
+        new_callable=AsyncMock,
+        side_effect=fetch_then_stop,
+    ) as mock_fetch:
+        assert await asyncio.wait_for(run_worker(queue, stop), 5) == 1
+
+    mock_fetch.assert_awaited_once()
+
+
+async def test_handle_fetch_url_fetches_payload_url():
+    """The fetch_url handler fetches and processes the given URL."""
+    with patch(
+        "backend.app.worker.runner.fetch_and_process_url", new_callable=AsyncMock
+    ) as mock_fetch:
+        await handle_fetch_url({"url": "http://example.com/a"})
+
+    assert mock_fetch.await_args.args[0] == "http://example.com/a"
+
+
+async def test_fetch_cycle_is_shared_between_workers():
+    """A cycle's sources run as fetch_url tasks on every worker, once each."""
+    urls = [f"http://example.com/{n}" for n in range(20)]
+    fetched: list[str] = []
+
+    async def fetch(url: str, *_args) -> bool:
+        await asyncio.sleep(0.01)
+        fetched.append(url)
+        return True
+
+    stop = asyncio.Event()
+    with (
+        patch.object(settings, "NEWS_SOURCES", urls),
+        patch.object(settings, "WORKER_POLL_INTERVAL_SECONDS", 0.01),
+        patch("backend.app.worker.runner.fetch_and_process_url", fetch),
+    ):
+        other = asyncio.create_task(run_worker(get_work_queue(), stop))
+        await asyncio.wait_for(handle_fetch_cycle({}), 5)
+        stop.set()
+        helped = await other
+
+    assert sorted(fetched) == sorted(urls)
+    assert helped > 0
+    assert get_work_queue().depth() == 0
+    cycle = get_checkpoint_store().start_or_resume(
+        urls, 3600, heartbeat_timeout_seconds=0
+    )
+    assert not cycle.resumed
+
+
+async def test_handle_fetch_url_skips_sources_no_longer_outstanding():
+    """A duplicate task for a source already done is not fetched again."""
+    checkpoints = get_checkpoint_store()
+    cycle = checkpoints.start_or_resume(["http://example.com/a"], 3600)
+    checkpoints.mark_done(cycle.id, "http://example.com/a")
+
+    with patch(
+        "backend.app.worker.runner.fetch_and_process_url", new_callable=AsyncMock
+    ) as mock_fetch:
+        await handle_fetch_url({"url": "http://example.com/a", "cycle_id": cycle.id})
+
+    mock_fetch.assert_not_called()
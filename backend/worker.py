@@ -0,0 +1,6 @@
+"""Run an ingestion worker"""
+
+from backend.app.worker import runner
+
+if __name__ == "__main__":
+    runner.main()